@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Compare the size and speed of the .otio (json) and .otiob (binary) formats.
+
+Usage: binary_perf_test.py [num_clips]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import opentimelineio as otio
+
+
+def _build_timeline(num_clips):
+    timeline = otio.schema.Timeline(name="binary_perf_test")
+    for track_index in range(4):
+        track = otio.schema.Track(name="V{}".format(track_index + 1))
+        timeline.tracks.append(track)
+
+        for i in range(num_clips // 4):
+            clip = otio.schema.Clip(
+                name="clip_{}".format(i),
+                media_reference=otio.schema.ExternalReference(
+                    target_url="/media/clip_{}.mov".format(i),
+                    available_range=otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(0, 24),
+                        otio.opentime.RationalTime(1000, 24)
+                    )
+                ),
+                source_range=otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(i, 24),
+                    otio.opentime.RationalTime(48, 24)
+                ),
+                metadata={"index": i, "tags": ["a", "b", "c"]}
+            )
+            clip.markers.append(
+                otio.schema.Marker(
+                    name="note",
+                    marked_range=otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(i + 1, 24),
+                        otio.opentime.RationalTime(0, 24)
+                    )
+                )
+            )
+            track.append(clip)
+
+    return timeline
+
+
+def _time(label, func):
+    begin = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - begin
+    print("{:24s} {:.3f} [s]".format(label, elapsed))
+    return elapsed, result
+
+
+def main():
+    num_clips = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    timeline = _build_timeline(num_clips)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        json_path = os.path.join(temp_dir, "timeline.otio")
+        binary_path = os.path.join(temp_dir, "timeline.otiob")
+
+        _time(
+            "write .otio",
+            lambda: otio.adapters.write_to_file(timeline, json_path)
+        )
+        _time(
+            "write .otiob",
+            lambda: otio.adapters.write_to_file(timeline, binary_path)
+        )
+
+        json_read, _ = _time(
+            "read .otio",
+            lambda: otio.adapters.read_from_file(json_path)
+        )
+        binary_read, _ = _time(
+            "read .otiob",
+            lambda: otio.adapters.read_from_file(binary_path)
+        )
+
+        json_size = os.path.getsize(json_path)
+        binary_size = os.path.getsize(binary_path)
+
+    print(
+        ".otio: {:.1f} MB, .otiob: {:.1f} MB ({:.1f}x smaller), "
+        "read {:.2f}x faster".format(
+            json_size / 1e6,
+            binary_size / 1e6,
+            json_size / binary_size,
+            json_read / binary_read
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
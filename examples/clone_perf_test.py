@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Benchmark cloning a large timeline.
+
+Builds a timeline of about num_objects objects (tracks of clips with an
+external reference and a marker each, some metadata on every clip), then
+reports how many objects per second clone() and copy.deepcopy() copy.
+
+Usage: clone_perf_test.py [num_objects]
+"""
+
+import copy
+import sys
+import time
+
+import opentimelineio as otio
+
+# the clip, its media reference and its marker
+OBJECTS_PER_CLIP = 3
+CLIPS_PER_TRACK = 10000
+
+
+def _build_timeline(num_objects):
+    timeline = otio.schema.Timeline(name="clone perf test")
+    num_clips = num_objects // OBJECTS_PER_CLIP
+    count = 2
+    track = None
+    for i in range(num_clips):
+        if i % CLIPS_PER_TRACK == 0:
+            track = otio.schema.Track(name="V{}".format(len(timeline.tracks)))
+            timeline.tracks.append(track)
+            count += 1
+        clip = otio.schema.Clip(
+            name="clip_{}".format(i),
+            media_reference=otio.schema.ExternalReference(
+                target_url="/media/clip_{}.mov".format(i),
+                available_range=otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(0, 24),
+                    otio.opentime.RationalTime(96, 24)
+                )
+            ),
+            source_range=otio.opentime.TimeRange(
+                otio.opentime.RationalTime(12, 24),
+                otio.opentime.RationalTime(48, 24)
+            ),
+            metadata={"shot": {"id": i, "tags": ["a", "b"]}}
+        )
+        clip.markers.append(
+            otio.schema.Marker(
+                name="note",
+                marked_range=otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(12, 24),
+                    otio.opentime.RationalTime(1, 24)
+                )
+            )
+        )
+        track.append(clip)
+        count += OBJECTS_PER_CLIP
+    return timeline, count
+
+
+def _time(function, repeat=3):
+    best = None
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - begin
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    num_objects = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+
+    timeline, count = _build_timeline(num_objects)
+    print("objects: {}".format(count))
+
+    for name, function in (
+        ("clone", timeline.clone),
+        ("deepcopy", lambda: copy.deepcopy(timeline)),
+    ):
+        elapsed = _time(function)
+        print(
+            "{:10s} {:8.3f} [s]  {:12.0f} objects/s".format(
+                name,
+                elapsed,
+                count / elapsed
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Benchmark slicing a track one edit at a time against apply_edits.
+
+Each slice on its own looks up the clip to cut in a time index that is
+rebuilt after every change, so the time per edit grows with the track.
+apply_edits applies a sorted run of slices in a single sweep.
+
+Usage: edit_perf_test.py [max_clips]
+"""
+
+import sys
+import time
+
+import opentimelineio as otio
+from opentimelineio.algorithms import edit
+
+
+def _build_track(num_clips):
+    track = otio.schema.Track(name="V1")
+    for i in range(num_clips):
+        track.append(
+            otio.schema.Clip(
+                name="clip_{}".format(i),
+                source_range=otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(0, 24),
+                    otio.opentime.RationalTime(48, 24)
+                )
+            )
+        )
+    return track
+
+
+def main():
+    max_clips = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    print("clips  one by one [s]  apply_edits [s]")
+
+    num_clips = 1000
+    while num_clips <= max_clips:
+        one_by_one = _build_track(num_clips)
+        batched = one_by_one.deepcopy()
+        times = [
+            otio.opentime.RationalTime(i * 48 + 17, 24)
+            for i in range(num_clips)
+        ]
+
+        begin = time.perf_counter()
+        for cut_time in times:
+            edit.slice(one_by_one, cut_time)
+        one_by_one_time = time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        edit.apply_edits(batched, [edit.Edit.slice(t) for t in times])
+        batched_time = time.perf_counter() - begin
+
+        print(
+            "{:8d}  {:.3f}  {:.3f}".format(
+                num_clips,
+                one_by_one_time,
+                batched_time
+            )
+        )
+        num_clips *= 2
+
+
+if __name__ == '__main__':
+    main()
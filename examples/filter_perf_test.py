@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Benchmark the filter algorithms on tracks of increasing size.
+
+Filtering is linear in the number of items, so the time per item should
+stay about the same as the track grows.
+
+Usage: filter_perf_test.py [max_items]
+"""
+
+import sys
+import time
+
+import opentimelineio as otio
+
+
+def _build_track(num_items):
+    track = otio.schema.Track(name="V1")
+    for i in range(num_items):
+        if i % 4 == 3:
+            track.append(
+                otio.schema.Transition(
+                    in_offset=otio.opentime.RationalTime(2, 24),
+                    out_offset=otio.opentime.RationalTime(2, 24)
+                )
+            )
+        else:
+            track.append(
+                otio.schema.Clip(
+                    name="clip_{}".format(i),
+                    source_range=otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(0, 24),
+                        otio.opentime.RationalTime(24, 24)
+                    )
+                )
+            )
+    return track
+
+
+def _no_transitions(item):
+    if isinstance(item, otio.schema.Transition):
+        return None
+    return item
+
+
+def main():
+    max_items = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    print("items  copy [s]  in place [s]  per item [us]")
+
+    num_items = 1000
+    while num_items <= max_items:
+        track = _build_track(num_items)
+
+        begin = time.perf_counter()
+        otio.algorithms.filtered_composition(track, _no_transitions)
+        copy_time = time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        otio.algorithms.filtered_composition(
+            track,
+            _no_transitions,
+            in_place=True
+        )
+        in_place_time = time.perf_counter() - begin
+
+        print(
+            "{:8d}  {:.3f}  {:.3f}  {:.2f}".format(
+                num_items,
+                copy_time,
+                in_place_time,
+                in_place_time / num_items * 1e6
+            )
+        )
+        num_items *= 10
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,267 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+// Benchmark flatten_stack against the previous recursive implementation,
+// which cloned a trimmed copy of the lower track for every gap, on stacks
+// of increasing size. The results of both are checked to be identical.
+
+#include <opentimelineio/clip.h>
+#include <opentimelineio/gap.h>
+#include <opentimelineio/stack.h>
+#include <opentimelineio/stackAlgorithm.h>
+#include <opentimelineio/track.h>
+#include <opentimelineio/trackAlgorithm.h>
+#include <opentimelineio/transition.h>
+
+#include <chrono>
+#include <cstdlib>
+#include <iostream>
+#include <map>
+
+namespace otio = opentimelineio::OPENTIMELINEIO_VERSION;
+
+using chrono_time_point = std::chrono::steady_clock::time_point;
+
+namespace legacy {
+
+typedef std::map<otio::Track*, std::map<otio::Composable*, otio::TimeRange>>
+    RangeTrackMap;
+typedef std::vector<otio::SerializableObject::Retainer<otio::Track>>
+    TrackRetainerVector;
+
+void
+flatten_next_item(
+    RangeTrackMap&                  range_track_map,
+    otio::Track*                    flat_track,
+    std::vector<otio::Track*> const& tracks,
+    int                             track_index,
+    std::optional<otio::TimeRange>  trim_range,
+    otio::ErrorStatus*              error_status)
+{
+    if (track_index < 0)
+    {
+        track_index = int(tracks.size()) - 1;
+    }
+    if (track_index < 0)
+    {
+        return;
+    }
+
+    otio::Track* track = tracks[track_index];
+
+    otio::SerializableObject::Retainer<otio::Track> track_retainer;
+    if (trim_range)
+    {
+        track = otio::track_trimmed_to_range(track, *trim_range, error_status);
+        if (track == nullptr || otio::is_error(error_status))
+        {
+            return;
+        }
+        track_retainer = otio::SerializableObject::Retainer<otio::Track>(track);
+    }
+
+    std::map<otio::Composable*, otio::TimeRange>* track_map;
+    auto it = range_track_map.find(track);
+    if (it != range_track_map.end())
+    {
+        track_map = &it->second;
+    }
+    else
+    {
+        auto result = range_track_map.emplace(
+            track,
+            track->range_of_all_children(error_status));
+        if (otio::is_error(error_status))
+        {
+            return;
+        }
+        track_map = &result.first->second;
+    }
+    for (auto child: track->children())
+    {
+        auto item = otio::dynamic_retainer_cast<otio::Item>(child);
+        if (!item || item->visible() || track_index == 0)
+        {
+            flat_track->insert_child(
+                static_cast<int>(flat_track->children().size()),
+                static_cast<otio::Composable*>(child->clone(error_status)),
+                error_status);
+            if (otio::is_error(error_status))
+            {
+                return;
+            }
+        }
+        else
+        {
+            otio::TimeRange trim = (*track_map)[item];
+            if (trim_range)
+            {
+                trim = otio::TimeRange(
+                    trim.start_time() + trim_range->start_time(),
+                    trim.duration());
+                (*track_map)[item] = trim;
+            }
+            flatten_next_item(
+                range_track_map,
+                flat_track,
+                tracks,
+                track_index - 1,
+                trim,
+                error_status);
+            if (otio::is_error(error_status))
+            {
+                return;
+            }
+        }
+    }
+
+    if (track_retainer)
+    {
+        range_track_map.erase(track_retainer);
+    }
+}
+
+otio::Track*
+flatten_stack(otio::Stack* in_stack, otio::ErrorStatus* error_status)
+{
+    std::vector<otio::Track*> tracks;
+    TrackRetainerVector       tracks_retainer;
+    for (auto c: in_stack->children())
+    {
+        if (auto track = otio::dynamic_retainer_cast<otio::Track>(c))
+        {
+            if (track->enabled())
+            {
+                tracks.push_back(track);
+            }
+        }
+    }
+
+    otio::RationalTime duration;
+    for (auto track: tracks)
+    {
+        duration = std::max(duration, track->duration(error_status));
+    }
+    for (size_t i = 0; i < tracks.size(); i++)
+    {
+        otio::RationalTime track_duration = tracks[i]->duration(error_status);
+        if (track_duration < duration)
+        {
+            auto new_track =
+                static_cast<otio::Track*>(tracks[i]->clone(error_status));
+            tracks_retainer.push_back(new_track);
+            new_track->append_child(
+                new otio::Gap(duration - track_duration),
+                error_status);
+            tracks[i] = new_track;
+        }
+    }
+
+    otio::Track* flat_track = new otio::Track;
+    flat_track->set_name("Flattened");
+
+    RangeTrackMap range_track_map;
+    flatten_next_item(
+        range_track_map,
+        flat_track,
+        tracks,
+        -1,
+        std::nullopt,
+        error_status);
+    return flat_track;
+}
+
+} // namespace legacy
+
+// Build a stack where every track alternates clips and gaps, with the
+// edit points of each track offset from the ones above so that the gaps
+// of a track show pieces of the tracks below.
+otio::Stack*
+build_stack(int num_tracks, int clips_per_track)
+{
+    auto stack = new otio::Stack("stack");
+    for (int t = 0; t < num_tracks; ++t)
+    {
+        auto track = new otio::Track("track");
+        const double offset = 3.0 * t;
+        if (t > 0)
+        {
+            track->append_child(new otio::Gap(otio::RationalTime(offset, 24)));
+        }
+        for (int i = 0; i < clips_per_track; ++i)
+        {
+            const double length = 20.0 + (i * 7 + t * 3) % 17;
+            if ((i + t) % 3 == 0 && t > 0)
+            {
+                track->append_child(
+                    new otio::Gap(otio::RationalTime(length, 24)));
+            }
+            else
+            {
+                track->append_child(new otio::Clip(
+                    "clip",
+                    nullptr,
+                    otio::TimeRange(
+                        otio::RationalTime(100.0 + i, 24),
+                        otio::RationalTime(length, 24))));
+            }
+        }
+        stack->append_child(track);
+    }
+    return stack;
+}
+
+double
+elapsed(chrono_time_point const& begin, chrono_time_point const& end)
+{
+    return std::chrono::duration<double>(end - begin).count();
+}
+
+int
+main(int argc, char** argv)
+{
+    const int num_tracks = argc > 1 ? std::atoi(argv[1]) : 8;
+    const int max_clips  = argc > 2 ? std::atoi(argv[2]) : 1000;
+
+    std::cout << "tracks  clips/track  legacy [s]  flatten_stack [s]  speed-up"
+              << std::endl;
+
+    for (int clips = std::max(1, max_clips / 16); clips <= max_clips;
+         clips *= 2)
+    {
+        otio::SerializableObject::Retainer<otio::Stack> stack(
+            build_stack(num_tracks, clips));
+        otio::ErrorStatus err;
+
+        auto begin = std::chrono::steady_clock::now();
+        otio::SerializableObject::Retainer<otio::Track> legacy_result(
+            legacy::flatten_stack(stack, &err));
+        auto   end         = std::chrono::steady_clock::now();
+        double legacy_time = elapsed(begin, end);
+
+        begin = std::chrono::steady_clock::now();
+        otio::SerializableObject::Retainer<otio::Track> result(
+            otio::flatten_stack(stack, &err));
+        end              = std::chrono::steady_clock::now();
+        double new_time = elapsed(begin, end);
+
+        if (otio::is_error(err))
+        {
+            std::cerr << "error: " << err.full_description << std::endl;
+            return 1;
+        }
+        if (legacy_result->to_json_string(&err)
+            != result->to_json_string(&err))
+        {
+            std::cerr << "error: results differ for " << clips
+                      << " clips per track" << std::endl;
+            return 1;
+        }
+
+        std::cout << num_tracks << "  " << clips << "  " << legacy_time
+                  << "  " << new_time << "  " << legacy_time / new_time
+                  << std::endl;
+    }
+
+    return 0;
+}
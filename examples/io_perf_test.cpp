@@ -4,10 +4,13 @@
 #include <iostream>
 
 #include "opentimelineio/clip.h"
+#include "opentimelineio/externalReference.h"
+#include "opentimelineio/marker.h"
 #include "opentimelineio/typeRegistry.h"
 #include "opentimelineio/serialization.h"
 #include "opentimelineio/deserialization.h"
 #include "opentimelineio/timeline.h"
+#include "opentimelineio/track.h"
 
 #include "util.h"
 
@@ -46,6 +49,39 @@ print_elapsed_time(
     return dur.count();
 }
 
+/// build a timeline of num_clips clips, each with a media reference, a marker
+/// and some metadata, for when no file is given
+otio::Timeline*
+build_timeline(int num_clips)
+{
+    otio::Timeline* timeline = new otio::Timeline("io_perf_test");
+    otio::Track*    track    = new otio::Track("V1");
+    timeline->tracks()->append_child(track);
+
+    for (int i = 0; i < num_clips; i++)
+    {
+        otio::Clip* clip = new otio::Clip(
+            "clip_" + std::to_string(i),
+            new otio::ExternalReference(
+                "/media/clip_" + std::to_string(i) + ".mov",
+                otio::TimeRange(
+                    otio::RationalTime(0, 24),
+                    otio::RationalTime(1000, 24))),
+            otio::TimeRange(
+                otio::RationalTime(i, 24),
+                otio::RationalTime(48, 24)));
+        clip->metadata()["index"] = int64_t(i);
+        clip->markers().push_back(new otio::Marker(
+            "note",
+            otio::TimeRange(
+                otio::RationalTime(i + 1, 24),
+                otio::RationalTime(0, 24))));
+        track->append_child(clip);
+    }
+
+    return timeline;
+}
+
 void
 print_version_map()
 {
@@ -75,7 +111,8 @@ main(
 
     if (argc < 2) 
     {
-        std::cerr << "usage: otio_io_perf_test path/to/timeline.otio ";
+        std::cerr << "usage: otio_io_perf_test ";
+        std::cerr << "(path/to/timeline.otio | --clips N) ";
         std::cerr << "[--keep-tmp]" << std::endl;
         return 1;
     }
@@ -135,25 +172,44 @@ main(
     std::any tl;
     std::string fname = std::string(argv[1]);
 
-    // read file
-    chrono_time_point begin = std::chrono::steady_clock::now();
-    otio::SerializableObject::Retainer<otio::Timeline> timeline(
-            dynamic_cast<otio::Timeline*>(
+    chrono_time_point begin;
+    chrono_time_point end;
+    otio::SerializableObject::Retainer<otio::Timeline> timeline;
+
+    if (fname == "--clips")
+    {
+        const int num_clips = argc > 2 ? std::stoi(argv[2]) : 100000;
+        keep_tmp = argc > 3 && std::string(argv[3]) == "--keep-tmp";
+
+        begin = std::chrono::steady_clock::now();
+        timeline = build_timeline(num_clips);
+        end = std::chrono::steady_clock::now();
+        print_elapsed_time(
+                "build_timeline [" + std::to_string(num_clips) + " clips]",
+                begin,
+                end
+        );
+    }
+    else
+    {
+        // read file
+        begin = std::chrono::steady_clock::now();
+        timeline = dynamic_cast<otio::Timeline*>(
                 otio::Timeline::from_json_file(
                     examples::normalize_path(argv[1]),
                     &err
                 )
-            )
-    );
-    chrono_time_point end = std::chrono::steady_clock::now();
-    assert(!otio::is_error(err));
-    if (!timeline)
-    {
-        examples::print_error(err);
-        return 1;
-    }
+        );
+        end = std::chrono::steady_clock::now();
+        assert(!otio::is_error(err));
+        if (!timeline)
+        {
+            examples::print_error(err);
+            return 1;
+        }
 
-    print_elapsed_time("deserialize_json_from_file", begin, end);
+        print_elapsed_time("deserialize_json_from_file", begin, end);
+    }
 
 
     double str_dg, str_nodg;
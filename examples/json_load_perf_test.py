@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Measure the time and peak memory it takes to load a .otio file.
+
+The file is loaded in a separate process, so that the peak memory reported
+is that of the load alone.  If no file is given, a timeline with num_clips
+clips is written to a temporary file and loaded.
+
+Usage: json_load_perf_test.py [num_clips | file.otio] [--runs N] [--threads N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import opentimelineio as otio
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+
+def _build_timeline(num_clips):
+    timeline = otio.schema.Timeline(name="json_load_perf_test")
+    for track_index in range(4):
+        track = otio.schema.Track(name="V{}".format(track_index + 1))
+        timeline.tracks.append(track)
+
+        for i in range(num_clips // 4):
+            clip = otio.schema.Clip(
+                name="clip_{}".format(i),
+                media_reference=otio.schema.ExternalReference(
+                    target_url="/media/clip_{}.mov".format(i),
+                    available_range=otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(0, 24),
+                        otio.opentime.RationalTime(1000, 24)
+                    )
+                ),
+                source_range=otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(i, 24),
+                    otio.opentime.RationalTime(48, 24)
+                ),
+                metadata={"index": i, "tags": ["a", "b", "c"]}
+            )
+            clip.markers.append(
+                otio.schema.Marker(
+                    name="note",
+                    marked_range=otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(i + 1, 24),
+                        otio.opentime.RationalTime(0, 24)
+                    )
+                )
+            )
+            track.append(clip)
+
+    return timeline
+
+
+def _load(path, num_threads):
+    begin = time.perf_counter()
+    otio.adapters.read_from_file(path, num_threads=num_threads)
+    elapsed = time.perf_counter() - begin
+
+    peak_rss = "n/a"
+    if resource is not None:
+        # kilobytes on linux, bytes on macOS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            max_rss //= 1024
+        peak_rss = "{:.0f} MB".format(max_rss / 1024)
+
+    print("load: {:.3f} [s], peak rss: {}".format(elapsed, peak_rss))
+
+
+def _run(path, runs, num_threads):
+    print(
+        "{}: {:.1f} MB".format(
+            os.path.basename(path),
+            os.path.getsize(path) / 1e6
+        )
+    )
+    for _ in range(runs):
+        subprocess.check_call(
+            [
+                sys.executable,
+                os.path.abspath(__file__),
+                "--load",
+                path,
+                "--threads",
+                str(num_threads)
+            ]
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("input", nargs="?", default="100000")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        help="number of threads to parse on, or 0 for one per core"
+    )
+    parser.add_argument("--load", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.load:
+        _load(args.load, args.threads)
+        return
+
+    if os.path.exists(args.input):
+        _run(args.input, args.runs, args.threads)
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "timeline.otio")
+        otio.adapters.write_to_file(_build_timeline(int(args.input)), path)
+        _run(path, args.runs, args.threads)
+
+
+if __name__ == '__main__':
+    main()
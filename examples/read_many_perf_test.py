@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Benchmark reading many .otio files with an increasing number of threads.
+
+The otio_json adapter releases the GIL while parsing, so
+otio.adapters.read_many should get faster as threads are added (up to the
+number of cores on the machine).
+
+Usage: read_many_perf_test.py [num_files] [clips_per_file]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import opentimelineio as otio
+
+
+def _build_timeline(name, num_clips):
+    timeline = otio.schema.Timeline(name=name)
+    track = otio.schema.Track(name="V1")
+    timeline.tracks.append(track)
+
+    for i in range(num_clips):
+        track.append(
+            otio.schema.Clip(
+                name="clip_{}".format(i),
+                media_reference=otio.schema.ExternalReference(
+                    target_url="/media/clip_{}.mov".format(i)
+                ),
+                source_range=otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(i, 24),
+                    otio.opentime.RationalTime(48, 24)
+                ),
+                metadata={"index": i, "tags": ["a", "b", "c"]}
+            )
+        )
+
+    return timeline
+
+
+def main():
+    num_files = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    num_clips = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = []
+        for i in range(num_files):
+            path = os.path.join(temp_dir, "timeline_{}.otio".format(i))
+            otio.adapters.write_to_file(
+                _build_timeline("timeline_{}".format(i), num_clips),
+                path
+            )
+            paths.append(path)
+
+        print(
+            "Reading {} files of {} clips each ({} cores)".format(
+                num_files,
+                num_clips,
+                os.cpu_count()
+            )
+        )
+
+        baseline = None
+        workers = 1
+        while workers <= max(1, os.cpu_count() or 1) * 2:
+            begin = time.perf_counter()
+            otio.adapters.read_many(paths, max_workers=workers)
+            elapsed = time.perf_counter() - begin
+
+            if baseline is None:
+                baseline = elapsed
+
+            print(
+                "{:3d} threads: {:.3f} [s] ({:.2f}x)".format(
+                    workers,
+                    elapsed,
+                    baseline / elapsed
+                )
+            )
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main()
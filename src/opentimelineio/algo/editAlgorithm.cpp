@@ -11,6 +11,10 @@
 #include "opentimelineio/track.h"
 #include "opentimelineio/transition.h"
 
+#include <algorithm>
+#include <memory>
+#include <set>
+
 namespace otime = opentime::OPENTIME_VERSION;
 
 using otime::RationalTime;
@@ -195,74 +199,132 @@ overwrite(
         }
         else
         {
-            // Determine if the first item is partially overwritten.
-            int       insert_index = composition->index_of_child(items.front());
-            bool      first_partial = false;
-            TimeRange first_source_range;
-            if (item_range.start_time() < range.start_time())
-            {
-                first_partial                 = true;
-                const TimeRange trimmed_range = items.front()->trimmed_range();
-                first_source_range            = TimeRange(
-                    trimmed_range.start_time(),
-                    range.start_time() - item_range.start_time());
-                ++insert_index;
-            }
+            // The item overwrites the end of the first item, the start of
+            // the last one and all of the items in between. A range that
+            // starts before the composition is moved to its start.
+            const TimeRange overwrite_range(
+                std::max(range.start_time(), composition_range.start_time()),
+                range.duration());
+            const RationalTime range_end = overwrite_range.end_time_exclusive();
 
-            // Determine if the last item is partially overwritten.
-            bool      last_partial = false;
-            TimeRange last_source_range;
-            if (items.size() >= 1)
+            Item*              head_item    = nullptr;
+            Item*              tail_item    = nullptr;
+            TimeRange          tail_range;
+            int                insert_index = -1;
+            std::vector<Item*> removed_items;
+
+            // The search for the items compares inclusive end times, which
+            // misses items with fractional durations, so the neighbors of
+            // the items found are checked too. The ranges are all found
+            // before any of the items change.
+            std::vector<Item*>     overlapped_items;
+            std::vector<TimeRange> child_ranges;
+            const auto&            children = composition->children();
+            for (size_t index = std::max(
+                     composition->index_of_child(items.front()) - 1,
+                     0);
+                 index < children.size();
+                 ++index)
             {
-                item_range =
-                    composition->trimmed_range_of_child(items.back()).value();
-                if (item_range.end_time_inclusive()
-                    > range.end_time_inclusive())
+                auto child = dynamic_cast<Item*>(children[index].value);
+                if (!child)
                 {
-                    last_partial = true;
-                    const TimeRange trimmed_range =
-                        items.back()->trimmed_range();
-                    RationalTime duration = item_range.end_time_inclusive()
-                                            - range.end_time_inclusive();
-                    if (items.size() == 1)
-                    {
-                        duration += range.start_time();
-                        last_source_range = TimeRange(
-                            trimmed_range.start_time() + range.duration(),
-                            duration);
-                    }
-                    else
-                    {
-                        last_source_range = TimeRange(
-                            trimmed_range.start_time() + duration,
-                            trimmed_range.duration() - duration);
-                    }
+                    continue;
+                }
+                const TimeRange child_range =
+                    composition->trimmed_range_of_child_at_index(
+                        int(index),
+                        error_status);
+                if (child_range.start_time() >= range_end)
+                {
+                    break;
                 }
+                overlapped_items.push_back(child);
+                child_ranges.push_back(child_range);
             }
 
-            // Adjust the first and last items.
-            if (first_partial)
+            for (size_t i = 0; i < overlapped_items.size(); ++i)
             {
-                items.front()->set_source_range(first_source_range);
-                items.erase(items.begin());
+                Item* const        child       = overlapped_items[i];
+                const TimeRange    child_range = child_ranges[i];
+                const RationalTime child_end   = child_range.end_time_exclusive();
+                if (child_end <= overwrite_range.start_time()
+                    || child_range.start_time() >= range_end)
+                {
+                    // The child only touches the range.
+                    continue;
+                }
+
+                if (insert_index < 0)
+                {
+                    insert_index = composition->index_of_child(child);
+                }
+
+                const TimeRange trimmed_range = child->trimmed_range();
+                const bool keeps_head =
+                    child_range.start_time() < overwrite_range.start_time();
+                const bool keeps_tail = child_end > range_end;
+                if (keeps_tail)
+                {
+                    const RationalTime cut =
+                        range_end - child_range.start_time();
+                    tail_item  = keeps_head
+                                     ? dynamic_cast<Item*>(child->clone())
+                                     : child;
+                    tail_range = TimeRange(
+                        trimmed_range.start_time() + cut,
+                        trimmed_range.duration() - cut);
+                }
+                if (keeps_head)
+                {
+                    head_item = child;
+                    child->set_source_range(TimeRange(
+                        trimmed_range.start_time(),
+                        overwrite_range.start_time()
+                            - child_range.start_time()));
+                }
+                else if (!keeps_tail)
+                {
+                    removed_items.push_back(child);
+                }
             }
-            if (last_partial)
+
+            // Remove the completely overwritten items.
+            for (auto removed_item : removed_items)
             {
-                items.back()->set_source_range(last_source_range);
-                items.erase(items.end() - 1);
+                composition->remove_child(
+                    composition->index_of_child(removed_item));
             }
 
-            // Remove the completely overwritten items.
-            while (!items.empty())
+            if (tail_item)
             {
-                composition->remove_child(items.back());
-                items.pop_back();
+                tail_item->set_source_range(tail_range);
+                if (tail_item != head_item && !tail_item->parent())
+                {
+                    composition->insert_child(
+                        head_item ? composition->index_of_child(head_item) + 1
+                                  : insert_index,
+                        tail_item);
+                }
             }
 
             // Insert the item.
+            if (head_item)
+            {
+                insert_index = composition->index_of_child(head_item) + 1;
+            }
+            else if (tail_item)
+            {
+                insert_index = composition->index_of_child(tail_item);
+            }
+            else if (insert_index < 0)
+            {
+                insert_index = int(composition->children().size());
+            }
             const TimeRange trimmed_range = item->trimmed_range();
-            item->set_source_range(
-                TimeRange(trimmed_range.start_time(), range.duration()));
+            item->set_source_range(TimeRange(
+                trimmed_range.start_time(),
+                overwrite_range.duration()));
             composition->insert_child(insert_index, item);
         }
     }
@@ -882,5 +944,681 @@ void remove(
         composition->insert_child(index, fill_template);
     }
 }
-            
+
+namespace
+{
+
+// Apply slice, insert, overwrite and remove edits to a track in one sweep.
+//
+// The functions above find the item at a time with child_at_time(), and the
+// time index behind it is rebuilt after every change, so each edit costs
+// O(M) for a track of M children. The sweep keeps the children it has
+// reached in a vector, with their start times, and takes the rest from the
+// track as it moves forward. An edit finds its item by bisection and only
+// moves the children after it in the vector, so N edits sorted by time
+// cost about O((N + M) log M). The track itself is only written back by
+// finish().
+//
+// The sweep only takes the cases where it gives the same result as the
+// functions above: a track without a source range whose children are
+// items, but not compositions, of a single rate. apply() declines anything
+// else (an edit at another rate, a range over several items, an item that
+// already has a parent, ...), and the caller then finishes the sweep and
+// applies the edit with the functions above.
+class EditSweep
+{
+public:
+    explicit EditSweep(Track* track);
+
+    bool valid() const { return _valid; }
+
+    static bool handles(Edit::Kind kind)
+    {
+        return kind == Edit::Kind::Slice || kind == Edit::Kind::Insert
+               || kind == Edit::Kind::Overwrite || kind == Edit::Kind::Remove;
+    }
+
+    bool apply(Edit const& edit);
+
+    void finish();
+
+private:
+    struct Entry
+    {
+        SerializableObject::Retainer<Item> item;
+        RationalTime                       start;
+        RationalTime                       duration;
+    };
+
+    bool _slice(RationalTime const& time);
+    bool _insert(
+        Item*               insert_item,
+        RationalTime const& time,
+        Item*               fill_template);
+    bool _overwrite(Item* item, TimeRange const& range, Item* fill_template);
+    bool _remove(RationalTime const& time, bool fill, Item* fill_template);
+
+    // Append item (and a fill before it) past the end of the track.
+    bool _append(Item* item, RationalTime const& time, Item* fill_template);
+
+    bool _accepts(Item* item) const;
+
+    RationalTime _end() const;
+    void         _pull(RationalTime const& time);
+    void         _pull(size_t count);
+    bool         _find(RationalTime const& time, size_t& index) const;
+    void         _insert_entry(size_t index, Item* item);
+    void         _update_from(size_t index);
+
+    Track*                                          _track;
+    std::vector<SerializableObject::Retainer<Item>> _children;
+    std::vector<RationalTime>                       _durations;
+    size_t                                          _next = 0;
+    std::vector<Entry>                              _entries;
+    std::set<Item const*>                           _used;
+    double                                          _rate  = 0;
+    bool                                            _valid = false;
+};
+
+EditSweep::EditSweep(Track* track)
+    : _track(track)
+{
+    if (track->source_range() || track->children().empty())
+    {
+        return;
+    }
+
+    _children.reserve(track->children().size());
+    _durations.reserve(track->children().size());
+    for (const auto& child: track->children())
+    {
+        auto item = dynamic_retainer_cast<Item>(child);
+        if (!item || dynamic_retainer_cast<Composition>(child))
+        {
+            return;
+        }
+
+        ErrorStatus        error_status;
+        const RationalTime duration = item->duration(&error_status);
+        if (is_error(error_status) || duration.value() < 0.0
+            || (!_durations.empty() && duration.rate() != _rate))
+        {
+            return;
+        }
+
+        _rate = duration.rate();
+        _children.push_back(item);
+        _durations.push_back(duration);
+    }
+
+    // Below a rate of one, the duration of the track is kept at a different
+    // rate than the sum of its children.
+    _valid = _rate >= 1.0;
+}
+
+bool
+EditSweep::apply(Edit const& edit)
+{
+    switch (edit.kind)
+    {
+        case Edit::Kind::Slice:
+            return edit.time.rate() == _rate && _slice(edit.time);
+        case Edit::Kind::Insert:
+            return edit.time.rate() == _rate
+                   && _insert(edit.item, edit.time, edit.fill_template);
+        case Edit::Kind::Overwrite:
+            return edit.range.start_time().rate() == _rate
+                   && edit.range.duration().rate() == _rate
+                   && _overwrite(edit.item, edit.range, edit.fill_template);
+        case Edit::Kind::Remove:
+            return edit.time.rate() == _rate
+                   && _remove(edit.time, edit.fill, edit.fill_template);
+        default:
+            return false;
+    }
+}
+
+void
+EditSweep::finish()
+{
+    std::vector<Composable*> children;
+    children.reserve(_entries.size() + _children.size() - _next);
+    for (const auto& entry: _entries)
+    {
+        children.push_back(entry.item);
+    }
+    for (size_t i = _next; i < _children.size(); ++i)
+    {
+        children.push_back(_children[i]);
+    }
+
+    _track->clear_children();
+    _track->set_children(children);
+}
+
+bool
+EditSweep::_slice(RationalTime const& time)
+{
+    size_t index = 0;
+    _pull(time);
+    if (!_find(time, index))
+    {
+        return false;
+    }
+
+    Item* const     item  = _entries[index].item;
+    const TimeRange range = TimeRange(
+        _entries[index].start,
+        _entries[index].duration);
+
+    // Check for slice at start of clip (invalid slice)
+    const RationalTime duration = time - range.start_time();
+    if (isEqual(duration.value(), 0.0))
+    {
+        return true;
+    }
+
+    // Adjust the source range for the first slice.
+    const TimeRange first_source_range(
+        item->trimmed_range().start_time(),
+        duration);
+    item->set_source_range(first_source_range);
+    _entries[index].duration = duration;
+
+    // Clone the item for the second slice.
+    const TimeRange second_source_range(
+        first_source_range.start_time() + first_source_range.duration(),
+        range.duration() - first_source_range.duration());
+    if (!isEqual(second_source_range.duration().value(), 0.0))
+    {
+        SerializableObject::Retainer<Item> second_item(
+            dynamic_cast<Item*>(item->clone()));
+        second_item->set_source_range(second_source_range);
+        _insert_entry(index + 1, second_item);
+    }
+    return true;
+}
+
+bool
+EditSweep::_insert(
+    Item*               insert_item,
+    RationalTime const& time,
+    Item*               fill_template)
+{
+    if (!_accepts(insert_item) || time < RationalTime(0.0, _rate))
+    {
+        return false;
+    }
+
+    size_t index = 0;
+    _pull(time);
+    if (!_find(time, index))
+    {
+        return _append(insert_item, time, fill_template);
+    }
+
+    Item* const     item  = _entries[index].item;
+    const TimeRange range = TimeRange(
+        _entries[index].start,
+        _entries[index].duration);
+    size_t insert_index = index;
+
+    // Item is partially split
+    bool            split = false;
+    const TimeRange first_source_range(
+        item->trimmed_range().start_time(),
+        time - range.start_time());
+    if (!isEqual(first_source_range.duration().value(), 0.0))
+    {
+        split = true;
+        item->set_source_range(first_source_range);
+        _entries[index].duration = first_source_range.duration();
+        ++insert_index;
+    }
+
+    // Insert the new item
+    _insert_entry(insert_index, insert_item);
+    const TimeRange insert_range(
+        _entries[insert_index].start,
+        _entries[insert_index].duration);
+
+    // Second item from splitting item
+    if (split)
+    {
+        const TimeRange second_source_range(
+            first_source_range.start_time() + insert_range.start_time()
+                + insert_range.duration(),
+            range.end_time_exclusive() - time);
+        if (!isEqual(second_source_range.duration().value(), 0.0))
+        {
+            SerializableObject::Retainer<Item> second_item(
+                dynamic_cast<Item*>(item->clone()));
+            second_item->set_source_range(second_source_range);
+            _insert_entry(insert_index + 1, second_item);
+        }
+    }
+    return true;
+}
+
+bool
+EditSweep::_overwrite(
+    Item*            item,
+    TimeRange const& range,
+    Item*            fill_template)
+{
+    const RationalTime start_time = range.start_time();
+    if (!_accepts(item) || start_time < RationalTime(0.0, _rate))
+    {
+        return false;
+    }
+
+    size_t index = 0;
+    _pull(start_time);
+    if (!_find(start_time, index))
+    {
+        return _append(item, start_time, fill_template);
+    }
+    _pull(index + 2);
+
+    // Only the case where the range is inside a single item: that item must
+    // be the only one find_children() returns for the range.
+    const TimeRange item_range(
+        _entries[index].start,
+        _entries[index].duration);
+    if (!item_range.contains(range, 0.0)
+        || item_range.end_time_inclusive() < start_time
+        || (index > 0
+            && TimeRange(_entries[index - 1].start, _entries[index - 1].duration)
+                       .end_time_inclusive()
+                   >= start_time)
+        || (index + 1 < _entries.size()
+            && _entries[index + 1].start <= range.end_time_inclusive()))
+    {
+        return false;
+    }
+
+    SerializableObject::Retainer<Item> first_item = _entries[index].item;
+
+    bool is_fill_fit = false;
+
+    // We check if we are replacing a gap with a clip with timewarp,
+    // which is the special case of fill() ReferencePoint::Fit.
+    if (dynamic_retainer_cast<Gap>(first_item))
+    {
+        for (const auto& effect: item->effects())
+        {
+            if (dynamic_retainer_cast<LinearTimeWarp>(effect))
+            {
+                is_fill_fit = true;
+                break;
+            }
+        }
+    }
+
+    // The item overwrites a portion inside an item.
+    const RationalTime first_duration =
+        range.start_time() - item_range.start_time();
+    const RationalTime second_duration =
+        item_range.duration() - range.duration() - first_duration;
+    size_t          insert_index  = index;
+    const TimeRange trimmed_range = first_item->trimmed_range();
+    if (isEqual(first_duration.value(), 0.0))
+    {
+        _entries.erase(_entries.begin() + index);
+    }
+    else
+    {
+        first_item->set_source_range(
+            TimeRange(trimmed_range.start_time(), first_duration));
+        _entries[index].duration = first_duration;
+        ++insert_index;
+    }
+    if (range.duration() < item->trimmed_range().duration() && !is_fill_fit)
+    {
+        item->set_source_range(
+            TimeRange(trimmed_range.start_time(), range.duration()));
+    }
+    _insert_entry(insert_index, item);
+    if (!isEqual(second_duration.value(), 0.0))
+    {
+        SerializableObject::Retainer<Item> second_item(
+            dynamic_cast<Item*>(first_item->clone()));
+        second_item->set_source_range(TimeRange(
+            second_item->trimmed_range().start_time() + first_duration
+                + range.duration(),
+            second_duration));
+        _insert_entry(insert_index + 1, second_item);
+    }
+    return true;
+}
+
+bool
+EditSweep::_remove(RationalTime const& time, bool fill, Item* fill_template)
+{
+    size_t index = 0;
+    _pull(time);
+    if (time < RationalTime(0.0, _rate) || !_find(time, index))
+    {
+        return false;
+    }
+
+    // insert_child() leaves out a fill template that already has a parent.
+    bool use_template = false;
+    if (fill && fill_template)
+    {
+        if (fill_template->parent() == _track)
+        {
+            return false;
+        }
+        use_template = !fill_template->parent() && !_used.count(fill_template);
+        if (use_template && !_accepts(fill_template))
+        {
+            return false;
+        }
+    }
+
+    const TimeRange item_range = _entries[index].item->trimmed_range();
+    _entries.erase(_entries.begin() + index);
+    if (fill && !fill_template)
+    {
+        _insert_entry(index, new Gap(item_range));
+    }
+    else if (use_template)
+    {
+        _insert_entry(index, fill_template);
+    }
+    else
+    {
+        _update_from(index);
+    }
+    return true;
+}
+
+bool
+EditSweep::_append(Item* item, RationalTime const& time, Item* fill_template)
+{
+    if (_next < _children.size())
+    {
+        return false;
+    }
+
+    // Append the item and a possible fill (gap).
+    const RationalTime fill_duration = time - _end();
+    if (!isEqual(fill_duration.value(), 0.0))
+    {
+        const TimeRange fill_range = TimeRange(
+            RationalTime(0.0, fill_duration.rate()),
+            fill_duration);
+        if (!fill_template)
+        {
+            _insert_entry(_entries.size(), new Gap(fill_range));
+        }
+        else if (fill_template->parent() == _track)
+        {
+            return false;
+        }
+        else if (!fill_template->parent() && !_used.count(fill_template))
+        {
+            // append_child() leaves out a template that has a parent
+            if (!_accepts(fill_template))
+            {
+                return false;
+            }
+            _insert_entry(_entries.size(), fill_template);
+        }
+    }
+    _insert_entry(_entries.size(), item);
+    return true;
+}
+
+bool
+EditSweep::_accepts(Item* item) const
+{
+    if (!item || item->parent() || _used.count(item)
+        || dynamic_cast<Composition*>(item))
+    {
+        return false;
+    }
+
+    ErrorStatus        error_status;
+    const RationalTime duration = item->duration(&error_status);
+    return !is_error(error_status) && duration.rate() == _rate
+           && duration.value() >= 0.0;
+}
+
+RationalTime
+EditSweep::_end() const
+{
+    if (_entries.empty())
+    {
+        return RationalTime(0.0, _rate);
+    }
+    return _entries.back().start + _entries.back().duration;
+}
+
+// Take children from the track until the entries reach past time.
+void
+EditSweep::_pull(RationalTime const& time)
+{
+    while (_next < _children.size() && _end() <= time)
+    {
+        _pull(_entries.size() + 1);
+    }
+}
+
+// Take children from the track until there are count entries.
+void
+EditSweep::_pull(size_t count)
+{
+    while (_next < _children.size() && _entries.size() < count)
+    {
+        _entries.push_back({ _children[_next], _end(), _durations[_next] });
+        ++_next;
+    }
+}
+
+// Find the entry that contains time, like child_at_time().
+bool
+EditSweep::_find(RationalTime const& time, size_t& index) const
+{
+    auto it = std::upper_bound(
+        _entries.begin(),
+        _entries.end(),
+        time,
+        [](RationalTime const& time, Entry const& entry) {
+            return time < entry.start;
+        });
+    if (it == _entries.begin())
+    {
+        return false;
+    }
+
+    index = static_cast<size_t>(it - _entries.begin()) - 1;
+    return TimeRange(_entries[index].start, _entries[index].duration)
+        .contains(time);
+}
+
+void
+EditSweep::_insert_entry(size_t index, Item* item)
+{
+    _used.insert(item);
+    _entries.insert(
+        _entries.begin() + index,
+        { item, RationalTime(), item->duration() });
+    _update_from(index);
+}
+
+// Update the start times from index on, summing the durations in order
+// the way the track does.
+void
+EditSweep::_update_from(size_t index)
+{
+    for (size_t i = index; i < _entries.size(); ++i)
+    {
+        _entries[i].start = i == 0 ? RationalTime(0.0, _rate)
+                                   : _entries[i - 1].start
+                                         + _entries[i - 1].duration;
+    }
+}
+
+void
+apply_edit(Composition* composition, Edit const& edit, ErrorStatus* error_status)
+{
+    switch (edit.kind)
+    {
+        case Edit::Kind::Trim:
+        case Edit::Kind::Slip:
+        case Edit::Kind::Slide:
+        case Edit::Kind::Ripple:
+        case Edit::Kind::Roll:
+            if (!edit.item || edit.item->parent() != composition)
+            {
+                *error_status = ErrorStatus(
+                    ErrorStatus::NOT_A_CHILD_OF,
+                    "item is not a child of the composition",
+                    edit.item);
+                return;
+            }
+            break;
+        case Edit::Kind::Overwrite:
+        case Edit::Kind::Insert:
+        case Edit::Kind::Fill:
+            if (!edit.item)
+            {
+                *error_status = ErrorStatus(
+                    ErrorStatus::NOT_AN_ITEM,
+                    "edit requires an item");
+                return;
+            }
+            break;
+        default:
+            break;
+    }
+
+    switch (edit.kind)
+    {
+        case Edit::Kind::Overwrite:
+            overwrite(
+                edit.item,
+                composition,
+                edit.range,
+                edit.remove_transitions,
+                edit.fill_template,
+                error_status);
+            break;
+        case Edit::Kind::Insert:
+            insert(
+                edit.item,
+                composition,
+                edit.time,
+                edit.remove_transitions,
+                edit.fill_template,
+                error_status);
+            break;
+        case Edit::Kind::Trim:
+            trim(
+                edit.item,
+                edit.delta_in,
+                edit.delta_out,
+                edit.fill_template,
+                error_status);
+            break;
+        case Edit::Kind::Slice:
+            slice(composition, edit.time, edit.remove_transitions, error_status);
+            break;
+        case Edit::Kind::Slip:
+            slip(edit.item, edit.delta_in);
+            break;
+        case Edit::Kind::Slide:
+            slide(edit.item, edit.delta_in);
+            break;
+        case Edit::Kind::Ripple:
+            ripple(edit.item, edit.delta_in, edit.delta_out, error_status);
+            break;
+        case Edit::Kind::Roll:
+            roll(edit.item, edit.delta_in, edit.delta_out, error_status);
+            break;
+        case Edit::Kind::Fill:
+            fill(
+                edit.item,
+                composition,
+                edit.time,
+                edit.reference_point,
+                error_status);
+            break;
+        case Edit::Kind::Remove:
+            remove(
+                composition,
+                edit.time,
+                edit.fill,
+                edit.fill_template,
+                error_status);
+            break;
+    }
+}
+
+} // namespace
+
+void
+apply_edits(
+    Composition*             composition,
+    std::vector<Edit> const& edits,
+    ErrorStatus*             error_status)
+{
+    // Runs of slice, insert, overwrite and remove edits on a track go
+    // through a sweep. The other edits, and the ones the sweep declines, are
+    // applied one at a time, after writing back the sweep.
+    Track* const               track     = dynamic_cast<Track*>(composition);
+    bool                       can_sweep = track != nullptr;
+    std::unique_ptr<EditSweep> sweep;
+
+    for (size_t i = 0; i < edits.size(); ++i)
+    {
+        const Edit& edit = edits[i];
+
+        if (can_sweep && EditSweep::handles(edit.kind))
+        {
+            if (!sweep && !track->children().empty())
+            {
+                sweep = std::make_unique<EditSweep>(track);
+                if (!sweep->valid())
+                {
+                    sweep.reset();
+                    can_sweep = false;
+                }
+            }
+            if (sweep && sweep->apply(edit))
+            {
+                continue;
+            }
+        }
+
+        if (sweep)
+        {
+            sweep->finish();
+            sweep.reset();
+        }
+
+        ErrorStatus edit_error_status;
+        apply_edit(composition, edit, &edit_error_status);
+        if (is_error(edit_error_status))
+        {
+            if (error_status)
+            {
+                *error_status = ErrorStatus(
+                    edit_error_status.outcome,
+                    "edit " + std::to_string(i) + ": "
+                        + edit_error_status.details,
+                    edit_error_status.object_details);
+            }
+            return;
+        }
+    }
+
+    if (sweep)
+    {
+        sweep->finish();
+    }
+}
+
 }}} // namespace opentimelineio::OPENTIMELINEIO_VERSION::algo
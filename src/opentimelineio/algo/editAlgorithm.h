@@ -5,6 +5,8 @@
 
 #include "opentimelineio/composition.h"
 
+#include <vector>
+
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION { namespace algo {
 
 //! Enum used by 3/4 Point Edit (aka. as fill)
@@ -214,4 +216,70 @@ void remove(
     Item*               fill_template = nullptr,
     ErrorStatus*        error_status = nullptr);
 
+//
+// A single edit, to be applied by apply_edits().
+//
+// Each kind of edit takes the arguments of the function of the same name:
+//
+//   Overwrite: item, range, remove_transitions, fill_template
+//      Insert: item, time, remove_transitions, fill_template
+//        Trim: item, delta_in, delta_out, fill_template
+//       Slice: time, remove_transitions
+//        Slip: item, delta_in (the delta)
+//       Slide: item, delta_in (the delta)
+//      Ripple: item, delta_in, delta_out
+//        Roll: item, delta_in, delta_out
+//        Fill: item, time, reference_point
+//      Remove: time, fill, fill_template
+//
+struct Edit
+{
+    enum class Kind
+    {
+        Overwrite,
+        Insert,
+        Trim,
+        Slice,
+        Slip,
+        Slide,
+        Ripple,
+        Roll,
+        Fill,
+        Remove
+    };
+
+    Kind                               kind;
+    SerializableObject::Retainer<Item> item;
+    TimeRange                          range     = TimeRange();
+    RationalTime                       time      = RationalTime();
+    RationalTime                       delta_in  = RationalTime();
+    RationalTime                       delta_out = RationalTime();
+    bool                               remove_transitions = true;
+    bool                               fill               = true;
+    SerializableObject::Retainer<Item> fill_template;
+    ReferencePoint                     reference_point = ReferencePoint::Source;
+};
+
+//
+// Apply a list of edits to a composition, in order.
+//
+// composition = usually a track item.
+//       edits = the edits to apply.
+//
+// The edits that take an item (other than Overwrite, Insert and Fill) apply
+// to an item of the composition.
+//
+// On a track, runs of Slice, Insert, Overwrite and Remove edits are applied
+// in a single sweep over the track, with the same result as applying them
+// one at a time. Sorting such a run by time makes it about
+// O((N + M) log M) for N edits on a track of M children, instead of
+// O(N * M).
+//
+// Stops at the first edit that fails; the edits before it stay applied.
+//
+void apply_edits(
+    Composition*             composition,
+    std::vector<Edit> const& edits,
+    ErrorStatus*             error_status = nullptr);
+
 }}} // namespace opentimelineio::OPENTIMELINEIO_VERSION::algo
@@ -9,6 +9,7 @@
 #include <assert.h>
 #include <map>
 #include <string>
+#include <utility>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
@@ -44,6 +45,14 @@ public:
         , _mutation_stamp{}
     {}
 
+    /// @brief Move a dictionary, which leaves the other dictionary empty.
+    AnyDictionary(AnyDictionary&& other)
+        : map(std::move(static_cast<map&>(other)))
+        , _mutation_stamp{}
+    {
+        other.mutate();
+    }
+
     /// @brief Destructor.
     ~AnyDictionary()
     {
@@ -67,7 +76,7 @@ public:
     {
         mutate();
         other.mutate();
-        map::operator=(other);
+        map::operator=(std::move(static_cast<map&>(other)));
         return *this;
     }
 
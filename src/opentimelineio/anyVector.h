@@ -7,6 +7,7 @@
 
 #include <any>
 #include <assert.h>
+#include <utility>
 #include <vector>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
@@ -39,6 +40,12 @@ public:
         , _mutation_stamp{ nullptr }
     {}
 
+    /// @brief Move a vector, which leaves the other vector empty.
+    AnyVector(AnyVector&& other)
+        : vector(std::move(static_cast<vector&>(other)))
+        , _mutation_stamp{ nullptr }
+    {}
+
     /// @brief Destructor.
     ~AnyVector()
     {
@@ -58,7 +65,7 @@ public:
     /// @brief Move operator.
     AnyVector& operator=(AnyVector&& other)
     {
-        vector::operator=(other);
+        vector::operator=(std::move(static_cast<vector&>(other)));
         return *this;
     }
 
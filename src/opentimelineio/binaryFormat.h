@@ -0,0 +1,99 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include "opentimelineio/version.h"
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+/// @name Binary Format
+///
+/// The binary (.otiob) encoding of the values that are written to json.
+/// A document is the magic bytes followed by a single value.  Each value
+/// starts with a one byte tag:
+///
+/// - Null, False, True: no payload
+/// - Int: a zigzag varint; UInt: a varint
+/// - Double: 8 bytes
+/// - String: a varint length and the bytes, which are added to the string
+///   table; StringRef: a varint index into the string table;
+///   LongString: a varint length and the bytes, not added to the table
+/// - Array: values up to End; Object: key, value pairs up to End, where each
+///   key is a String, StringRef or LongString
+/// - RationalTime: value, rate; TimeRange: start time value, start time
+///   rate, duration value, duration rate; TimeTransform: offset value,
+///   offset rate, rate, scale; V2d: x, y; Box2d: min x, min y, max x, max y;
+///   all as doubles
+/// - Color: r, g, b, a as doubles, then the name as a string
+/// - ReferenceId: the id as a string
+///
+/// Varints are little endian base 128, doubles are little endian IEEE 754.
+///@{
+
+constexpr char   binary_magic[]    = { 'O', 'T', 'I', 'O', 'B', 'I', 'N', 1 };
+constexpr size_t binary_magic_size = sizeof(binary_magic);
+
+// Strings longer than this are written as LongString.
+constexpr size_t binary_max_table_string_size = 256;
+
+enum class BinaryTag : uint8_t
+{
+    End = 0,
+    Null,
+    False,
+    True,
+    Int,
+    UInt,
+    Double,
+    String,
+    StringRef,
+    LongString,
+    Array,
+    Object,
+    RationalTime,
+    TimeRange,
+    TimeTransform,
+    Color,
+    V2d,
+    Box2d,
+    ReferenceId
+};
+
+inline uint64_t
+binary_double_bits(double value)
+{
+    uint64_t bits;
+    std::memcpy(&bits, &value, sizeof(bits));
+    return bits;
+}
+
+inline double
+binary_double_from_bits(uint64_t bits)
+{
+    double value;
+    std::memcpy(&value, &bits, sizeof(value));
+    return value;
+}
+
+inline uint64_t
+binary_zigzag_encode(int64_t value)
+{
+    return (static_cast<uint64_t>(value) << 1)
+           ^ static_cast<uint64_t>(value >> 63);
+}
+
+inline int64_t
+binary_zigzag_decode(uint64_t value)
+{
+    return static_cast<int64_t>(value >> 1)
+           ^ -static_cast<int64_t>(value & 1);
+}
+
+///@}
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
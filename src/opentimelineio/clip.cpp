@@ -107,6 +107,8 @@ Clip::set_media_references(
     }
 
     _active_media_reference_key = new_active_key;
+    bump_timing_stamp();
+    _content_changed();
 }
 
 std::string
@@ -129,6 +131,8 @@ Clip::set_active_media_reference_key(
         return;
     }
     _active_media_reference_key = new_active_key;
+    bump_timing_stamp();
+    _content_changed();
 }
 
 void
@@ -136,6 +140,8 @@ Clip::set_media_reference(MediaReference* media_reference)
 {
     _media_references[_active_media_reference_key] =
         media_reference ? media_reference : new MissingReference;
+    bump_timing_stamp();
+    _content_changed();
 }
 
 bool
@@ -156,6 +162,16 @@ Clip::write_to(Writer& writer) const
     writer.write("active_media_reference_key", _active_media_reference_key);
 }
 
+void
+Clip::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<Clip*>(clone_object);
+    clone->_media_references           = cloner.clone(_media_references);
+    clone->_active_media_reference_key = _active_media_reference_key;
+}
+
 TimeRange
 Clip::available_range(ErrorStatus* error_status) const
 {
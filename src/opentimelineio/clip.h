@@ -92,6 +92,7 @@ protected:
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
 private:
     template <typename MediaRefMap>
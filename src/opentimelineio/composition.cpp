@@ -42,6 +42,7 @@ Composition::clear_children()
 
     _children.clear();
     _child_set.clear();
+    _children_changed();
 }
 
 bool
@@ -68,6 +69,7 @@ Composition::set_children(
 
     _children  = decltype(_children)(children.begin(), children.end());
     _child_set = std::set<Composable*>(children.begin(), children.end());
+    _children_changed();
     return true;
 }
 
@@ -99,6 +101,7 @@ Composition::insert_child(
     }
 
     _child_set.insert(child);
+    _children_changed();
     return true;
 }
 
@@ -131,6 +134,7 @@ Composition::set_child(int index, Composable* child, ErrorStatus* error_status)
         child->_set_parent(this);
         _children[index] = child;
         _child_set.insert(child);
+        _children_changed();
     }
     return true;
 }
@@ -163,18 +167,40 @@ Composition::remove_child(int index, ErrorStatus* error_status)
         _children.erase(_children.begin() + index);
     }
 
+    _children_changed();
     return true;
 }
 
+void
+Composition::_children_changed()
+{
+    {
+        std::lock_guard<std::mutex> lock(_child_index_mutex);
+        _child_index.clear();
+    }
+    bump_timing_stamp();
+    _content_changed();
+}
+
 int
 Composition::index_of_child(Composable const* child, ErrorStatus* error_status)
     const
 {
-    for (size_t i = 0; i < _children.size(); i++)
     {
-        if (_children[i] == child)
+        std::lock_guard<std::mutex> lock(_child_index_mutex);
+        if (_child_index.empty() && !_children.empty())
+        {
+            _child_index.reserve(_children.size());
+            for (size_t i = 0; i < _children.size(); i++)
+            {
+                _child_index[_children[i].value] = int(i);
+            }
+        }
+
+        auto it = _child_index.find(child);
+        if (it != _child_index.end())
         {
-            return int(i);
+            return it->second;
         }
     }
 
@@ -199,6 +225,7 @@ Composition::read_from(Reader& reader)
                 return false;
             }
         }
+        _children_changed();
     }
     return true;
 }
@@ -210,6 +237,29 @@ Composition::write_to(Writer& writer) const
     writer.write("children", _children);
 }
 
+void
+Composition::_copy_to(SerializableObject* clone, Cloner& cloner) const
+{
+    Parent::_copy_to(clone, cloner);
+    if (!cloner.clones_children())
+    {
+        return;
+    }
+
+    // the cloned children are held until set_children() retains them
+    auto                     children = cloner.clone(_children);
+    std::vector<Composable*> child_pointers;
+    child_pointers.reserve(children.size());
+    for (auto const& child: children)
+    {
+        if (child)
+        {
+            child_pointers.push_back(child);
+        }
+    }
+    static_cast<Composition*>(clone)->set_children(child_pointers);
+}
+
 bool
 Composition::is_parent_of(Composable const* other) const
 {
@@ -421,7 +471,6 @@ Composition::_children_at_time(RationalTime t, ErrorStatus* error_status) const
 {
     std::vector<Composable*> result;
 
-    // range_of_child_at_index is O(i), so this loop is quadratic:
     for (size_t i = 0; i < _children.size() && !is_error(error_status); i++)
     {
         if (range_of_child_at_index(int(i), error_status).contains(t))
@@ -482,51 +531,45 @@ Composition::child_at_time(
 {
     Retainer<Composable> result;
 
-    auto range_map = range_of_all_children(error_status);
-    if (is_error(error_status))
     {
-        return result;
-    }
-
-    // find the first item whose end_time_exclusive is after the
-    const auto first_inside_range = _bisect_left(
-        search_time,
-        [&range_map](Composable* child) {
-            return range_map[child].end_time_exclusive();
-        },
-        error_status);
-    if (is_error(error_status))
-    {
-        return result;
-    }
+        std::lock_guard<std::mutex> lock(_time_index_mutex);
+        if (!_update_time_index(error_status))
+        {
+            return result;
+        }
+        auto const& ranges = _time_index;
+
+        // find the first item whose end_time_exclusive is after the
+        const auto first_inside_range = _bisect_left(
+            search_time,
+            [&ranges](int64_t index) {
+                return ranges[index].end_time_exclusive();
+            },
+            error_status);
+        if (is_error(error_status))
+        {
+            return result;
+        }
 
-    // find the last item whose start_time is before the
-    const auto last_in_range = _bisect_right(
-        search_time,
-        [&range_map](Composable* child) {
-            return range_map[child].start_time();
-        },
-        error_status,
-        first_inside_range);
-    if (is_error(error_status))
-    {
-        return result;
-    }
+        // find the last item whose start_time is before the
+        const auto last_in_range = _bisect_right(
+            search_time,
+            [&ranges](int64_t index) { return ranges[index].start_time(); },
+            error_status,
+            first_inside_range);
+        if (is_error(error_status))
+        {
+            return result;
+        }
 
-    // limit the search to children who are in the search_range
-    std::vector<Retainer<Composable>> possible_matches;
-    for (auto child = _children.begin() + first_inside_range;
-         child < _children.begin() + last_in_range;
-         ++child)
-    {
-        possible_matches.push_back(child->value);
-    }
-    for (const auto& thing: possible_matches)
-    {
-        if (range_map[thing].overlaps(search_time))
+        // limit the search to children who are in the search_range
+        for (auto index = first_inside_range; index < last_in_range; ++index)
         {
-            result = thing;
-            break;
+            if (ranges[index].overlaps(search_time))
+            {
+                result = _children[index];
+                break;
+            }
         }
     }
 
@@ -565,18 +608,19 @@ Composition::children_in_range(
 {
     std::vector<Retainer<Composable>> children;
 
-    auto range_map = range_of_all_children(error_status);
-    if (is_error(error_status))
+    std::lock_guard<std::mutex> lock(_time_index_mutex);
+    if (!_update_time_index(error_status))
     {
         return children;
     }
+    auto const& ranges = _time_index;
 
     // find the first item whose end_time_inclusive is after the
     // start_time of the search range
     const auto first_inside_range = _bisect_left(
         search_range.start_time(),
-        [&range_map](Composable* child) {
-            return range_map[child].end_time_inclusive();
+        [&ranges](int64_t index) {
+            return ranges[index].end_time_inclusive();
         },
         error_status);
     if (is_error(error_status))
@@ -588,9 +632,7 @@ Composition::children_in_range(
     // end_time_inclusive of the search_range
     const auto last_in_range = _bisect_right(
         search_range.end_time_inclusive(),
-        [&range_map](Composable* child) {
-            return range_map[child].start_time();
-        },
+        [&ranges](int64_t index) { return ranges[index].start_time(); },
         error_status,
         first_inside_range);
     if (is_error(error_status))
@@ -608,13 +650,57 @@ Composition::children_in_range(
     return children;
 }
 
+bool
+Composition::_update_time_index(ErrorStatus* error_status) const
+{
+    _time_index_stats.queries++;
+
+    const uint64_t stamp = timing_stamp();
+    if (_time_index_stamp == stamp)
+    {
+        return true;
+    }
+
+    // Use a local status, so that a partial result is never kept around
+    // when the caller did not ask for errors.
+    ErrorStatus status;
+    auto        range_map = range_of_all_children(&status);
+    if (is_error(status))
+    {
+        if (error_status)
+        {
+            *error_status = status;
+        }
+        return false;
+    }
+
+    _time_index.clear();
+    _time_index.reserve(_children.size());
+    for (const auto& child: _children)
+    {
+        _time_index.push_back(range_map[child]);
+    }
+
+    _time_index_stamp = stamp;
+    _time_index_stats.rebuilds++;
+    _time_index_stats.size = int64_t(_time_index.size());
+    return true;
+}
+
+Composition::TimeIndexStats
+Composition::time_index_stats() const
+{
+    std::lock_guard<std::mutex> lock(_time_index_mutex);
+    return _time_index_stats;
+}
+
 int64_t
 Composition::_bisect_right(
-    RationalTime const&                             tgt,
-    std::function<RationalTime(Composable*)> const& key_func,
-    ErrorStatus*                                    error_status,
-    std::optional<int64_t>                          lower_search_bound,
-    std::optional<int64_t>                          upper_search_bound) const
+    RationalTime const&                         tgt,
+    std::function<RationalTime(int64_t)> const& key_func,
+    ErrorStatus*                                error_status,
+    std::optional<int64_t>                      lower_search_bound,
+    std::optional<int64_t>                      upper_search_bound) const
 {
     if (*lower_search_bound < 0)
     {
@@ -636,7 +722,7 @@ Composition::_bisect_right(
         midpoint_index = static_cast<int64_t>(
             std::floor((*lower_search_bound + *upper_search_bound) / 2.0));
 
-        if (tgt < key_func(_children[midpoint_index]))
+        if (tgt < key_func(midpoint_index))
         {
             upper_search_bound = midpoint_index;
         }
@@ -651,11 +737,11 @@ Composition::_bisect_right(
 
 int64_t
 Composition::_bisect_left(
-    RationalTime const&                             tgt,
-    std::function<RationalTime(Composable*)> const& key_func,
-    ErrorStatus*                                    error_status,
-    std::optional<int64_t>                          lower_search_bound,
-    std::optional<int64_t>                          upper_search_bound) const
+    RationalTime const&                         tgt,
+    std::function<RationalTime(int64_t)> const& key_func,
+    ErrorStatus*                                error_status,
+    std::optional<int64_t>                      lower_search_bound,
+    std::optional<int64_t>                      upper_search_bound) const
 {
     if (*lower_search_bound < 0)
     {
@@ -677,7 +763,7 @@ Composition::_bisect_left(
         midpoint_index = static_cast<int64_t>(
             std::floor((*lower_search_bound + *upper_search_bound) / 2.0));
 
-        if (key_func(_children[midpoint_index]) < tgt)
+        if (key_func(midpoint_index) < tgt)
         {
             lower_search_bound = midpoint_index + 1;
         }
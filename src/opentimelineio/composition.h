@@ -5,7 +5,9 @@
 
 #include "opentimelineio/item.h"
 #include "opentimelineio/version.h"
+#include <mutex>
 #include <set>
+#include <unordered_map>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
@@ -172,11 +174,33 @@ public:
         std::optional<TimeRange> const& search_range   = std::nullopt,
         bool                            shallow_search = false) const;
 
+    /// @brief Statistics about the time index of a composition.
+    ///
+    /// The time index holds the range of every child and is used by
+    /// child_at_time(), children_in_range() and find_children() with a
+    /// search range. It is kept between queries and rebuilt after anything
+    /// that affects timing has been changed.
+    struct TimeIndexStats
+    {
+        /// @brief The number of queries that used the index.
+        int64_t queries = 0;
+
+        /// @brief The number of times the index was (re)built.
+        int64_t rebuilds = 0;
+
+        /// @brief The number of children in the index.
+        int64_t size = 0;
+    };
+
+    /// @brief Return the statistics of the time index.
+    TimeIndexStats time_index_stats() const;
+
 protected:
     virtual ~Composition();
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
     std::vector<Composition*> _path_from_child(
         Composable const* child,
@@ -187,6 +211,13 @@ private:
     std::vector<Composable*>
     _children_at_time(RationalTime, ErrorStatus* error_status = nullptr) const;
 
+    // Called whenever _children is mutated.
+    void _children_changed();
+
+    // Bring _time_index up to date with the current timing stamp. Must be
+    // called with _time_index_mutex locked.
+    bool _update_time_index(ErrorStatus* error_status) const;
+
     // Return the index of the last item in seq such that all e in seq[:index]
     // have key_func(e) <= tgt, and all e in seq[index:] have key_func(e) > tgt.
     //
@@ -194,12 +225,13 @@ private:
     // such that meets the above condition.
     //
     // lower_search_bound and upper_search_bound bound the slice to be searched.
+    // key_func is called with the index of the child in _children.
     //
     // Assumes that seq is already sorted.
     int64_t _bisect_right(
-        RationalTime const&                             tgt,
-        std::function<RationalTime(Composable*)> const& key_func,
-        ErrorStatus*                                    error_status = nullptr,
+        RationalTime const&                         tgt,
+        std::function<RationalTime(int64_t)> const& key_func,
+        ErrorStatus*                                error_status = nullptr,
         std::optional<int64_t> lower_search_bound = std::optional<int64_t>(0),
         std::optional<int64_t> upper_search_bound = std::nullopt) const;
 
@@ -210,12 +242,13 @@ private:
     // such that meets the above condition.
     //
     // lower_search_bound and upper_search_bound bound the slice to be searched.
+    // key_func is called with the index of the child in _children.
     //
     // Assumes that seq is already sorted.
     int64_t _bisect_left(
-        RationalTime const&                             tgt,
-        std::function<RationalTime(Composable*)> const& key_func,
-        ErrorStatus*                                    error_status = nullptr,
+        RationalTime const&                         tgt,
+        std::function<RationalTime(int64_t)> const& key_func,
+        ErrorStatus*                                error_status = nullptr,
         std::optional<int64_t> lower_search_bound = std::optional<int64_t>(0),
         std::optional<int64_t> upper_search_bound = std::nullopt) const;
 
@@ -224,6 +257,20 @@ private:
     // This is for fast lookup only, and varies automatically
     // as _children is mutated.
     std::set<Composable*> _child_set;
+
+    // Index of each child in _children, for fast lookup in
+    // index_of_child().  Built lazily, and cleared whenever _children is
+    // mutated.
+    mutable std::unordered_map<Composable const*, int> _child_index;
+    mutable std::mutex                                 _child_index_mutex;
+
+    // The range of each child, in the same order as _children, as returned
+    // by range_of_all_children(). Rebuilt lazily when the timing stamp
+    // changes.
+    mutable std::vector<TimeRange> _time_index;
+    mutable uint64_t               _time_index_stamp = 0;
+    mutable TimeIndexStats         _time_index_stats;
+    mutable std::mutex             _time_index_mutex;
 };
 
 template <typename T>
@@ -0,0 +1,25 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "opentimelineio/contentStamp.h"
+
+#include <atomic>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+// Starts at one so that a hash recorded with stamp zero is never valid.
+static std::atomic<uint64_t> _content_stamp{ 1 };
+
+uint64_t
+content_stamp() noexcept
+{
+    return _content_stamp.load(std::memory_order_acquire);
+}
+
+void
+bump_content_stamp() noexcept
+{
+    _content_stamp.fetch_add(1, std::memory_order_acq_rel);
+}
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
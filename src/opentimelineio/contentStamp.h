@@ -0,0 +1,30 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include "opentimelineio/version.h"
+
+#include <cstdint>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+/// @brief Return the current content stamp.
+///
+/// The content stamp is a process wide counter that is incremented whenever
+/// a container is edited in a way its owning object cannot see, for example
+/// through a dictionary or list handed out to Python before the edit.
+///
+/// Objects record the stamp when they compute their content hash, and
+/// compute it again once the stamp has moved on. Edits made through the
+/// setters and accessors of an object do not need to bump the stamp, they
+/// discard the cached hashes of the objects they change directly.
+uint64_t content_stamp() noexcept;
+
+/// @brief Increment the content stamp, invalidating all cached content hashes.
+///
+/// Call this after editing the metadata, markers, effects or children of an
+/// object through a reference obtained before its content hash was computed.
+void bump_content_stamp() noexcept;
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -1,10 +1,12 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright Contributors to the OpenTimelineIO project
 
+#include "binaryFormat.h"
 #include "opentime/rationalTime.h"
 #include "opentime/timeRange.h"
 #include "opentime/timeTransform.h"
 #include "opentimelineio/color.h"
+#include "opentimelineio/deserialization.h"
 #include "opentimelineio/serializableObject.h"
 #include "opentimelineio/serializableObjectWithMetadata.h"
 #include "stringUtils.h"
@@ -13,7 +15,23 @@
 #include <rapidjson/cursorstreamwrapper.h>
 #include <rapidjson/error/en.h>
 #include <rapidjson/filereadstream.h>
+#include <rapidjson/memorystream.h>
 #include <rapidjson/reader.h>
+#include <rapidjson/stringbuffer.h>
+#include <rapidjson/writer.h>
+
+#include <algorithm>
+#include <atomic>
+#include <cstring>
+#include <exception>
+#include <fstream>
+#include <iterator>
+#include <memory>
+#include <mutex>
+#include <set>
+#include <string_view>
+#include <thread>
+#include <vector>
 
 #if defined(_WINDOWS)
 #    ifndef WIN32_LEAN_AND_MEAN
@@ -22,11 +40,121 @@
 #    ifndef NOMINMAX
 #        define NOMINMAX
 #    endif // NOMINMAX
+#    include <sys/stat.h>
+#    include <sys/types.h>
 #    include <windows.h>
+#else
+#    include <fcntl.h>
+#    include <sys/mman.h>
+#    include <sys/stat.h>
+#    include <unistd.h>
 #endif
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
+// A rapidjson input stream over a sequence of pieces of text, which keeps
+// track of the line and column it is at, like CursorStreamWrapper.  The
+// stream moves on to the next piece only when the next character is
+// needed, so whatever ends at the end of a piece is handled first.
+class _PieceStream
+{
+public:
+    typedef char Ch;
+
+    struct Piece
+    {
+        char const* begin;
+        char const* end;
+        size_t      line;
+        size_t      column;
+    };
+
+    _PieceStream(std::vector<Piece> pieces)
+        : _pieces(std::move(pieces))
+    {
+        _start(0);
+    }
+
+    Ch Peek()
+    {
+        _next();
+        return _cur != _end ? *_cur : '\0';
+    }
+
+    Ch Take()
+    {
+        _next();
+        if (_cur == _end)
+        {
+            return '\0';
+        }
+
+        Ch c = *_cur++;
+        _count++;
+        if (c == '\n')
+        {
+            _line++;
+            _column = 0;
+        }
+        else
+        {
+            _column++;
+        }
+        return c;
+    }
+
+    size_t Tell() const { return _count; }
+
+    Ch* PutBegin()
+    {
+        RAPIDJSON_ASSERT(false);
+        return 0;
+    }
+    void Put(Ch) { RAPIDJSON_ASSERT(false); }
+    void Flush() { RAPIDJSON_ASSERT(false); }
+    size_t PutEnd(Ch*)
+    {
+        RAPIDJSON_ASSERT(false);
+        return 0;
+    }
+
+    size_t GetLine() const { return _line; }
+    size_t GetColumn() const { return _column; }
+
+    // the number of pieces that have been read to the end, and left
+    size_t pieces_passed() const { return _index; }
+
+private:
+    void _start(size_t index)
+    {
+        _index = index;
+        if (_index < _pieces.size())
+        {
+            auto const& piece = _pieces[_index];
+            _cur              = piece.begin;
+            _end              = piece.end;
+            _line             = piece.line;
+            _column           = piece.column;
+        }
+    }
+
+    void _next()
+    {
+        while (_cur == _end && _index + 1 < _pieces.size())
+        {
+            _start(_index + 1);
+        }
+    }
+
+    std::vector<Piece> _pieces;
+    size_t             _index  = 0;
+    char const*        _cur    = nullptr;
+    char const*        _end    = nullptr;
+    size_t             _count  = 0;
+    size_t             _line   = 1;
+    size_t             _column = 0;
+};
+
 class JSONDecoder : public OTIO_rapidjson::
                         BaseReaderHandler<OTIO_rapidjson::UTF8<>, JSONDecoder>
 {
@@ -57,26 +185,50 @@ public:
         }
     }
 
-    bool Null() { return store(std::any()); }
-    bool Bool(bool b) { return store(std::any(b)); }
+    bool Null() { return _capture_depth ? _capture.Null() : store(std::any()); }
+    bool Bool(bool b)
+    {
+        return _capture_depth ? _capture.Bool(b) : store(std::any(b));
+    }
 
     // coerce all integer types to int64_t...
-    bool Int(int i) { return store(std::any(static_cast<int64_t>(i))); }
-    bool Int64(int64_t i) { return store(std::any(static_cast<int64_t>(i))); }
-    bool Uint(unsigned u) { return store(std::any(static_cast<int64_t>(u))); }
+    bool Int(int i)
+    {
+        return _capture_depth ? _capture.Int(i)
+                              : store(std::any(static_cast<int64_t>(i)));
+    }
+    bool Int64(int64_t i)
+    {
+        return _capture_depth ? _capture.Int64(i)
+                              : store(std::any(static_cast<int64_t>(i)));
+    }
+    bool Uint(unsigned u)
+    {
+        return _capture_depth ? _capture.Uint(u)
+                              : store(std::any(static_cast<int64_t>(u)));
+    }
     bool Uint64(uint64_t u)
     {
+        if (_capture_depth)
+        {
+            return _capture.Uint64(u);
+        }
+
         /// prevent an overflow
         return store(std::any(static_cast<int64_t>(u & 0x7FFFFFFFFFFFFFFF)));
     }
 
     // ...and all floating point types to double
-    bool Double(double d) { return store(std::any(d)); }
+    bool Double(double d)
+    {
+        return _capture_depth ? _capture.Double(d) : store(std::any(d));
+    }
 
     bool
     String(const char* str, OTIO_rapidjson::SizeType length, bool /* copy */)
     {
-        return store(std::any(std::string(str, length)));
+        return _capture_depth ? _capture.String(str, length)
+                              : store(std::any(std::string(str, length)));
     }
 
     bool Key(const char* str, OTIO_rapidjson::SizeType length, bool /* copy */)
@@ -86,6 +238,14 @@ public:
             return false;
         }
 
+        if (_capture_depth)
+        {
+            _capture_has_schema =
+                _capture_has_schema
+                || (length == 11 && std::memcmp(str, "OTIO_SCHEMA", 11) == 0);
+            return _capture.Key(str, length);
+        }
+
         if (_stack.empty() || !_stack.back().is_dict)
         {
             _internal_error(
@@ -93,7 +253,14 @@ public:
             return false;
         }
 
-        _stack.back().cur_key = std::string(str, length);
+        auto& top   = _stack.back();
+        top.cur_key.assign(str, length);
+        if (_deferral != Deferral::none && !top.skipped)
+        {
+            top.skips_value = _is_deferred_field(top);
+        }
+        top.captures_value = _lazy_metadata && top.cur_key == "metadata"
+                             && top.dict.count("OTIO_SCHEMA");
         return true;
     }
 
@@ -104,7 +271,18 @@ public:
             return false;
         }
 
-        _stack.emplace_back(_DictOrArray{ false /* is_dict*/ });
+        if (_capture_depth)
+        {
+            _capture_depth++;
+            return _capture.StartArray();
+        }
+
+        if (_splice_stream && !_take_splices())
+        {
+            return false;
+        }
+
+        _stack.emplace_back(_DictOrArray{ false /* is_dict*/, _skips_value() });
         return true;
     }
 
@@ -115,7 +293,28 @@ public:
             return false;
         }
 
-        _stack.emplace_back(_DictOrArray{ true /* is_dict*/ });
+        if (_capture_depth)
+        {
+            _capture_depth++;
+            return _capture.StartObject();
+        }
+
+        if (_lazy_metadata && !_stack.empty() && _stack.back().is_dict
+            && _stack.back().captures_value)
+        {
+            _capture_buffer.Clear();
+            _capture.Reset(_capture_buffer);
+            _capture_depth      = 1;
+            _capture_has_schema = false;
+            return _capture.StartObject();
+        }
+
+        if (_splice_stream && !_take_splices())
+        {
+            return false;
+        }
+
+        _stack.emplace_back(_DictOrArray{ true /* is_dict*/, _skips_value() });
         return true;
     }
 
@@ -126,6 +325,17 @@ public:
             return false;
         }
 
+        if (_capture_depth)
+        {
+            _capture_depth--;
+            return _capture.EndArray();
+        }
+
+        if (_splice_stream && !_take_splices())
+        {
+            return false;
+        }
+
         if (_stack.empty())
         {
             _internal_error(
@@ -158,6 +368,12 @@ public:
             return false;
         }
 
+        if (_capture_depth)
+        {
+            _capture.EndObject();
+            return --_capture_depth ? true : _end_capture();
+        }
+
         if (_stack.empty())
         {
             _internal_error(
@@ -172,8 +388,15 @@ public:
                     "JSONDecoder::_handle_end_object() called without matching _handle_start_object");
                 _stack.pop_back();
             }
+            else if (top.skipped && _deferral == Deferral::skip)
+            {
+                _stack.pop_back();
+            }
             else
             {
+                bool defers_fields = _deferral != Deferral::none
+                                     && !top.skipped && _defers_fields(top);
+
                 // when we end a dictionary, we immediately convert it
                 // to the type it really represents, if it is a schema object.
                 SerializableObject::Reader reader(
@@ -182,7 +405,13 @@ public:
                     nullptr,
                     static_cast<int>(_line_number_function()));
                 _stack.pop_back();
-                store(reader._decode(_resolver));
+
+                std::any result = reader._decode(_resolver);
+                if (defers_fields)
+                {
+                    _add_deferring_object(result);
+                }
+                store(std::move(result));
             }
         }
         return true;
@@ -195,20 +424,32 @@ public:
             return false;
         }
 
+        if (_splice_stream && !_take_splices())
+        {
+            return false;
+        }
+
+        if (_deferral == Deferral::skip && _skips_value())
+        {
+            return true;
+        }
+
         if (_stack.empty())
         {
             _root.swap(a);
         }
         else
         {
+            // the key is not needed once its value is stored, so both are
+            // moved into place rather than copied
             auto& top = _stack.back();
             if (top.is_dict)
             {
-                top.dict.emplace(_stack.back().cur_key, a);
+                top.dict.emplace(std::move(top.cur_key), std::move(a));
             }
             else
             {
-                top.array.emplace_back(a);
+                top.array.emplace_back(std::move(a));
             }
         }
         return true;
@@ -246,177 +487,1358 @@ public:
 
     struct _DictOrArray
     {
-        _DictOrArray(bool is_dict) { this->is_dict = is_dict; }
+        _DictOrArray(bool is_dict, bool skipped = false)
+        {
+            this->is_dict = is_dict;
+            this->skipped = skipped;
+        }
 
         bool          is_dict;
         AnyDictionary dict;
         AnyVector     array;
         std::string   cur_key;
-    };
 
-    std::vector<_DictOrArray>               _stack;
-    std::function<void(ErrorStatus const&)> _error_function;
-    std::function<size_t()>                 _line_number_function;
+        // whether this is (part of) the value of a deferred field, and
+        // whether the value under cur_key is
+        bool skipped;
+        bool skips_value = false;
 
-    SerializableObject::Reader::_Resolver _resolver;
-};
+        // whether this is an object whose deferred fields are skipped, or
+        // -1 while that is not known yet
+        int defers_fields = -1;
 
-SerializableObject::Reader::Reader(
-    AnyDictionary&          source,
-    error_function_t const& error_function,
-    SerializableObject*     so,
-    int                     line_number)
-    : _error_function(error_function)
-    , _source(so)
-    , _line_number(line_number)
-{
-    // destructively read from source.  Decoding it will either return it back
-    // anyway, or convert it to another type, in which case we want to destroy
-    // the original so as to not keep extra data around.
-    _dict.swap(source);
-}
+        // whether the value under cur_key is kept as JSON text
+        bool captures_value = false;
+    };
 
-void
-SerializableObject::Reader::_error(ErrorStatus const& error_status)
-{
-    if (!_source)
+    // Under the lazy metadata policy, the metadata of schema objects is kept
+    // as JSON text, which is parsed when it is first accessed, or written
+    // back out as it is.  The text is captured by writing out what is read,
+    // so it is compact whatever the input looks like.
+    bool _end_capture()
     {
-        if (_line_number > 0)
+        if (_capture_has_schema)
         {
-            _error_function(ErrorStatus(
-                error_status.outcome,
-                string_printf("near line %d", _line_number)));
-        }
-        else
-        {
-            _error_function(error_status);
+            // metadata holding objects is read as usual, by reading the
+            // captured text back through this decoder
+            OTIO_rapidjson::Reader       reader;
+            OTIO_rapidjson::StringStream stream(_capture_buffer.GetString());
+
+            _lazy_metadata = false;
+            bool status    = reader.Parse<
+                   OTIO_rapidjson::kParseNanAndInfFlag
+                   | OTIO_rapidjson::kParseFullPrecisionFlag>(stream, *this);
+            _lazy_metadata = true;
+            return status;
         }
-        return;
-    }
 
-    std::string line_description;
-    if (_line_number > 0)
-    {
-        line_description = string_printf(" (near line %d)", _line_number);
+        return store(std::any(SerializableObject::RawJSON{
+            std::make_shared<std::string const>(
+                _capture_buffer.GetString(),
+                _capture_buffer.GetSize()) }));
     }
 
-    std::string name = "<unknown>";
-    auto        e    = _dict.find("name");
-    if (e != _dict.end() && e->second.type() == typeid(std::string))
+    bool                         _lazy_metadata = false;
+    OTIO_rapidjson::StringBuffer _capture_buffer;
+    OTIO_rapidjson::Writer<
+        OTIO_rapidjson::StringBuffer,
+        OTIO_rapidjson::UTF8<>,
+        OTIO_rapidjson::UTF8<>,
+        OTIO_rapidjson::CrtAllocator,
+        OTIO_rapidjson::kWriteNanAndInfFlag>
+         _capture{ _capture_buffer };
+    int  _capture_depth      = 0;
+    bool _capture_has_schema = false;
+
+    // Reading the skeleton of a file skips the metadata, markers and effects
+    // of the objects of these schemas, which the objects load from the file
+    // when they are first accessed.  To load them, the file is read in full
+    // again, and the objects are matched up by the order they were read in.
+    enum class Deferral
     {
-        name = std::any_cast<std::string>(e->second);
-    }
-
-    _error_function(ErrorStatus(
-        error_status.outcome,
-        string_printf(
-            "While reading object named '%s' (of type '%s'): %s%s",
-            name.c_str(),
-            type_name_for_error_message(_source).c_str(),
-            error_status.details.c_str(),
-            line_description.c_str())));
-}
+        none,
+        skip,  // skip deferred fields, and give objects the _deferred_source
+        index, // read everything, and collect the objects in _deferred_objects
+    };
 
-void
-SerializableObject::Reader::_fix_reference_ids(
-    AnyDictionary&          m,
-    error_function_t const& error_function,
-    _Resolver&              resolver,
-    int                     line_number)
-{
-    for (auto& e: m)
+    static bool _defers_fields(_DictOrArray& top)
     {
-        _fix_reference_ids(e.second, error_function, resolver, line_number);
+        if (top.defers_fields < 0)
+        {
+            auto e = top.dict.find("OTIO_SCHEMA");
+            if (e == top.dict.end() || e->second.type() != typeid(std::string))
+            {
+                return false;
+            }
+
+            static std::set<std::string> const schemas = {
+                "Clip",
+                "ExternalReference",
+                "Gap",
+                "GeneratorReference",
+                "ImageSequenceReference",
+                "MissingReference",
+                "Stack",
+                "Timeline",
+                "Track",
+                "Transition",
+            };
+
+            auto const& schema = std::any_cast<std::string const&>(e->second);
+            top.defers_fields =
+                schemas.count(schema.substr(0, schema.find('.'))) ? 1 : 0;
+        }
+        return top.defers_fields == 1;
     }
-}
 
-void
-SerializableObject::Reader::_fix_reference_ids(
-    std::any&               a,
-    error_function_t const& error_function,
-    _Resolver&              resolver,
-    int                     line_number)
-{
-    if (a.type() == typeid(AnyDictionary))
+    static bool _is_deferred_field(_DictOrArray& top)
     {
-        _fix_reference_ids(
-            std::any_cast<AnyDictionary&>(a),
-            error_function,
-            resolver,
-            line_number);
+        return (top.cur_key == "metadata" || top.cur_key == "markers"
+                || top.cur_key == "effects")
+               && _defers_fields(top);
     }
-    else if (a.type() == typeid(AnyVector))
+
+    // whether the next value read is (part of) a deferred field
+    bool _skips_value()
     {
-        AnyVector& child_array = std::any_cast<AnyVector&>(a);
-        for (size_t i = 0; i < child_array.size(); i++)
+        if (_stack.empty())
         {
-            _fix_reference_ids(
-                child_array[i],
-                error_function,
-                resolver,
-                line_number);
+            return false;
         }
+        auto const& top = _stack.back();
+        return top.skipped || (top.is_dict && top.skips_value);
     }
-    else if (a.type() == typeid(SerializableObject::ReferenceId))
+
+    void _add_deferring_object(std::any const& a)
     {
-        std::string id = std::any_cast<SerializableObject::ReferenceId>(a).id;
-        auto        e  = resolver.object_for_id.find(id);
-        if (e == resolver.object_for_id.end())
+        if (a.type() != typeid(SerializableObject::Retainer<>))
         {
-            error_function(ErrorStatus(
-                ErrorStatus::UNRESOLVED_OBJECT_REFERENCE,
-                string_printf("%s (near line %d)", id.c_str(), line_number)));
+            return;
+        }
+
+        auto so = dynamic_cast<SerializableObjectWithMetadata*>(
+            std::any_cast<SerializableObject::Retainer<> const&>(a).value);
+        if (!so)
+        {
+            return;
+        }
+
+        if (_deferral == Deferral::skip)
+        {
+            so->_deferred_source = _deferred_source;
+            so->_deferred_index  = _deferred_count++;
         }
         else
         {
-            a = std::any(Retainer<>(e->second));
+            _deferred_objects->emplace_back(so);
         }
     }
-}
 
-template <typename T>
-bool
-SerializableObject::Reader::_fetch(
-    std::string const& key,
-    T*                 dest,
-    bool*              had_null)
-{
-    auto e = _dict.find(key);
-    if (e == _dict.end())
-    {
-        _error(ErrorStatus(ErrorStatus::KEY_NOT_FOUND, key));
-        return false;
-    }
-    else if (e->second.type() == typeid(void) && had_null)
-    {
-        _dict.erase(e);
-        *had_null = true;
-        return true;
-    }
-    else if (e->second.type() != typeid(T))
+    Deferral _deferral = Deferral::none;
+    std::shared_ptr<SerializableObjectWithMetadata::DeferredFieldSource>
+                                                           _deferred_source;
+    size_t                                                 _deferred_count = 0;
+    std::vector<SerializableObject::Retainer<SerializableObjectWithMetadata>>*
+        _deferred_objects = nullptr;
+
+    // When a document is parsed on several threads, runs of the elements of
+    // its large arrays are parsed separately, and the stream that the rest
+    // of it is read from skips them.  Each time the stream has skipped a
+    // run, the elements it was parsed into are added to the array being
+    // read, before whatever comes next.
+    bool _take_splices()
     {
-        _error(ErrorStatus(
-            ErrorStatus::TYPE_MISMATCH,
-            string_printf(
-                "expected type %s under key '%s': found type %s instead",
-                type_name_for_error_message(typeid(T)).c_str(),
-                key.c_str(),
-                type_name_for_error_message(e->second.type()).c_str())));
-        return false;
-    }
+        while (_splices_taken < _splice_stream->pieces_passed())
+        {
+            if (_stack.empty() || _stack.back().is_dict)
+            {
+                _internal_error(
+                    "JSONDecoder: elements parsed separately are not part of an array");
+                return false;
+            }
 
-    if (had_null)
-    {
-        *had_null = false;
+            auto& array = _stack.back().array;
+            for (auto& e: (*_splices)[_splices_taken++])
+            {
+                array.emplace_back(std::move(e));
+            }
+        }
+        return true;
     }
 
-    std::swap(*dest, std::any_cast<T&>(e->second));
-    _dict.erase(e);
-    return true;
-}
+    _PieceStream const*     _splice_stream = nullptr;
+    std::vector<AnyVector>* _splices       = nullptr;
+    size_t                  _splices_taken = 0;
+
+    std::vector<_DictOrArray>               _stack;
+    std::function<void(ErrorStatus const&)> _error_function;
+    std::function<size_t()>                 _line_number_function;
+
+    SerializableObject::Reader::_Resolver _resolver;
+};
+
+/**
+ * Reads the binary format described in binaryFormat.h.  What is read is
+ * handed to a JSONDecoder, so values and objects end up decoded exactly as
+ * they are from json, except for the time types, which are stored directly.
+ */
+class BinaryReader
+{
+public:
+    BinaryReader(char const* data, size_t size)
+        : _begin(data)
+        , _cur(data)
+        , _end(data + size)
+    {}
+
+    bool parse(JSONDecoder& handler)
+    {
+        if (size_t(_end - _cur) < binary_magic_size
+            || std::memcmp(_cur, binary_magic, binary_magic_size) != 0)
+        {
+            return _parse_error("not an OpenTimelineIO binary document");
+        }
+        _cur += binary_magic_size;
+
+        BinaryTag tag = BinaryTag::End;
+        if (!_read_tag(&tag) || !_read_value(handler, tag, 0))
+        {
+            return false;
+        }
+
+        if (_cur != _end)
+        {
+            return _parse_error("unexpected data after the root value");
+        }
+        return true;
+    }
+
+    ErrorStatus const& error_status() const { return _error_status; }
+
+private:
+    static constexpr int _max_depth = 1024;
+
+    bool _read_value(JSONDecoder& handler, BinaryTag tag, int depth)
+    {
+        uint64_t         u;
+        double           d[4];
+        std::string_view s;
+
+        switch (tag)
+        {
+            case BinaryTag::Null:
+                return handler.Null();
+            case BinaryTag::False:
+                return handler.Bool(false);
+            case BinaryTag::True:
+                return handler.Bool(true);
+            case BinaryTag::Int:
+                return _read_varint(&u)
+                       && handler.Int64(binary_zigzag_decode(u));
+            case BinaryTag::UInt:
+                return _read_varint(&u) && handler.Uint64(u);
+            case BinaryTag::Double:
+                return _read_doubles(d, 1) && handler.Double(d[0]);
+            case BinaryTag::String:
+            case BinaryTag::StringRef:
+            case BinaryTag::LongString:
+                return _read_string(tag, &s)
+                       && handler.String(
+                           s.data(),
+                           static_cast<OTIO_rapidjson::SizeType>(s.size()),
+                           true);
+            case BinaryTag::Array:
+                return _read_array(handler, depth);
+            case BinaryTag::Object:
+                return _read_object(handler, depth);
+            case BinaryTag::RationalTime:
+                return _read_doubles(d, 2)
+                       && handler.store(std::any(RationalTime(d[0], d[1])));
+            case BinaryTag::TimeRange:
+                return _read_doubles(d, 4)
+                       && handler.store(std::any(TimeRange(
+                           RationalTime(d[0], d[1]),
+                           RationalTime(d[2], d[3]))));
+            case BinaryTag::TimeTransform:
+                return _read_doubles(d, 4)
+                       && handler.store(std::any(TimeTransform(
+                           RationalTime(d[0], d[1]),
+                           d[3],
+                           d[2])));
+            case BinaryTag::Color:
+                return _read_doubles(d, 4) && _read_tag(&tag)
+                       && _read_string(tag, &s)
+                       && handler.store(std::any(
+                           Color(d[0], d[1], d[2], d[3], std::string(s))));
+            case BinaryTag::V2d:
+                return _read_doubles(d, 2)
+                       && handler.store(
+                           std::any(IMATH_NAMESPACE::V2d(d[0], d[1])));
+            case BinaryTag::Box2d:
+                return _read_doubles(d, 4)
+                       && handler.store(std::any(IMATH_NAMESPACE::Box2d(
+                           IMATH_NAMESPACE::V2d(d[0], d[1]),
+                           IMATH_NAMESPACE::V2d(d[2], d[3]))));
+            case BinaryTag::ReferenceId:
+                return _read_tag(&tag) && _read_string(tag, &s)
+                       && handler.store(std::any(
+                           SerializableObject::ReferenceId{ std::string(s) }));
+            default:
+                return _parse_error(string_printf(
+                    "unexpected tag %d",
+                    static_cast<int>(tag)));
+        }
+    }
+
+    bool _read_array(JSONDecoder& handler, int depth)
+    {
+        if (depth >= _max_depth)
+        {
+            return _parse_error("values are nested too deeply");
+        }
+
+        if (!handler.StartArray())
+        {
+            return false;
+        }
+
+        BinaryTag tag = BinaryTag::End;
+        while (_read_tag(&tag))
+        {
+            if (tag == BinaryTag::End)
+            {
+                return handler.EndArray(0);
+            }
+            if (!_read_value(handler, tag, depth + 1))
+            {
+                return false;
+            }
+        }
+        return false;
+    }
+
+    bool _read_object(JSONDecoder& handler, int depth)
+    {
+        if (depth >= _max_depth)
+        {
+            return _parse_error("values are nested too deeply");
+        }
+
+        if (!handler.StartObject())
+        {
+            return false;
+        }
+
+        BinaryTag        tag = BinaryTag::End;
+        std::string_view key;
+        while (_read_tag(&tag))
+        {
+            if (tag == BinaryTag::End)
+            {
+                return handler.EndObject(0);
+            }
+            if (!_read_string(tag, &key)
+                || !handler.Key(
+                    key.data(),
+                    static_cast<OTIO_rapidjson::SizeType>(key.size()),
+                    true)
+                || !_read_tag(&tag) || !_read_value(handler, tag, depth + 1))
+            {
+                return false;
+            }
+        }
+        return false;
+    }
+
+    bool _read_tag(BinaryTag* tag)
+    {
+        if (_cur == _end)
+        {
+            return _parse_error("unexpected end of data");
+        }
+        *tag = static_cast<BinaryTag>(*_cur++);
+        return true;
+    }
+
+    bool _read_varint(uint64_t* value)
+    {
+        *value = 0;
+        for (int shift = 0; shift < 64; shift += 7)
+        {
+            if (_cur == _end)
+            {
+                return _parse_error("unexpected end of data");
+            }
+            uint8_t byte = static_cast<uint8_t>(*_cur++);
+            *value |= static_cast<uint64_t>(byte & 0x7F) << shift;
+            if (!(byte & 0x80))
+            {
+                return true;
+            }
+        }
+        return _parse_error("malformed integer");
+    }
+
+    bool _read_doubles(double* values, int count)
+    {
+        if (size_t(_end - _cur) < size_t(count) * 8)
+        {
+            return _parse_error("unexpected end of data");
+        }
+        for (int i = 0; i < count; i++)
+        {
+            uint64_t bits = 0;
+            for (int b = 0; b < 8; b++)
+            {
+                bits |= static_cast<uint64_t>(static_cast<uint8_t>(*_cur++))
+                        << (8 * b);
+            }
+            values[i] = binary_double_from_bits(bits);
+        }
+        return true;
+    }
+
+    bool _read_string(BinaryTag tag, std::string_view* value)
+    {
+        uint64_t u;
+        if (tag == BinaryTag::StringRef)
+        {
+            if (!_read_varint(&u))
+            {
+                return false;
+            }
+            if (u >= _string_table.size())
+            {
+                return _parse_error("string reference out of range");
+            }
+            *value = _string_table[u];
+            return true;
+        }
+
+        if (tag != BinaryTag::String && tag != BinaryTag::LongString)
+        {
+            return _parse_error(string_printf(
+                "expected a string, found tag %d",
+                static_cast<int>(tag)));
+        }
+
+        if (!_read_varint(&u))
+        {
+            return false;
+        }
+        if (u > size_t(_end - _cur))
+        {
+            return _parse_error("unexpected end of data");
+        }
+
+        *value = std::string_view(_cur, u);
+        _cur += u;
+        if (tag == BinaryTag::String)
+        {
+            _string_table.push_back(*value);
+        }
+        return true;
+    }
+
+    bool _parse_error(std::string const& details)
+    {
+        _error_status = ErrorStatus(
+            ErrorStatus::BINARY_PARSE_ERROR,
+            string_printf(
+                "%s (at byte %zu)",
+                details.c_str(),
+                size_t(_cur - _begin)));
+        return false;
+    }
+
+    char const* _begin;
+    char const* _cur;
+    char const* _end;
+
+    // the strings are not copied, they point into the data
+    std::vector<std::string_view> _string_table;
+
+    ErrorStatus _error_status;
+};
+
+// Parse JSON text kept by the lazy metadata policy.  The text was written
+// from parsed values, so it is read back in full precision to get the same
+// values again.
+static std::any
+_parsed_raw_json(SerializableObject::RawJSON const& raw)
+{
+    OTIO_rapidjson::Reader       reader;
+    OTIO_rapidjson::MemoryStream ms(raw.json->data(), raw.json->size());
+    JSONDecoder                  handler([]() { return size_t(0); });
+
+    bool status = reader.Parse<
+        OTIO_rapidjson::kParseNanAndInfFlag
+        | OTIO_rapidjson::kParseFullPrecisionFlag>(ms, handler);
+    handler.finalize();
+
+    if (!status || handler.has_errored())
+    {
+        return std::any(AnyDictionary());
+    }
+    return std::move(handler._root);
+}
+
+void
+SerializableObject::Reader::_parse_raw_json(std::any& value)
+{
+    value = _parsed_raw_json(std::any_cast<RawJSON const&>(value));
+}
+
+void
+SerializableObjectWithMetadata::_parse_raw_metadata() const
+{
+    auto parsed = _parsed_raw_json(_raw_metadata);
+    _raw_metadata.json.reset();
+
+    auto self = const_cast<SerializableObjectWithMetadata*>(this);
+    if (parsed.type() == typeid(AnyDictionary))
+    {
+        self->_metadata.swap(std::any_cast<AnyDictionary&>(parsed));
+    }
+}
+
+SerializableObject::Reader::Reader(
+    AnyDictionary&          source,
+    error_function_t const& error_function,
+    SerializableObject*     so,
+    int                     line_number)
+    : _error_function(error_function)
+    , _source(so)
+    , _line_number(line_number)
+{
+    // destructively read from source.  Decoding it will either return it back
+    // anyway, or convert it to another type, in which case we want to destroy
+    // the original so as to not keep extra data around.
+    _dict.swap(source);
+}
+
+void
+SerializableObject::Reader::_error(ErrorStatus const& error_status)
+{
+    if (!_source)
+    {
+        if (_line_number > 0)
+        {
+            _error_function(ErrorStatus(
+                error_status.outcome,
+                string_printf("near line %d", _line_number)));
+        }
+        else
+        {
+            _error_function(error_status);
+        }
+        return;
+    }
+
+    std::string line_description;
+    if (_line_number > 0)
+    {
+        line_description = string_printf(" (near line %d)", _line_number);
+    }
+
+    std::string name = "<unknown>";
+    auto        e    = _dict.find("name");
+    if (e != _dict.end() && e->second.type() == typeid(std::string))
+    {
+        name = std::any_cast<std::string>(e->second);
+    }
+
+    _error_function(ErrorStatus(
+        error_status.outcome,
+        string_printf(
+            "While reading object named '%s' (of type '%s'): %s%s",
+            name.c_str(),
+            type_name_for_error_message(_source).c_str(),
+            error_status.details.c_str(),
+            line_description.c_str())));
+}
+
+void
+SerializableObject::Reader::_fix_reference_ids(
+    AnyDictionary&          m,
+    error_function_t const& error_function,
+    _Resolver&              resolver,
+    int                     line_number)
+{
+    for (auto& e: m)
+    {
+        _fix_reference_ids(e.second, error_function, resolver, line_number);
+    }
+}
+
+void
+SerializableObject::Reader::_fix_reference_ids(
+    std::any&               a,
+    error_function_t const& error_function,
+    _Resolver&              resolver,
+    int                     line_number)
+{
+    if (a.type() == typeid(AnyDictionary))
+    {
+        _fix_reference_ids(
+            std::any_cast<AnyDictionary&>(a),
+            error_function,
+            resolver,
+            line_number);
+    }
+    else if (a.type() == typeid(AnyVector))
+    {
+        AnyVector& child_array = std::any_cast<AnyVector&>(a);
+        for (size_t i = 0; i < child_array.size(); i++)
+        {
+            _fix_reference_ids(
+                child_array[i],
+                error_function,
+                resolver,
+                line_number);
+        }
+    }
+    else if (a.type() == typeid(SerializableObject::ReferenceId))
+    {
+        std::string id = std::any_cast<SerializableObject::ReferenceId>(a).id;
+        auto        e  = resolver.object_for_id.find(id);
+        if (e == resolver.object_for_id.end())
+        {
+            error_function(ErrorStatus(
+                ErrorStatus::UNRESOLVED_OBJECT_REFERENCE,
+                string_printf("%s (near line %d)", id.c_str(), line_number)));
+        }
+        else
+        {
+            a = std::any(Retainer<>(e->second));
+        }
+    }
+}
+
+bool
+SerializableObject::Reader::_resolve_reference_ids(
+    AnyDictionary& m,
+    _Resolver&     resolver)
+{
+    bool resolved = true;
+    for (auto& e: m)
+    {
+        resolved = _resolve_reference_ids(e.second, resolver) && resolved;
+    }
+    return resolved;
+}
+
+bool
+SerializableObject::Reader::_resolve_reference_ids(
+    std::any&  a,
+    _Resolver& resolver)
+{
+    if (a.type() == typeid(AnyDictionary))
+    {
+        return _resolve_reference_ids(
+            std::any_cast<AnyDictionary&>(a),
+            resolver);
+    }
+    else if (a.type() == typeid(AnyVector))
+    {
+        bool resolved = true;
+        for (auto& e: std::any_cast<AnyVector&>(a))
+        {
+            resolved = _resolve_reference_ids(e, resolver) && resolved;
+        }
+        return resolved;
+    }
+    else if (a.type() == typeid(SerializableObject::ReferenceId))
+    {
+        auto e = resolver.object_for_id.find(
+            std::any_cast<SerializableObject::ReferenceId const&>(a).id);
+        if (e == resolver.object_for_id.end())
+        {
+            return false;
+        }
+        a = std::any(Retainer<>(e->second));
+    }
+    return true;
+}
+
+bool
+SerializableObject::Reader::read_raw_json(
+    std::string const& key,
+    RawJSON*           dest)
+{
+    auto e = _dict.find(key);
+    if (e == _dict.end() || e->second.type() != typeid(RawJSON))
+    {
+        return false;
+    }
+
+    *dest = std::any_cast<RawJSON&>(e->second);
+    _dict.erase(e);
+    return true;
+}
+
+template <typename T>
+bool
+SerializableObject::Reader::_fetch(
+    std::string const& key,
+    T*                 dest,
+    bool*              had_null)
+{
+    auto e = _dict.find(key);
+    if (e == _dict.end())
+    {
+        _error(ErrorStatus(ErrorStatus::KEY_NOT_FOUND, key));
+        return false;
+    }
+    else if (e->second.type() == typeid(void) && had_null)
+    {
+        _dict.erase(e);
+        *had_null = true;
+        return true;
+    }
+    else if (e->second.type() != typeid(T))
+    {
+        _error(ErrorStatus(
+            ErrorStatus::TYPE_MISMATCH,
+            string_printf(
+                "expected type %s under key '%s': found type %s instead",
+                type_name_for_error_message(typeid(T)).c_str(),
+                key.c_str(),
+                type_name_for_error_message(e->second.type()).c_str())));
+        return false;
+    }
+
+    if (had_null)
+    {
+        *had_null = false;
+    }
+
+    std::swap(*dest, std::any_cast<T&>(e->second));
+    _dict.erase(e);
+    return true;
+}
+
+bool
+SerializableObject::Reader::_fetch(std::string const& key, double* dest)
+{
+    auto e = _dict.find(key);
+    if (e == _dict.end())
+    {
+        _error(ErrorStatus(ErrorStatus::KEY_NOT_FOUND, key));
+        return false;
+    }
+
+    if (e->second.type() == typeid(double))
+    {
+        *dest = std::any_cast<double>(e->second);
+        _dict.erase(e);
+        return true;
+    }
+    else if (e->second.type() == typeid(int))
+    {
+        *dest = static_cast<double>(std::any_cast<int>(e->second));
+        _dict.erase(e);
+        return true;
+    }
+    else if (e->second.type() == typeid(int64_t))
+    {
+        *dest = static_cast<double>(std::any_cast<int64_t>(e->second));
+        _dict.erase(e);
+        return true;
+    }
+
+    _error(ErrorStatus(
+        ErrorStatus::TYPE_MISMATCH,
+        string_printf(
+            "expected type %s under key '%s': found type %s instead",
+            type_name_for_error_message(typeid(double)).c_str(),
+            key.c_str(),
+            type_name_for_error_message(e->second.type()).c_str())));
+    return false;
+}
+
+bool
+SerializableObject::Reader::_fetch_numbers(
+    std::string const& key,
+    AnyVector const&   value,
+    double*            numbers,
+    size_t             count)
+{
+    bool valid = value.size() == count;
+    for (size_t i = 0; valid && i < count; ++i)
+    {
+        auto const& type = value[i].type();
+        if (type == typeid(double))
+        {
+            numbers[i] = std::any_cast<double>(value[i]);
+        }
+        else if (type == typeid(int64_t))
+        {
+            numbers[i] = static_cast<double>(std::any_cast<int64_t>(value[i]));
+        }
+        else if (type == typeid(int))
+        {
+            numbers[i] = static_cast<double>(std::any_cast<int>(value[i]));
+        }
+        else
+        {
+            valid = false;
+        }
+    }
+
+    if (!valid)
+    {
+        _error(ErrorStatus(
+            ErrorStatus::TYPE_MISMATCH,
+            string_printf(
+                "expected %zu numbers under key '%s'",
+                count,
+                key.c_str())));
+    }
+    return valid;
+}
+
+bool
+SerializableObject::Reader::_fetch(
+    std::string const& key,
+    RationalTime*      dest,
+    bool*              had_null)
+{
+    auto e = _dict.find(key);
+    if (e == _dict.end() || e->second.type() != typeid(AnyVector))
+    {
+        return _fetch<RationalTime>(key, dest, had_null);
+    }
+
+    double numbers[2];
+    if (!_fetch_numbers(
+            key,
+            std::any_cast<AnyVector const&>(e->second),
+            numbers,
+            2))
+    {
+        return false;
+    }
+
+    *dest = RationalTime(numbers[0], numbers[1]);
+    if (had_null)
+    {
+        *had_null = false;
+    }
+    _dict.erase(e);
+    return true;
+}
+
+bool
+SerializableObject::Reader::_fetch(
+    std::string const& key,
+    TimeRange*         dest,
+    bool*              had_null)
+{
+    auto e = _dict.find(key);
+    if (e == _dict.end() || e->second.type() != typeid(AnyVector))
+    {
+        return _fetch<TimeRange>(key, dest, had_null);
+    }
+
+    double numbers[4];
+    if (!_fetch_numbers(
+            key,
+            std::any_cast<AnyVector const&>(e->second),
+            numbers,
+            4))
+    {
+        return false;
+    }
+
+    *dest = TimeRange(
+        RationalTime(numbers[0], numbers[1]),
+        RationalTime(numbers[2], numbers[3]));
+    if (had_null)
+    {
+        *had_null = false;
+    }
+    _dict.erase(e);
+    return true;
+}
+
+bool
+SerializableObject::Reader::_fetch(std::string const& key, int64_t* dest)
+{
+    auto e = _dict.find(key);
+    if (e == _dict.end())
+    {
+        _error(ErrorStatus(ErrorStatus::KEY_NOT_FOUND, key));
+        return false;
+    }
+
+    if (e->second.type() == typeid(int64_t))
+    {
+        *dest = std::any_cast<int64_t>(e->second);
+        _dict.erase(e);
+        return true;
+    }
+    else if (e->second.type() == typeid(int))
+    {
+        *dest = std::any_cast<int>(e->second);
+        _dict.erase(e);
+        return true;
+    }
+
+    _error(ErrorStatus(
+        ErrorStatus::TYPE_MISMATCH,
+        string_printf(
+            "expected type %s under key '%s': found type %s instead",
+            type_name_for_error_message(typeid(int64_t)).c_str(),
+            key.c_str(),
+            type_name_for_error_message(e->second.type()).c_str())));
+    return false;
+}
+
+bool
+SerializableObject::Reader::_fetch(
+    std::string const&   key,
+    SerializableObject** dest)
+{
+    auto e = _dict.find(key);
+    if (e == _dict.end())
+    {
+        _error(ErrorStatus(ErrorStatus::KEY_NOT_FOUND, key));
+        return false;
+    }
+
+    if (e->second.type() == typeid(void))
+    {
+        *dest = nullptr;
+        _dict.erase(e);
+        return true;
+    }
+    else if (e->second.type() != typeid(SerializableObject::Retainer<>))
+    {
+        _error(ErrorStatus(
+            ErrorStatus::TYPE_MISMATCH,
+            string_printf(
+                "expected SerializableObject* under key '%s': found type %s instead",
+                key.c_str(),
+                type_name_for_error_message(e->second.type()).c_str())));
+        return false;
+    }
+
+    *dest = std::any_cast<SerializableObject::Retainer<>>(e->second);
+    _dict.erase(e);
+    return true;
+}
+
+bool
+SerializableObject::Reader::_type_check(
+    std::type_info const& wanted,
+    std::type_info const& found)
+{
+    if (wanted != found)
+    {
+        _error(ErrorStatus(
+            ErrorStatus::TYPE_MISMATCH,
+            string_printf(
+                "while decoding complex STL type, expected type '%s', found type '%s' instead",
+                type_name_for_error_message(wanted).c_str(),
+                type_name_for_error_message(found).c_str())));
+        return false;
+    }
+    return true;
+}
+
+bool
+SerializableObject::Reader::_type_check_so(
+    std::type_info const& wanted,
+    std::type_info const& found,
+    std::type_info const& so_type)
+{
+    if (wanted != found)
+    {
+        _error(ErrorStatus(
+            ErrorStatus::TYPE_MISMATCH,
+            string_printf(
+                "expected to read a %s, found a %s instead",
+                type_name_for_error_message(so_type).c_str(),
+                type_name_for_error_message(found).c_str())));
+        return false;
+    }
+    return true;
+}
+
+std::any
+SerializableObject::Reader::_decode(_Resolver& resolver)
+{
+    if (_dict.find("OTIO_SCHEMA") == _dict.end())
+    {
+        return std::any(std::move(_dict));
+    }
+
+    std::string schema_name_and_version;
+
+    if (!_fetch("OTIO_SCHEMA", &schema_name_and_version))
+    {
+        return std::any();
+    }
+
+    // value types are decoded directly, without going through the registry
+    using value_decoder = std::any (*)(Reader&);
+    static std::unordered_map<std::string, value_decoder> const
+        value_decoders = {
+            { "RationalTime.1",
+              [](Reader& reader) {
+                  double rate, value;
+                  return reader._fetch("rate", &rate)
+                                 && reader._fetch("value", &value)
+                             ? std::any(RationalTime(value, rate))
+                             : std::any();
+              } },
+            { "TimeRange.1",
+              [](Reader& reader) {
+                  RationalTime start_time, duration;
+                  return reader._fetch("start_time", &start_time)
+                                 && reader._fetch("duration", &duration)
+                             ? std::any(TimeRange(start_time, duration))
+                             : std::any();
+              } },
+            { "Color.1",
+              [](Reader& reader) {
+                  double      r, g, b, a;
+                  std::string name;
+                  return reader._fetch("r", &r) && reader._fetch("g", &g)
+                                 && reader._fetch("b", &b)
+                                 && reader._fetch("a", &a)
+                                 && reader._fetch("name", &name)
+                             ? std::any(Color(r, g, b, a, name))
+                             : std::any();
+              } },
+            { "TimeTransform.1",
+              [](Reader& reader) {
+                  RationalTime offset;
+                  double       rate, scale;
+                  return reader._fetch("offset", &offset)
+                                 && reader._fetch("rate", &rate)
+                                 && reader._fetch("scale", &scale)
+                             ? std::any(TimeTransform(offset, scale, rate))
+                             : std::any();
+              } },
+            { "SerializableObjectRef.1",
+              [](Reader& reader) {
+                  std::string ref_id;
+                  return reader._fetch("id", &ref_id)
+                             ? std::any(SerializableObject::ReferenceId{
+                                 ref_id })
+                             : std::any();
+              } },
+            { "V2d.1",
+              [](Reader& reader) {
+                  double x, y;
+                  return reader._fetch("x", &x) && reader._fetch("y", &y)
+                             ? std::any(IMATH_NAMESPACE::V2d(x, y))
+                             : std::any();
+              } },
+            { "Box2d.1",
+              [](Reader& reader) {
+                  IMATH_NAMESPACE::V2d min, max;
+                  return reader._fetch("min", &min)
+                                 && reader._fetch("max", &max)
+                             ? std::any(IMATH_NAMESPACE::Box2d(
+                                 std::move(min),
+                                 std::move(max)))
+                             : std::any();
+              } },
+        };
+
+    auto value_decoder_entry = value_decoders.find(schema_name_and_version);
+    if (value_decoder_entry != value_decoders.end())
+    {
+        std::any result = value_decoder_entry->second(*this);
+        if (result.type() == typeid(SerializableObject::ReferenceId))
+        {
+            resolver.has_reference_ids = true;
+        }
+        return result;
+    }
+    else
+    {
+        std::string ref_id;
+        if (_dict.find("OTIO_REF_ID") != _dict.end())
+        {
+            if (!_fetch("OTIO_REF_ID", &ref_id))
+            {
+                return std::any();
+            }
+
+            auto e = resolver.object_for_id.find(ref_id);
+            if (e != resolver.object_for_id.end())
+            {
+                _error(ErrorStatus(
+                    ErrorStatus::DUPLICATE_OBJECT_REFERENCE,
+                    ref_id));
+                return std::any();
+            }
+        }
+
+        // the same few schema strings are read over and over, so each one is
+        // split and looked up in the registry once per read
+        TypeRegistry& r      = TypeRegistry::instance();
+        auto          schema = resolver.schema_for_label.find(
+            schema_name_and_version);
+        if (schema == resolver.schema_for_label.end())
+        {
+            _Resolver::_Schema new_schema;
+            if (!split_schema_string(
+                    schema_name_and_version,
+                    &new_schema.name,
+                    &new_schema.version))
+            {
+                _error(ErrorStatus(
+                    ErrorStatus::MALFORMED_SCHEMA,
+                    string_printf(
+                        "badly formed schema version string '%s'",
+                        schema_name_and_version.c_str())));
+                return std::any();
+            }
+
+            {
+                std::lock_guard<std::mutex> lock(r._registry_mutex);
+                if (auto type_record = r._find_type_record(new_schema.name))
+                {
+                    new_schema.current_version = type_record->schema_version;
+                }
+            }
+
+            schema = resolver.schema_for_label
+                         .emplace(schema_name_and_version, std::move(new_schema))
+                         .first;
+        }
+
+        std::string const& schema_name    = schema->second.name;
+        int                schema_version = schema->second.version;
+
+        // Metadata kept as JSON text is parsed now, unless it is read as it
+        // is by a SerializableObjectWithMetadata: upgrade functions and
+        // other schemas expect it parsed.
+        auto raw_metadata     = _dict.find("metadata");
+        bool has_raw_metadata = raw_metadata != _dict.end()
+                                && raw_metadata->second.type() == typeid(RawJSON);
+        if (has_raw_metadata
+            && schema_version != schema->second.current_version)
+        {
+            _parse_raw_json(raw_metadata->second);
+            has_raw_metadata = false;
+        }
+
+        ErrorStatus error_status;
+        if (SerializableObject* so = r._instance_from_schema(
+                schema_name,
+                schema_version,
+                _dict,
+                true /* internal_read */,
+                &error_status))
+        {
+            if (has_raw_metadata
+                && !dynamic_cast<SerializableObjectWithMetadata*>(so))
+            {
+                _parse_raw_json(_dict["metadata"]);
+            }
+
+            if (!ref_id.empty())
+            {
+                resolver.object_for_id[ref_id] = so;
+            }
+
+            // Objects are read as soon as they are complete, which releases
+            // their data straight away.  Only those whose data refers to
+            // objects that are yet to be read wait until the whole document
+            // has been read.
+            std::any result = SerializableObject::Retainer<>(so);
+            if (resolver.has_reference_ids
+                && !_resolve_reference_ids(_dict, resolver))
+            {
+                resolver.data_for_object.emplace(so, std::move(_dict));
+                resolver.line_number_for_object[so] = _line_number;
+                return result;
+            }
+
+            Reader r(_dict, _error_function, so, _line_number);
+            so->read_from(r);
+            return result;
+        }
+
+        _error(error_status);
+        return std::any();
+    }
+}
+
+bool
+SerializableObject::Reader::read(std::string const& key, bool* value)
+{
+    return _fetch(key, value);
+}
+
+bool
+SerializableObject::Reader::read(std::string const& key, int* value)
+{
+    return _fetch(key, value);
+}
+
+bool
+SerializableObject::Reader::read(std::string const& key, double* value)
+{
+    return _fetch(key, value);
+}
+
+bool
+SerializableObject::Reader::read(std::string const& key, std::string* value)
+{
+    bool had_null;
+    if (!_fetch(key, value, &had_null))
+    {
+        return false;
+    }
+
+    if (had_null)
+    {
+        value->clear();
+    }
+    return true;
+}
+
+bool
+SerializableObject::Reader::read(std::string const& key, RationalTime* value)
+{
+    return _fetch(key, value);
+}
+
+bool
+SerializableObject::Reader::read(std::string const& key, TimeRange* value)
+{
+    return _fetch(key, value);
+}
 
 bool
-SerializableObject::Reader::_fetch(std::string const& key, double* dest)
+SerializableObject::Reader::read(std::string const& key, Color* value)
+{
+    return _fetch(key, value);
+}
+
+bool
+SerializableObject::Reader::read(std::string const& key, TimeTransform* value)
+{
+    return _fetch(key, value);
+}
+
+bool
+SerializableObject::Reader::read(std::string const& key, AnyDictionary* value)
+{
+    return _fetch(key, value);
+}
+
+bool
+SerializableObject::Reader::read(std::string const& key, AnyVector* value)
+{
+    return _fetch(key, value);
+}
+
+bool
+SerializableObject::Reader::read(
+    std::string const&    key,
+    IMATH_NAMESPACE::V2d* value)
+{
+    return _fetch(key, value);
+}
+
+bool
+SerializableObject::Reader::read(
+    std::string const&      key,
+    IMATH_NAMESPACE::Box2d* value)
+{
+    return _fetch(key, value);
+}
+
+template <typename T>
+bool
+SerializableObject::Reader::_read_optional(
+    std::string const& key,
+    std::optional<T>*  value)
+{
+    bool had_null;
+    T    result;
+    if (!SerializableObject::Reader::_fetch(key, &result, &had_null))
+    {
+        return false;
+    }
+
+    *value = had_null ? std::optional<T>() : std::optional<T>(result);
+    return true;
+}
+bool
+SerializableObject::Reader::read(
+    std::string const&   key,
+    std::optional<bool>* value)
+{
+    return _read_optional(key, value);
+}
+
+bool
+SerializableObject::Reader::read(
+    std::string const&  key,
+    std::optional<int>* value)
+{
+    return _read_optional(key, value);
+}
+
+bool
+SerializableObject::Reader::read(
+    std::string const&     key,
+    std::optional<double>* value)
+{
+    return _read_optional(key, value);
+}
+
+bool
+SerializableObject::Reader::read(
+    std::string const&           key,
+    std::optional<RationalTime>* value)
+{
+    return _read_optional(key, value);
+}
+
+bool
+SerializableObject::Reader::read(
+    std::string const&        key,
+    std::optional<TimeRange>* value)
+{
+    return _read_optional(key, value);
+}
+
+bool
+SerializableObject::Reader::read(
+    std::string const&        key,
+    std::optional<Color>*     value)
+{
+    return _read_optional(key, value);
+}
+
+bool
+SerializableObject::Reader::read(
+    std::string const&            key,
+    std::optional<TimeTransform>* value)
+{
+    return _read_optional(key, value);
+}
+
+bool
+SerializableObject::Reader::read(
+    std::string const&                     key,
+    std::optional<IMATH_NAMESPACE::Box2d>* value)
+{
+    return _read_optional(key, value);
+}
+
+bool
+SerializableObject::Reader::read(std::string const& key, std::any* value)
 {
     auto e = _dict.find(key);
     if (e == _dict.end())
@@ -424,471 +1846,1048 @@ SerializableObject::Reader::_fetch(std::string const& key, double* dest)
         _error(ErrorStatus(ErrorStatus::KEY_NOT_FOUND, key));
         return false;
     }
+    else
+    {
+        value->swap(e->second);
+        _dict.erase(e);
+        return true;
+    }
+}
+
+bool
+deserialize_json_from_string(
+    std::string const& input,
+    std::any*          destination,
+    ErrorStatus*       error_status,
+    bool               lazy_metadata)
+{
+    return deserialize_json_from_buffer(
+        input.c_str(),
+        input.size(),
+        destination,
+        error_status,
+        lazy_metadata);
+}
+
+bool
+deserialize_json_from_buffer(
+    char const*  data,
+    size_t       size,
+    std::any*    destination,
+    ErrorStatus* error_status,
+    bool         lazy_metadata)
+{
+    OTIO_rapidjson::Reader                            reader;
+    OTIO_rapidjson::MemoryStream                      ms(data, size);
+    OTIO_rapidjson::CursorStreamWrapper<decltype(ms)> csw(ms);
+    JSONDecoder handler(std::bind(&decltype(csw)::GetLine, &csw));
+    handler._lazy_metadata = lazy_metadata;
+
+    bool status =
+        reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(csw, handler);
+    handler.finalize();
+
+    if (handler.has_errored(error_status))
+    {
+        return false;
+    }
+
+    if (!status)
+    {
+        if (error_status)
+        {
+            auto msg      = GetParseError_En(reader.GetParseErrorCode());
+            *error_status = ErrorStatus(
+                ErrorStatus::JSON_PARSE_ERROR,
+                string_printf(
+                    "JSON parse error on input string: %s "
+                    "(line %d, column %d)",
+                    msg,
+                    csw.GetLine(),
+                    csw.GetColumn()));
+        }
+        return false;
+    }
+
+    destination->swap(handler._root);
+    return true;
+}
+
+// The "children" arrays of a JSON document that are not part of metadata,
+// and where each of their elements begins and ends, as found by
+// _scan_arrays().
+struct _ScannedArray
+{
+    struct Element
+    {
+        char const* begin;
+        char const* end;
+
+        // whether there are arrays inside of the element
+        bool has_arrays = false;
+
+        size_t size() const { return end - begin; }
+    };
+
+    // the array this one is inside of, if any, and the element of it
+    size_t parent;
+    size_t parent_element;
+
+    std::vector<Element> elements;
+};
+
+static size_t const _no_array = size_t(-1);
+
+static bool
+_is_space(char c)
+{
+    return c == ' ' || c == '\n' || c == '\r' || c == '\t';
+}
+
+// Find the "children" arrays of the JSON document in data, without parsing
+// it.  Only the characters that make up the structure of the document are
+// looked at, so this is much faster than parsing it.  Returns false if the
+// document is not well formed, as far as can be told.
+static bool
+_scan_arrays(
+    char const*                 data,
+    size_t                      size,
+    std::vector<_ScannedArray>& arrays)
+{
+    struct Frame
+    {
+        bool   is_array;
+        bool   in_metadata;
+        size_t array; // the "children" array this is, or is inside of
+        bool   is_children;
+        bool   in_element = false;
+
+        // for objects, whether the value being read is "children" or
+        // "metadata"
+        bool children_value = false;
+        bool metadata_value = false;
+    };
+
+    static bool const* const structural = [] {
+        static bool table[256] = {};
+        for (unsigned char c: std::string_view("\"{}[],:"))
+        {
+            table[c] = true;
+        }
+        return table;
+    }();
+
+    std::vector<Frame> stack;
+    char const*        end       = data + size;
+    char const*        key_begin = nullptr;
+    char const*        key_end   = nullptr;
+
+    for (char const* p = data; p < end;)
+    {
+        if (!stack.empty() && stack.back().is_children
+            && !stack.back().in_element)
+        {
+            while (p < end && _is_space(*p))
+            {
+                p++;
+            }
+            if (p < end && *p != ']')
+            {
+                stack.back().in_element = true;
+                arrays[stack.back().array].elements.push_back({ p, p });
+            }
+        }
+
+        while (p < end && !structural[static_cast<unsigned char>(*p)])
+        {
+            p++;
+        }
+        if (p == end)
+        {
+            break;
+        }
+
+        switch (*p)
+        {
+            case '"': {
+                char const* q = p + 1;
+                while (true)
+                {
+                    q = static_cast<char const*>(
+                        std::memchr(q, '"', end - q));
+                    if (!q)
+                    {
+                        return false;
+                    }
+
+                    // the quote is escaped by an odd number of backslashes
+                    char const* b = q;
+                    while (b[-1] == '\\')
+                    {
+                        b--;
+                    }
+                    if ((q - b) % 2 == 0)
+                    {
+                        break;
+                    }
+                    q++;
+                }
+                key_begin = p + 1;
+                key_end   = q;
+                p         = q + 1;
+                break;
+            }
+            case ':': {
+                if (stack.empty() || stack.back().is_array || !key_begin)
+                {
+                    return false;
+                }
+                std::string_view key(key_begin, key_end - key_begin);
+                stack.back().children_value = key == "children";
+                stack.back().metadata_value = key == "metadata";
+                p++;
+                break;
+            }
+            case '{':
+            case '[': {
+                Frame frame{ *p == '[', false, _no_array, false };
+                if (!stack.empty())
+                {
+                    auto const& parent = stack.back();
+                    frame.in_metadata =
+                        parent.in_metadata
+                        || (!parent.is_array && parent.metadata_value);
+                    frame.array = parent.array;
+                    frame.is_children =
+                        frame.is_array && !frame.in_metadata
+                        && !parent.is_array && parent.children_value;
+                }
+
+                if (frame.is_children)
+                {
+                    size_t parent_element = 0;
+                    if (frame.array != _no_array)
+                    {
+                        auto& elements = arrays[frame.array].elements;
+                        if (elements.empty())
+                        {
+                            return false;
+                        }
+                        elements.back().has_arrays = true;
+                        parent_element             = elements.size() - 1;
+                    }
+                    arrays.push_back({ frame.array, parent_element, {} });
+                    frame.array = arrays.size() - 1;
+                }
+                stack.push_back(frame);
+                p++;
+                break;
+            }
+            default: {
+                // one of '}', ']' or ','
+                if (stack.empty())
+                {
+                    return false;
+                }
+
+                auto& top = stack.back();
+                if (top.is_children && top.in_element)
+                {
+                    char const* element_end = p;
+                    while (_is_space(element_end[-1]))
+                    {
+                        element_end--;
+                    }
+                    arrays[top.array].elements.back().end = element_end;
+                    top.in_element                        = false;
+                }
+
+                if (*p != ',')
+                {
+                    if (top.is_array != (*p == ']'))
+                    {
+                        return false;
+                    }
+                    stack.pop_back();
+                }
+                p++;
+                break;
+            }
+        }
+    }
+
+    return stack.empty();
+}
+
+// The column that p is at, in data.
+static size_t
+_column_at(char const* data, char const* p)
+{
+    char const* line_begin = p;
+    while (line_begin > data && line_begin[-1] != '\n')
+    {
+        line_begin--;
+    }
+    return p - line_begin;
+}
+
+// A run of consecutive elements of an array, which is parsed on its own.
+struct _ParallelChunk
+{
+    _PieceStream::Piece range;
+    size_t              splice;
+
+    AnyVector                        elements;
+    decltype(JSONDecoder::_resolver) resolver;
+    ErrorStatus                      error_status;
+};
+
+// Runs of elements are split up into chunks of about chunk_size bytes, and
+// the ranges of text they are in are added to skipped.  Elements that are
+// larger than that, and have arrays inside of them, are split up in turn.
+static void
+_split_array(
+    std::vector<_ScannedArray> const&       arrays,
+    std::vector<std::vector<size_t>> const& nested,
+    size_t                                  index,
+    size_t                                  chunk_size,
+    std::vector<_ParallelChunk>&            chunks,
+    std::vector<_PieceStream::Piece>&       skipped)
+{
+    auto const& elements = arrays[index].elements;
+    auto        is_split = [&](size_t i) {
+        return elements[i].has_arrays && elements[i].size() >= chunk_size;
+    };
+
+    size_t i = 0;
+    while (i < elements.size())
+    {
+        if (is_split(i))
+        {
+            for (auto n: nested[index])
+            {
+                if (arrays[n].parent_element == i)
+                {
+                    _split_array(
+                        arrays,
+                        nested,
+                        n,
+                        chunk_size,
+                        chunks,
+                        skipped);
+                }
+            }
+            i++;
+            continue;
+        }
+
+        size_t first = i;
+        while (i < elements.size() && !is_split(i))
+        {
+            size_t begin = i;
+            size_t size  = 0;
+            while (i < elements.size() && !is_split(i) && size < chunk_size)
+            {
+                size += elements[i].size();
+                i++;
+            }
+
+            chunks.push_back(_ParallelChunk{
+                { elements[begin].begin, elements[i - 1].end, 0, 0 },
+                skipped.size() });
+        }
+
+        // the rest of the document is read without the text of the run: up
+        // to the next element, or from the end of the previous one, so that
+        // what is left is still well formed
+        if (i < elements.size())
+        {
+            skipped.push_back(
+                { elements[first].begin, elements[i].begin, 0, 0 });
+        }
+        else
+        {
+            skipped.push_back(
+                { first > 0 ? elements[first - 1].end : elements[first].begin,
+                  elements[i - 1].end,
+                  0,
+                  0 });
+        }
+    }
+}
+
+// Call f(i) for each i up to count, on num_threads threads.  An exception
+// thrown by f (e.g. from creating an object of a schema defined in Python)
+// stops the calls, and is rethrown once all the threads are done.
+template <typename F>
+static void
+_parallel_for(unsigned num_threads, size_t count, F const& f)
+{
+    std::atomic<size_t> next{ 0 };
+    std::exception_ptr  exception;
+    std::mutex          exception_mutex;
+
+    auto run = [&]() {
+        try
+        {
+            for (size_t i; (i = next++) < count;)
+            {
+                f(i);
+            }
+        }
+        catch (...)
+        {
+            std::lock_guard<std::mutex> lock(exception_mutex);
+            exception = std::current_exception();
+            next      = count;
+        }
+    };
 
-    if (e->second.type() == typeid(double))
+    std::vector<std::thread> threads;
+    for (size_t i = 1; i < std::min<size_t>(num_threads, count); i++)
     {
-        *dest = std::any_cast<double>(e->second);
-        _dict.erase(e);
-        return true;
+        threads.emplace_back(run);
     }
-    else if (e->second.type() == typeid(int))
+    run();
+    for (auto& thread: threads)
     {
-        *dest = static_cast<double>(std::any_cast<int>(e->second));
-        _dict.erase(e);
-        return true;
+        thread.join();
     }
-    else if (e->second.type() == typeid(int64_t))
+
+    if (exception)
     {
-        *dest = static_cast<double>(std::any_cast<int64_t>(e->second));
-        _dict.erase(e);
-        return true;
+        std::rethrow_exception(exception);
     }
-
-    _error(ErrorStatus(
-        ErrorStatus::TYPE_MISMATCH,
-        string_printf(
-            "expected type %s under key '%s': found type %s instead",
-            type_name_for_error_message(typeid(double)).c_str(),
-            key.c_str(),
-            type_name_for_error_message(e->second.type()).c_str())));
-    return false;
 }
 
-bool
-SerializableObject::Reader::_fetch(std::string const& key, int64_t* dest)
+// Set the line and column of each piece, which begins at some point in
+// data.  The lines are counted on num_threads threads.
+static void
+_set_lines(
+    char const*                                   data,
+    std::vector<_PieceStream::Piece*> const&      pieces,
+    unsigned                                      num_threads)
 {
-    auto e = _dict.find(key);
-    if (e == _dict.end())
+    std::vector<size_t> lines(pieces.size());
+    _parallel_for(num_threads, pieces.size(), [&](size_t i) {
+        char const* begin = i > 0 ? pieces[i - 1]->begin : data;
+        lines[i]          = std::count(begin, pieces[i]->begin, '\n');
+    });
+
+    size_t line = 1;
+    for (size_t i = 0; i < pieces.size(); i++)
     {
-        _error(ErrorStatus(ErrorStatus::KEY_NOT_FOUND, key));
-        return false;
+        line += lines[i];
+        pieces[i]->line   = line;
+        pieces[i]->column = _column_at(data, pieces[i]->begin);
     }
+}
 
-    if (e->second.type() == typeid(int64_t))
-    {
-        *dest = std::any_cast<int64_t>(e->second);
-        _dict.erase(e);
-        return true;
-    }
-    else if (e->second.type() == typeid(int))
+static bool
+_parse_error(
+    OTIO_rapidjson::Reader const& reader,
+    _PieceStream const&           stream,
+    ErrorStatus*                  error_status)
+{
+    if (error_status)
     {
-        *dest = std::any_cast<int>(e->second);
-        _dict.erase(e);
-        return true;
+        *error_status = ErrorStatus(
+            ErrorStatus::JSON_PARSE_ERROR,
+            string_printf(
+                "JSON parse error on input string: %s "
+                "(line %d, column %d)",
+                GetParseError_En(reader.GetParseErrorCode()),
+                stream.GetLine(),
+                stream.GetColumn()));
     }
-
-    _error(ErrorStatus(
-        ErrorStatus::TYPE_MISMATCH,
-        string_printf(
-            "expected type %s under key '%s': found type %s instead",
-            type_name_for_error_message(typeid(int64_t)).c_str(),
-            key.c_str(),
-            type_name_for_error_message(e->second.type()).c_str())));
     return false;
 }
 
-bool
-SerializableObject::Reader::_fetch(
-    std::string const&   key,
-    SerializableObject** dest)
+static void
+_parse_chunk(_ParallelChunk& chunk, bool lazy_metadata)
 {
-    auto e = _dict.find(key);
-    if (e == _dict.end())
-    {
-        _error(ErrorStatus(ErrorStatus::KEY_NOT_FOUND, key));
-        return false;
-    }
+    static char const open[]  = "[";
+    static char const close[] = "]";
 
-    if (e->second.type() == typeid(void))
+    auto const&  range = chunk.range;
+    _PieceStream stream({ { open, open + 1, range.line, range.column },
+                          range,
+                          { close, close + 1, range.line, 0 } });
+    JSONDecoder  handler(std::bind(&_PieceStream::GetLine, &stream));
+    handler._lazy_metadata = lazy_metadata;
+
+    OTIO_rapidjson::Reader reader;
+    bool                   status =
+        reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(stream, handler);
+
+    if (handler.has_errored(&chunk.error_status))
     {
-        *dest = nullptr;
-        _dict.erase(e);
-        return true;
+        return;
     }
-    else if (e->second.type() != typeid(SerializableObject::Retainer<>))
+    if (!status)
     {
-        _error(ErrorStatus(
-            ErrorStatus::TYPE_MISMATCH,
-            string_printf(
-                "expected SerializableObject* under key '%s': found type %s instead",
-                key.c_str(),
-                type_name_for_error_message(e->second.type()).c_str())));
-        return false;
+        _parse_error(reader, stream, &chunk.error_status);
+        return;
     }
 
-    *dest = std::any_cast<SerializableObject::Retainer<>>(e->second);
-    _dict.erase(e);
-    return true;
+    // the objects are resolved along with the rest of the document
+    chunk.elements.swap(std::any_cast<AnyVector&>(handler._root));
+    chunk.resolver = std::move(handler._resolver);
 }
 
-bool
-SerializableObject::Reader::_type_check(
-    std::type_info const& wanted,
-    std::type_info const& found)
+// The contents of a file, mapped into memory where that is supported.
+class _FileContents
 {
-    if (wanted != found)
+public:
+    ~_FileContents()
     {
-        _error(ErrorStatus(
-            ErrorStatus::TYPE_MISMATCH,
-            string_printf(
-                "while decoding complex STL type, expected type '%s', found type '%s' instead",
-                type_name_for_error_message(wanted).c_str(),
-                type_name_for_error_message(found).c_str())));
-        return false;
+#if !defined(_WINDOWS)
+        if (_mapping)
+        {
+            munmap(_mapping, _size);
+        }
+#endif
     }
-    return true;
-}
 
-bool
-SerializableObject::Reader::_type_check_so(
-    std::type_info const& wanted,
-    std::type_info const& found,
-    std::type_info const& so_type)
-{
-    if (wanted != found)
+    bool open(std::string const& file_name)
     {
-        _error(ErrorStatus(
-            ErrorStatus::TYPE_MISMATCH,
-            string_printf(
-                "expected to read a %s, found a %s instead",
-                type_name_for_error_message(so_type).c_str(),
-                type_name_for_error_message(found).c_str())));
-        return false;
+#if defined(_WINDOWS)
+        const int wlen =
+            MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, NULL, 0);
+        std::vector<wchar_t> wchars(wlen);
+        MultiByteToWideChar(
+            CP_UTF8,
+            0,
+            file_name.c_str(),
+            -1,
+            wchars.data(),
+            wlen);
+        std::ifstream is(wchars.data(), std::ios::binary);
+        if (!is.is_open())
+        {
+            return false;
+        }
+        _buffer.assign(
+            (std::istreambuf_iterator<char>(is)),
+            std::istreambuf_iterator<char>());
+        _data = _buffer.data();
+        _size = _buffer.size();
+        return !is.bad();
+#else
+        int fd = ::open(file_name.c_str(), O_RDONLY);
+        if (fd < 0)
+        {
+            return false;
+        }
+
+        struct stat st;
+        bool        ok = fstat(fd, &st) == 0;
+        _size          = ok ? size_t(st.st_size) : 0;
+        if (ok && _size > 0)
+        {
+            // an empty file cannot be mapped, and is left empty
+            int flags = MAP_PRIVATE;
+#    if defined(MAP_POPULATE)
+            // the whole file is read, so it is read ahead all at once
+            flags |= MAP_POPULATE;
+#    endif
+            _mapping = mmap(nullptr, _size, PROT_READ, flags, fd, 0);
+            if (_mapping == MAP_FAILED)
+            {
+                _mapping = nullptr;
+                ok       = false;
+            }
+            else
+            {
+                _data = static_cast<char const*>(_mapping);
+            }
+        }
+        ::close(fd);
+        return ok;
+#endif
     }
-    return true;
-}
 
-std::any
-SerializableObject::Reader::_decode(_Resolver& resolver)
-{
-    if (_dict.find("OTIO_SCHEMA") == _dict.end())
+    char const* data() const { return _data; }
+    size_t      size() const { return _size; }
+
+    // Let the memory that the text from begin to end is in go, if it can
+    // be read back from the file when it is needed again.
+    void release(char const* begin, char const* end) const
     {
-        return std::any(std::move(_dict));
+#if !defined(_WINDOWS)
+        size_t page    = static_cast<size_t>(sysconf(_SC_PAGESIZE));
+        auto   offset  = [&](char const* p) { return size_t(p - _data); };
+        size_t first   = (offset(begin) + page - 1) / page * page;
+        size_t last    = offset(end) / page * page;
+        if (_mapping && first < last)
+        {
+            madvise(
+                static_cast<char*>(_mapping) + first,
+                last - first,
+                MADV_DONTNEED);
+        }
+#endif
     }
 
-    std::string schema_name_and_version;
+private:
+    char const* _data = "";
+    size_t      _size = 0;
+#if defined(_WINDOWS)
+    std::string _buffer;
+#else
+    void* _mapping = nullptr;
+#endif
+};
 
-    if (!_fetch("OTIO_SCHEMA", &schema_name_and_version))
+// Parse the document in contents on num_threads threads: the runs of
+// elements of its large "children" arrays are parsed on their own, and then
+// the rest of the document, with the elements put in place as it is read.
+static bool
+_deserialize_json_in_parallel(
+    _FileContents const& contents,
+    std::any*            destination,
+    ErrorStatus*         error_status,
+    bool                 lazy_metadata,
+    unsigned             num_threads)
+{
+    char const* data = contents.data();
+    size_t      size = contents.size();
+
+    std::vector<_ParallelChunk>      chunks;
+    std::vector<_PieceStream::Piece> skipped;
     {
-        return std::any();
+        std::vector<_ScannedArray> arrays;
+        if (num_threads > 1 && _scan_arrays(data, size, arrays))
+        {
+            std::vector<std::vector<size_t>> nested(arrays.size());
+            for (size_t i = 0; i < arrays.size(); i++)
+            {
+                if (arrays[i].parent != _no_array)
+                {
+                    nested[arrays[i].parent].push_back(i);
+                }
+            }
+
+            size_t chunk_size =
+                std::max<size_t>(size / (num_threads * 8), 1 << 16);
+            for (size_t i = 0; i < arrays.size(); i++)
+            {
+                if (arrays[i].parent == _no_array)
+                {
+                    _split_array(arrays, nested, i, chunk_size, chunks, skipped);
+                }
+            }
+        }
     }
 
-    if (schema_name_and_version == "RationalTime.1")
+    // a document that is not well formed is left for the parser to report
+    // on
+    if (chunks.size() < 2)
     {
-        double rate, value;
-        return _fetch("rate", &rate) && _fetch("value", &value)
-                   ? std::any(RationalTime(value, rate))
-                   : std::any();
+        return deserialize_json_from_buffer(
+            data,
+            size,
+            destination,
+            error_status,
+            lazy_metadata);
     }
-    else if (schema_name_and_version == "TimeRange.1")
+
+    // the rest of the document is read in the pieces around the chunks
+    std::vector<_PieceStream::Piece> pieces{ { data, data + size, 1, 0 } };
+    for (auto const& s: skipped)
     {
-        RationalTime start_time, duration;
-        return _fetch("start_time", &start_time)
-                       && _fetch("duration", &duration)
-                   ? std::any(TimeRange(start_time, duration))
-                   : std::any();
+        pieces.back().end = s.begin;
+        pieces.push_back({ s.end, data + size, 0, 0 });
     }
-    else if (schema_name_and_version == "Color.1")
+
+    std::vector<_PieceStream::Piece*> begins;
+    for (auto& chunk: chunks)
     {
-        float r, g, b, a;
-        std::string name;
-        return _fetch("r", &r)
-                       && _fetch("g", &g)
-                       && _fetch("b", &b)
-                       && _fetch("a", &a)
-                       && _fetch("name", &name)
-                   ? std::any(Color(r, g, b, a, name))
-                   : std::any();
+        begins.push_back(&chunk.range);
     }
-    else if (schema_name_and_version == "TimeTransform.1")
+    for (size_t i = 1; i < pieces.size(); i++)
     {
-        RationalTime offset;
-        double       rate, scale;
-        return _fetch("offset", &offset) && _fetch("rate", &rate)
-                       && _fetch("scale", &scale)
-                   ? std::any(TimeTransform(offset, scale, rate))
-                   : std::any();
+        begins.push_back(&pieces[i]);
     }
-    else if (schema_name_and_version == "SerializableObjectRef.1")
+    std::sort(
+        begins.begin(),
+        begins.end(),
+        [](_PieceStream::Piece* a, _PieceStream::Piece* b) {
+            return a->begin < b->begin;
+        });
+    _set_lines(data, begins, num_threads);
+
+    _parallel_for(num_threads, chunks.size(), [&](size_t i) {
+        _parse_chunk(chunks[i], lazy_metadata);
+        contents.release(chunks[i].range.begin, chunks[i].range.end);
+    });
+
+    for (auto& chunk: chunks)
     {
-        std::string ref_id;
-        if (!_fetch("id", &ref_id))
+        if (is_error(chunk.error_status))
+        {
+            if (error_status)
+            {
+                *error_status = chunk.error_status;
+            }
+            return false;
+        }
+    }
+
+    _PieceStream           stream(std::move(pieces));
+    std::vector<AnyVector> splices(skipped.size());
+    JSONDecoder handler(std::bind(&_PieceStream::GetLine, &stream));
+    handler._lazy_metadata = lazy_metadata;
+    handler._splice_stream = &stream;
+    handler._splices       = &splices;
+
+    auto& resolver = handler._resolver;
+    for (auto& chunk: chunks)
+    {
+        auto& splice = splices[chunk.splice];
+        splice.reserve(splice.size() + chunk.elements.size());
+        for (auto& e: chunk.elements)
         {
-            return std::any();
+            splice.emplace_back(std::move(e));
         }
 
-        return std::any(SerializableObject::ReferenceId{ ref_id });
+        resolver.data_for_object.merge(chunk.resolver.data_for_object);
+        resolver.object_for_id.merge(chunk.resolver.object_for_id);
+        resolver.line_number_for_object.merge(
+            chunk.resolver.line_number_for_object);
+        resolver.has_reference_ids =
+            resolver.has_reference_ids || chunk.resolver.has_reference_ids;
     }
-    else if (schema_name_and_version == "V2d.1")
+    chunks.clear();
+
+    OTIO_rapidjson::Reader reader;
+    bool                   status =
+        reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(stream, handler);
+    handler.finalize();
+
+    if (handler.has_errored(error_status))
     {
-        double x, y;
-        return _fetch("x", &x) && _fetch("y", &y)
-                   ? std::any(IMATH_NAMESPACE::V2d(x, y))
-                   : std::any();
+        return false;
     }
-    else if (schema_name_and_version == "Box2d.1")
+    if (!status)
     {
-        IMATH_NAMESPACE::V2d min, max;
-        return _fetch("min", &min) && _fetch("max", &max)
-                   ? std::any(
-                         IMATH_NAMESPACE::Box2d(std::move(min), std::move(max)))
-                   : std::any();
+        return _parse_error(reader, stream, error_status);
     }
-    else
+
+    destination->swap(handler._root);
+    return true;
+}
+
+// The size and modification time of a file, to tell whether it has changed.
+struct _FileStamp
+{
+    int64_t size     = -1;
+    int64_t modified = 0;
+
+    bool operator==(_FileStamp const& other) const noexcept
     {
-        std::string ref_id;
-        if (_dict.find("OTIO_REF_ID") != _dict.end())
-        {
-            if (!_fetch("OTIO_REF_ID", &ref_id))
-            {
-                return std::any();
-            }
+        return size >= 0 && size == other.size && modified == other.modified;
+    }
+    bool operator!=(_FileStamp const& other) const noexcept
+    {
+        return !(*this == other);
+    }
+};
 
-            auto e = resolver.object_for_id.find(ref_id);
-            if (e != resolver.object_for_id.end())
-            {
-                _error(ErrorStatus(
-                    ErrorStatus::DUPLICATE_OBJECT_REFERENCE,
-                    ref_id));
-                return std::any();
-            }
-        }
+static _FileStamp
+_file_stamp(FILE* fp)
+{
+    _FileStamp stamp;
+#if defined(_WINDOWS)
+    struct _stat64 st;
+    if (_fstat64(_fileno(fp), &st) == 0)
+    {
+        stamp.size     = st.st_size;
+        stamp.modified = st.st_mtime;
+    }
+#else // _WINDOWS
+    struct stat st;
+    if (fstat(fileno(fp), &st) == 0)
+    {
+        stamp.size = st.st_size;
+#    if defined(__APPLE__)
+        stamp.modified = int64_t(st.st_mtimespec.tv_sec) * 1000000000
+                         + st.st_mtimespec.tv_nsec;
+#    else
+        stamp.modified =
+            int64_t(st.st_mtim.tv_sec) * 1000000000 + st.st_mtim.tv_nsec;
+#    endif
+    }
+#endif // _WINDOWS
+    return stamp;
+}
 
-        TypeRegistry& r = TypeRegistry::instance();
-        std::string   schema_name;
-        int           schema_version;
+static bool
+_deserialize_json_from_file(
+    std::string const&                       file_name,
+    std::any*                                destination,
+    ErrorStatus*                             error_status,
+    std::function<void(JSONDecoder&)> const& setup_handler,
+    _FileStamp*                              file_stamp = nullptr)
+{
 
-        if (!split_schema_string(
-                schema_name_and_version,
-                &schema_name,
-                &schema_version))
+    FILE* fp = nullptr;
+#if defined(_WINDOWS)
+    const int wlen =
+        MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, NULL, 0);
+    std::vector<wchar_t> wchars(wlen);
+    MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, wchars.data(), wlen);
+    if (_wfopen_s(&fp, wchars.data(), L"r") != 0)
+    {
+        fp = nullptr;
+    }
+#else  // _WINDOWS
+    fp = fopen(file_name.c_str(), "r");
+#endif // _WINDOWS
+    if (!fp)
+    {
+        if (error_status)
         {
-            _error(ErrorStatus(
-                ErrorStatus::MALFORMED_SCHEMA,
-                string_printf(
-                    "badly formed schema version string '%s'",
-                    schema_name_and_version.c_str())));
-            return std::any();
+            *error_status =
+                ErrorStatus(ErrorStatus::FILE_OPEN_FAILED, file_name);
         }
+        return false;
+    }
 
-        ErrorStatus error_status;
-        if (SerializableObject* so = r._instance_from_schema(
-                schema_name,
-                schema_version,
-                _dict,
-                true /* internal_read */,
-                &error_status))
-        {
-            if (!ref_id.empty())
-            {
-                resolver.object_for_id[ref_id] = so;
-            }
-            resolver.data_for_object.emplace(so, std::move(_dict));
-            resolver.line_number_for_object[so] = _line_number;
-            return std::any(SerializableObject::Retainer<>(so));
-        }
+    if (file_stamp)
+    {
+        *file_stamp = _file_stamp(fp);
+    }
 
-        _error(error_status);
-        return std::any();
+    OTIO_rapidjson::Reader reader;
+
+    char                           readBuffer[65536];
+    OTIO_rapidjson::FileReadStream fs(fp, readBuffer, sizeof(readBuffer));
+    OTIO_rapidjson::CursorStreamWrapper<decltype(fs)> csw(fs);
+    JSONDecoder handler(std::bind(&decltype(csw)::GetLine, &csw));
+    if (setup_handler)
+    {
+        setup_handler(handler);
     }
-}
-
-bool
-SerializableObject::Reader::read(std::string const& key, bool* value)
-{
-    return _fetch(key, value);
-}
 
-bool
-SerializableObject::Reader::read(std::string const& key, int* value)
-{
-    return _fetch(key, value);
-}
+    bool status =
+        reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(csw, handler);
+    fclose(fp);
 
-bool
-SerializableObject::Reader::read(std::string const& key, double* value)
-{
-    return _fetch(key, value);
-}
+    handler.finalize();
 
-bool
-SerializableObject::Reader::read(std::string const& key, std::string* value)
-{
-    bool had_null;
-    if (!_fetch(key, value, &had_null))
+    if (handler.has_errored(error_status))
     {
         return false;
     }
 
-    if (had_null)
+    if (!status)
     {
-        value->clear();
+        auto msg = GetParseError_En(reader.GetParseErrorCode());
+        if (error_status)
+        {
+            *error_status = ErrorStatus(
+                ErrorStatus::JSON_PARSE_ERROR,
+                string_printf(
+                    "JSON parse error on input string: %s "
+                    "(line %d, column %d)",
+                    msg,
+                    csw.GetLine(),
+                    csw.GetColumn()));
+        }
+        return false;
     }
-    return true;
-}
 
-bool
-SerializableObject::Reader::read(std::string const& key, RationalTime* value)
-{
-    return _fetch(key, value);
+    destination->swap(handler._root);
+    return true;
 }
 
-bool
-SerializableObject::Reader::read(std::string const& key, TimeRange* value)
+class SerializableObjectWithMetadata::DeferredFieldSource
 {
-    return _fetch(key, value);
-}
+public:
+    DeferredFieldSource(std::string const& file_name)
+        : _file_name(file_name)
+    {
+        ++_count;
+    }
 
-bool
-SerializableObject::Reader::read(std::string const& key, Color* value)
-{
-    return _fetch(key, value);
-}
+    ~DeferredFieldSource() { --_count; }
 
-bool
-SerializableObject::Reader::read(std::string const& key, TimeTransform* value)
-{
-    return _fetch(key, value);
-}
+    // The number of sources, which are kept by the objects whose deferred
+    // fields are not loaded yet.
+    static std::atomic<size_t> _count;
 
-bool
-SerializableObject::Reader::read(std::string const& key, AnyDictionary* value)
-{
-    return _fetch(key, value);
-}
+    // The file as it was when the objects were read from it.
+    _FileStamp _file_stamp;
 
-bool
-SerializableObject::Reader::read(std::string const& key, AnyVector* value)
-{
-    return _fetch(key, value);
-}
+    // Return the fully read object that the index'th object with deferred
+    // fields was read as.  The file is read on the first call, and must not
+    // have changed since the objects were read from it.
+    Retainer<SerializableObjectWithMetadata> take(
+        size_t                index,
+        std::type_info const& type,
+        ErrorStatus*          error_status)
+    {
+        std::lock_guard<std::mutex> lock(_mutex);
 
-bool
-SerializableObject::Reader::read(
-    std::string const&    key,
-    IMATH_NAMESPACE::V2d* value)
-{
-    return _fetch(key, value);
-}
+        if (!_loaded)
+        {
+            _loaded = true;
+
+            std::any   root;
+            _FileStamp file_stamp;
+            bool       status = _deserialize_json_from_file(
+                _file_name,
+                &root,
+                &_error_status,
+                [this](JSONDecoder& handler) {
+                    handler._deferral         = JSONDecoder::Deferral::index;
+                    handler._deferred_objects = &_objects;
+                },
+                &file_stamp);
+
+            if (_error_status.outcome != ErrorStatus::FILE_OPEN_FAILED
+                && file_stamp != _file_stamp)
+            {
+                _error_status = ErrorStatus(
+                    ErrorStatus::DEFERRED_SOURCE_CHANGED,
+                    _file_name);
+            }
+            if (!status || is_error(_error_status))
+            {
+                _objects.clear();
+            }
+        }
 
-bool
-SerializableObject::Reader::read(
-    std::string const&      key,
-    IMATH_NAMESPACE::Box2d* value)
-{
-    return _fetch(key, value);
-}
+        Retainer<SerializableObjectWithMetadata> result;
+        if (!is_error(_error_status) && index < _objects.size())
+        {
+            result          = _objects[index];
+            _objects[index] = nullptr;
+        }
 
-template <typename T>
-bool
-SerializableObject::Reader::_read_optional(
-    std::string const& key,
-    std::optional<T>*  value)
-{
-    bool had_null;
-    T    result;
-    if (!SerializableObject::Reader::_fetch(key, &result, &had_null))
-    {
-        return false;
+        if (!result || typeid(*result.value) != type)
+        {
+            if (error_status)
+            {
+                *error_status = is_error(_error_status)
+                                    ? _error_status
+                                    : ErrorStatus(
+                                        ErrorStatus::DEFERRED_SOURCE_CHANGED,
+                                        _file_name);
+            }
+            return nullptr;
+        }
+        return result;
     }
 
-    *value = had_null ? std::optional<T>() : std::optional<T>(result);
-    return true;
-}
-bool
-SerializableObject::Reader::read(
-    std::string const&   key,
-    std::optional<bool>* value)
-{
-    return _read_optional(key, value);
-}
+private:
+    std::string                                           _file_name;
+    std::mutex                                            _mutex;
+    bool                                                  _loaded = false;
+    ErrorStatus                                           _error_status;
+    std::vector<Retainer<SerializableObjectWithMetadata>> _objects;
+};
 
-bool
-SerializableObject::Reader::read(
-    std::string const&  key,
-    std::optional<int>* value)
-{
-    return _read_optional(key, value);
-}
+std::atomic<size_t>
+    SerializableObjectWithMetadata::DeferredFieldSource::_count(0);
 
 bool
-SerializableObject::Reader::read(
-    std::string const&     key,
-    std::optional<double>* value)
+SerializableObjectWithMetadata::any_deferred_fields() noexcept
 {
-    return _read_optional(key, value);
+    return DeferredFieldSource::_count > 0;
 }
 
 bool
-SerializableObject::Reader::read(
-    std::string const&           key,
-    std::optional<RationalTime>* value)
+SerializableObjectWithMetadata::_load_deferred_fields_from_source(
+    ErrorStatus* error_status) const
 {
-    return _read_optional(key, value);
-}
+    // The fields stay deferred if they cannot be loaded, so that the object
+    // is not written without them.
+    auto full =
+        _deferred_source->take(_deferred_index, typeid(*this), error_status);
+    if (!full)
+    {
+        return false;
+    }
 
-bool
-SerializableObject::Reader::read(
-    std::string const&        key,
-    std::optional<TimeRange>* value)
-{
-    return _read_optional(key, value);
+    _deferred_source.reset();
+    const_cast<SerializableObjectWithMetadata*>(this)->_take_deferred_fields(
+        full);
+    return true;
 }
 
 bool
-SerializableObject::Reader::read(
-    std::string const&        key,
-    std::optional<Color>*     value)
+deserialize_json_from_file(
+    std::string const& file_name,
+    std::any*          destination,
+    ErrorStatus*       error_status,
+    bool               lazy_metadata,
+    int                num_threads)
 {
-    return _read_optional(key, value);
-}
+    if (num_threads != 1)
+    {
+        _FileContents contents;
+        if (!contents.open(file_name))
+        {
+            if (error_status)
+            {
+                *error_status =
+                    ErrorStatus(ErrorStatus::FILE_OPEN_FAILED, file_name);
+            }
+            return false;
+        }
 
-bool
-SerializableObject::Reader::read(
-    std::string const&            key,
-    std::optional<TimeTransform>* value)
-{
-    return _read_optional(key, value);
-}
+        return _deserialize_json_in_parallel(
+            contents,
+            destination,
+            error_status,
+            lazy_metadata,
+            num_threads > 1 ? num_threads
+                            : std::max(std::thread::hardware_concurrency(), 1u));
+    }
 
-bool
-SerializableObject::Reader::read(
-    std::string const&                     key,
-    std::optional<IMATH_NAMESPACE::Box2d>* value)
-{
-    return _read_optional(key, value);
+    return _deserialize_json_from_file(
+        file_name,
+        destination,
+        error_status,
+        [lazy_metadata](JSONDecoder& handler) {
+            handler._lazy_metadata = lazy_metadata;
+        });
 }
 
 bool
-SerializableObject::Reader::read(std::string const& key, std::any* value)
+deserialize_json_skeleton_from_file(
+    std::string const& file_name,
+    std::any*          destination,
+    ErrorStatus*       error_status)
 {
-    auto e = _dict.find(key);
-    if (e == _dict.end())
-    {
-        _error(ErrorStatus(ErrorStatus::KEY_NOT_FOUND, key));
-        return false;
-    }
-    else
-    {
-        value->swap(e->second);
-        _dict.erase(e);
-        return true;
-    }
+    auto source =
+        std::make_shared<SerializableObjectWithMetadata::DeferredFieldSource>(
+            file_name);
+
+    return _deserialize_json_from_file(
+        file_name,
+        destination,
+        error_status,
+        [&source](JSONDecoder& handler) {
+            handler._deferral        = JSONDecoder::Deferral::skip;
+            handler._deferred_source = source;
+        },
+        &source->_file_stamp);
 }
 
 bool
-deserialize_json_from_string(
-    std::string const& input,
-    std::any*          destination,
-    ErrorStatus*       error_status)
+deserialize_binary_from_buffer(
+    char const*  data,
+    size_t       size,
+    std::any*    destination,
+    ErrorStatus* error_status)
 {
-    OTIO_rapidjson::Reader                            reader;
-    OTIO_rapidjson::StringStream                      ss(input.c_str());
-    OTIO_rapidjson::CursorStreamWrapper<decltype(ss)> csw(ss);
-    JSONDecoder handler(std::bind(&decltype(csw)::GetLine, &csw));
+    BinaryReader reader(data, size);
+    JSONDecoder  handler([]() { return size_t(0); });
 
-    bool status =
-        reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(csw, handler);
+    bool status = reader.parse(handler);
     handler.finalize();
 
     if (handler.has_errored(error_status))
@@ -900,15 +2899,7 @@ deserialize_json_from_string(
     {
         if (error_status)
         {
-            auto msg      = GetParseError_En(reader.GetParseErrorCode());
-            *error_status = ErrorStatus(
-                ErrorStatus::JSON_PARSE_ERROR,
-                string_printf(
-                    "JSON parse error on input string: %s "
-                    "(line %d, column %d)",
-                    msg,
-                    csw.GetLine(),
-                    csw.GetColumn()));
+            *error_status = reader.error_status();
         }
         return false;
     }
@@ -918,26 +2909,22 @@ deserialize_json_from_string(
 }
 
 bool
-deserialize_json_from_file(
+deserialize_binary_from_file(
     std::string const& file_name,
     std::any*          destination,
     ErrorStatus*       error_status)
 {
-
-    FILE* fp = nullptr;
 #if defined(_WINDOWS)
     const int wlen =
         MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, NULL, 0);
     std::vector<wchar_t> wchars(wlen);
     MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, wchars.data(), wlen);
-    if (_wfopen_s(&fp, wchars.data(), L"r") != 0)
-    {
-        fp = nullptr;
-    }
+    std::ifstream is(wchars.data(), std::ios::binary);
 #else  // _WINDOWS
-    fp = fopen(file_name.c_str(), "r");
+    std::ifstream is(file_name, std::ios::binary);
 #endif // _WINDOWS
-    if (!fp)
+
+    if (!is.is_open())
     {
         if (error_status)
         {
@@ -947,43 +2934,24 @@ deserialize_json_from_file(
         return false;
     }
 
-    OTIO_rapidjson::Reader reader;
-
-    char                           readBuffer[65536];
-    OTIO_rapidjson::FileReadStream fs(fp, readBuffer, sizeof(readBuffer));
-    OTIO_rapidjson::CursorStreamWrapper<decltype(fs)> csw(fs);
-    JSONDecoder handler(std::bind(&decltype(csw)::GetLine, &csw));
-
-    bool status =
-        reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(csw, handler);
-    fclose(fp);
-
-    handler.finalize();
-
-    if (handler.has_errored(error_status))
-    {
-        return false;
-    }
-
-    if (!status)
+    std::string data(
+        (std::istreambuf_iterator<char>(is)),
+        std::istreambuf_iterator<char>());
+    if (is.bad())
     {
-        auto msg = GetParseError_En(reader.GetParseErrorCode());
         if (error_status)
         {
-            *error_status = ErrorStatus(
-                ErrorStatus::JSON_PARSE_ERROR,
-                string_printf(
-                    "JSON parse error on input string: %s "
-                    "(line %d, column %d)",
-                    msg,
-                    csw.GetLine(),
-                    csw.GetColumn()));
+            *error_status =
+                ErrorStatus(ErrorStatus::FILE_OPEN_FAILED, file_name);
         }
         return false;
     }
 
-    destination->swap(handler._root);
-    return true;
+    return deserialize_binary_from_buffer(
+        data.data(),
+        data.size(),
+        destination,
+        error_status);
 }
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -7,18 +7,65 @@
 #include "opentimelineio/version.h"
 
 #include <any>
+#include <cstddef>
 #include <string>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
 /// @brief Deserialize JSON data from a string.
+///
+/// With lazy_metadata, the metadata of objects is kept as JSON text until
+/// it is first accessed, and written back out as it is if it never is.
+/// Metadata holding objects is always read in full.
 bool deserialize_json_from_string(
     std::string const& input,
     std::any*          destination,
-    ErrorStatus*       error_status = nullptr);
+    ErrorStatus*       error_status  = nullptr,
+    bool               lazy_metadata = false);
+
+/// @brief Deserialize JSON data from a buffer of size bytes.
+///
+/// The data is parsed in place; it does not need to be null terminated.
+bool deserialize_json_from_buffer(
+    char const*  data,
+    size_t       size,
+    std::any*    destination,
+    ErrorStatus* error_status  = nullptr,
+    bool         lazy_metadata = false);
 
 /// @brief Deserialize JSON data from a file.
+///
+/// With num_threads other than 1, the file is parsed on that many threads,
+/// or on one per core if it is 0.  The elements of the "children" arrays in
+/// the file are parsed in runs, each on its own, and the rest of the file
+/// after them.
 bool deserialize_json_from_file(
+    std::string const& file_name,
+    std::any*          destination,
+    ErrorStatus*       error_status  = nullptr,
+    bool               lazy_metadata = false,
+    int                num_threads   = 1);
+
+/// @brief Deserialize the structure of the JSON data in a file.
+///
+/// The metadata, markers and effects of timelines, stacks, tracks, clips,
+/// gaps, transitions and media references are skipped.  Each object loads
+/// them from the file when one of them is first accessed, so the file should
+/// not change while the objects are in use.
+bool deserialize_json_skeleton_from_file(
+    std::string const& file_name,
+    std::any*          destination,
+    ErrorStatus*       error_status = nullptr);
+
+/// @brief Deserialize binary (.otiob) data from a buffer of size bytes.
+bool deserialize_binary_from_buffer(
+    char const*  data,
+    size_t       size,
+    std::any*    destination,
+    ErrorStatus* error_status = nullptr);
+
+/// @brief Deserialize binary (.otiob) data from a file.
+bool deserialize_binary_from_file(
     std::string const& file_name,
     std::any*          destination,
     ErrorStatus*       error_status = nullptr);
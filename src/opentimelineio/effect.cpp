@@ -32,7 +32,17 @@ Effect::write_to(Writer& writer) const
 {
     Parent::write_to(writer);
     writer.write("effect_name", _effect_name);
-    writer.write("enabled", _enabled);
+    writer.write_unless_default("enabled", this, &Effect::_enabled);
+}
+
+void
+Effect::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<Effect*>(clone_object);
+    clone->_effect_name = _effect_name;
+    clone->_enabled     = _enabled;
 }
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -40,19 +40,25 @@ public:
     void set_effect_name(std::string const& effect_name)
     {
         _effect_name = effect_name;
+        _content_changed();
     }
 
     /// @brief Return whether the effect is enabed.
     bool enabled() const { return _enabled; };
 
     /// @brief Set whether the effect is enabled.
-    void set_enabled(bool enabled) { _enabled = enabled; }  
+    void set_enabled(bool enabled)
+    {
+        _enabled = enabled;
+        _content_changed();
+    }
 
 protected:
     virtual ~Effect();
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
 private:
     std::string _effect_name;
@@ -66,6 +66,10 @@ ErrorStatus::outcome_to_string(Outcome o)
             return "the media references cannot contain an empty key";
         case NOT_A_GAP:
             return "object is not descendent of Gap type";
+        case BINARY_PARSE_ERROR:
+            return "binary parse error";
+        case DEFERRED_SOURCE_CHANGED:
+            return "the file that deferred fields are loaded from has changed";
         default:
             return "unknown/illegal ErrorStatus::Outcome code";
     };
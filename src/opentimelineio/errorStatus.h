@@ -44,7 +44,9 @@ struct ErrorStatus
         CANNOT_COMPUTE_BOUNDS,
         MEDIA_REFERENCES_DO_NOT_CONTAIN_ACTIVE_KEY,
         MEDIA_REFERENCES_CONTAIN_EMPTY_KEY,
-        NOT_A_GAP
+        NOT_A_GAP,
+        BINARY_PARSE_ERROR,
+        DEFERRED_SOURCE_CHANGED
     };
 
     /// @brief Construct a new status with no error.
@@ -30,4 +30,13 @@ ExternalReference::write_to(Writer& writer) const
     writer.write("target_url", _target_url);
 }
 
+void
+ExternalReference::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<ExternalReference*>(clone_object);
+    clone->_target_url = _target_url;
+}
+
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
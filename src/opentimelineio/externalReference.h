@@ -41,6 +41,7 @@ public:
     void set_target_url(std::string const& target_url)
     {
         _target_url = target_url;
+        _content_changed();
     }
 
 protected:
@@ -48,6 +49,7 @@ protected:
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
 private:
     std::string _target_url;
@@ -36,4 +36,14 @@ GeneratorReference::write_to(Writer& writer) const
     writer.write("parameters", _parameters);
 }
 
+void
+GeneratorReference::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<GeneratorReference*>(clone_object);
+    clone->_generator_kind = _generator_kind;
+    clone->_parameters     = cloner.clone(_parameters);
+}
+
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
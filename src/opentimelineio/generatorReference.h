@@ -45,10 +45,15 @@ public:
     void set_generator_kind(std::string const& generator_kind)
     {
         _generator_kind = generator_kind;
+        _content_changed();
     }
 
     /// @brief Modify the generator parameters.
-    AnyDictionary& parameters() noexcept { return _parameters; }
+    AnyDictionary& parameters() noexcept
+    {
+        _content_changed();
+        return _parameters;
+    }
 
     /// @brief Return the generator parameters.
     AnyDictionary parameters() const noexcept { return _parameters; }
@@ -58,6 +63,7 @@ protected:
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
 private:
     std::string   _generator_kind;
@@ -268,4 +268,20 @@ ImageSequenceReference::write_to(Writer& writer) const
     }
     writer.write("missing_frame_policy", missing_frame_policy_value);
 }
+
+void
+ImageSequenceReference::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<ImageSequenceReference*>(clone_object);
+    clone->_target_url_base      = _target_url_base;
+    clone->_name_prefix          = _name_prefix;
+    clone->_name_suffix          = _name_suffix;
+    clone->_start_frame          = _start_frame;
+    clone->_frame_step           = _frame_step;
+    clone->_rate                 = _rate;
+    clone->_frame_zero_padding   = _frame_zero_padding;
+    clone->_missing_frame_policy = _missing_frame_policy;
+}
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -72,6 +72,7 @@ public:
     void set_target_url_base(std::string const& target_url_base)
     {
         _target_url_base = target_url_base;
+        _content_changed();
     }
 
     /// @brief Return the file name prefix.
@@ -81,6 +82,7 @@ public:
     void set_name_prefix(std::string const& target_url_base)
     {
         _name_prefix = target_url_base;
+        _content_changed();
     }
 
     /// @brief Return the file name suffix.
@@ -90,6 +92,7 @@ public:
     void set_name_suffix(std::string const& target_url_base)
     {
         _name_suffix = target_url_base;
+        _content_changed();
     }
 
     /// @brief Return the start frame.
@@ -99,19 +102,28 @@ public:
     void set_start_frame(int start_frame) noexcept
     {
         _start_frame = start_frame;
+        _content_changed();
     }
 
     /// @brief Return the frame step.
     int frame_step() const noexcept { return _frame_step; }
 
     /// @brief Set the frame step.
-    void set_frame_step(int frame_step) noexcept { _frame_step = frame_step; }
+    void set_frame_step(int frame_step) noexcept
+    {
+        _frame_step = frame_step;
+        _content_changed();
+    }
 
     /// @brief Return the frame rate.
     double rate() const noexcept { return _rate; }
 
     /// @brief Set the frame rate.
-    void set_rate(double rate) noexcept { _rate = rate; }
+    void set_rate(double rate) noexcept
+    {
+        _rate = rate;
+        _content_changed();
+    }
 
     /// @brief Return the frame number zero padding.
     int frame_zero_padding() const noexcept { return _frame_zero_padding; }
@@ -120,6 +132,7 @@ public:
     void set_frame_zero_padding(int frame_zero_padding) noexcept
     {
         _frame_zero_padding = frame_zero_padding;
+        _content_changed();
     }
 
     /// @brief Set the missing frame policy.
@@ -127,6 +140,7 @@ public:
     set_missing_frame_policy(MissingFramePolicy missing_frame_policy) noexcept
     {
         _missing_frame_policy = missing_frame_policy;
+        _content_changed();
     }
 
     /// @brief Return the missing frame policy.
@@ -161,6 +175,7 @@ protected:
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
 private:
     std::string        _target_url_base;
@@ -186,11 +186,34 @@ void
 Item::write_to(Writer& writer) const
 {
     Parent::write_to(writer);
-    writer.write("source_range", _source_range);
-    writer.write("effects", _effects);
-    writer.write("markers", _markers);
-    writer.write("enabled", _enabled);
-    writer.write("color", _color);
+    writer.write_unless_default("source_range", this, &Item::_source_range);
+    writer.write_unless_default("effects", this, &Item::_effects);
+    writer.write_unless_default("markers", this, &Item::_markers);
+    writer.write_unless_default("enabled", this, &Item::_enabled);
+    writer.write_unless_default("color", this, &Item::_color);
+}
+
+void
+Item::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<Item*>(clone_object);
+    clone->_source_range = _source_range;
+    clone->_effects      = cloner.clone(_effects);
+    clone->_markers      = cloner.clone(_markers);
+    clone->_enabled      = _enabled;
+    clone->_color        = _color;
+}
+
+void
+Item::_take_deferred_fields(SerializableObjectWithMetadata* source)
+{
+    Parent::_take_deferred_fields(source);
+
+    auto item = static_cast<Item*>(source);
+    _effects.swap(item->_effects);
+    _markers.swap(item->_markers);
 }
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
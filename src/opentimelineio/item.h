@@ -7,6 +7,7 @@
 #include "opentimelineio/color.h"
 #include "opentimelineio/composable.h"
 #include "opentimelineio/errorStatus.h"
+#include "opentimelineio/timingStamp.h"
 #include "opentimelineio/version.h"
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
@@ -53,7 +54,11 @@ public:
     bool enabled() const { return _enabled; };
 
     /// @brief Set whether the item is enabled.
-    void set_enabled(bool enabled) { _enabled = enabled; }
+    void set_enabled(bool enabled)
+    {
+        _enabled = enabled;
+        _content_changed();
+    }
 
     /// @brief Return the source range of the item.
     std::optional<TimeRange> source_range() const noexcept
@@ -65,23 +70,37 @@ public:
     void set_source_range(std::optional<TimeRange> const& source_range)
     {
         _source_range = source_range;
+        bump_timing_stamp();
+        _content_changed();
     }
 
     /// @brief Modify the list of effects.
-    std::vector<Retainer<Effect>>& effects() noexcept { return _effects; }
+    std::vector<Retainer<Effect>>& effects() noexcept
+    {
+        _load_deferred_fields();
+        _content_changed();
+        return _effects;
+    }
 
     /// @brief Return the list of effects.
     std::vector<Retainer<Effect>> const& effects() const noexcept
     {
+        _load_deferred_fields();
         return _effects;
     }
 
     /// @brief Modify the list of markers.
-    std::vector<Retainer<Marker>>& markers() noexcept { return _markers; }
+    std::vector<Retainer<Marker>>& markers() noexcept
+    {
+        _load_deferred_fields();
+        _content_changed();
+        return _markers;
+    }
 
     /// @brief Return the list of markers.
     std::vector<Retainer<Marker>> const& markers() const noexcept
     {
+        _load_deferred_fields();
         return _markers;
     }
 
@@ -128,6 +147,7 @@ public:
     void set_color(std::optional<Color> const& color)
     {
         _color = color;
+        _content_changed();
     }
 
 protected:
@@ -135,6 +155,8 @@ protected:
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
+    void _take_deferred_fields(SerializableObjectWithMetadata* source) override;
 
 private:
     std::optional<TimeRange>      _source_range;
@@ -31,4 +31,13 @@ LinearTimeWarp::write_to(Writer& writer) const
     writer.write("time_scalar", _time_scalar);
 }
 
+void
+LinearTimeWarp::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<LinearTimeWarp*>(clone_object);
+    clone->_time_scalar = _time_scalar;
+}
+
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -40,6 +40,7 @@ public:
     void set_time_scalar(double time_scalar) noexcept
     {
         _time_scalar = time_scalar;
+        _content_changed();
     }
 
 protected:
@@ -47,6 +48,7 @@ protected:
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
 private:
     double _time_scalar;
@@ -34,9 +34,20 @@ void
 Marker::write_to(Writer& writer) const
 {
     Parent::write_to(writer);
-    writer.write("color", _color);
+    writer.write_unless_default("color", this, &Marker::_color);
     writer.write("marked_range", _marked_range);
-    writer.write("comment", _comment);
+    writer.write_unless_default("comment", this, &Marker::_comment);
+}
+
+void
+Marker::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<Marker*>(clone_object);
+    clone->_color        = _color;
+    clone->_marked_range = _marked_range;
+    clone->_comment      = _comment;
 }
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -59,7 +59,11 @@ public:
     std::string color() const noexcept { return _color; }
 
     /// @brief Set the marker color.
-    void set_color(std::string const& color) { _color = color; }
+    void set_color(std::string const& color)
+    {
+        _color = color;
+        _content_changed();
+    }
 
     /// @brief Return the marker time range.
     TimeRange marked_range() const noexcept { return _marked_range; }
@@ -68,19 +72,25 @@ public:
     void set_marked_range(TimeRange const& marked_range) noexcept
     {
         _marked_range = marked_range;
+        _content_changed();
     }
 
     /// @brief Return the marker comment.
     std::string comment() const noexcept { return _comment; }
 
     /// @brief Set the marker comment.
-    void set_comment(std::string const& comment) { _comment = comment; }
+    void set_comment(std::string const& comment)
+    {
+        _comment = comment;
+        _content_changed();
+    }
 
 protected:
     virtual ~Marker();
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
 private:
     std::string _color;
@@ -38,8 +38,24 @@ void
 MediaReference::write_to(Writer& writer) const
 {
     Parent::write_to(writer);
-    writer.write("available_range", _available_range);
-    writer.write("available_image_bounds", _available_image_bounds);
+    writer.write_unless_default(
+        "available_range",
+        this,
+        &MediaReference::_available_range);
+    writer.write_unless_default(
+        "available_image_bounds",
+        this,
+        &MediaReference::_available_image_bounds);
+}
+
+void
+MediaReference::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<MediaReference*>(clone_object);
+    clone->_available_range        = _available_range;
+    clone->_available_image_bounds = _available_image_bounds;
 }
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
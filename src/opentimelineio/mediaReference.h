@@ -4,6 +4,7 @@
 #pragma once
 
 #include "opentimelineio/serializableObjectWithMetadata.h"
+#include "opentimelineio/timingStamp.h"
 #include "opentimelineio/version.h"
 
 #include <Imath/ImathBox.h>
@@ -48,6 +49,8 @@ public:
     void set_available_range(std::optional<TimeRange> const& available_range)
     {
         _available_range = available_range;
+        bump_timing_stamp();
+        _content_changed();
     }
 
     /// @brief Return whether the reference is missing.
@@ -64,6 +67,7 @@ public:
         std::optional<IMATH_NAMESPACE::Box2d> const& available_image_bounds)
     {
         _available_image_bounds = available_image_bounds;
+        _content_changed();
     }
 
 protected:
@@ -71,6 +75,7 @@ protected:
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
 private:
     std::optional<TimeRange>              _available_range;
@@ -22,6 +22,7 @@ void
 SerializableCollection::clear_children()
 {
     _children.clear();
+    _content_changed();
 }
 
 void
@@ -29,6 +30,7 @@ SerializableCollection::set_children(
     std::vector<SerializableObject*> const& children)
 {
     _children = decltype(_children)(children.begin(), children.end());
+    _content_changed();
 }
 
 void
@@ -43,6 +45,7 @@ SerializableCollection::insert_child(int index, SerializableObject* child)
     {
         _children.insert(_children.begin() + std::max(index, 0), child);
     }
+    _content_changed();
 }
 
 bool
@@ -62,6 +65,7 @@ SerializableCollection::set_child(
     }
 
     _children[index] = child;
+    _content_changed();
     return true;
 }
 
@@ -88,6 +92,7 @@ SerializableCollection::remove_child(int index, ErrorStatus* error_status)
         _children.erase(_children.begin() + std::max(index, 0));
     }
 
+    _content_changed();
     return true;
 }
 
@@ -104,6 +109,15 @@ SerializableCollection::write_to(Writer& writer) const
     writer.write("children", _children);
 }
 
+void
+SerializableCollection::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<SerializableCollection*>(clone_object);
+    clone->_children = cloner.clone(_children);
+}
+
 std::vector<SerializableObject::Retainer<Clip>>
 SerializableCollection::find_clips(
     ErrorStatus*                    error_status,
@@ -55,6 +55,7 @@ public:
     /// @brief Modify the list of children.
     std::vector<Retainer<SerializableObject>>& children() noexcept
     {
+        _content_changed();
         return _children;
     }
 
@@ -106,6 +107,7 @@ protected:
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
 private:
     std::vector<Retainer<SerializableObject>> _children;
@@ -16,7 +16,9 @@ SerializableObject::SerializableObject()
 }
 
 SerializableObject::~SerializableObject()
-{}
+{
+    _content_changed();
+}
 
 // forwarded functions
 std::string
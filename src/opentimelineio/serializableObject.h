@@ -17,12 +17,15 @@
 #include "serialization.h"
 
 #include <list>
+#include <memory>
 #include <optional>
 #include <unordered_map>
+#include <unordered_set>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
 class CloningEncoder;
+class HashingEncoder;
 
 /// @brief A serializable object.
 class SerializableObject
@@ -88,25 +91,66 @@ public:
         ErrorStatus*       error_status = nullptr);
 
     /// @brief Return whether this object is equivalent to another.
-    bool is_equivalent_to(SerializableObject const& other) const;
+    ///
+    /// If float_precision is not 0, the non-integral numbers of time, color
+    /// and geometry values only have to be equal to that many significant
+    /// digits, so that an object is equivalent to what is read back after
+    /// serialize_json_to_string() writes it with that float_precision.
+    /// Times must still be in the same frames.
+    bool is_equivalent_to(
+        SerializableObject const& other,
+        int                       float_precision = 0) const;
+
+    /// @brief Return a hash of the content of this object.
+    ///
+    /// The hash covers the schema name and version, the fields, the metadata
+    /// and, recursively, the hashes of the objects this object holds, so two
+    /// objects that serialize to the same JSON have the same hash. It does
+    /// not change between runs.
+    ///
+    /// The hash is cached, and the cache is discarded when the object, or an
+    /// object it holds, is changed through its setters or accessors. Edits
+    /// made through a reference to the metadata, markers, effects or children
+    /// obtained before the hash was computed are not seen; call
+    /// bump_content_stamp() after such edits.
+    ///
+    /// If the operation fails, 0 is returned and error_status is set
+    /// appropriately.
+    uint64_t content_hash(ErrorStatus* error_status = nullptr) const;
 
     /// @brief Makes a (deep) clone of this instance.
     ///
-    /// Descendent objects are cloned as well.
+    /// Descendent objects are cloned as well. Objects of the built-in
+    /// schemas are copied field by field; other objects are cloned by
+    /// serializing them.
     ///
     /// If the operation fails, nullptr is returned and error_status
     /// is set appropriately.
     SerializableObject* clone(ErrorStatus* error_status = nullptr) const;
 
+    /// @brief Makes a clone of this instance, like clone(), except that the
+    /// compositions in the clone are left without children.
+    ///
+    /// This lets a caller build a copy of only the parts of a tree it keeps,
+    /// by adding clones of those children to the empty compositions.
+    SerializableObject*
+    clone_without_children(ErrorStatus* error_status = nullptr) const;
+
     /// @brief Allow external system (e.g. Python, Swift) to add serializable
     /// fields on the fly.
     ///
     /// C++ implementations should have no need for this functionality.
-    AnyDictionary& dynamic_fields() { return _dynamic_fields; }
+    AnyDictionary& dynamic_fields()
+    {
+        _content_changed();
+        return _dynamic_fields;
+    }
 
     template <typename T = SerializableObject>
     struct Retainer;
 
+    struct RawJSON;
+
     /// @brief This class provides reading functionality.
     class Reader
     {
@@ -161,8 +205,11 @@ public:
         template <typename T>
         bool read(std::string const& key, Retainer<T>* dest)
         {
+            // the value is held on to until dest retains the object, as it
+            // may hold the only reference to it
+            std::any            a;
             SerializableObject* so;
-            if (!read(key, &so))
+            if (!read(key, &a) || !_from_any(a, &so))
             {
                 return false;
             }
@@ -194,6 +241,13 @@ public:
             return _dict.find(key) != _dict.end();
         }
 
+        /// @brief Fetch the value of key if it is JSON text that has not
+        /// been parsed yet.
+        ///
+        /// Returns false, and leaves the value to be read as usual, if it
+        /// is anything else.
+        bool read_raw_json(std::string const& key, RawJSON* dest);
+
         template <typename T>
         bool read_if_present(std::string const& key, T* dest)
         {
@@ -218,9 +272,30 @@ public:
             std::map<std::string, SerializableObject*>   object_for_id;
             std::map<SerializableObject*, int>           line_number_for_object;
 
+            struct _Schema
+            {
+                std::string name;
+                int         version         = 0;
+                int         current_version = -1;
+            };
+            std::unordered_map<std::string, _Schema> schema_for_label;
+
+            // whether any references to objects have been read
+            bool has_reference_ids = false;
+
             void finalize(error_function_t error_function)
             {
-                for (auto e: data_for_object)
+                // Reading an object consumes its data, which may hold the
+                // only references to objects that are yet to be read, so
+                // all of them are kept alive until every one has been read.
+                std::vector<Retainer<>> objects;
+                objects.reserve(data_for_object.size());
+                for (auto& e: data_for_object)
+                {
+                    objects.emplace_back(e.first);
+                }
+
+                for (auto& e: data_for_object)
                 {
                     int line_number = line_number_for_object[e.first];
                     Reader::_fix_reference_ids(
@@ -248,7 +323,7 @@ public:
             std::vector<T>   result;
             result.reserve(av.size());
 
-            for (auto e: av)
+            for (auto const& e: av)
             {
                 T elem;
                 if (!_from_any(e, &elem))
@@ -274,7 +349,7 @@ public:
             AnyVector const& av = std::any_cast<AnyVector const&>(source);
             std::list<T>     result;
 
-            for (auto e: av)
+            for (auto const& e: av)
             {
                 T elem;
                 if (!_from_any(e, &elem))
@@ -301,7 +376,7 @@ public:
                 std::any_cast<AnyDictionary const&>(source);
             std::map<std::string, T> result;
 
-            for (auto e: dict)
+            for (auto const& e: dict)
             {
                 T elem;
                 if (!_from_any(e.second, &elem))
@@ -401,6 +476,24 @@ public:
         bool _fetch(std::string const& key, int64_t* dest);
         bool _fetch(std::string const& key, double* dest);
         bool _fetch(std::string const& key, SerializableObject** dest);
+
+        // Times are also read from the arrays of their numbers that
+        // serialize_json_to_string() writes with compact_times.
+        bool _fetch(
+            std::string const& key,
+            RationalTime*      dest,
+            bool*              had_null = nullptr);
+        bool _fetch(
+            std::string const& key,
+            TimeRange*         dest,
+            bool*              had_null = nullptr);
+        bool _fetch_numbers(
+            std::string const& key,
+            AnyVector const&   value,
+            double*            numbers,
+            size_t             count);
+
+        void _parse_raw_json(std::any& value);
         bool
         _type_check(std::type_info const& wanted, std::type_info const& found);
         bool _type_check_so(
@@ -408,6 +501,11 @@ public:
             std::type_info const& found,
             std::type_info const& so_type);
 
+        // Replace the references to objects that have been read, and
+        // return whether there were no others.
+        static bool _resolve_reference_ids(AnyDictionary&, _Resolver&);
+        static bool _resolve_reference_ids(std::any&, _Resolver&);
+
         static void _fix_reference_ids(
             AnyDictionary&,
             error_function_t const& error_function,
@@ -442,7 +540,8 @@ public:
             std::any const&           value,
             class Encoder&            encoder,
             const schema_version_map* downgrade_version_manifest = nullptr,
-            ErrorStatus*              error_status               = nullptr);
+            ErrorStatus*              error_status               = nullptr,
+            bool                      omit_defaults              = false);
 
         void write(std::string const& key, bool value);
         void write(std::string const& key, int64_t value);
@@ -469,6 +568,11 @@ public:
         void write(std::string const& key, AnyVector const& value);
         void write(std::string const& key, std::any const& value);
 
+        /// @brief Write JSON text as it is, if the encoder writes JSON.
+        ///
+        /// Returns false, without writing anything, if it does not.
+        bool write_raw_json(std::string const& key, RawJSON const& value);
+
         template <typename T>
         void write(std::string const& key, T const& value)
         {
@@ -481,6 +585,48 @@ public:
             write(key, retainer.value);
         }
 
+        /// @brief Return whether fields that are equal to their default
+        /// value are left out.
+        bool omits_defaults() const noexcept { return _omit_defaults; }
+
+        /// @brief Return whether the field of object is left out, because
+        /// it is equal to its default value.
+        ///
+        /// The default value is the value of the field in the object the
+        /// reader creates for the schema, before it reads any fields.
+        template <typename T, typename U>
+        bool is_default(T const* object, U T::*field)
+        {
+            if (!_omit_defaults)
+            {
+                return false;
+            }
+            auto defaults = dynamic_cast<T const*>(_default_object(object));
+            return defaults
+                   && _equals_default(object->*field, defaults->*field);
+        }
+
+        /// @brief Write the field of object, unless it is equal to its
+        /// default value and defaults are left out.
+        ///
+        /// Only use this for fields that are read with
+        /// Reader::read_if_present(), which leaves a missing field at its
+        /// default value.
+        template <typename T, typename U>
+        void write_unless_default(
+            std::string const& key,
+            T const*           object,
+            U T::*field)
+        {
+            if (!is_default(object, field))
+            {
+                write(key, object->*field);
+            }
+        }
+
+        /// @brief Fail the serialization with the given error.
+        void error(ErrorStatus const& error_status);
+
     private:
         /// Convenience routines for converting various STL structures of specific
         /// types to a parallel hierarchy holding std::any.
@@ -557,9 +703,11 @@ public:
 
         Writer(
             class Encoder&            encoder,
-            const schema_version_map* downgrade_version_manifest)
+            const schema_version_map* downgrade_version_manifest,
+            bool                      omit_defaults = false)
             : _encoder(encoder)
             , _downgrade_version_manifest(downgrade_version_manifest)
+            , _omit_defaults(omit_defaults)
 
         {
             _build_dispatch_tables();
@@ -572,6 +720,30 @@ public:
 
         void _build_dispatch_tables();
         void _write(std::string const& key, std::any const& value);
+
+        SerializableObject const*
+        _default_object(SerializableObject const* object);
+
+        template <typename U>
+        static bool _equals_default(U const& value, U const& default_value)
+        {
+            return value == default_value;
+        }
+
+        template <typename U>
+        static bool _equals_default(
+            std::vector<U> const& values,
+            std::vector<U> const& default_values)
+        {
+            return values.empty() && default_values.empty();
+        }
+
+        static bool _equals_default(
+            AnyDictionary const& value,
+            AnyDictionary const& default_value)
+        {
+            return value.empty() && default_value.empty();
+        }
         void _encoder_write_key(std::string const& key);
 
         bool _any_dict_equals(std::any const& lhs, std::any const& rhs);
@@ -597,8 +769,85 @@ public:
         Writer*         _child_writer          = nullptr;
         CloningEncoder* _child_cloning_encoder = nullptr;
 
+        std::unordered_map<
+            TypeRegistry::_TypeRecord const*,
+            SerializableObject*>
+            _default_objects;
+
         class Encoder&            _encoder;
         const schema_version_map* _downgrade_version_manifest;
+        bool                      _omit_defaults;
+        int                       _float_precision = 0;
+        friend class SerializableObject;
+    };
+
+    /// @brief This class provides cloning functionality.
+    ///
+    /// The built-in schemas clone themselves by copying their fields with a
+    /// Cloner; see _copy_to().
+    class Cloner
+    {
+    public:
+        /// @brief Return a deep copy of value, or nullptr for nullptr.
+        SerializableObject* clone(SerializableObject const* value);
+
+        template <typename T>
+        Retainer<T> clone(Retainer<T> const& value)
+        {
+            Retainer<> result(clone(value.value));
+            return Retainer<T>(dynamic_cast<T*>(result.value));
+        }
+
+        template <typename T>
+        std::vector<Retainer<T>> clone(std::vector<Retainer<T>> const& values)
+        {
+            std::vector<Retainer<T>> result;
+            result.reserve(values.size());
+            for (auto const& value: values)
+            {
+                result.push_back(clone(value));
+            }
+            return result;
+        }
+
+        template <typename T>
+        std::map<std::string, Retainer<T>>
+        clone(std::map<std::string, Retainer<T>> const& values)
+        {
+            std::map<std::string, Retainer<T>> result;
+            for (auto const& e: values)
+            {
+                result.emplace_hint(result.end(), e.first, clone(e.second));
+            }
+            return result;
+        }
+
+        AnyDictionary clone(AnyDictionary const& value);
+        AnyVector     clone(AnyVector const& value);
+        std::any      clone(std::any const& value);
+
+        /// @brief Return whether the children of compositions are cloned.
+        bool clones_children() const noexcept { return _clones_children; }
+
+        /// @brief Fail the clone with the given error.
+        void error(ErrorStatus const& error_status)
+        {
+            _error_status = error_status;
+        }
+
+    private:
+        explicit Cloner(bool clones_children = true)
+            : _clones_children(clones_children)
+        {}
+
+        Cloner(Cloner const&)           = delete;
+        Cloner operator=(Cloner const&) = delete;
+
+        // objects being copied, to detect cycles
+        std::unordered_set<SerializableObject const*> _copying;
+        ErrorStatus                                   _error_status;
+        bool                                          _clones_children;
+
         friend class SerializableObject;
     };
 
@@ -678,6 +927,20 @@ protected:
 
     virtual std::string _schema_name_for_reference() const;
 
+    /// @brief Copy the fields of this object to clone, a newly created object
+    /// of the same schema, cloning the objects it holds with cloner.
+    ///
+    /// Like read_from() and write_to(), each schema handles its own fields
+    /// and then calls its parent class. Only the built-in schemas clone
+    /// this way; other schemas are cloned by serializing them.
+    virtual void _copy_to(SerializableObject* clone, Cloner& cloner) const;
+
+    /// @brief Discard the cached content hash of this object, and of the
+    /// objects whose content hash includes it.
+    ///
+    /// Called by every function that changes what this object serializes.
+    void _content_changed() noexcept;
+
 private:
     SerializableObject(SerializableObject const&)            = delete;
     SerializableObject& operator=(SerializableObject const&) = delete;
@@ -698,6 +961,12 @@ public:
         }
     };
 
+    /// @brief This struct holds JSON text that is parsed when it is needed.
+    struct RawJSON
+    {
+        std::shared_ptr<std::string const> json;
+    };
+
     /// @todo Add comment.
     void install_external_keepalive_monitor(
         std::function<void()> monitor,
@@ -720,6 +989,9 @@ private:
 
     TypeRegistry::_TypeRecord const* _type_record() const;
 
+    SerializableObject* _clone_with_encoder(ErrorStatus* error_status) const;
+    SerializableObject* _clone(Cloner& cloner, ErrorStatus* error_status) const;
+
     mutable TypeRegistry::_TypeRecord const* _cached_type_record;
     int                                      _managed_ref_count;
     std::function<void()>                    _external_keepalive_monitor;
@@ -727,7 +999,12 @@ private:
     mutable std::mutex _mutex;
 
     AnyDictionary _dynamic_fields;
+
+    struct _ContentHashCache;
+    mutable std::shared_ptr<_ContentHashCache> _content_hash_cache;
+
     friend class TypeRegistry;
+    friend class HashingEncoder;
 };
 
 template <class T, class U>
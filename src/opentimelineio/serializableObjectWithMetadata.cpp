@@ -3,8 +3,32 @@
 
 #include "opentimelineio/serializableObjectWithMetadata.h"
 
+#include <cctype>
+
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
+namespace {
+
+bool
+_is_empty_json_object(std::string const& json)
+{
+    std::string text;
+    for (char c: json)
+    {
+        if (!std::isspace(static_cast<unsigned char>(c)))
+        {
+            text.push_back(c);
+            if (text.size() > 2)
+            {
+                return false;
+            }
+        }
+    }
+    return text == "{}";
+}
+
+} // namespace
+
 SerializableObjectWithMetadata::SerializableObjectWithMetadata(
     std::string const&   name,
     AnyDictionary const& metadata)
@@ -18,6 +42,7 @@ SerializableObjectWithMetadata::~SerializableObjectWithMetadata()
 bool
 SerializableObjectWithMetadata::read_from(Reader& reader)
 {
+    reader.read_raw_json("metadata", &_raw_metadata);
     return reader.read_if_present("metadata", &_metadata)
            && reader.read_if_present("name", &_name)
            && SerializableObject::read_from(reader);
@@ -26,9 +51,55 @@ SerializableObjectWithMetadata::read_from(Reader& reader)
 void
 SerializableObjectWithMetadata::write_to(Writer& writer) const
 {
+    ErrorStatus error_status;
+    if (!load_deferred_fields(&error_status))
+    {
+        writer.error(error_status);
+        return;
+    }
+
     SerializableObject::write_to(writer);
-    writer.write("metadata", _metadata);
-    writer.write("name", _name);
+    // _metadata stays empty until the raw metadata is loaded
+    bool const omit_metadata =
+        writer.is_default(this, &SerializableObjectWithMetadata::_metadata)
+        && (!_raw_metadata.json || _is_empty_json_object(*_raw_metadata.json));
+    if (!omit_metadata
+        && (!_raw_metadata.json
+            || !writer.write_raw_json("metadata", _raw_metadata)))
+    {
+        _load_metadata();
+        writer.write("metadata", _metadata);
+    }
+    writer.write_unless_default(
+        "name",
+        this,
+        &SerializableObjectWithMetadata::_name);
+}
+
+void
+SerializableObjectWithMetadata::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    ErrorStatus error_status;
+    if (!load_deferred_fields(&error_status))
+    {
+        cloner.error(error_status);
+        return;
+    }
+
+    SerializableObject::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<SerializableObjectWithMetadata*>(clone_object);
+    clone->_metadata     = cloner.clone(_metadata);
+    clone->_raw_metadata = _raw_metadata;
+    clone->_name         = _name;
+}
+
+void
+SerializableObjectWithMetadata::_take_deferred_fields(
+    SerializableObjectWithMetadata* source)
+{
+    _metadata.swap(source->_metadata);
+    _raw_metadata = std::move(source->_raw_metadata);
 }
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
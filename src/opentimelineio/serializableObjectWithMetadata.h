@@ -6,6 +6,8 @@
 #include "opentimelineio/serializableObject.h"
 #include "opentimelineio/version.h"
 
+#include <memory>
+
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
 /// @brief A serializable object with metadata.
@@ -33,23 +35,93 @@ public:
     std::string name() const noexcept { return _name; }
 
     /// @brief Set the object name.
-    void set_name(std::string const& name) { _name = name; }
+    void set_name(std::string const& name)
+    {
+        _name = name;
+        _content_changed();
+    }
 
     /// @brief Modify the object metadata.
-    AnyDictionary& metadata() noexcept { return _metadata; }
+    AnyDictionary& metadata() noexcept
+    {
+        _load_metadata();
+        _content_changed();
+        return _metadata;
+    }
 
     /// @brief Return the object metadata.
-    AnyDictionary metadata() const noexcept { return _metadata; }
+    AnyDictionary metadata() const noexcept
+    {
+        _load_metadata();
+        return _metadata;
+    }
+
+    /// @brief Return whether fields of the object were skipped when it was
+    /// read by deserialize_json_skeleton_from_file().
+    ///
+    /// Deferred fields are loaded from the source file the first time any of
+    /// them is accessed.
+    bool has_deferred_fields() const noexcept
+    {
+        return bool(_deferred_source);
+    }
+
+    /// @brief Load the deferred fields, if there are any.
+    ///
+    /// This fails, and the fields stay deferred, if the source file cannot
+    /// be read any more or has changed since the object was read from it.
+    bool load_deferred_fields(ErrorStatus* error_status = nullptr) const
+    {
+        return !_deferred_source
+               || _load_deferred_fields_from_source(error_status);
+    }
+
+    /// @brief Return whether any object still has deferred fields.
+    static bool any_deferred_fields() noexcept;
+
+    /// @brief The file that deferred fields are loaded from.
+    class DeferredFieldSource;
 
 protected:
     virtual ~SerializableObjectWithMetadata();
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
+
+    /// @brief Load the deferred fields, if there are any.
+    ///
+    /// Accessors that cannot report errors use this, and see empty fields if
+    /// they cannot be loaded.
+    void _load_deferred_fields() const { load_deferred_fields(); }
+
+    /// @brief Take the deferred fields of a fully read copy of this object.
+    virtual void _take_deferred_fields(SerializableObjectWithMetadata* source);
 
 private:
+    friend class JSONDecoder;
+
+    void _load_metadata() const
+    {
+        _load_deferred_fields();
+        if (_raw_metadata.json)
+        {
+            _parse_raw_metadata();
+        }
+    }
+
+    bool _load_deferred_fields_from_source(ErrorStatus* error_status) const;
+    void _parse_raw_metadata() const;
+
     std::string   _name;
     AnyDictionary _metadata;
+
+    // The metadata as JSON text, when it was read with the lazy metadata
+    // policy and has not been accessed since.
+    mutable RawJSON _raw_metadata;
+
+    mutable std::shared_ptr<DeferredFieldSource> _deferred_source;
+    size_t                                       _deferred_index = 0;
 };
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
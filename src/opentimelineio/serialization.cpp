@@ -2,22 +2,32 @@
 // Copyright Contributors to the OpenTimelineIO project
 
 #include "opentimelineio/serialization.h"
+#include "binaryFormat.h"
 #include "errorStatus.h"
 #include "opentimelineio/anyDictionary.h"
 #include "opentimelineio/color.h"
+#include "opentimelineio/composition.h"
+#include "opentimelineio/contentStamp.h"
 #include "opentimelineio/serializableObject.h"
+#include "opentimelineio/serializableObjectWithMetadata.h"
 #include "opentimelineio/unknownSchema.h"
 #include "stringUtils.h"
+#include <cmath>
 #include <cstddef>
+#include <cstring>
+#include <limits>
 #include <string>
+#include <unordered_map>
 
 #define RAPIDJSON_NAMESPACE OTIO_rapidjson
 #include <rapidjson/ostreamwrapper.h>
 #include <rapidjson/prettywriter.h>
+#include <rapidjson/reader.h>
 #include <rapidjson/stringbuffer.h>
 #include <rapidjson/writer.h>
 
 #include <fstream>
+#include <sstream>
 
 #if defined(_WINDOWS)
 #    ifndef WIN32_LEAN_AND_MEAN
@@ -31,6 +41,65 @@
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
+/**
+ * Round a non-integral value to the given number of significant digits, or
+ * return it as it is if precision is 0.  The result is the double nearest to
+ * the rounded decimal, so it is written as that decimal.
+ */
+static double
+_round_to_precision(double value, int precision)
+{
+    static constexpr double powers_of_ten[] = {
+        1e0,  1e1,  1e2,  1e3,  1e4,  1e5,  1e6,  1e7,  1e8,  1e9,  1e10, 1e11,
+        1e12, 1e13, 1e14, 1e15, 1e16, 1e17, 1e18, 1e19, 1e20, 1e21, 1e22
+    };
+
+    if (precision <= 0 || precision >= 17 || !std::isfinite(value)
+        || value == std::trunc(value))
+    {
+        return value;
+    }
+
+    int const exponent =
+        precision - 1
+        - static_cast<int>(std::floor(std::log10(std::abs(value))));
+    if (exponent > 22 || exponent < -22)
+    {
+        // powers of ten beyond these are not exact doubles
+        return value;
+    }
+
+    // dividing by an exact power of ten rounds only once
+    return exponent >= 0
+               ? std::round(value * powers_of_ten[exponent])
+                     / powers_of_ten[exponent]
+               : std::round(value / powers_of_ten[-exponent])
+                     * powers_of_ten[-exponent];
+}
+
+/**
+ * Round the non-integral value of a time to the given number of significant
+ * digits after its whole frames, rather than of the whole value, so that the
+ * frame it is in does not change however large it is.  A value that would
+ * round into the next frame is returned as it is.
+ */
+static double
+_round_time_value(double value, int precision)
+{
+    if (precision <= 0 || !std::isfinite(value) || value == std::trunc(value))
+    {
+        return value;
+    }
+
+    double const frames = std::trunc(value);
+    int const    frame_digits =
+        frames == 0
+               ? 0
+               : static_cast<int>(std::floor(std::log10(std::abs(frames)))) + 1;
+    double const rounded = _round_to_precision(value, precision + frame_digits);
+    return std::trunc(rounded) == frames ? rounded : value;
+}
+
 /**
  * Base class for encoders.  Since rapidjson is templated (no virtual functions)
  * we need to do our dynamically classed hierarchy to abstract away which writer
@@ -81,6 +150,26 @@ public:
     virtual void write_value(IMATH_NAMESPACE::Box2d const&)          = 0;
     virtual void write_value(IMATH_NAMESPACE::V2d const&)            = 0;
 
+    // Called for the times of schema fields.  The reader knows their type
+    // from the schema, so an encoder can write them in a compact form.
+    virtual void write_field_value(class RationalTime const& value)
+    {
+        write_value(value);
+    }
+    virtual void write_field_value(class TimeRange const& value)
+    {
+        write_value(value);
+    }
+
+    // Called for each object before it is written.  An encoder that returns
+    // true has encoded the object itself, and its contents are not written.
+    virtual bool write_object(SerializableObject const*) { return false; }
+
+    // Encoders that write JSON can write JSON text as it is; the others are
+    // given the parsed value instead.
+    virtual bool writes_raw_json() { return false; }
+    virtual void write_raw_json(std::string const&) {}
+
 protected:
     void _error(ErrorStatus const& error_status)
     {
@@ -159,12 +248,11 @@ public:
             auto& top = _stack.back();
             if (top.is_dict)
             {
-                top.dict.emplace(top.cur_key, a);
+                top.dict.emplace(std::move(top.cur_key), std::move(a));
             }
             else
             {
-                std::any newstack(std::move(a));
-                top.array.emplace_back(newstack);
+                top.array.emplace_back(std::move(a));
             }
         }
     }
@@ -185,11 +273,11 @@ public:
             auto& top = _stack.back();
             if (top.is_dict)
             {
-                top.dict.emplace(_stack.back().cur_key, a);
+                top.dict.emplace(std::move(top.cur_key), std::move(a));
             }
             else
             {
-                top.array.emplace_back(a);
+                top.array.emplace_back(std::move(a));
             }
         }
     }
@@ -455,71 +543,122 @@ private:
     ResultObjectPolicy        _result_object_policy;
     const schema_version_map* _downgrade_version_manifest = nullptr;
 
-    void _downgrade_dictionary(AnyDictionary& m)
+    // The downgrade functions to run on the dictionaries of a schema string,
+    // and the schema string to give them afterwards.  Plans are worked out
+    // the first time a schema string is seen, and an empty plan means that
+    // dictionaries of the schema string are written as they are.
+    // The functions are not copied out of the type registry, since copying
+    // a function of Python takes the GIL, which must never be waited for
+    // while the registry is locked. Type records and their functions are
+    // never removed, so the pointers stay valid.
+    struct _DowngradePlan
     {
-        std::string schema_string = "";
+        std::vector<std::function<void(AnyDictionary*)> const*> functions;
+        std::string                                             schema_string;
+    };
 
-        if (!m.get_if_set("OTIO_SCHEMA", &schema_string))
+    std::unordered_map<std::string, _DowngradePlan> _downgrade_plans;
+
+    _DowngradePlan const* _downgrade_plan(std::string const& schema_string)
+    {
+        auto e = _downgrade_plans.find(schema_string);
+        if (e != _downgrade_plans.end())
         {
-            return;
+            return &e->second;
         }
 
+        _DowngradePlan plan;
+
         const auto         sep         = schema_string.rfind('.');
         const std::string& schema_name = schema_string.substr(0, sep);
 
         const auto dg_version_it =
             _downgrade_version_manifest->find(schema_name);
 
-        if (dg_version_it == _downgrade_version_manifest->end())
+        if (dg_version_it != _downgrade_version_manifest->end())
         {
-            return;
-        }
+            const std::string& schema_vers = schema_string.substr(sep + 1);
+            int                current_version = -1;
 
-        const std::string& schema_vers     = schema_string.substr(sep + 1);
-        int                current_version = -1;
+            if (!schema_vers.empty())
+            {
+                current_version = std::stoi(schema_vers);
+            }
 
-        if (!schema_vers.empty())
-        {
-            current_version = std::stoi(schema_vers);
-        }
+            // @TODO: is 0 a legitimate schema version?
+            if (current_version < 0)
+            {
+                _internal_error(string_printf(
+                    "Could not parse version number from Schema"
+                    " string: %s",
+                    schema_string.c_str()));
+                return nullptr;
+            }
 
-        // @TODO: is 0 a legitimate schema version?
-        if (current_version < 0)
-        {
-            _internal_error(string_printf(
-                "Could not parse version number from Schema"
-                " string: %s",
-                schema_string.c_str()));
-            return;
-        }
+            const int target_version = static_cast<int>(dg_version_it->second);
+
+            TypeRegistry& r = TypeRegistry::instance();
+            std::lock_guard<std::mutex> lock(r._registry_mutex);
+            const auto type_rec = r._find_type_record(schema_name);
+
+            while (current_version > target_version)
+            {
+                if (!type_rec)
+                {
+                    break;
+                }
 
-        const int target_version = static_cast<int>(dg_version_it->second);
+                const auto& next_dg_fn =
+                    (type_rec->downgrade_functions.find(current_version));
 
-        const auto& type_rec =
-            (TypeRegistry::instance()._find_type_record(schema_name));
+                if (next_dg_fn == type_rec->downgrade_functions.end())
+                {
+                    break;
+                }
 
-        while (current_version > target_version)
-        {
-            const auto& next_dg_fn =
-                (type_rec->downgrade_functions.find(current_version));
+                plan.functions.push_back(&next_dg_fn->second);
+                current_version--;
+            }
 
-            if (next_dg_fn == type_rec->downgrade_functions.end())
+            if (current_version > target_version)
             {
                 _internal_error(string_printf(
                     "No downgrader function available for "
                     "going from version %d to version %d.",
                     current_version,
                     target_version));
-                return;
+                return nullptr;
             }
 
-            // apply it
-            next_dg_fn->second(&m);
+            plan.schema_string =
+                schema_name + "." + std::to_string(current_version);
+        }
+
+        return &_downgrade_plans.emplace(schema_string, std::move(plan))
+                    .first->second;
+    }
+
+    void _downgrade_dictionary(AnyDictionary& m)
+    {
+        auto schema = m.find("OTIO_SCHEMA");
+        if (schema == m.end() || schema->second.type() != typeid(std::string))
+        {
+            return;
+        }
+
+        _DowngradePlan const* plan =
+            _downgrade_plan(std::any_cast<std::string const&>(schema->second));
+        if (!plan || plan->functions.empty())
+        {
+            return;
+        }
 
-            current_version--;
+        for (auto function: plan->functions)
+        {
+            (*function)(&m);
         }
 
-        m["OTIO_SCHEMA"] = schema_name + "." + std::to_string(current_version);
+        m["OTIO_SCHEMA"] = plan->schema_string;
     }
 };
 
@@ -527,8 +666,15 @@ template <typename RapidJSONWriterType>
 class JSONEncoder : public Encoder
 {
 public:
-    JSONEncoder(RapidJSONWriterType& writer)
+    JSONEncoder(
+        RapidJSONWriterType& writer,
+        int                  float_precision = 0,
+        bool                 integral_as_int = false,
+        bool                 compact_times   = false)
         : _writer(writer)
+        , _float_precision(float_precision)
+        , _integral_as_int(integral_as_int)
+        , _compact_times(compact_times)
     {}
 
     virtual ~JSONEncoder() {}
@@ -560,10 +706,10 @@ public:
         _writer.String("RationalTime.1");
 
         _writer.Key("rate");
-        _writer.Double(value.rate());
+        _write_number(value.rate());
 
         _writer.Key("value");
-        _writer.Double(value.value());
+        _write_time_value(value.value());
 
         _writer.EndObject();
     }
@@ -595,10 +741,10 @@ public:
         write_value(value.offset());
 
         _writer.Key("rate");
-        _writer.Double(value.rate());
+        _write_number(value.rate());
 
         _writer.Key("scale");
-        _writer.Double(value.scale());
+        _write_number(value.scale());
 
         _writer.EndObject();
     }
@@ -611,16 +757,16 @@ public:
         _writer.String("Color.1");
 
         _writer.Key("r");
-        _writer.Double(value.r());
+        _write_number(value.r());
 
         _writer.Key("g");
-        _writer.Double(value.g());
+        _write_number(value.g());
 
         _writer.Key("b");
-        _writer.Double(value.b());
+        _write_number(value.b());
 
         _writer.Key("a");
-        _writer.Double(value.a());
+        _write_number(value.a());
 
         _writer.Key("name");
         _writer.String(value.name().c_str());
@@ -646,10 +792,10 @@ public:
         _writer.String("V2d.1");
 
         _writer.Key("x");
-        _writer.Double(value.x);
+        _write_number(value.x);
 
         _writer.Key("y");
-        _writer.Double(value.y);
+        _write_number(value.y);
 
         _writer.EndObject();
     }
@@ -670,194 +816,944 @@ public:
         _writer.EndObject();
     }
 
-    void start_array(size_t) { _writer.StartArray(); }
-
-    void start_object() { _writer.StartObject(); }
-
-    void end_array() { _writer.EndArray(); }
-
-    void end_object() { _writer.EndObject(); }
-
-private:
-    RapidJSONWriterType& _writer;
-};
+    void write_field_value(RationalTime const& value)
+    {
+        if (!_compact_times)
+        {
+            write_value(value);
+            return;
+        }
 
-template <typename T>
-bool
-_simple_any_comparison(std::any const& lhs, std::any const& rhs)
-{
-    return lhs.type() == typeid(T) && rhs.type() == typeid(T)
-           && std::any_cast<T const&>(lhs) == std::any_cast<T const&>(rhs);
-}
+        double const numbers[] = {
+            _round_time_value(value.value(), _float_precision),
+            _round_to_precision(value.rate(), _float_precision)
+        };
+        _write_numbers(numbers, 2);
+    }
 
-template <>
-bool
-_simple_any_comparison<void>(std::any const& lhs, std::any const& rhs)
-{
-    return lhs.type() == typeid(void) && rhs.type() == typeid(void);
-}
+    void write_field_value(TimeRange const& value)
+    {
+        if (!_compact_times)
+        {
+            write_value(value);
+            return;
+        }
 
-template <>
-bool
-_simple_any_comparison<char const*>(std::any const& lhs, std::any const& rhs)
-{
-    return lhs.type() == typeid(char const*)
-           && rhs.type() == typeid(char const*)
-           && !strcmp(
-               std::any_cast<char const*>(lhs),
-               std::any_cast<char const*>(rhs));
-}
+        double const numbers[] = {
+            _round_time_value(value.start_time().value(), _float_precision),
+            _round_to_precision(value.start_time().rate(), _float_precision),
+            _round_time_value(value.duration().value(), _float_precision),
+            _round_to_precision(value.duration().rate(), _float_precision)
+        };
+        _write_numbers(numbers, 4);
+    }
 
-void
-SerializableObject::Writer::_build_dispatch_tables()
-{
-    /*
-     * These are basically atomic writes to the encoder:
-     */
+    void start_array(size_t) { _writer.StartArray(); }
 
-    auto& wt          = _write_dispatch_table;
-    wt[&typeid(void)] = [this](std::any const&) {
-        _encoder.write_null_value();
-    };
-    wt[&typeid(bool)] = [this](std::any const& value) {
-        _encoder.write_value(std::any_cast<bool>(value));
-    };
-    wt[&typeid(int64_t)] = [this](std::any const& value) {
-        _encoder.write_value(std::any_cast<int64_t>(value));
-    };
-    wt[&typeid(double)] = [this](std::any const& value) {
-        _encoder.write_value(std::any_cast<double>(value));
-    };
-    wt[&typeid(std::string)] = [this](std::any const& value) {
-        _encoder.write_value(std::any_cast<std::string const&>(value));
-    };
-    wt[&typeid(char const*)] = [this](std::any const& value) {
-        _encoder.write_value(std::string(std::any_cast<char const*>(value)));
-    };
-    wt[&typeid(RationalTime)] = [this](std::any const& value) {
-        _encoder.write_value(std::any_cast<RationalTime const&>(value));
-    };
-    wt[&typeid(TimeRange)] = [this](std::any const& value) {
-        _encoder.write_value(std::any_cast<TimeRange const&>(value));
-    };
-    wt[&typeid(TimeTransform)] = [this](std::any const& value) {
-        _encoder.write_value(std::any_cast<TimeTransform const&>(value));
-    };
-    wt[&typeid(Color)] = [this](std::any const& value) {
-        _encoder.write_value(std::any_cast<Color const&>(value));
-    };
-    wt[&typeid(IMATH_NAMESPACE::V2d)] = [this](std::any const& value) {
-        _encoder.write_value(std::any_cast<IMATH_NAMESPACE::V2d const&>(value));
-    };
-    wt[&typeid(IMATH_NAMESPACE::Box2d)] = [this](std::any const& value) {
-        _encoder.write_value(
-            std::any_cast<IMATH_NAMESPACE::Box2d const&>(value));
-    };
+    void start_object() { _writer.StartObject(); }
 
-    /*
-     * These next recurse back through the Writer itself:
-     */
-    wt[&typeid(SerializableObject::Retainer<>)] =
-        [this](std::any const& value) {
-            this->write(
-                _no_key,
-                std::any_cast<SerializableObject::Retainer<>>(value));
-        };
+    void end_array() { _writer.EndArray(); }
 
-    wt[&typeid(AnyDictionary)] = [this](std::any const& value) {
-        this->write(_no_key, std::any_cast<AnyDictionary const&>(value));
-    };
+    void end_object() { _writer.EndObject(); }
 
-    wt[&typeid(AnyVector)] = [this](std::any const& value) {
-        this->write(_no_key, std::any_cast<AnyVector const&>(value));
-    };
+    bool writes_raw_json() { return true; }
 
-    /*
-     * Install a backup table, using the actual type name as a key.
-     * This is to deal with type aliasing across compilation units.
-     */
-    for (const auto& e: wt)
+    // The text is parsed straight into the writer, so that it is formatted
+    // like the rest of the output.
+    void write_raw_json(std::string const& json)
     {
-        _write_dispatch_table_by_name[e.first->name()] = e.second;
+        OTIO_rapidjson::Reader       reader;
+        OTIO_rapidjson::StringStream stream(json.c_str());
+        reader.Parse<
+            OTIO_rapidjson::kParseNanAndInfFlag
+            | OTIO_rapidjson::kParseFullPrecisionFlag>(stream, _writer);
     }
 
-    auto& et                   = _equality_dispatch_table;
-    et[&typeid(void)]          = &_simple_any_comparison<void>;
-    et[&typeid(bool)]          = &_simple_any_comparison<bool>;
-    et[&typeid(int64_t)]       = &_simple_any_comparison<int64_t>;
-    et[&typeid(double)]        = &_simple_any_comparison<double>;
-    et[&typeid(std::string)]   = &_simple_any_comparison<std::string>;
-    et[&typeid(char const*)]   = &_simple_any_comparison<char const*>;
-    et[&typeid(RationalTime)]  = &_simple_any_comparison<RationalTime>;
-    et[&typeid(TimeRange)]     = &_simple_any_comparison<TimeRange>;
-    et[&typeid(TimeTransform)] = &_simple_any_comparison<TimeTransform>;
-    et[&typeid(Color)]         = &_simple_any_comparison<Color>;
-    et[&typeid(SerializableObject::ReferenceId)] =
-        &_simple_any_comparison<SerializableObject::ReferenceId>;
-    et[&typeid(IMATH_NAMESPACE::V2d)] =
-        &_simple_any_comparison<IMATH_NAMESPACE::V2d>;
-    et[&typeid(IMATH_NAMESPACE::Box2d)] =
-        &_simple_any_comparison<IMATH_NAMESPACE::Box2d>;
+private:
+    // The numbers of time, color and geometry values are read back as
+    // doubles whatever their form, so they can be written shorter.
+    void _write_number(double value)
+    {
+        _write_rounded_number(_round_to_precision(value, _float_precision));
+    }
 
-    /*
-     * These next recurse back through the Writer itself:
-     */
-    et[&typeid(AnyDictionary)] =
-        [this](std::any const& lhs, std::any const& rhs) {
-            return _any_dict_equals(lhs, rhs);
-        };
-    et[&typeid(AnyVector)] = [this](std::any const& lhs, std::any const& rhs) {
-        return _any_array_equals(lhs, rhs);
-    };
-}
+    void _write_time_value(double value)
+    {
+        _write_rounded_number(_round_time_value(value, _float_precision));
+    }
 
-bool
-SerializableObject::Writer::_any_dict_equals(
-    std::any const& lhs,
-    std::any const& rhs)
-{
-    if (lhs.type() != typeid(AnyDictionary)
-        || rhs.type() != typeid(AnyDictionary))
+    void _write_rounded_number(double value)
     {
-        return false;
+        if (_integral_as_int && value == std::trunc(value)
+            && std::abs(value) < 9007199254740992.0)
+        {
+            _writer.Int64(static_cast<int64_t>(value));
+            return;
+        }
+        _writer.Double(value);
     }
 
-    AnyDictionary const& ld = std::any_cast<AnyDictionary const&>(lhs);
-    AnyDictionary const& rd = std::any_cast<AnyDictionary const&>(rhs);
+    // The numbers, already rounded, are written as one raw value, so that
+    // indented output keeps them on a single line.
+    void _write_numbers(double const* numbers, size_t count)
+    {
+        char  buffer[4 * 26 + 8];
+        char* end = buffer;
+        *end++    = '[';
+        for (size_t i = 0; i < count; ++i)
+        {
+            if (i > 0)
+            {
+                *end++ = ',';
+            }
+            end = _format_number(numbers[i], end);
+        }
+        *end++ = ']';
 
-    auto r_it = rd.begin();
+        _writer.RawValue(
+            buffer,
+            static_cast<size_t>(end - buffer),
+            OTIO_rapidjson::kArrayType);
+    }
 
-    for (const auto& l_it: ld)
+    // Format value like _write_rounded_number() writes it.
+    char* _format_number(double value, char* buffer)
     {
-        if (r_it == rd.end())
+        if (!std::isfinite(value))
         {
-            return false;
+            char const* text = std::isnan(value) ? "NaN"
+                               : value < 0       ? "-Infinity"
+                                                 : "Infinity";
+            size_t const size = std::strlen(text);
+            std::memcpy(buffer, text, size);
+            return buffer + size;
         }
-
-        if (l_it.first != r_it->first
-            || !_any_equals(l_it.second, r_it->second))
+        if (_integral_as_int && value == std::trunc(value)
+            && std::abs(value) < 9007199254740992.0)
         {
-            return false;
+            return OTIO_rapidjson::internal::i64toa(
+                static_cast<int64_t>(value),
+                buffer);
         }
-        ++r_it;
+        return OTIO_rapidjson::internal::dtoa(value, buffer);
     }
-    return r_it == rd.end();
-}
 
-bool
-SerializableObject::Writer::_any_array_equals(
-    std::any const& lhs,
-    std::any const& rhs)
+    RapidJSONWriterType& _writer;
+    int                  _float_precision;
+    bool                 _integral_as_int;
+    bool                 _compact_times;
+};
+
+/**
+ * This encoder writes the binary format described in binaryFormat.h.
+ * Keys, schema names and short strings are written once and referred to by
+ * index after that, so documents with many objects of the same few types
+ * are several times smaller than their json.
+ */
+class BinaryEncoder : public Encoder
 {
-    if (lhs.type() != typeid(AnyVector) || rhs.type() != typeid(AnyVector))
+public:
+    BinaryEncoder(std::ostream& stream)
+        : _stream(stream)
     {
-        return false;
+        _buffer.reserve(_flush_size);
+        _buffer.append(binary_magic, binary_magic_size);
     }
 
-    AnyVector const& lv = std::any_cast<AnyVector const&>(lhs);
-    AnyVector const& rv = std::any_cast<AnyVector const&>(rhs);
+    virtual ~BinaryEncoder() {}
 
-    if (lv.size() != rv.size())
+    void flush()
+    {
+        _stream.write(_buffer.data(), _buffer.size());
+        _buffer.clear();
+    }
+
+    void write_key(std::string const& key) { _write_string(key); }
+
+    void write_null_value() { _write_tag(BinaryTag::Null); }
+
+    void write_value(bool value)
+    {
+        _write_tag(value ? BinaryTag::True : BinaryTag::False);
+    }
+
+    void write_value(int value) { write_value(static_cast<int64_t>(value)); }
+
+    void write_value(int64_t value)
+    {
+        _write_tag(BinaryTag::Int);
+        _write_varint(binary_zigzag_encode(value));
+    }
+
+    void write_value(uint64_t value)
+    {
+        _write_tag(BinaryTag::UInt);
+        _write_varint(value);
+    }
+
+    void write_value(std::string const& value)
+    {
+        _write_string(value);
+    }
+
+    void write_value(double value)
+    {
+        _write_tag(BinaryTag::Double);
+        _write_double(value);
+    }
+
+    void write_value(RationalTime const& value)
+    {
+        _write_tag(BinaryTag::RationalTime);
+        _write_double(value.value());
+        _write_double(value.rate());
+    }
+
+    void write_value(TimeRange const& value)
+    {
+        _write_tag(BinaryTag::TimeRange);
+        _write_double(value.start_time().value());
+        _write_double(value.start_time().rate());
+        _write_double(value.duration().value());
+        _write_double(value.duration().rate());
+    }
+
+    void write_value(TimeTransform const& value)
+    {
+        _write_tag(BinaryTag::TimeTransform);
+        _write_double(value.offset().value());
+        _write_double(value.offset().rate());
+        _write_double(value.rate());
+        _write_double(value.scale());
+    }
+
+    void write_value(Color const& value)
+    {
+        _write_tag(BinaryTag::Color);
+        _write_double(value.r());
+        _write_double(value.g());
+        _write_double(value.b());
+        _write_double(value.a());
+        _write_string(value.name());
+    }
+
+    void write_value(SerializableObject::ReferenceId value)
+    {
+        _write_tag(BinaryTag::ReferenceId);
+        _write_string(value.id);
+    }
+
+    void write_value(IMATH_NAMESPACE::V2d const& value)
+    {
+        _write_tag(BinaryTag::V2d);
+        _write_double(value.x);
+        _write_double(value.y);
+    }
+
+    void write_value(IMATH_NAMESPACE::Box2d const& value)
+    {
+        _write_tag(BinaryTag::Box2d);
+        _write_double(value.min.x);
+        _write_double(value.min.y);
+        _write_double(value.max.x);
+        _write_double(value.max.y);
+    }
+
+    void start_array(size_t) { _write_tag(BinaryTag::Array); }
+
+    void start_object() { _write_tag(BinaryTag::Object); }
+
+    void end_array() { _write_tag(BinaryTag::End); }
+
+    void end_object() { _write_tag(BinaryTag::End); }
+
+private:
+    static constexpr size_t _flush_size = 65536;
+
+    void _write_tag(BinaryTag tag)
+    {
+        if (_buffer.size() >= _flush_size)
+        {
+            flush();
+        }
+        _buffer.push_back(static_cast<char>(tag));
+    }
+
+    void _write_varint(uint64_t value)
+    {
+        while (value >= 0x80)
+        {
+            _buffer.push_back(static_cast<char>((value & 0x7F) | 0x80));
+            value >>= 7;
+        }
+        _buffer.push_back(static_cast<char>(value));
+    }
+
+    void _write_double(double value)
+    {
+        uint64_t bits = binary_double_bits(value);
+        for (int i = 0; i < 8; i++)
+        {
+            _buffer.push_back(static_cast<char>(bits & 0xFF));
+            bits >>= 8;
+        }
+    }
+
+    void _write_string(std::string const& value)
+    {
+        if (value.size() > binary_max_table_string_size)
+        {
+            _write_tag(BinaryTag::LongString);
+            _write_varint(value.size());
+            _buffer.append(value);
+            return;
+        }
+
+        auto e = _string_table.find(value);
+        if (e != _string_table.end())
+        {
+            _write_tag(BinaryTag::StringRef);
+            _write_varint(e->second);
+            return;
+        }
+
+        uint64_t index = _string_table.size();
+        _string_table.emplace(value, index);
+        _write_tag(BinaryTag::String);
+        _write_varint(value.size());
+        _buffer.append(value);
+    }
+
+    std::ostream&                             _stream;
+    std::string                               _buffer;
+    std::unordered_map<std::string, uint64_t> _string_table;
+};
+
+/**
+ * The cached content hash of an object.
+ */
+struct SerializableObject::_ContentHashCache
+{
+    uint64_t hash = 0;
+
+    // content_stamp() when the hash was computed, or zero once discarded.
+    uint64_t stamp = 0;
+
+    bool computing = false;
+
+    // The caches of the objects whose hash includes this one.
+    std::vector<std::weak_ptr<_ContentHashCache>> dependents;
+
+    void discard() noexcept
+    {
+        if (stamp == 0 && dependents.empty())
+        {
+            return;
+        }
+
+        stamp               = 0;
+        auto old_dependents = std::move(dependents);
+        dependents.clear();
+        for (auto const& dependent: old_dependents)
+        {
+            if (auto cache = dependent.lock())
+            {
+                cache->discard();
+            }
+        }
+    }
+
+    void add_dependent(std::shared_ptr<_ContentHashCache> const& cache)
+    {
+        bool found = false;
+        for (auto it = dependents.begin(); it != dependents.end();)
+        {
+            if (it->expired())
+            {
+                it = dependents.erase(it);
+                continue;
+            }
+            found = found || it->lock() == cache;
+            ++it;
+        }
+        if (!found)
+        {
+            dependents.push_back(cache);
+        }
+    }
+};
+
+/**
+ * This encoder hashes what it is given instead of writing it anywhere.
+ * Objects nested in the object being hashed are not walked, their own
+ * (cached) content hash is folded in instead.
+ */
+class HashingEncoder : public Encoder
+{
+public:
+    HashingEncoder(
+        std::shared_ptr<SerializableObject::_ContentHashCache> const& cache)
+        : _cache(cache)
+    {}
+
+    virtual ~HashingEncoder() {}
+
+    uint64_t hash() const { return _hash; }
+
+    bool write_object(SerializableObject const* value) override
+    {
+        // the object being hashed is written out in full
+        if (!_started)
+        {
+            _started = true;
+            return false;
+        }
+
+        ErrorStatus error_status;
+        uint64_t    hash = value->content_hash(&error_status);
+        if (is_error(error_status))
+        {
+            _error(error_status);
+            return true;
+        }
+
+        value->_content_hash_cache->add_dependent(_cache);
+        _mix(_object_tag);
+        _mix(hash);
+        return true;
+    }
+
+    void write_key(std::string const& key)
+    {
+        _mix(_key_tag);
+        _mix_string(key);
+    }
+
+    void write_null_value() { _mix(_null_tag); }
+
+    void write_value(bool value)
+    {
+        _mix(_bool_tag);
+        _mix(value);
+    }
+
+    void write_value(int value) { write_value(int64_t(value)); }
+
+    void write_value(int64_t value)
+    {
+        _mix(_int_tag);
+        _mix(uint64_t(value));
+    }
+
+    void write_value(uint64_t value)
+    {
+        // written the same as an int64_t when it fits in one
+        _mix(
+            value <= uint64_t(std::numeric_limits<int64_t>::max())
+                ? _int_tag
+                : _uint_tag);
+        _mix(value);
+    }
+
+    void write_value(double value)
+    {
+        _mix(_double_tag);
+        _mix_double(value);
+    }
+
+    void write_value(std::string const& value)
+    {
+        _mix(_string_tag);
+        _mix_string(value);
+    }
+
+    void write_value(RationalTime const& value)
+    {
+        _mix(_rational_time_tag);
+        _mix_double(value.value());
+        _mix_double(value.rate());
+    }
+
+    void write_value(TimeRange const& value)
+    {
+        _mix(_time_range_tag);
+        write_value(value.start_time());
+        write_value(value.duration());
+    }
+
+    void write_value(TimeTransform const& value)
+    {
+        _mix(_time_transform_tag);
+        write_value(value.offset());
+        _mix_double(value.scale());
+        _mix_double(value.rate());
+    }
+
+    void write_value(Color const& value)
+    {
+        _mix(_color_tag);
+        _mix_double(value.r());
+        _mix_double(value.g());
+        _mix_double(value.b());
+        _mix_double(value.a());
+        _mix_string(value.name());
+    }
+
+    void write_value(SerializableObject::ReferenceId value)
+    {
+        _mix(_reference_id_tag);
+        _mix_string(value.id);
+    }
+
+    void write_value(IMATH_NAMESPACE::V2d const& value)
+    {
+        _mix(_v2d_tag);
+        _mix_double(value.x);
+        _mix_double(value.y);
+    }
+
+    void write_value(IMATH_NAMESPACE::Box2d const& value)
+    {
+        _mix(_box2d_tag);
+        write_value(value.min);
+        write_value(value.max);
+    }
+
+    void start_array(size_t size)
+    {
+        _mix(_start_array_tag);
+        _mix(size);
+    }
+
+    void start_object() { _mix(_start_object_tag); }
+
+    void end_array() { _mix(_end_array_tag); }
+
+    void end_object() { _mix(_end_object_tag); }
+
+private:
+    // Every value is preceded by a tag, so that e.g. an int and a double
+    // with the same bits, or a key and a string value, hash differently.
+    enum : uint64_t
+    {
+        _null_tag = 1,
+        _bool_tag,
+        _int_tag,
+        _uint_tag,
+        _double_tag,
+        _string_tag,
+        _rational_time_tag,
+        _time_range_tag,
+        _time_transform_tag,
+        _color_tag,
+        _reference_id_tag,
+        _v2d_tag,
+        _box2d_tag,
+        _key_tag,
+        _start_array_tag,
+        _end_array_tag,
+        _start_object_tag,
+        _end_object_tag,
+        _object_tag
+    };
+
+    // The splitmix64 finalizer.
+    static uint64_t _scramble(uint64_t x) noexcept
+    {
+        x += 0x9e3779b97f4a7c15ULL;
+        x = (x ^ (x >> 30)) * 0xbf58476d1ce4e5b9ULL;
+        x = (x ^ (x >> 27)) * 0x94d049bb133111ebULL;
+        return x ^ (x >> 31);
+    }
+
+    void _mix(uint64_t value) noexcept
+    {
+        _hash = _scramble(_hash ^ _scramble(value));
+    }
+
+    void _mix_double(double value) noexcept
+    {
+        // -0.0 hashes as 0.0, and all NaNs hash alike
+        if (value == 0.0)
+        {
+            value = 0.0;
+        }
+        else if (std::isnan(value))
+        {
+            value = std::numeric_limits<double>::quiet_NaN();
+        }
+
+        uint64_t bits;
+        std::memcpy(&bits, &value, sizeof(bits));
+        _mix(bits);
+    }
+
+    void _mix_string(std::string const& value) noexcept
+    {
+        // FNV-1a
+        uint64_t hash = 0xcbf29ce484222325ULL;
+        for (unsigned char c: value)
+        {
+            hash = (hash ^ c) * 0x100000001b3ULL;
+        }
+        _mix(value.size());
+        _mix(hash);
+    }
+
+    std::shared_ptr<SerializableObject::_ContentHashCache> _cache;
+    uint64_t _hash    = 0x4f54494f68617368ULL;
+    bool     _started = false;
+};
+
+/**
+ * This encoder writes nothing: it only walks the objects it is given, which
+ * loads their deferred fields.
+ */
+class DeferredFieldLoadingEncoder : public Encoder
+{
+public:
+    virtual ~DeferredFieldLoadingEncoder() {}
+
+    void start_object() {}
+    void end_object() {}
+    void start_array(size_t) {}
+    void end_array() {}
+
+    void write_key(std::string const&) {}
+    void write_null_value() {}
+    void write_value(bool) {}
+    void write_value(int) {}
+    void write_value(int64_t) {}
+    void write_value(uint64_t) {}
+    void write_value(double) {}
+    void write_value(std::string const&) {}
+    void write_value(RationalTime const&) {}
+    void write_value(TimeRange const&) {}
+    void write_value(TimeTransform const&) {}
+    void write_value(Color const&) {}
+    void write_value(SerializableObject::ReferenceId) {}
+    void write_value(IMATH_NAMESPACE::Box2d const&) {}
+    void write_value(IMATH_NAMESPACE::V2d const&) {}
+
+    // metadata that is still json text is left as it is
+    bool writes_raw_json() override { return true; }
+};
+
+template <typename T>
+bool
+_simple_any_comparison(std::any const& lhs, std::any const& rhs)
+{
+    return lhs.type() == typeid(T) && rhs.type() == typeid(T)
+           && std::any_cast<T const&>(lhs) == std::any_cast<T const&>(rhs);
+}
+
+template <>
+bool
+_simple_any_comparison<void>(std::any const& lhs, std::any const& rhs)
+{
+    return lhs.type() == typeid(void) && rhs.type() == typeid(void);
+}
+
+template <>
+bool
+_simple_any_comparison<char const*>(std::any const& lhs, std::any const& rhs)
+{
+    return lhs.type() == typeid(char const*)
+           && rhs.type() == typeid(char const*)
+           && !strcmp(
+               std::any_cast<char const*>(lhs),
+               std::any_cast<char const*>(rhs));
+}
+
+static RationalTime
+_round_to_precision(RationalTime value, int precision)
+{
+    return RationalTime(
+        _round_time_value(value.value(), precision),
+        _round_to_precision(value.rate(), precision));
+}
+
+// Whether two times, whose rates are compared rounded, have the same frame.
+static bool
+_same_frame(RationalTime lhs, RationalTime rhs)
+{
+    return std::trunc(lhs.value()) == std::trunc(rhs.value());
+}
+
+static bool
+_same_frames(RationalTime const& lhs, RationalTime const& rhs)
+{
+    return _same_frame(lhs, rhs);
+}
+
+static bool
+_same_frames(TimeRange const& lhs, TimeRange const& rhs)
+{
+    return _same_frame(lhs.start_time(), rhs.start_time())
+           && _same_frame(lhs.duration(), rhs.duration());
+}
+
+static bool
+_same_frames(TimeTransform const& lhs, TimeTransform const& rhs)
+{
+    return _same_frame(lhs.offset(), rhs.offset());
+}
+
+static TimeRange
+_round_to_precision(TimeRange value, int precision)
+{
+    return TimeRange(
+        _round_to_precision(value.start_time(), precision),
+        _round_to_precision(value.duration(), precision));
+}
+
+static TimeTransform
+_round_to_precision(TimeTransform value, int precision)
+{
+    return TimeTransform(
+        _round_to_precision(value.offset(), precision),
+        _round_to_precision(value.scale(), precision),
+        _round_to_precision(value.rate(), precision));
+}
+
+static Color
+_round_to_precision(Color const& value, int precision)
+{
+    return Color(
+        _round_to_precision(value.r(), precision),
+        _round_to_precision(value.g(), precision),
+        _round_to_precision(value.b(), precision),
+        _round_to_precision(value.a(), precision),
+        value.name());
+}
+
+static IMATH_NAMESPACE::V2d
+_round_to_precision(IMATH_NAMESPACE::V2d value, int precision)
+{
+    return IMATH_NAMESPACE::V2d(
+        _round_to_precision(value.x, precision),
+        _round_to_precision(value.y, precision));
+}
+
+static IMATH_NAMESPACE::Box2d
+_round_to_precision(IMATH_NAMESPACE::Box2d const& value, int precision)
+{
+    return IMATH_NAMESPACE::Box2d(
+        _round_to_precision(value.min, precision),
+        _round_to_precision(value.max, precision));
+}
+
+template <typename T>
+bool
+_rounded_any_comparison(std::any const& lhs, std::any const& rhs, int precision)
+{
+    return lhs.type() == typeid(T) && rhs.type() == typeid(T)
+           && _round_to_precision(std::any_cast<T const&>(lhs), precision)
+                  == _round_to_precision(
+                      std::any_cast<T const&>(rhs),
+                      precision);
+}
+
+// Times are also compared by their frames, which rounding never changes.
+template <typename T>
+bool
+_rounded_time_comparison(std::any const& lhs, std::any const& rhs, int precision)
+{
+    return _rounded_any_comparison<T>(lhs, rhs, precision)
+           && _same_frames(
+               std::any_cast<T const&>(lhs),
+               std::any_cast<T const&>(rhs));
+}
+
+void
+SerializableObject::Writer::_build_dispatch_tables()
+{
+    /*
+     * These are basically atomic writes to the encoder:
+     */
+
+    auto& wt          = _write_dispatch_table;
+    wt[&typeid(void)] = [this](std::any const&) {
+        _encoder.write_null_value();
+    };
+    wt[&typeid(bool)] = [this](std::any const& value) {
+        _encoder.write_value(std::any_cast<bool>(value));
+    };
+    wt[&typeid(int64_t)] = [this](std::any const& value) {
+        _encoder.write_value(std::any_cast<int64_t>(value));
+    };
+    wt[&typeid(double)] = [this](std::any const& value) {
+        _encoder.write_value(std::any_cast<double>(value));
+    };
+    wt[&typeid(std::string)] = [this](std::any const& value) {
+        _encoder.write_value(std::any_cast<std::string const&>(value));
+    };
+    wt[&typeid(char const*)] = [this](std::any const& value) {
+        _encoder.write_value(std::string(std::any_cast<char const*>(value)));
+    };
+    wt[&typeid(RationalTime)] = [this](std::any const& value) {
+        _encoder.write_value(std::any_cast<RationalTime const&>(value));
+    };
+    wt[&typeid(TimeRange)] = [this](std::any const& value) {
+        _encoder.write_value(std::any_cast<TimeRange const&>(value));
+    };
+    wt[&typeid(TimeTransform)] = [this](std::any const& value) {
+        _encoder.write_value(std::any_cast<TimeTransform const&>(value));
+    };
+    wt[&typeid(Color)] = [this](std::any const& value) {
+        _encoder.write_value(std::any_cast<Color const&>(value));
+    };
+    wt[&typeid(IMATH_NAMESPACE::V2d)] = [this](std::any const& value) {
+        _encoder.write_value(std::any_cast<IMATH_NAMESPACE::V2d const&>(value));
+    };
+    wt[&typeid(IMATH_NAMESPACE::Box2d)] = [this](std::any const& value) {
+        _encoder.write_value(
+            std::any_cast<IMATH_NAMESPACE::Box2d const&>(value));
+    };
+
+    /*
+     * These next recurse back through the Writer itself:
+     */
+    wt[&typeid(SerializableObject::Retainer<>)] =
+        [this](std::any const& value) {
+            this->write(
+                _no_key,
+                std::any_cast<SerializableObject::Retainer<>>(value));
+        };
+
+    wt[&typeid(AnyDictionary)] = [this](std::any const& value) {
+        this->write(_no_key, std::any_cast<AnyDictionary const&>(value));
+    };
+
+    wt[&typeid(AnyVector)] = [this](std::any const& value) {
+        this->write(_no_key, std::any_cast<AnyVector const&>(value));
+    };
+
+    /*
+     * Install a backup table, using the actual type name as a key.
+     * This is to deal with type aliasing across compilation units.
+     */
+    for (const auto& e: wt)
+    {
+        _write_dispatch_table_by_name[e.first->name()] = e.second;
+    }
+
+    auto& et                   = _equality_dispatch_table;
+    et[&typeid(void)]          = &_simple_any_comparison<void>;
+    et[&typeid(bool)]          = &_simple_any_comparison<bool>;
+    et[&typeid(int64_t)]       = &_simple_any_comparison<int64_t>;
+    et[&typeid(double)]        = &_simple_any_comparison<double>;
+    et[&typeid(std::string)]   = &_simple_any_comparison<std::string>;
+    et[&typeid(char const*)]   = &_simple_any_comparison<char const*>;
+    et[&typeid(SerializableObject::ReferenceId)] =
+        &_simple_any_comparison<SerializableObject::ReferenceId>;
+
+    /*
+     * These next compare to _float_precision significant digits, the frames
+     * of times included:
+     */
+    et[&typeid(RationalTime)] =
+        [this](std::any const& lhs, std::any const& rhs) {
+            return _rounded_time_comparison<RationalTime>(
+                lhs,
+                rhs,
+                _float_precision);
+        };
+    et[&typeid(TimeRange)] =
+        [this](std::any const& lhs, std::any const& rhs) {
+            return _rounded_time_comparison<TimeRange>(
+                lhs,
+                rhs,
+                _float_precision);
+        };
+    et[&typeid(TimeTransform)] =
+        [this](std::any const& lhs, std::any const& rhs) {
+            return _rounded_time_comparison<TimeTransform>(
+                lhs,
+                rhs,
+                _float_precision);
+        };
+    et[&typeid(Color)] =
+        [this](std::any const& lhs, std::any const& rhs) {
+            return _rounded_any_comparison<Color>(
+                lhs,
+                rhs,
+                _float_precision);
+        };
+    et[&typeid(IMATH_NAMESPACE::V2d)] =
+        [this](std::any const& lhs, std::any const& rhs) {
+            return _rounded_any_comparison<IMATH_NAMESPACE::V2d>(
+                lhs,
+                rhs,
+                _float_precision);
+        };
+    et[&typeid(IMATH_NAMESPACE::Box2d)] =
+        [this](std::any const& lhs, std::any const& rhs) {
+            return _rounded_any_comparison<IMATH_NAMESPACE::Box2d>(
+                lhs,
+                rhs,
+                _float_precision);
+        };
+
+    /*
+     * These next recurse back through the Writer itself:
+     */
+    et[&typeid(AnyDictionary)] =
+        [this](std::any const& lhs, std::any const& rhs) {
+            return _any_dict_equals(lhs, rhs);
+        };
+    et[&typeid(AnyVector)] = [this](std::any const& lhs, std::any const& rhs) {
+        return _any_array_equals(lhs, rhs);
+    };
+}
+
+bool
+SerializableObject::Writer::_any_dict_equals(
+    std::any const& lhs,
+    std::any const& rhs)
+{
+    if (lhs.type() != typeid(AnyDictionary)
+        || rhs.type() != typeid(AnyDictionary))
+    {
+        return false;
+    }
+
+    AnyDictionary const& ld = std::any_cast<AnyDictionary const&>(lhs);
+    AnyDictionary const& rd = std::any_cast<AnyDictionary const&>(rhs);
+
+    auto r_it = rd.begin();
+
+    for (const auto& l_it: ld)
+    {
+        if (r_it == rd.end())
+        {
+            return false;
+        }
+
+        if (l_it.first != r_it->first
+            || !_any_equals(l_it.second, r_it->second))
+        {
+            return false;
+        }
+        ++r_it;
+    }
+    return r_it == rd.end();
+}
+
+bool
+SerializableObject::Writer::_any_array_equals(
+    std::any const& lhs,
+    std::any const& rhs)
+{
+    if (lhs.type() != typeid(AnyVector) || rhs.type() != typeid(AnyVector))
+    {
+        return false;
+    }
+
+    AnyVector const& lv = std::any_cast<AnyVector const&>(lhs);
+    AnyVector const& rv = std::any_cast<AnyVector const&>(rhs);
+
+    if (lv.size() != rv.size())
     {
         return false;
     }
@@ -887,13 +1783,39 @@ SerializableObject::Writer::write_root(
     std::any const&           value,
     Encoder&                  encoder,
     const schema_version_map* schema_version_targets,
-    ErrorStatus*              error_status)
+    ErrorStatus*              error_status,
+    bool                      omit_defaults)
 {
-    Writer w(encoder, schema_version_targets);
+    Writer w(encoder, schema_version_targets, omit_defaults);
     w.write(w._no_key, value);
     return !encoder.has_errored(error_status);
 }
 
+void
+SerializableObject::Writer::error(ErrorStatus const& error_status)
+{
+    _encoder._error(error_status);
+}
+
+SerializableObject const*
+SerializableObject::Writer::_default_object(SerializableObject const* object)
+{
+    auto type_record = object->_type_record();
+    auto e           = _default_objects.find(type_record);
+    if (e != _default_objects.end())
+    {
+        return e->second;
+    }
+
+    SerializableObject* result =
+        type_record->create ? type_record->create_object() : nullptr;
+    if (result)
+    {
+        _default_objects.emplace(type_record, result);
+    }
+    return result;
+}
+
 void
 SerializableObject::Writer::_encoder_write_key(std::string const& key)
 {
@@ -910,6 +1832,21 @@ SerializableObject::Writer::write(std::string const& key, bool value)
     _encoder.write_value(value);
 }
 
+bool
+SerializableObject::Writer::write_raw_json(
+    std::string const& key,
+    RawJSON const&     value)
+{
+    if (!_encoder.writes_raw_json())
+    {
+        return false;
+    }
+
+    _encoder_write_key(key);
+    _encoder.write_raw_json(*value.json);
+    return true;
+}
+
 void
 SerializableObject::Writer::write(std::string const& key, int64_t value)
 {
@@ -937,14 +1874,14 @@ void
 SerializableObject::Writer::write(std::string const& key, RationalTime value)
 {
     _encoder_write_key(key);
-    _encoder.write_value(value);
+    _encoder.write_field_value(value);
 }
 
 void
 SerializableObject::Writer::write(std::string const& key, TimeRange value)
 {
     _encoder_write_key(key);
-    _encoder.write_value(value);
+    _encoder.write_field_value(value);
 }
 
 void
@@ -953,7 +1890,7 @@ SerializableObject::Writer::write(
     std::optional<RationalTime> value)
 {
     _encoder_write_key(key);
-    value ? _encoder.write_value(*value) : _encoder.write_null_value();
+    value ? _encoder.write_field_value(*value) : _encoder.write_null_value();
 }
 
 void
@@ -962,7 +1899,7 @@ SerializableObject::Writer::write(
     std::optional<TimeRange> value)
 {
     _encoder_write_key(key);
-    value ? _encoder.write_value(*value) : _encoder.write_null_value();
+    value ? _encoder.write_field_value(*value) : _encoder.write_null_value();
 }
 
 void
@@ -1002,6 +1939,11 @@ SerializableObject::Writer::write(
         return;
     }
 
+    if (_encoder.write_object(value))
+    {
+        return;
+    }
+
     auto e = _id_for_object.find(value);
     if (e != _id_for_object.end())
     {
@@ -1113,7 +2055,7 @@ SerializableObject::Writer::write(
     // anydictionary or the SerializableObject
     if (downgraded.has_value())
     {
-        for (const auto& kv: std::any_cast<AnyDictionary>(downgraded))
+        for (const auto& kv: std::any_cast<AnyDictionary const&>(downgraded))
         {
             this->write(kv.first, kv.second);
         }
@@ -1248,7 +2190,9 @@ SerializableObject::Writer::write(std::string const& key, std::any const& value)
 }
 
 bool
-SerializableObject::is_equivalent_to(SerializableObject const& other) const
+SerializableObject::is_equivalent_to(
+    SerializableObject const& other,
+    int                       float_precision) const
 {
     if (_type_record() != other._type_record())
     {
@@ -1261,6 +2205,7 @@ SerializableObject::is_equivalent_to(SerializableObject const& other) const
     CloningEncoder             e1(policy), e2(policy);
     SerializableObject::Writer w1(e1, {});
     SerializableObject::Writer w2(e2, {});
+    w1._float_precision = float_precision;
 
     w1.write(w1._no_key, std::any(Retainer<>(this)));
     w2.write(w2._no_key, std::any(Retainer<>(&other)));
@@ -1270,8 +2215,179 @@ SerializableObject::is_equivalent_to(SerializableObject const& other) const
         && w1._any_equals(e1._root, e2._root));
 }
 
+uint64_t
+SerializableObject::content_hash(ErrorStatus* error_status) const
+{
+    if (!_content_hash_cache)
+    {
+        _content_hash_cache = std::make_shared<_ContentHashCache>();
+    }
+
+    _ContentHashCache& cache = *_content_hash_cache;
+    uint64_t const     stamp = content_stamp();
+    if (cache.stamp == stamp)
+    {
+        return cache.hash;
+    }
+
+    if (cache.computing)
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(
+                ErrorStatus::OBJECT_CYCLE,
+                string_printf(
+                    "cyclically encountered object has schema %s",
+                    schema_name().c_str()));
+        }
+        return 0;
+    }
+
+    HashingEncoder             e(_content_hash_cache);
+    SerializableObject::Writer w(e, {});
+
+    cache.computing = true;
+    w.write(w._no_key, this);
+    cache.computing = false;
+
+    if (e.has_errored(error_status))
+    {
+        return 0;
+    }
+
+    cache.hash  = e.hash();
+    cache.stamp = stamp;
+    return cache.hash;
+}
+
+void
+SerializableObject::_content_changed() noexcept
+{
+    if (_content_hash_cache)
+    {
+        _content_hash_cache->discard();
+    }
+}
+
 SerializableObject*
 SerializableObject::clone(ErrorStatus* error_status) const
+{
+    Cloner cloner;
+    return _clone(cloner, error_status);
+}
+
+SerializableObject*
+SerializableObject::clone_without_children(ErrorStatus* error_status) const
+{
+    Cloner cloner(false);
+    return _clone(cloner, error_status);
+}
+
+SerializableObject*
+SerializableObject::_clone(Cloner& cloner, ErrorStatus* error_status) const
+{
+    SerializableObject::Retainer<> result(cloner.clone(this));
+    if (is_error(cloner._error_status))
+    {
+        if (error_status)
+        {
+            *error_status = cloner._error_status;
+        }
+        return nullptr;
+    }
+
+    return result.take_value();
+}
+
+void
+SerializableObject::_copy_to(SerializableObject* clone, Cloner& cloner) const
+{
+    clone->_dynamic_fields = cloner.clone(_dynamic_fields);
+}
+
+SerializableObject*
+SerializableObject::Cloner::clone(SerializableObject const* value)
+{
+    if (!value || is_error(_error_status))
+    {
+        return nullptr;
+    }
+
+    auto type_record = value->_type_record();
+    if (!type_record->clone_by_copy)
+    {
+        auto result = value->_clone_with_encoder(&_error_status);
+        if (!_clones_children)
+        {
+            if (auto composition = dynamic_cast<Composition*>(result))
+            {
+                composition->clear_children();
+            }
+        }
+        return result;
+    }
+
+    if (!_copying.insert(value).second)
+    {
+        _error_status = ErrorStatus(
+            ErrorStatus::OBJECT_CYCLE,
+            string_printf(
+                "cyclically encountered object has schema %s",
+                type_record->schema_name.c_str()));
+        return nullptr;
+    }
+
+    SerializableObject* result = type_record->create_object();
+    value->_copy_to(result, *this);
+    _copying.erase(value);
+    return result;
+}
+
+AnyDictionary
+SerializableObject::Cloner::clone(AnyDictionary const& value)
+{
+    AnyDictionary result;
+    for (auto const& e: value)
+    {
+        result.emplace_hint(result.end(), e.first, clone(e.second));
+    }
+    return result;
+}
+
+AnyVector
+SerializableObject::Cloner::clone(AnyVector const& value)
+{
+    AnyVector result;
+    result.reserve(value.size());
+    for (auto const& e: value)
+    {
+        result.push_back(clone(e));
+    }
+    return result;
+}
+
+std::any
+SerializableObject::Cloner::clone(std::any const& value)
+{
+    auto const& type = value.type();
+    if (type == typeid(Retainer<>))
+    {
+        return std::any(
+            Retainer<>(clone(std::any_cast<Retainer<> const&>(value).value)));
+    }
+    else if (type == typeid(AnyDictionary))
+    {
+        return std::any(clone(std::any_cast<AnyDictionary const&>(value)));
+    }
+    else if (type == typeid(AnyVector))
+    {
+        return std::any(clone(std::any_cast<AnyVector const&>(value)));
+    }
+    return value;
+}
+
+SerializableObject*
+SerializableObject::_clone_with_encoder(ErrorStatus* error_status) const
 {
     CloningEncoder e(
         CloningEncoder::ResultObjectPolicy::CloneBackToSerializableObject);
@@ -1299,13 +2415,47 @@ SerializableObject::clone(ErrorStatus* error_status) const
                : nullptr;
 }
 
+// Readers of older releases only read times in the verbose form, so that is
+// written whenever schemas are downgraded for one.
+static bool
+_writes_compact_times(
+    bool                      compact_times,
+    const schema_version_map* schema_version_targets)
+{
+    return compact_times
+           && (!schema_version_targets || schema_version_targets->empty());
+}
+
+// Deferred fields are loaded from the file an object was read from, which
+// may be the file it is written to, so they are all loaded before that file
+// is opened.
+static bool
+_load_deferred_fields(std::any const& value, ErrorStatus* error_status)
+{
+    if (!SerializableObjectWithMetadata::any_deferred_fields())
+    {
+        return true;
+    }
+
+    DeferredFieldLoadingEncoder encoder;
+    return SerializableObject::Writer::write_root(
+        value,
+        encoder,
+        nullptr,
+        error_status);
+}
+
 // to json_string
 std::string
 serialize_json_to_string_pretty(
     const std::any&           value,
     const schema_version_map* schema_version_targets,
     ErrorStatus*              error_status,
-    int                       indent)
+    int                       indent,
+    bool                      omit_defaults,
+    int                       float_precision,
+    bool                      integral_as_int,
+    bool                      compact_times)
 {
     OTIO_rapidjson::StringBuffer output_string_buffer;
 
@@ -1319,13 +2469,18 @@ serialize_json_to_string_pretty(
 
     json_writer.SetIndent(' ', indent);
 
-    JSONEncoder<decltype(json_writer)> json_encoder(json_writer);
+    JSONEncoder<decltype(json_writer)> json_encoder(
+        json_writer,
+        float_precision,
+        integral_as_int,
+        _writes_compact_times(compact_times, schema_version_targets));
 
     if (!SerializableObject::Writer::write_root(
             value,
             json_encoder,
             schema_version_targets,
-            error_status))
+            error_status,
+            omit_defaults))
     {
         return std::string();
     }
@@ -1338,7 +2493,11 @@ std::string
 serialize_json_to_string_compact(
     const std::any&           value,
     const schema_version_map* schema_version_targets,
-    ErrorStatus*              error_status)
+    ErrorStatus*              error_status,
+    bool                      omit_defaults,
+    int                       float_precision,
+    bool                      integral_as_int,
+    bool                      compact_times)
 {
     OTIO_rapidjson::StringBuffer output_string_buffer;
 
@@ -1350,13 +2509,18 @@ serialize_json_to_string_compact(
         OTIO_rapidjson::kWriteNanAndInfFlag>
         json_writer(output_string_buffer);
 
-    JSONEncoder<decltype(json_writer)> json_encoder(json_writer);
+    JSONEncoder<decltype(json_writer)> json_encoder(
+        json_writer,
+        float_precision,
+        integral_as_int,
+        _writes_compact_times(compact_times, schema_version_targets));
 
     if (!SerializableObject::Writer::write_root(
             value,
             json_encoder,
             schema_version_targets,
-            error_status))
+            error_status,
+            omit_defaults))
     {
         return std::string();
     }
@@ -1370,7 +2534,11 @@ serialize_json_to_string(
     const std::any&           value,
     const schema_version_map* schema_version_targets,
     ErrorStatus*              error_status,
-    int                       indent)
+    int                       indent,
+    bool                      omit_defaults,
+    int                       float_precision,
+    bool                      integral_as_int,
+    bool                      compact_times)
 {
     if (indent > 0)
     {
@@ -1378,12 +2546,20 @@ serialize_json_to_string(
             value,
             schema_version_targets,
             error_status,
-            indent);
+            indent,
+            omit_defaults,
+            float_precision,
+            integral_as_int,
+            compact_times);
     }
     return serialize_json_to_string_compact(
         value,
         schema_version_targets,
-        error_status);
+        error_status,
+        omit_defaults,
+        float_precision,
+        integral_as_int,
+        compact_times);
 }
 
 bool
@@ -1392,8 +2568,16 @@ serialize_json_to_file(
     std::string const&        file_name,
     const schema_version_map* schema_version_targets,
     ErrorStatus*              error_status,
-    int                       indent)
+    int                       indent,
+    bool                      omit_defaults,
+    int                       float_precision,
+    bool                      integral_as_int,
+    bool                      compact_times)
 {
+    if (!_load_deferred_fields(value, error_status))
+    {
+        return false;
+    }
 
 #if defined(_WINDOWS)
     const int wlen =
@@ -1415,30 +2599,204 @@ serialize_json_to_file(
         return false;
     }
 
-    OTIO_rapidjson::OStreamWrapper osw(os);
-    bool                           status;
+    if (!serialize_json_to_stream(
+            value,
+            os,
+            schema_version_targets,
+            error_status,
+            indent,
+            omit_defaults,
+            float_precision,
+            integral_as_int,
+            compact_times))
+    {
+        if (error_status
+            && error_status->outcome == ErrorStatus::FILE_WRITE_FAILED)
+        {
+            error_status->details = file_name;
+        }
+        return false;
+    }
+    return true;
+}
 
-    OTIO_rapidjson::PrettyWriter<
-        decltype(osw),
-        OTIO_rapidjson::UTF8<>,
-        OTIO_rapidjson::UTF8<>,
-        OTIO_rapidjson::CrtAllocator,
-        OTIO_rapidjson::kWriteNanAndInfFlag>
-                                       json_writer(osw);
-    JSONEncoder<decltype(json_writer)> json_encoder(json_writer);
+bool
+serialize_json_to_stream(
+    std::any const&           value,
+    std::ostream&             stream,
+    const schema_version_map* schema_version_targets,
+    ErrorStatus*              error_status,
+    int                       indent,
+    bool                      omit_defaults,
+    int                       float_precision,
+    bool                      integral_as_int,
+    bool                      compact_times)
+{
+    OTIO_rapidjson::OStreamWrapper osw(stream);
+    bool                           status;
 
-    if (indent >= 0)
+    if (indent < 0)
+    {
+        OTIO_rapidjson::Writer<
+            decltype(osw),
+            OTIO_rapidjson::UTF8<>,
+            OTIO_rapidjson::UTF8<>,
+            OTIO_rapidjson::CrtAllocator,
+            OTIO_rapidjson::kWriteNanAndInfFlag>
+                                           json_writer(osw);
+        JSONEncoder<decltype(json_writer)> json_encoder(
+            json_writer,
+            float_precision,
+            integral_as_int,
+            _writes_compact_times(compact_times, schema_version_targets));
+
+        status = SerializableObject::Writer::write_root(
+            value,
+            json_encoder,
+            schema_version_targets,
+            error_status,
+            omit_defaults);
+    }
+    else
     {
+        OTIO_rapidjson::PrettyWriter<
+            decltype(osw),
+            OTIO_rapidjson::UTF8<>,
+            OTIO_rapidjson::UTF8<>,
+            OTIO_rapidjson::CrtAllocator,
+            OTIO_rapidjson::kWriteNanAndInfFlag>
+                                           json_writer(osw);
+        JSONEncoder<decltype(json_writer)> json_encoder(
+            json_writer,
+            float_precision,
+            integral_as_int,
+            _writes_compact_times(compact_times, schema_version_targets));
         json_writer.SetIndent(' ', indent);
+
+        status = SerializableObject::Writer::write_root(
+            value,
+            json_encoder,
+            schema_version_targets,
+            error_status,
+            omit_defaults);
     }
 
-    status = SerializableObject::Writer::write_root(
-        value,
-        json_encoder,
-        schema_version_targets,
-        error_status);
+    if (!status)
+    {
+        return false;
+    }
+
+    stream.flush();
+    if (!stream)
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(
+                ErrorStatus::FILE_WRITE_FAILED,
+                "stream");
+        }
+        return false;
+    }
+    return true;
+}
+
+std::string
+serialize_binary_to_string(
+    const std::any&           value,
+    const schema_version_map* schema_version_targets,
+    ErrorStatus*              error_status)
+{
+    std::ostringstream stream;
+    if (!serialize_binary_to_stream(
+            value,
+            stream,
+            schema_version_targets,
+            error_status))
+    {
+        return std::string();
+    }
+    return stream.str();
+}
+
+bool
+serialize_binary_to_stream(
+    std::any const&           value,
+    std::ostream&             stream,
+    const schema_version_map* schema_version_targets,
+    ErrorStatus*              error_status)
+{
+    BinaryEncoder binary_encoder(stream);
+
+    if (!SerializableObject::Writer::write_root(
+            value,
+            binary_encoder,
+            schema_version_targets,
+            error_status))
+    {
+        return false;
+    }
+
+    binary_encoder.flush();
+    stream.flush();
+    if (!stream)
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(
+                ErrorStatus::FILE_WRITE_FAILED,
+                "stream");
+        }
+        return false;
+    }
+    return true;
+}
+
+bool
+serialize_binary_to_file(
+    std::any const&           value,
+    std::string const&        file_name,
+    const schema_version_map* schema_version_targets,
+    ErrorStatus*              error_status)
+{
+    if (!_load_deferred_fields(value, error_status))
+    {
+        return false;
+    }
+
+#if defined(_WINDOWS)
+    const int wlen =
+        MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, NULL, 0);
+    std::vector<wchar_t> wchars(wlen);
+    MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, wchars.data(), wlen);
+    std::ofstream os(wchars.data(), std::ios::binary);
+#else  // _WINDOWS
+    std::ofstream os(file_name, std::ios::binary);
+#endif // _WINDOWS
+
+    if (!os.is_open())
+    {
+        if (error_status)
+        {
+            *error_status =
+                ErrorStatus(ErrorStatus::FILE_WRITE_FAILED, file_name);
+        }
+        return false;
+    }
 
-    return status;
+    if (!serialize_binary_to_stream(
+            value,
+            os,
+            schema_version_targets,
+            error_status))
+    {
+        if (error_status
+            && error_status->outcome == ErrorStatus::FILE_WRITE_FAILED)
+        {
+            error_status->details = file_name;
+        }
+        return false;
+    }
+    return true;
 }
 
 SerializableObject::Writer::~Writer()
@@ -1451,6 +2809,10 @@ SerializableObject::Writer::~Writer()
     {
         delete _child_cloning_encoder;
     }
+    for (auto const& e: _default_objects)
+    {
+        e.second->possibly_delete();
+    }
 }
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
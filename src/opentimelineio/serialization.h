@@ -8,17 +8,58 @@
 #include "opentimelineio/version.h"
 
 #include <any>
+#include <ostream>
 #include <string>
 #include <unordered_map>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
 /// @brief Serialize JSON data to a string.
+///
+/// If omit_defaults is true, fields that are equal to the value they are
+/// read as when missing are left out.
+///
+/// The numbers of RationalTime, TimeRange, TimeTransform, Color, V2d and
+/// Box2d values are read back as doubles whatever their form, so they can be
+/// written shorter: if float_precision is not 0, non-integral ones are
+/// rounded to that many significant digits, and if integral_as_int is true,
+/// integral ones are written without a fractional part.  The digits of the
+/// value of a time are counted after its whole frames, so that rounding
+/// never moves it to another frame.  Use
+/// SerializableObject::is_equivalent_to() with the same float_precision to
+/// check what is read back.
+///
+/// If compact_times is true, the RationalTime and TimeRange fields of schemas
+/// are written as arrays of their numbers, [value, rate] and [start value,
+/// start rate, duration value, duration rate], which the reader reads back
+/// knowing their type from the schema.  Readers of older releases do not,
+/// and since the schema versions are the same they fail on the first compact
+/// field with a type error, so the verbose form is written whenever
+/// schema_version_targets are given.
 std::string serialize_json_to_string(
     const std::any&           value,
     const schema_version_map* schema_version_targets = nullptr,
     ErrorStatus*              error_status           = nullptr,
-    int                       indent                 = 4);
+    int                       indent                 = 4,
+    bool                      omit_defaults          = false,
+    int                       float_precision        = 0,
+    bool                      integral_as_int        = false,
+    bool                      compact_times          = false);
+
+/// @brief Serialize JSON data to a stream.
+///
+/// The data is written as it is encoded, so the whole document is never
+/// held in memory.
+bool serialize_json_to_stream(
+    const std::any&           value,
+    std::ostream&             stream,
+    const schema_version_map* schema_version_targets = nullptr,
+    ErrorStatus*              error_status           = nullptr,
+    int                       indent                 = 4,
+    bool                      omit_defaults          = false,
+    int                       float_precision        = 0,
+    bool                      integral_as_int        = false,
+    bool                      compact_times          = false);
 
 /// @brief Serialize JSON data to a file.
 bool serialize_json_to_file(
@@ -26,6 +67,32 @@ bool serialize_json_to_file(
     std::string const&        file_name,
     const schema_version_map* schema_version_targets = nullptr,
     ErrorStatus*              error_status           = nullptr,
-    int                       indent                 = 4);
+    int                       indent                 = 4,
+    bool                      omit_defaults          = false,
+    int                       float_precision        = 0,
+    bool                      integral_as_int        = false,
+    bool                      compact_times          = false);
+
+/// @brief Serialize to the binary (.otiob) format as a string of bytes.
+std::string serialize_binary_to_string(
+    const std::any&           value,
+    const schema_version_map* schema_version_targets = nullptr,
+    ErrorStatus*              error_status           = nullptr);
+
+/// @brief Serialize to the binary (.otiob) format to a stream.
+///
+/// The stream should be opened in binary mode.
+bool serialize_binary_to_stream(
+    const std::any&           value,
+    std::ostream&             stream,
+    const schema_version_map* schema_version_targets = nullptr,
+    ErrorStatus*              error_status           = nullptr);
+
+/// @brief Serialize to the binary (.otiob) format to a file.
+bool serialize_binary_to_file(
+    const std::any&           value,
+    std::string const&        file_name,
+    const schema_version_map* schema_version_targets = nullptr,
+    ErrorStatus*              error_status           = nullptr);
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
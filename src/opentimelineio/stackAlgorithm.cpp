@@ -4,256 +4,373 @@
 #include "opentimelineio/stackAlgorithm.h"
 #include "opentimelineio/gap.h"
 #include "opentimelineio/track.h"
-#include "opentimelineio/trackAlgorithm.h"
 #include "opentimelineio/transition.h"
 
+#include <algorithm>
+
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
-typedef std::map<Track*, std::map<Composable*, TimeRange>> RangeTrackMap;
-typedef std::vector<SerializableObject::Retainer<Track>>   TrackRetainerVector;
-
-static void
-_flatten_next_item(
-    RangeTrackMap&             range_track_map,
-    Track*                     flat_track,
-    std::vector<Track*> const& tracks,
-    int                        track_index,
-    std::optional<TimeRange>   trim_range,
-    ErrorStatus*               error_status)
+StackResolver::StackResolver(
+    Stack*                          in_stack,
+    std::optional<TimeRange> const& search_range,
+    ErrorStatus*                    error_status)
 {
-    if (track_index < 0)
-    {
-        track_index = int(tracks.size()) - 1;
-    }
+    std::vector<Track*> tracks;
+    tracks.reserve(in_stack->children().size());
 
-    if (track_index < 0)
+    for (auto c: in_stack->children())
     {
-        return;
+        if (auto track = dynamic_retainer_cast<Track>(c))
+        {
+            if (track->enabled())
+            {
+                tracks.push_back(track);
+            }
+        }
+        else
+        {
+            if (error_status)
+            {
+                *error_status = ErrorStatus(
+                    ErrorStatus::TYPE_MISMATCH,
+                    "expected item of type Track*",
+                    c);
+            }
+            return;
+        }
     }
 
-    Track* track = tracks[track_index];
+    _init(tracks, search_range, error_status);
+}
 
-    SerializableObject::Retainer<Track> track_retainer;
-    if (trim_range)
+StackResolver::StackResolver(
+    std::vector<Track*> const&      tracks,
+    std::optional<TimeRange> const& search_range,
+    ErrorStatus*                    error_status)
+{
+    _init(tracks, search_range, error_status);
+}
+
+void
+StackResolver::_init(
+    std::vector<Track*> const&      tracks,
+    std::optional<TimeRange> const& search_range,
+    ErrorStatus*                    error_status)
+{
+    // Tracks that are shorter than the longest one are padded at the end.
+    // Rather than cloning the track to append a real Gap, the padding is
+    // kept as an entry without a composable.
+    RationalTime duration;
+    for (auto track: tracks)
     {
-        track = track_trimmed_to_range(track, *trim_range, error_status);
-        if (track == nullptr || is_error(error_status))
+        duration = std::max(duration, track->duration(error_status));
+        if (is_error(error_status))
         {
             return;
         }
-        track_retainer = SerializableObject::Retainer<Track>(track);
     }
 
-    std::map<Composable*, TimeRange>* track_map;
-    auto                              it = range_track_map.find(track);
-    if (it != range_track_map.end())
-    {
-        track_map = &it->second;
-    }
-    else
+    std::vector<TrackRanges> track_ranges(tracks.size());
+    for (size_t i = 0; i < tracks.size(); i++)
     {
-        auto result = range_track_map.emplace(
-            track,
-            track->range_of_all_children(error_status));
+        Track*       track          = tracks[i];
+        TrackRanges& ranges         = track_ranges[i];
+        RationalTime track_duration = track->duration(error_status);
         if (is_error(error_status))
         {
             return;
         }
-        track_map = &result.first->second;
-    }
-    for (auto child: track->children())
-    {
-        auto item = dynamic_retainer_cast<Item>(child);
-        if (!item)
+
+        auto range_map = track->range_of_all_children(error_status);
+        if (is_error(error_status))
         {
-            if (!dynamic_retainer_cast<Transition>(child))
-            {
-                if (error_status)
-                {
-                    *error_status = ErrorStatus(
-                        ErrorStatus::TYPE_MISMATCH,
-                        "expected item of type Item* || Transition*",
-                        child);
-                }
-                return;
-            }
+            return;
         }
 
-        if (!item || item->visible() || track_index == 0)
+        std::optional<RationalTime> last_end_time;
+        ranges.entries.reserve(track->children().size() + 1);
+        for (const auto& child: track->children())
         {
-            flat_track->insert_child(
-                static_cast<int>(flat_track->children().size()),
-                static_cast<Composable*>(child->clone(error_status)),
-                error_status);
-            if (is_error(error_status))
+            const TimeRange range = range_map[child];
+            ranges.entries.push_back({ child, range });
+            if (dynamic_retainer_cast<Item>(child))
             {
-                return;
+                last_end_time = range.end_time_exclusive();
             }
         }
-        else
+
+        if (track_duration < duration)
         {
-            TimeRange trim = (*track_map)[item];
-            if (trim_range)
-            {
-                trim = TimeRange(
-                    trim.start_time() + trim_range->start_time(),
-                    trim.duration());
-                (*track_map)[item] = trim;
-            }
+            const RationalTime padding = duration - track_duration;
+            ranges.entries.push_back(
+                { nullptr,
+                  TimeRange(
+                      last_end_time ? *last_end_time
+                                    : RationalTime(0, padding.rate()),
+                      padding) });
+        }
 
-            _flatten_next_item(
-                range_track_map,
-                flat_track,
-                tracks,
-                track_index - 1,
-                trim,
-                error_status);
-            if (track == nullptr || is_error(error_status))
-            {
-                return;
-            }
+        const size_t count = ranges.entries.size();
+        ranges.max_end_times.resize(count);
+        ranges.min_start_times.resize(count);
+        for (size_t j = 0; j < count; j++)
+        {
+            const RationalTime end_time =
+                ranges.entries[j].range.end_time_exclusive();
+            ranges.max_end_times[j] =
+                j == 0 ? end_time
+                       : std::max(ranges.max_end_times[j - 1], end_time);
+        }
+        for (size_t j = count; j--;)
+        {
+            const RationalTime start_time = ranges.entries[j].range.start_time();
+            ranges.min_start_times[j] =
+                j == count - 1
+                    ? start_time
+                    : std::min(ranges.min_start_times[j + 1], start_time);
         }
     }
 
-    // range_track_map persists over the entire duration of flatten_stack
-    // track_retainer.value is about to be deleted; it's entirely possible
-    // that a new item will be created at the same pointer location, so we
-    // have to clean this value out of the map now.
-    if (track_retainer)
+    _retainers.assign(tracks.begin(), tracks.end());
+    _tracks = std::move(track_ranges);
+    if (!_tracks.empty())
     {
-        range_track_map.erase(track_retainer);
+        _push_frame(int(_tracks.size()) - 1, search_range);
     }
 }
 
-// add a gap to end of a track if it is shorter then the longest track.
-// shorter tracks are clones and get added to the tracks_retainer.
-// a new track will replace the original pointer in the track vector.
-static void
-_normalize_tracks_lengths(
-    std::vector<Track*>& tracks,
-    TrackRetainerVector& tracks_retainer,
-    ErrorStatus*         error_status)
+void
+StackResolver::_push_frame(
+    int                             track_index,
+    std::optional<TimeRange> const& trim_range)
 {
-    RationalTime duration;
-    for (auto track: tracks)
+    TrackRanges const& track = _tracks[track_index];
+
+    size_t position = 0;
+    if (trim_range)
     {
-        duration = std::max(duration, track->duration(error_status));
-        if (is_error(error_status))
-        {
-            return;
-        }
+        // the first entry that ends after the start of the trim range
+        position = std::upper_bound(
+                       track.max_end_times.begin(),
+                       track.max_end_times.end(),
+                       trim_range->start_time())
+                   - track.max_end_times.begin();
     }
 
-    for (size_t i = 0; i < tracks.size(); i++)
+    _frames.push_back({ track_index, position, trim_range });
+}
+
+// Sweep the top track, emitting the visible pieces and descending to the
+// track below for the invisible ones. This gives the same result as
+// trimming the lower track to the range of each invisible item, without
+// cloning any tracks.
+bool
+StackResolver::next(ResolvedSegment& segment, ErrorStatus* error_status)
+{
+    while (!_frames.empty())
     {
-        Track*       old_track      = tracks[i];
-        RationalTime track_duration = old_track->duration(error_status);
-        if (track_duration < duration)
+        Frame&             frame = _frames.back();
+        TrackRanges const& track = _tracks[frame.track_index];
+        if (frame.position >= track.entries.size()
+            || (frame.trim_range
+                && track.min_start_times[frame.position]
+                       >= frame.trim_range->end_time_exclusive()))
+        {
+            _frames.pop_back();
+            continue;
+        }
+
+        const int   track_index = frame.track_index;
+        const auto  trim_range  = frame.trim_range;
+        Composable* composable  = track.entries[frame.position].composable;
+        TimeRange   range       = track.entries[frame.position].range;
+        Item*       item        = dynamic_cast<Item*>(composable);
+        ++frame.position;
+
+        if (composable && !item && !dynamic_cast<Transition*>(composable))
+        {
+            _frames.clear();
+            if (error_status)
+            {
+                *error_status = ErrorStatus(
+                    ErrorStatus::TYPE_MISMATCH,
+                    "expected item of type Item* || Transition*",
+                    composable);
+            }
+            return false;
+        }
+
+        std::optional<TimeRange> source_range;
+        bool                     trimmed = false;
+        if (trim_range)
         {
-            Track* new_track =
-                static_cast<Track*>(old_track->clone(error_status));
-            if (is_error(error_status))
+            if (!trim_range->intersects(range))
             {
-                return;
+                continue;
             }
-            // add track to retainer so it can be freed later
-            tracks_retainer.push_back(
-                SerializableObject::Retainer<Track>(new_track));
-            new_track->append_child(
-                new Gap(duration - track_duration),
-                error_status);
-            if (is_error(error_status))
+
+            if (!trim_range->contains(range))
             {
-                return;
+                if (!item && composable)
+                {
+                    _frames.clear();
+                    if (error_status)
+                    {
+                        *error_status = ErrorStatus(
+                            ErrorStatus::CANNOT_TRIM_TRANSITION,
+                            "Cannot trim in the middle of a transition");
+                    }
+                    return false;
+                }
+
+                // trim the ends of the item to the trim range
+                if (item)
+                {
+                    source_range = item->trimmed_range(error_status);
+                    if (is_error(error_status))
+                    {
+                        _frames.clear();
+                        return false;
+                    }
+                }
+                else
+                {
+                    source_range = TimeRange(
+                        RationalTime(0, range.duration().rate()),
+                        range.duration());
+                }
+
+                RationalTime start_time = range.start_time();
+                if (trim_range->start_time() > range.start_time())
+                {
+                    auto trim_amount = trim_range->start_time() - start_time;
+                    source_range     = TimeRange(
+                        source_range->start_time() + trim_amount,
+                        source_range->duration() - trim_amount);
+                    start_time = trim_range->start_time();
+                    trimmed    = true;
+                }
+
+                auto trim_end  = trim_range->end_time_exclusive();
+                auto range_end = range.end_time_exclusive();
+                if (trim_end < range_end)
+                {
+                    auto trim_amount = range_end - trim_end;
+                    source_range     = TimeRange(
+                        source_range->start_time(),
+                        source_range->duration() - trim_amount);
+                    trimmed = true;
+                }
+
+                range = TimeRange(start_time, source_range->duration());
             }
-            tracks[i] = new_track;
         }
-    }
-}
 
-Track*
-flatten_stack(Stack* in_stack, ErrorStatus* error_status)
-{
-    std::vector<Track*> tracks;
-    // tracks are cloned if they need to be normalized
-    // they get added to this retainer so they can be
-    // freed when the algorithm is complete
-    TrackRetainerVector tracks_retainer;
-    tracks.reserve(in_stack->children().size());
+        // transitions, visible items and everything on the bottom track are
+        // part of the result, anything else shows the track below
+        const bool visible = composable ? (!item || item->visible()) : false;
+        if (!visible && track_index > 0)
+        {
+            _push_frame(track_index - 1, range);
+            continue;
+        }
 
-    for (auto c: in_stack->children())
-    {
-        if (auto track = dynamic_retainer_cast<Track>(c))
+        if (!source_range)
         {
-            if (track->enabled())
+            if (item)
             {
-                tracks.push_back(track);
+                source_range = item->trimmed_range(error_status);
+                if (is_error(error_status))
+                {
+                    _frames.clear();
+                    return false;
+                }
             }
-        }
-        else
-        {
-            if (error_status)
+            else if (!composable)
             {
-                *error_status = ErrorStatus(
-                    ErrorStatus::TYPE_MISMATCH,
-                    "expected item of type Track*",
-                    c);
+                source_range = TimeRange(
+                    RationalTime(0, range.duration().rate()),
+                    range.duration());
             }
-            return nullptr;
         }
+
+        segment.composable   = composable;
+        segment.range        = range;
+        segment.source_range = source_range;
+        segment.trimmed      = trimmed;
+        return true;
     }
 
-    _normalize_tracks_lengths(tracks, tracks_retainer, error_status);
-    if (is_error(error_status))
+    return false;
+}
+
+static Track*
+_flatten_tracks(
+    StackResolver&     resolver,
+    ErrorStatus const& init_status,
+    ErrorStatus*       error_status)
+{
+    if (is_error(init_status))
     {
+        if (error_status)
+        {
+            *error_status = init_status;
+        }
         return nullptr;
     }
 
     Track* flat_track = new Track;
     flat_track->set_name("Flattened");
 
-    RangeTrackMap range_track_map;
-    _flatten_next_item(
-        range_track_map,
-        flat_track,
-        tracks,
-        -1,
-        std::nullopt,
-        error_status);
+    // only the pieces that end up in the result are cloned
+    ResolvedSegment segment;
+    while (resolver.next(segment, error_status))
+    {
+        Composable* piece = nullptr;
+        if (segment.composable)
+        {
+            piece = static_cast<Composable*>(
+                segment.composable->clone(error_status));
+            if (is_error(error_status) || !piece)
+            {
+                break;
+            }
+            if (segment.trimmed)
+            {
+                static_cast<Item*>(piece)->set_source_range(
+                    *segment.source_range);
+            }
+        }
+        else
+        {
+            piece = new Gap(*segment.source_range);
+        }
+
+        if (!flat_track->insert_child(
+                static_cast<int>(flat_track->children().size()),
+                piece,
+                error_status))
+        {
+            break;
+        }
+    }
+
     return flat_track;
 }
 
 Track*
-flatten_stack(std::vector<Track*> const& tracks, ErrorStatus* error_status)
+flatten_stack(Stack* in_stack, ErrorStatus* error_status)
 {
-    std::vector<Track*> flat_tracks;
-    // tracks are cloned if they need to be normalized
-    // they get added to this retainer so they can be
-    // freed when the algorithm is complete
-    TrackRetainerVector tracks_retainer;
-    flat_tracks.reserve(tracks.size());
-    for (auto track: tracks)
-    {
-        flat_tracks.push_back(track);
-    }
-
-    _normalize_tracks_lengths(flat_tracks, tracks_retainer, error_status);
-    if (is_error(error_status))
-    {
-        return nullptr;
-    }
-
-    Track* flat_track = new Track;
-    flat_track->set_name("Flattened");
+    ErrorStatus   init_status;
+    StackResolver resolver(in_stack, std::nullopt, &init_status);
+    return _flatten_tracks(resolver, init_status, error_status);
+}
 
-    RangeTrackMap range_track_map;
-    _flatten_next_item(
-        range_track_map,
-        flat_track,
-        flat_tracks,
-        -1,
-        std::nullopt,
-        error_status);
-    return flat_track;
+Track*
+flatten_stack(std::vector<Track*> const& tracks, ErrorStatus* error_status)
+{
+    ErrorStatus   init_status;
+    StackResolver resolver(tracks, std::nullopt, &init_status);
+    return _flatten_tracks(resolver, init_status, error_status);
 }
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -17,4 +17,91 @@ Track* flatten_stack(
     std::vector<Track*> const& tracks,
     ErrorStatus*               error_status = nullptr);
 
+/// @brief A visible segment of a stack.
+struct ResolvedSegment
+{
+    /// @brief The item or transition that is visible, or null for the end of
+    /// a track that is shorter than the others.
+    Composable* composable = nullptr;
+
+    /// @brief The range of the segment in the stack.
+    TimeRange range;
+
+    /// @brief The source range of the item for this segment.
+    ///
+    /// This is unset for transitions.
+    std::optional<TimeRange> source_range;
+
+    /// @brief Whether the item was cut to fit the segment.
+    bool trimmed = false;
+};
+
+/// @brief Walk the visible segments of a stack in time order.
+///
+/// The segments are the ones flatten_stack would produce, but nothing is
+/// cloned: each segment refers to the original item. The stack must not be
+/// modified while it is being resolved.
+class StackResolver
+{
+public:
+    /// @brief Create a new resolver.
+    ///
+    /// If a search range is given, only the segments that intersect it are
+    /// returned, trimmed to it.
+    StackResolver(
+        Stack*                          in_stack,
+        std::optional<TimeRange> const& search_range = std::nullopt,
+        ErrorStatus*                    error_status = nullptr);
+
+    /// @brief Create a new resolver for a list of tracks.
+    StackResolver(
+        std::vector<Track*> const&      tracks,
+        std::optional<TimeRange> const& search_range = std::nullopt,
+        ErrorStatus*                    error_status = nullptr);
+
+    /// @brief Get the next segment.
+    ///
+    /// Returns false when there are no more segments, or on error.
+    bool next(ResolvedSegment& segment, ErrorStatus* error_status = nullptr);
+
+private:
+    // The children of one track with their ranges in the track.
+    struct TrackRanges
+    {
+        struct Entry
+        {
+            Composable* composable;
+            TimeRange   range;
+        };
+
+        std::vector<Entry> entries;
+
+        // Running maximum of the end times, and minimum of the start times
+        // from each entry to the last. Transitions overlap their neighbors,
+        // so the ranges alone are not sorted; these are, and bound the
+        // entries that can intersect a given range.
+        std::vector<RationalTime> max_end_times;
+        std::vector<RationalTime> min_start_times;
+    };
+
+    // A track being swept over a range of the track above.
+    struct Frame
+    {
+        int                      track_index;
+        size_t                   position;
+        std::optional<TimeRange> trim_range;
+    };
+
+    void _init(
+        std::vector<Track*> const&      tracks,
+        std::optional<TimeRange> const& search_range,
+        ErrorStatus*                    error_status);
+
+    void _push_frame(int track_index, std::optional<TimeRange> const& trim_range);
+
+    std::vector<SerializableObject::Retainer<Track>> _retainers;
+    std::vector<TrackRanges>                         _tracks;
+    std::vector<Frame>                               _frames;
+};
+
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
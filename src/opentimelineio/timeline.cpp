@@ -22,6 +22,7 @@ void
 Timeline::set_tracks(Stack* stack)
 {
     _tracks = stack ? stack : new Stack("tracks");
+    _content_changed();
 }
 
 bool
@@ -36,10 +37,23 @@ void
 Timeline::write_to(Writer& writer) const
 {
     Parent::write_to(writer);
-    writer.write("global_start_time", _global_start_time);
+    writer.write_unless_default(
+        "global_start_time",
+        this,
+        &Timeline::_global_start_time);
     writer.write("tracks", _tracks);
 }
 
+void
+Timeline::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<Timeline*>(clone_object);
+    clone->_global_start_time = _global_start_time;
+    clone->_tracks            = cloner.clone(_tracks);
+}
+
 std::vector<Track*>
 Timeline::video_tracks() const
 {
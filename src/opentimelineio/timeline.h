@@ -57,6 +57,7 @@ public:
     set_global_start_time(std::optional<RationalTime> const& global_start_time)
     {
         _global_start_time = global_start_time;
+        _content_changed();
     }
 
     /// @brief Return the duration of the timeline.
@@ -114,6 +115,7 @@ protected:
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
 private:
     std::optional<RationalTime> _global_start_time;
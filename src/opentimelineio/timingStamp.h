@@ -0,0 +1,26 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include "opentimelineio/version.h"
+
+#include <cstdint>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
+
+/// @brief Return the current timing stamp.
+///
+/// The timing stamp is a process wide counter that is incremented whenever
+/// something that can change the timing of a composable is mutated, for
+/// example the children of a composition, the source range of an item, the
+/// offsets of a transition or the available range of a media reference.
+///
+/// Compositions record the stamp when they build cached child ranges, and
+/// rebuild the cache once the stamp has moved on.
+uint64_t timing_stamp() noexcept;
+
+/// @brief Increment the timing stamp, invalidating all cached child ranges.
+void bump_timing_stamp() noexcept;
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -42,6 +42,15 @@ Track::write_to(Writer& writer) const
     writer.write("kind", _kind);
 }
 
+void
+Track::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<Track*>(clone_object);
+    clone->_kind = _kind;
+}
+
 TimeRange
 Track::range_of_child_at_index(int index, ErrorStatus* error_status) const
 {
@@ -55,7 +64,23 @@ Track::range_of_child_at_index(int index, ErrorStatus* error_status) const
         return TimeRange();
     }
 
-    Composable*  child          = children()[index];
+    Composable* child = children()[index];
+
+    {
+        std::lock_guard<std::mutex> lock(_range_cache_mutex);
+        if (_update_range_cache())
+        {
+            RationalTime start_time = _child_start_times[index];
+            if (auto transition = dynamic_cast<Transition*>(child))
+            {
+                start_time -= transition->in_offset();
+            }
+            return TimeRange(start_time, _child_durations[index]);
+        }
+    }
+
+    // One of the children has no duration, walk the children before this
+    // one so the error is reported the same way as without the cache.
     RationalTime child_duration = child->duration(error_status);
     if (is_error(error_status))
     {
@@ -85,6 +110,63 @@ Track::range_of_child_at_index(int index, ErrorStatus* error_status) const
     return TimeRange(start_time, child_duration);
 }
 
+bool
+Track::_update_range_cache() const
+{
+    const uint64_t stamp = timing_stamp();
+    if (_range_cache_stamp == stamp)
+    {
+        return _range_cache_valid;
+    }
+
+    _range_cache_stamp = stamp;
+    _range_cache_valid = false;
+    _child_start_times.clear();
+    _child_durations.clear();
+
+    const size_t count = children().size();
+    _child_durations.reserve(count);
+    for (const auto& child: children())
+    {
+        ErrorStatus error_status;
+        _child_durations.push_back(child->duration(&error_status));
+        if (is_error(error_status))
+        {
+            _child_durations.clear();
+            return false;
+        }
+    }
+
+    // The running total starts at the lowest rate in use, so that adding it
+    // to a zero time at the rate of the child gives the same rate as
+    // summing the durations onto that zero time directly.
+    double min_rate = 1;
+    for (size_t i = 0; i < count; i++)
+    {
+        if (i == 0 || _child_durations[i].rate() < min_rate)
+        {
+            min_rate = _child_durations[i].rate();
+        }
+    }
+
+    _child_start_times.reserve(count);
+    RationalTime running_total(0, min_rate);
+    for (size_t i = 0; i < count; i++)
+    {
+        RationalTime start_time(0, _child_durations[i].rate());
+        start_time += running_total;
+        _child_start_times.push_back(start_time);
+
+        if (!children()[i]->overlapping())
+        {
+            running_total += _child_durations[i];
+        }
+    }
+
+    _range_cache_valid = true;
+    return true;
+}
+
 TimeRange
 Track::trimmed_range_of_child_at_index(int index, ErrorStatus* error_status)
     const
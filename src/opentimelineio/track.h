@@ -6,6 +6,8 @@
 #include "opentimelineio/composition.h"
 #include "opentimelineio/version.h"
 
+#include <mutex>
+
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
 class Clip;
@@ -54,7 +56,11 @@ public:
     std::string kind() const noexcept { return _kind; }
 
     /// @brief Set this kind of track.
-    void set_kind(std::string const& kind) { _kind = kind; }
+    void set_kind(std::string const& kind)
+    {
+        _kind = kind;
+        _content_changed();
+    }
 
     TimeRange range_of_child_at_index(
         int          index,
@@ -89,9 +95,24 @@ protected:
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
 private:
+    // Bring the cached child start times and durations up to date with the
+    // current timing stamp.  Returns false if the durations of the children
+    // could not be computed, in which case the cache must not be used.
+    bool _update_range_cache() const;
+
     std::string _kind;
+
+    // Start time and duration of each child, so that looking up the range
+    // of a child does not have to sum the durations of all of the children
+    // before it.  Rebuilt lazily when the timing stamp changes.
+    mutable uint64_t                  _range_cache_stamp = 0;
+    mutable bool                      _range_cache_valid = false;
+    mutable std::vector<RationalTime> _child_start_times;
+    mutable std::vector<RationalTime> _child_durations;
+    mutable std::mutex                _range_cache_mutex;
 };
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION
@@ -45,6 +45,17 @@ Transition::write_to(Writer& writer) const
     writer.write("transition_type", _transition_type);
 }
 
+void
+Transition::_copy_to(SerializableObject* clone_object, Cloner& cloner) const
+{
+    Parent::_copy_to(clone_object, cloner);
+
+    auto clone = static_cast<Transition*>(clone_object);
+    clone->_in_offset       = _in_offset;
+    clone->_out_offset      = _out_offset;
+    clone->_transition_type = _transition_type;
+}
+
 RationalTime
 Transition::duration(ErrorStatus* /* error_status */) const
 {
@@ -4,6 +4,7 @@
 #pragma once
 
 #include "opentimelineio/composable.h"
+#include "opentimelineio/timingStamp.h"
 #include "opentimelineio/version.h"
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
@@ -52,6 +53,7 @@ public:
     void set_transition_type(std::string const& transition_type)
     {
         _transition_type = transition_type;
+        _content_changed();
     }
 
     /// @brief Return the transition in time offset.
@@ -61,6 +63,8 @@ public:
     void set_in_offset(RationalTime const& in_offset) noexcept
     {
         _in_offset = in_offset;
+        bump_timing_stamp();
+        _content_changed();
     }
 
     /// @brief Return the transition out time offset.
@@ -70,6 +74,8 @@ public:
     void set_out_offset(RationalTime const& out_offset) noexcept
     {
         _out_offset = out_offset;
+        bump_timing_stamp();
+        _content_changed();
     }
 
     RationalTime duration(ErrorStatus* error_status = nullptr) const override;
@@ -87,6 +93,7 @@ protected:
 
     bool read_from(Reader&) override;
     void write_to(Writer&) const override;
+    void _copy_to(SerializableObject* clone, Cloner& cloner) const override;
 
 private:
     std::string  _transition_type;
@@ -88,6 +88,14 @@ TypeRegistry::TypeRegistry()
     register_type_from_existing_type("Sequence", 1, "Track", nullptr);
     register_type<Transition>();
 
+    // The schemas above implement _copy_to(), except UnknownSchema, which
+    // has to keep its data as it was read.
+    for (auto& e: _type_records_by_type_name)
+    {
+        e.second->clone_by_copy =
+            e.second->schema_name != UnknownSchema::Schema::name;
+    }
+
     /*
      * Upgrade functions:
      */
@@ -118,18 +126,23 @@ TypeRegistry::TypeRegistry()
 
     // 2->1
     register_downgrade_function(Clip::Schema::name, 2, [](AnyDictionary* d) {
-        AnyDictionary mrefs;
-        std::string   active_rkey = "";
-
-        if (d->get_if_set("media_references", &mrefs))
+        // the active reference is moved out of media_references, which is
+        // dropped, rather than copied
+        auto mrefs       = d->find("media_references");
+        auto active_rkey = d->find("active_media_reference_key");
+
+        if (mrefs != d->end() && mrefs->second.type() == typeid(AnyDictionary)
+            && active_rkey != d->end()
+            && active_rkey->second.type() == typeid(std::string))
         {
-            if (d->get_if_set("active_media_reference_key", &active_rkey))
+            auto& refs = std::any_cast<AnyDictionary&>(mrefs->second);
+            auto  active_ref =
+                refs.find(std::any_cast<std::string const&>(active_rkey->second));
+            if (active_ref != refs.end()
+                && active_ref->second.type() == typeid(AnyDictionary))
             {
-                AnyDictionary active_ref;
-                if (mrefs.get_if_set(active_rkey, &active_ref))
-                {
-                    (*d)["media_reference"] = active_ref;
-                }
+                std::any media_reference = std::move(active_ref->second);
+                (*d)["media_reference"]  = std::move(media_reference);
             }
         }
 
@@ -256,6 +269,88 @@ TypeRegistry::register_downgrade_function(
     return false;
 }
 
+bool
+TypeRegistry::register_upgrade_rules(
+    std::string const&             schema_name,
+    int                            version_to_upgrade_to,
+    std::vector<SchemaRule> const& rules)
+{
+    return register_upgrade_function(
+        schema_name,
+        version_to_upgrade_to,
+        [rules](AnyDictionary* d) { apply_schema_rules(rules, d); });
+}
+
+bool
+TypeRegistry::register_downgrade_rules(
+    std::string const&             schema_name,
+    int                            version_to_downgrade_from,
+    std::vector<SchemaRule> const& rules)
+{
+    return register_downgrade_function(
+        schema_name,
+        version_to_downgrade_from,
+        [rules](AnyDictionary* d) { apply_schema_rules(rules, d); });
+}
+
+void
+TypeRegistry::apply_schema_rules(
+    std::vector<SchemaRule> const& rules,
+    AnyDictionary*                 dict)
+{
+    for (auto const& rule: rules)
+    {
+        auto e = dict->find(rule.key);
+        switch (rule.kind)
+        {
+            case SchemaRule::Kind::rename:
+                if (e != dict->end())
+                {
+                    std::any value = std::move(e->second);
+                    dict->erase(e);
+                    (*dict)[rule.new_key] = std::move(value);
+                }
+                break;
+            case SchemaRule::Kind::drop:
+                if (e != dict->end())
+                {
+                    dict->erase(e);
+                }
+                break;
+            case SchemaRule::Kind::set_default:
+                if (e == dict->end())
+                {
+                    (*dict)[rule.key] = rule.value;
+                }
+                break;
+            case SchemaRule::Kind::move_to_metadata: {
+                if (e == dict->end())
+                {
+                    break;
+                }
+
+                auto& metadata = (*dict)["metadata"];
+                if (!metadata.has_value())
+                {
+                    metadata = AnyDictionary();
+                }
+                else if (metadata.type() != typeid(AnyDictionary))
+                {
+                    break;
+                }
+
+                // inserting metadata leaves e valid
+                std::any value = std::move(e->second);
+                dict->erase(e);
+                std::any_cast<AnyDictionary&>(metadata)
+                    [rule.new_key.empty() ? rule.key : rule.new_key] =
+                    std::move(value);
+                break;
+            }
+        }
+    }
+}
+
 SerializableObject*
 TypeRegistry::_instance_from_schema(
     std::string    schema_name,
@@ -7,11 +7,13 @@
 #include "opentimelineio/version.h"
 
 #include <algorithm>
+#include <any>
 #include <functional>
 #include <map>
 #include <mutex>
 #include <string>
 #include <unordered_map>
+#include <vector>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION {
 
@@ -35,6 +37,33 @@ using label_to_schema_version_map =
 
 extern const label_to_schema_version_map CORE_VERSION_MAP;
 
+/// @brief A declarative change to the fields of a schema.
+///
+/// Schema rules describe the common upgrades and downgrades, which rename,
+/// drop or add fields, without a function.  They are applied in C++, so
+/// bridges to other languages are not called back for each object.
+struct SchemaRule
+{
+    enum class Kind
+    {
+        /// Rename the field key to new_key.
+        rename,
+        /// Remove the field key.
+        drop,
+        /// Set the field key to value, if it is not present.
+        set_default,
+        /// Move the field key into the metadata dictionary, as new_key
+        /// (or key, if new_key is empty).
+        move_to_metadata
+    };
+
+    Kind        kind;
+    std::string key;
+    std::string new_key;
+    std::any    value;
+};
+
+
 /// @brief Type registry.
 class TypeRegistry
 {
@@ -138,6 +167,26 @@ public:
             upgrade_function);
     }
 
+    /// @brief Register rules that upgrade the given schema to version_to_upgrade_to.
+    ///
+    /// The rules are applied in order, in place of an upgrade function; see
+    /// register_upgrade_function() for details.
+    bool register_upgrade_rules(
+        std::string const&             schema_name,
+        int                            version_to_upgrade_to,
+        std::vector<SchemaRule> const& rules);
+
+    /// @brief Register rules that downgrade the given schema from
+    /// version_to_downgrade_from to version_to_downgrade_from - 1.
+    bool register_downgrade_rules(
+        std::string const&             schema_name,
+        int                            version_to_downgrade_from,
+        std::vector<SchemaRule> const& rules);
+
+    /// @brief Apply the rules to a data dictionary.
+    static void
+    apply_schema_rules(std::vector<SchemaRule> const& rules, AnyDictionary* dict);
+
     /// @brief Return the instance from the given schema.
     SerializableObject* instance_from_schema(
         std::string const& schema_name,
@@ -175,6 +224,10 @@ private:
         std::string                          class_name;
         std::function<SerializableObject*()> create;
 
+        // Objects of this schema are cloned by copying their fields (see
+        // SerializableObject::_copy_to()) instead of serializing them.
+        bool clone_by_copy = false;
+
         std::map<int, std::function<void(AnyDictionary*)>> upgrade_functions;
         std::map<int, std::function<void(AnyDictionary*)>> downgrade_functions;
 
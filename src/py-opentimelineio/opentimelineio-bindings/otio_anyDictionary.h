@@ -71,6 +71,8 @@ struct AnyDictionaryProxy : public AnyDictionary::MutationStamp {
         else {
             m.emplace(key, std::move(pyAny->a));
         }
+        // the object holding the dictionary does not see edits made through it
+        bump_content_stamp();
     }
     
     void del_item(std::string const& key) {
@@ -80,6 +82,7 @@ struct AnyDictionaryProxy : public AnyDictionary::MutationStamp {
             throw py::key_error(key);
         }
         m.erase(e);
+        bump_content_stamp();
     }
 
     int len() {
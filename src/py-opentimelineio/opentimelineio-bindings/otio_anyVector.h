@@ -58,6 +58,8 @@ struct AnyVectorProxy : public AnyVector::MutationStamp {
             throw py::index_error("list assignment index out of range");
         }
         std::swap(v[index], pyAny->a);
+        // the object holding the vector does not see edits made through it
+        bump_content_stamp();
     }
     
     void insert(int index, PyAny* pyAny) {
@@ -70,6 +72,7 @@ struct AnyVectorProxy : public AnyVector::MutationStamp {
         else {
             v.insert(v.begin() + std::max(index, 0), std::move(pyAny->a));
         }
+        bump_content_stamp();
     }
 
     void del_item(int index) {
@@ -86,6 +89,7 @@ struct AnyVectorProxy : public AnyVector::MutationStamp {
         else {
             v.erase(v.begin() + std::max(index, 0));
         }
+        bump_content_stamp();
     }
 
     int len() {
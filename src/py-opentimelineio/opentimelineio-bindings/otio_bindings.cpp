@@ -16,9 +16,73 @@
 
 #include <Imath/ImathBox.h>
 
+#include <algorithm>
+#include <ostream>
+#include <streambuf>
+#include <vector>
+
 namespace py = pybind11;
 using namespace pybind11::literals;
 
+// A stream buffer that passes what is written to it to a Python callable,
+// in bytes objects of at most buffer_size bytes. It is used with the GIL
+// released, and takes the GIL only to call write.
+//
+// If write raises, the Python error is left set and the buffer fails, so
+// the caller can raise it once the GIL is taken back.
+class PyWriteStreamBuffer : public std::streambuf {
+public:
+    PyWriteStreamBuffer(py::function write, size_t buffer_size)
+        : _write(write),
+          _buffer(std::max<size_t>(buffer_size, 1)) {
+        setp(_buffer.data(), _buffer.data() + _buffer.size());
+    }
+
+    bool failed() const { return _failed; }
+
+protected:
+    int_type overflow(int_type c) override {
+        if (!_flush()) {
+            return traits_type::eof();
+        }
+        if (!traits_type::eq_int_type(c, traits_type::eof())) {
+            *pptr() = traits_type::to_char_type(c);
+            pbump(1);
+        }
+        return traits_type::not_eof(c);
+    }
+
+    int sync() override {
+        return _flush() ? 0 : -1;
+    }
+
+private:
+    bool _flush() {
+        if (_failed) {
+            return false;
+        }
+
+        std::ptrdiff_t size = pptr() - pbase();
+        if (size > 0) {
+            py::gil_scoped_acquire acquire;
+            try {
+                _write(py::bytes(pbase(), size));
+            }
+            catch (py::error_already_set& e) {
+                e.restore();
+                _failed = true;
+                return false;
+            }
+        }
+        setp(_buffer.data(), _buffer.data() + _buffer.size());
+        return true;
+    }
+
+    py::function      _write;
+    std::vector<char> _buffer;
+    bool              _failed = false;
+};
+
 // temporarily disabling this feature while I chew on it
 const static bool EXCEPTION_ON_DOUBLE_REGISTER = false;
 
@@ -154,6 +218,57 @@ register_downgrade_function(
     
 }
 
+// Rules are given as sequences of the kind of rule and its arguments:
+//   ("rename", key, new_key)
+//   ("drop", key)
+//   ("set_default", key, value)
+//   ("move_to_metadata", key[, metadata_key])
+static std::vector<SchemaRule> schema_rules_from_py(py::iterable const& rules_obj) {
+    std::vector<SchemaRule> rules;
+    for (auto item: rules_obj) {
+        auto args = py::cast<py::sequence>(item);
+        auto kind = args.size() ? py::cast<std::string>(args[0]) : std::string();
+
+        SchemaRule rule;
+        size_t min_args = 2, max_args = 2;
+        if (kind == "rename") {
+            rule.kind = SchemaRule::Kind::rename;
+            min_args = max_args = 3;
+        }
+        else if (kind == "drop") {
+            rule.kind = SchemaRule::Kind::drop;
+        }
+        else if (kind == "set_default") {
+            rule.kind = SchemaRule::Kind::set_default;
+            min_args = max_args = 3;
+        }
+        else if (kind == "move_to_metadata") {
+            rule.kind = SchemaRule::Kind::move_to_metadata;
+            max_args = 3;
+        }
+        else {
+            throw py::value_error("Unknown schema rule: '" + kind + "'");
+        }
+
+        if (args.size() < min_args || args.size() > max_args) {
+            throw py::value_error(
+                    "Wrong number of arguments for schema rule '" + kind + "'");
+        }
+
+        rule.key = py::cast<std::string>(args[1]);
+        if (args.size() > 2) {
+            if (rule.kind == SchemaRule::Kind::set_default) {
+                py_to_any(args[2], &rule.value);
+            }
+            else {
+                rule.new_key = py::cast<std::string>(args[2]);
+            }
+        }
+        rules.push_back(std::move(rule));
+    }
+    return rules;
+}
+
 static void set_type_record(SerializableObject* so, std::string schema_name) {
     TypeRegistry::instance().set_type_record(so, schema_name, ErrorStatusHandler());
 }
@@ -179,6 +294,7 @@ PYBIND11_MODULE(_otio, m) {
     otio_any_vector_bindings(m);
     otio_imath_bindings(m);
     otio_serializable_object_bindings(m);
+    otio_edit_algorithm_bindings(m);
     otio_tests_bindings(m);
 
     m.def(
@@ -186,65 +302,319 @@ PYBIND11_MODULE(_otio, m) {
             [](
                 PyAny* pyAny,
                 const schema_version_map& schema_version_targets,
-                int indent
+                int indent,
+                bool omit_defaults,
+                int float_precision,
+                bool integral_as_int,
+                bool compact_times
               ) 
             {
-                auto result = serialize_json_to_string(
-                        pyAny->a,
-                        &schema_version_targets,
-                        ErrorStatusHandler(),
-                        indent
-                );
+                // The error handler raises on destruction, so it has to
+                // outlive the region where the GIL is released.
+                auto error_status = ErrorStatusHandler();
+                std::string result;
+                {
+                    py::gil_scoped_release release;
+                    result = serialize_json_to_string(
+                            pyAny->a,
+                            &schema_version_targets,
+                            error_status,
+                            indent,
+                            omit_defaults,
+                            float_precision,
+                            integral_as_int,
+                            compact_times
+                    );
+                }
 
                 return result;
             },
             "value"_a,
             "schema_version_targets"_a,
-            "indent"_a
+            "indent"_a,
+            "omit_defaults"_a = false,
+            "float_precision"_a = 0,
+            "integral_as_int"_a = false,
+            "compact_times"_a = false
     )
      .def("_serialize_json_to_file",
           [](
               PyAny* pyAny,
               std::string filename,
               const schema_version_map& schema_version_targets,
-              int indent
+              int indent,
+              bool omit_defaults,
+              int float_precision,
+              bool integral_as_int,
+              bool compact_times
           ) {
-              return serialize_json_to_file(
-                      pyAny->a,
-                      filename,
-                      &schema_version_targets,
-                      ErrorStatusHandler(),
-                      indent
-              );
+              auto error_status = ErrorStatusHandler();
+              bool result;
+              {
+                  py::gil_scoped_release release;
+                  result = serialize_json_to_file(
+                          pyAny->a,
+                          filename,
+                          &schema_version_targets,
+                          error_status,
+                          indent,
+                          omit_defaults,
+                          float_precision,
+                          integral_as_int,
+                          compact_times
+                  );
+              }
+              return result;
           },
           "value"_a,
           "filename"_a,
           "schema_version_targets"_a,
-          "indent"_a)
+          "indent"_a,
+          "omit_defaults"_a = false,
+          "float_precision"_a = 0,
+          "integral_as_int"_a = false,
+          "compact_times"_a = false)
+     .def("_serialize_json_to_writer",
+          [](
+              PyAny* pyAny,
+              py::function write,
+              const schema_version_map& schema_version_targets,
+              int indent,
+              size_t buffer_size,
+              bool omit_defaults,
+              int float_precision,
+              bool integral_as_int,
+              bool compact_times
+          ) {
+              PyWriteStreamBuffer buffer(write, buffer_size);
+              {
+                  auto error_status = ErrorStatusHandler();
+                  {
+                      py::gil_scoped_release release;
+                      std::ostream stream(&buffer);
+                      serialize_json_to_stream(
+                              pyAny->a,
+                              stream,
+                              &schema_version_targets,
+                              error_status,
+                              indent,
+                              omit_defaults,
+                              float_precision,
+                              integral_as_int,
+                              compact_times
+                      );
+                  }
+
+                  // raise what write raised, rather than the write error
+                  if (buffer.failed()) {
+                      error_status.error_status = ErrorStatus();
+                      throw py::error_already_set();
+                  }
+              }
+          },
+          "value"_a,
+          "write"_a,
+          "schema_version_targets"_a,
+          "indent"_a,
+          "buffer_size"_a,
+          "omit_defaults"_a = false,
+          "float_precision"_a = 0,
+          "integral_as_int"_a = false,
+          "compact_times"_a = false)
      .def("deserialize_json_from_string",
-          [](std::string input) {
+          [](py::str input, bool lazy_metadata) {
+              // parse the utf-8 of the str in place, without copying it
+              Py_ssize_t  size;
+              char const* data = PyUnicode_AsUTF8AndSize(input.ptr(), &size);
+              if (!data) {
+                  throw py::error_already_set();
+              }
+
               std::any result;
-              deserialize_json_from_string(input, &result, ErrorStatusHandler());
+              {
+                  auto error_status = ErrorStatusHandler();
+                  py::gil_scoped_release release;
+                  deserialize_json_from_buffer(
+                          data, size, &result, error_status, lazy_metadata);
+              }
               return any_to_py(result, true /*top_level*/);
-          }, "input"_a,
+          }, "input"_a, "lazy_metadata"_a = false)
+     .def("deserialize_json_from_string",
+          [](py::buffer input, bool lazy_metadata) {
+              // bytes, bytearray, memoryview, mmap...: parsed in place
+              Py_buffer view;
+              if (PyObject_GetBuffer(input.ptr(), &view, PyBUF_SIMPLE) != 0) {
+                  throw py::error_already_set();
+              }
+
+              std::any result;
+              try {
+                  auto error_status = ErrorStatusHandler();
+                  py::gil_scoped_release release;
+                  deserialize_json_from_buffer(
+                          static_cast<char const*>(view.buf),
+                          view.len,
+                          &result,
+                          error_status,
+                          lazy_metadata);
+              }
+              catch (...) {
+                  PyBuffer_Release(&view);
+                  throw;
+              }
+              PyBuffer_Release(&view);
+              return any_to_py(result, true /*top_level*/);
+          }, "input"_a, "lazy_metadata"_a = false,
           R"docstring(Deserialize json string to in-memory objects.
 
-:param str input: json string to deserialize
+:param input: json to deserialize, as a str or as utf-8 in any object that supports the buffer protocol (bytes, bytearray, memoryview, mmap...)
+:param bool lazy_metadata: keep the metadata of objects as json text until it is first accessed, and write it back out as it is if it never is
 
 :returns: root object in the string (usually a Timeline or SerializableCollection)
 :rtype: SerializableObject
 
+The json is parsed in place, without a copy, and the GIL is released while it is parsed, so several threads can
+deserialize at the same time.
+
 )docstring")
      .def("deserialize_json_from_file",
-          [](std::string filename) {
+          [](std::string filename, bool lazy_metadata, int num_threads) {
               std::any result;
-              deserialize_json_from_file(filename, &result, ErrorStatusHandler());
+              {
+                  auto error_status = ErrorStatusHandler();
+                  py::gil_scoped_release release;
+                  deserialize_json_from_file(
+                          filename, &result, error_status, lazy_metadata, num_threads);
+              }
               return any_to_py(result, true /*top_level*/);
           }, 
           "filename"_a,
+          "lazy_metadata"_a = false,
+          "num_threads"_a = 1,
           R"docstring(Deserialize json file to in-memory objects.
 
 :param str filename: path to json file to read
+:param bool lazy_metadata: keep the metadata of objects as json text until it is first accessed, and write it back out as it is if it never is
+:param int num_threads: parse the file on this many threads, or on one per core if 0; the elements of the "children" arrays in the file are parsed in runs, each on its own
+
+:returns: root object in the file (usually a Timeline or SerializableCollection)
+:rtype: SerializableObject
+
+The GIL is released while the file is read and parsed, so several threads
+can deserialize at the same time.
+
+)docstring")
+     .def("deserialize_json_skeleton_from_file",
+          [](std::string filename) {
+              std::any result;
+              {
+                  auto error_status = ErrorStatusHandler();
+                  py::gil_scoped_release release;
+                  deserialize_json_skeleton_from_file(
+                          filename, &result, error_status);
+              }
+              return any_to_py(result, true /*top_level*/);
+          },
+          "filename"_a,
+          R"docstring(Deserialize the structure of a json file to in-memory objects.
+
+:param str filename: path to json file to read
+
+:returns: root object in the file (usually a Timeline or SerializableCollection)
+:rtype: SerializableObject
+
+The metadata, markers and effects of timelines, stacks, tracks, clips, gaps, transitions and media references are
+skipped.  Each object loads them from the file the first time one of them is accessed, so the file should not
+change while the objects are in use.
+
+)docstring")
+     .def("_serialize_binary_to_string",
+          [](
+              PyAny* pyAny,
+              const schema_version_map& schema_version_targets
+          ) {
+              auto error_status = ErrorStatusHandler();
+              std::string result;
+              {
+                  py::gil_scoped_release release;
+                  result = serialize_binary_to_string(
+                          pyAny->a,
+                          &schema_version_targets,
+                          error_status
+                  );
+              }
+              return py::bytes(result);
+          },
+          "value"_a,
+          "schema_version_targets"_a)
+     .def("_serialize_binary_to_file",
+          [](
+              PyAny* pyAny,
+              std::string filename,
+              const schema_version_map& schema_version_targets
+          ) {
+              auto error_status = ErrorStatusHandler();
+              bool result;
+              {
+                  py::gil_scoped_release release;
+                  result = serialize_binary_to_file(
+                          pyAny->a,
+                          filename,
+                          &schema_version_targets,
+                          error_status
+                  );
+              }
+              return result;
+          },
+          "value"_a,
+          "filename"_a,
+          "schema_version_targets"_a)
+     .def("deserialize_binary_from_string",
+          [](py::buffer input) {
+              Py_buffer view;
+              if (PyObject_GetBuffer(input.ptr(), &view, PyBUF_SIMPLE) != 0) {
+                  throw py::error_already_set();
+              }
+
+              std::any result;
+              try {
+                  auto error_status = ErrorStatusHandler();
+                  py::gil_scoped_release release;
+                  deserialize_binary_from_buffer(
+                          static_cast<char const*>(view.buf),
+                          view.len,
+                          &result,
+                          error_status);
+              }
+              catch (...) {
+                  PyBuffer_Release(&view);
+                  throw;
+              }
+              PyBuffer_Release(&view);
+              return any_to_py(result, true /*top_level*/);
+          }, "input"_a,
+          R"docstring(Deserialize binary (.otiob) data to in-memory objects.
+
+:param input: the data, in any object that supports the buffer protocol (bytes, bytearray, memoryview, mmap...)
+
+:returns: root object in the data (usually a Timeline or SerializableCollection)
+:rtype: SerializableObject
+
+)docstring")
+     .def("deserialize_binary_from_file",
+          [](std::string filename) {
+              std::any result;
+              {
+                  auto error_status = ErrorStatusHandler();
+                  py::gil_scoped_release release;
+                  deserialize_binary_from_file(filename, &result, error_status);
+              }
+              return any_to_py(result, true /*top_level*/);
+          },
+          "filename"_a,
+          R"docstring(Deserialize binary (.otiob) file to in-memory objects.
+
+:param str filename: path to binary file to read
 
 :returns: root object in the file (usually a Timeline or SerializableCollection)
 :rtype: SerializableObject
@@ -309,6 +679,36 @@ Return an instance of the schema from data in the data_dict.
           "schema_name"_a,
           "version_to_downgrade_from"_a,
           "downgrade_function"_a);
+    m.def("register_upgrade_rules",
+          [](std::string const& schema_name, int version_to_upgrade_to, py::iterable rules) {
+              return TypeRegistry::instance().register_upgrade_rules(
+                      schema_name, version_to_upgrade_to, schema_rules_from_py(rules));
+          },
+          "schema_name"_a,
+          "version_to_upgrade_to"_a,
+          "rules"_a,
+          R"docstring(Register rules that upgrade a schema to version_to_upgrade_to.
+
+The rules are applied in C++, in order, without calling back into Python.  Each rule is a sequence of the kind of rule and its arguments:
+
+- ``("rename", key, new_key)``
+- ``("drop", key)``
+- ``("set_default", key, value)``
+- ``("move_to_metadata", key[, metadata_key])``
+
+:returns: False if the schema is not registered or already has an upgrade for this version.
+:raises ValueError: for a malformed rule.)docstring");
+    m.def("register_downgrade_rules",
+          [](std::string const& schema_name, int version_to_downgrade_from, py::iterable rules) {
+              return TypeRegistry::instance().register_downgrade_rules(
+                      schema_name, version_to_downgrade_from, schema_rules_from_py(rules));
+          },
+          "schema_name"_a,
+          "version_to_downgrade_from"_a,
+          "rules"_a,
+          R"docstring(Register rules that downgrade a schema from version_to_downgrade_from to the version before it.
+
+See :func:`register_upgrade_rules` for the format of the rules.)docstring");
     m.def(
             "release_to_schema_version_map",
             [](){ return label_to_schema_version_map(CORE_VERSION_MAP);},
@@ -326,6 +726,26 @@ The CORE_VERSION_MAP maps OTIO release versions to maps of schema name to schema
             return flatten_stack(tracks, ErrorStatusHandler());
         }, "tracks"_a);        
 
+    py::class_<StackResolver>(m, "StackResolver")
+        .def("__iter__", [](StackResolver* resolver) {
+                return resolver;
+            }, py::return_value_policy::reference_internal)
+        .def("__next__", [](StackResolver* resolver) {
+                ResolvedSegment segment;
+                if (!resolver->next(segment, ErrorStatusHandler())) {
+                    throw py::stop_iteration();
+                }
+                return py::make_tuple(segment.composable,
+                                      segment.range,
+                                      segment.source_range);
+            });
+    m.def("resolve_stack", [](Stack* s, std::optional<TimeRange> search_range) {
+            return std::make_unique<StackResolver>(s, search_range, ErrorStatusHandler());
+        }, "in_stack"_a, "search_range"_a = std::nullopt);
+    m.def("resolve_stack", [](std::vector<Track*> tracks, std::optional<TimeRange> search_range) {
+            return std::make_unique<StackResolver>(tracks, search_range, ErrorStatusHandler());
+        }, "tracks"_a, "search_range"_a = std::nullopt);
+
     void _build_any_to_py_dispatch_table();
     _build_any_to_py_dispatch_table();
 }
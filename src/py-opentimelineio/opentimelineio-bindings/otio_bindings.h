@@ -10,4 +10,5 @@ void otio_any_dictionary_bindings(pybind11::module);
 void otio_any_vector_bindings(pybind11::module);
 void otio_imath_bindings(pybind11::module);
 void otio_serializable_object_bindings(pybind11::module);
+void otio_edit_algorithm_bindings(pybind11::module);
 void otio_tests_bindings(pybind11::module);
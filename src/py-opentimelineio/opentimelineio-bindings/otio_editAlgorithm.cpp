@@ -0,0 +1,247 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#include "otio_bindings.h"
+#include "otio_errorStatusHandler.h"
+
+#include "opentimelineio/algo/editAlgorithm.h"
+#include "opentimelineio/item.h"
+
+namespace py = pybind11;
+using namespace pybind11::literals;
+
+using namespace opentimelineio::OPENTIMELINEIO_VERSION;
+using namespace opentimelineio::OPENTIMELINEIO_VERSION::algo;
+
+// The editing functions below release the GIL while they run. The error
+// handler raises on destruction, so it is created before the GIL is
+// released and destroyed after it is reacquired.
+
+static void define_edit_functions(py::module m) {
+    m.def("overwrite", [](Item* item, Composition* composition, TimeRange const& range,
+                          bool remove_transitions, Item* fill_template) {
+            auto error_status = ErrorStatusHandler();
+            py::gil_scoped_release release;
+            overwrite(item, composition, range, remove_transitions, fill_template, error_status);
+        }, "item"_a.none(false), "composition"_a.none(false), "range"_a,
+        "remove_transitions"_a = true, "fill_template"_a = nullptr, R"docstring(
+Overwrite the items of a composition within range with item.
+
+Items partially inside the range are trimmed, and a gap (or fill_template) fills any space between the end of the composition and the range.
+)docstring");
+
+    m.def("insert", [](Item* item, Composition* composition, RationalTime const& time,
+                       bool remove_transitions, Item* fill_template) {
+            auto error_status = ErrorStatusHandler();
+            py::gil_scoped_release release;
+            insert(item, composition, time, remove_transitions, fill_template, error_status);
+        }, "item"_a.none(false), "composition"_a.none(false), "time"_a,
+        "remove_transitions"_a = true, "fill_template"_a = nullptr, R"docstring(
+Insert item into a composition at time, splitting the item at that time.
+
+The composition gets longer by the duration of item.
+)docstring");
+
+    m.def("trim", [](Item* item, RationalTime const& delta_in, RationalTime const& delta_out,
+                     Item* fill_template) {
+            auto error_status = ErrorStatusHandler();
+            py::gil_scoped_release release;
+            trim(item, delta_in, delta_out, fill_template, error_status);
+        }, "item"_a.none(false), "delta_in"_a, "delta_out"_a, "fill_template"_a = nullptr, R"docstring(
+Adjust the start time and end time of item without moving the other items.
+
+The space left is filled with a gap (or fill_template), or taken from a neighboring gap.
+)docstring");
+
+    m.def("slice", [](Composition* composition, RationalTime const& time, bool remove_transitions) {
+            auto error_status = ErrorStatusHandler();
+            py::gil_scoped_release release;
+            slice(composition, time, remove_transitions, error_status);
+        }, "composition"_a.none(false), "time"_a, "remove_transitions"_a = true, R"docstring(
+Slice the item of a composition at time in two.
+)docstring");
+
+    m.def("slip", [](Item* item, RationalTime const& delta) {
+            py::gil_scoped_release release;
+            slip(item, delta);
+        }, "item"_a.none(false), "delta"_a, R"docstring(
+Move the source start time of item by delta, without changing its duration.
+
+Clamped to the available range of the media, if any.
+)docstring");
+
+    m.def("slide", [](Item* item, RationalTime const& delta) {
+            py::gil_scoped_release release;
+            slide(item, delta);
+        }, "item"_a.none(false), "delta"_a, R"docstring(
+Move item by delta, adjusting the duration of the item before it.
+
+Does nothing for the first item of a composition.
+)docstring");
+
+    m.def("ripple", [](Item* item, RationalTime const& delta_in, RationalTime const& delta_out) {
+            auto error_status = ErrorStatusHandler();
+            py::gil_scoped_release release;
+            ripple(item, delta_in, delta_out, error_status);
+        }, "item"_a.none(false), "delta_in"_a, "delta_out"_a, R"docstring(
+Adjust the source range of item, moving the items after it.
+)docstring");
+
+    m.def("roll", [](Item* item, RationalTime const& delta_in, RationalTime const& delta_out) {
+            auto error_status = ErrorStatusHandler();
+            py::gil_scoped_release release;
+            roll(item, delta_in, delta_out, error_status);
+        }, "item"_a.none(false), "delta_in"_a, "delta_out"_a, R"docstring(
+Move the edit points of item, adjusting the neighboring items to fit.
+)docstring");
+
+    m.def("fill", [](Item* item, Composition* track, RationalTime const& track_time,
+                     ReferencePoint reference_point) {
+            auto error_status = ErrorStatusHandler();
+            py::gil_scoped_release release;
+            fill(item, track, track_time, reference_point, error_status);
+        }, "item"_a.none(false), "track"_a.none(false), "track_time"_a,
+        "reference_point"_a = ReferencePoint::Source, R"docstring(
+Place item into the gap of track at track_time (3/4 point edit).
+)docstring");
+
+    m.def("remove", [](Composition* composition, RationalTime const& time, bool fill,
+                       Item* fill_template) {
+            auto error_status = ErrorStatusHandler();
+            py::gil_scoped_release release;
+            remove(composition, time, fill, fill_template, error_status);
+        }, "composition"_a.none(false), "time"_a, "fill"_a = true, "fill_template"_a = nullptr, R"docstring(
+Remove the item of a composition at time, replacing it with a gap (or fill_template) if fill is set.
+)docstring");
+}
+
+static void define_edit_class(py::module m) {
+    py::class_<Edit> edit_class(m, "Edit", R"docstring(
+A single edit, to be applied with :func:`apply_edits`.
+
+Create edits with the static methods, which take the same arguments as the functions of the same name, less the composition.
+)docstring");
+
+    py::enum_<Edit::Kind>(edit_class, "Kind")
+        .value("overwrite", Edit::Kind::Overwrite)
+        .value("insert", Edit::Kind::Insert)
+        .value("trim", Edit::Kind::Trim)
+        .value("slice", Edit::Kind::Slice)
+        .value("slip", Edit::Kind::Slip)
+        .value("slide", Edit::Kind::Slide)
+        .value("ripple", Edit::Kind::Ripple)
+        .value("roll", Edit::Kind::Roll)
+        .value("fill", Edit::Kind::Fill)
+        .value("remove", Edit::Kind::Remove);
+
+    edit_class
+        .def_readonly("kind", &Edit::kind)
+        .def_property_readonly("item", [](Edit const& edit) {
+                return edit.item.value;
+            })
+        .def_static("overwrite", [](Item* item, TimeRange const& range, bool remove_transitions,
+                                    Item* fill_template) {
+                Edit edit { Edit::Kind::Overwrite };
+                edit.item = item;
+                edit.range = range;
+                edit.remove_transitions = remove_transitions;
+                edit.fill_template = fill_template;
+                return edit;
+            }, "item"_a.none(false), "range"_a, "remove_transitions"_a = true,
+            "fill_template"_a = nullptr)
+        .def_static("insert", [](Item* item, RationalTime const& time, bool remove_transitions,
+                                 Item* fill_template) {
+                Edit edit { Edit::Kind::Insert };
+                edit.item = item;
+                edit.time = time;
+                edit.remove_transitions = remove_transitions;
+                edit.fill_template = fill_template;
+                return edit;
+            }, "item"_a.none(false), "time"_a, "remove_transitions"_a = true,
+            "fill_template"_a = nullptr)
+        .def_static("trim", [](Item* item, RationalTime const& delta_in,
+                               RationalTime const& delta_out, Item* fill_template) {
+                Edit edit { Edit::Kind::Trim };
+                edit.item = item;
+                edit.delta_in = delta_in;
+                edit.delta_out = delta_out;
+                edit.fill_template = fill_template;
+                return edit;
+            }, "item"_a.none(false), "delta_in"_a, "delta_out"_a, "fill_template"_a = nullptr)
+        .def_static("slice", [](RationalTime const& time, bool remove_transitions) {
+                Edit edit { Edit::Kind::Slice };
+                edit.time = time;
+                edit.remove_transitions = remove_transitions;
+                return edit;
+            }, "time"_a, "remove_transitions"_a = true)
+        .def_static("slip", [](Item* item, RationalTime const& delta) {
+                Edit edit { Edit::Kind::Slip };
+                edit.item = item;
+                edit.delta_in = delta;
+                return edit;
+            }, "item"_a.none(false), "delta"_a)
+        .def_static("slide", [](Item* item, RationalTime const& delta) {
+                Edit edit { Edit::Kind::Slide };
+                edit.item = item;
+                edit.delta_in = delta;
+                return edit;
+            }, "item"_a.none(false), "delta"_a)
+        .def_static("ripple", [](Item* item, RationalTime const& delta_in,
+                                 RationalTime const& delta_out) {
+                Edit edit { Edit::Kind::Ripple };
+                edit.item = item;
+                edit.delta_in = delta_in;
+                edit.delta_out = delta_out;
+                return edit;
+            }, "item"_a.none(false), "delta_in"_a, "delta_out"_a)
+        .def_static("roll", [](Item* item, RationalTime const& delta_in,
+                               RationalTime const& delta_out) {
+                Edit edit { Edit::Kind::Roll };
+                edit.item = item;
+                edit.delta_in = delta_in;
+                edit.delta_out = delta_out;
+                return edit;
+            }, "item"_a.none(false), "delta_in"_a, "delta_out"_a)
+        .def_static("fill", [](Item* item, RationalTime const& track_time,
+                               ReferencePoint reference_point) {
+                Edit edit { Edit::Kind::Fill };
+                edit.item = item;
+                edit.time = track_time;
+                edit.reference_point = reference_point;
+                return edit;
+            }, "item"_a.none(false), "track_time"_a,
+            "reference_point"_a = ReferencePoint::Source)
+        .def_static("remove", [](RationalTime const& time, bool fill, Item* fill_template) {
+                Edit edit { Edit::Kind::Remove };
+                edit.time = time;
+                edit.fill = fill;
+                edit.fill_template = fill_template;
+                return edit;
+            }, "time"_a, "fill"_a = true, "fill_template"_a = nullptr);
+
+    m.def("apply_edits", [](Composition* composition, std::vector<Edit> const& edits) {
+            auto error_status = ErrorStatusHandler();
+            py::gil_scoped_release release;
+            apply_edits(composition, edits, error_status);
+        }, "composition"_a.none(false), "edits"_a, R"docstring(
+Apply a list of :class:`Edit` to a composition, in order, in a single call.
+
+On a track, runs of slice, insert, overwrite and remove edits are applied in a single sweep, which is much faster when they are sorted by time. The result is the same as applying the edits one at a time.
+
+Stops at the first edit that fails, leaving the edits before it applied.
+)docstring");
+}
+
+void otio_edit_algorithm_bindings(py::module m) {
+    py::module algo = m.def_submodule("algo", "Editing algorithms");
+
+    py::enum_<ReferencePoint>(algo, "ReferencePoint", "How :func:`fill` fits an item into a gap.")
+        .value("Source", ReferencePoint::Source)
+        .value("Sequence", ReferencePoint::Sequence)
+        .value("Fit", ReferencePoint::Fit);
+
+    define_edit_functions(algo);
+    define_edit_class(algo);
+}
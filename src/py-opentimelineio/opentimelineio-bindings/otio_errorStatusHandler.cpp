@@ -49,6 +49,10 @@ ErrorStatusHandler::~ErrorStatusHandler() noexcept(false) {
         throw py::value_error("Illegal/malformed schema: " + details());
     case ErrorStatus::JSON_PARSE_ERROR:
         throw py::value_error("JSON parse error while reading: " + details());
+    case ErrorStatus::BINARY_PARSE_ERROR:
+        throw py::value_error("Binary parse error while reading: " + details());
+    case ErrorStatus::DEFERRED_SOURCE_CHANGED:
+        throw py::value_error("Cannot load deferred fields, the file has changed since it was read: " + details());
     case ErrorStatus::FILE_OPEN_FAILED:
         PyErr_SetFromErrnoWithFilename(PyExc_OSError, details().c_str());
         throw py::error_already_set();
@@ -161,9 +161,25 @@ static void define_bases1(py::module m) {
         .def_property_readonly("_dynamic_fields", [](SerializableObject* s) {
                 auto ptr = s->dynamic_fields().get_or_create_mutation_stamp();
                 return (AnyDictionaryProxy*)(ptr); }, py::return_value_policy::take_ownership)
-        .def("is_equivalent_to", &SerializableObject::is_equivalent_to, "other"_a.none(false))
+        .def("is_equivalent_to", &SerializableObject::is_equivalent_to, "other"_a.none(false), "float_precision"_a = 0, R"docstring(
+Return whether this object is equivalent to other.
+
+If float_precision is not 0, the non-integral numbers of time, color and geometry values only have to be equal to that many significant digits, so that an object is equivalent to what is read back after it is written with that float_precision. Times must still be in the same frames.
+)docstring")
+        .def("content_hash", [](SerializableObject* so) {
+                return so->content_hash(ErrorStatusHandler()); }, R"docstring(
+Return a 64 bit hash of the content of this object: its schema, fields, metadata and children.
+
+Objects that serialize to the same JSON have the same hash. The hash is cached, and recomputed only for the objects that changed and the objects that hold them.
+)docstring")
         .def("clone", [](SerializableObject* so) {
                 return so->clone(ErrorStatusHandler()); })
+        .def("clone_without_children", [](SerializableObject* so) {
+                return so->clone_without_children(ErrorStatusHandler()); }, R"docstring(
+Return a clone of this object, like :meth:`clone`, except that the compositions in the clone have no children.
+
+Use it to copy only the parts of a timeline that are kept, by appending clones of those children to the empty compositions.
+)docstring")
         .def("to_json_string", [](SerializableObject* so, int indent) {
                 return so->to_json_string(ErrorStatusHandler(), {}, indent); },
             "indent"_a = 4)
@@ -194,6 +210,7 @@ static void define_bases1(py::module m) {
             py::arg_v("name"_a = std::string()),
             py::arg_v("metadata"_a = py::none()))
         .def_property_readonly("metadata", [](SOWithMetadata* s) {
+                s->load_deferred_fields(ErrorStatusHandler());
                 auto ptr = s->metadata().get_or_create_mutation_stamp();
             return (AnyDictionaryProxy*)(ptr); }, py::return_value_policy::take_ownership)
         .def_property("name", [](SOWithMetadata* so) {
@@ -370,9 +387,11 @@ An object that can be composed within a :class:`~Composition` (such as :class:`~
             return item->trimmed_range(ErrorStatusHandler());
         })
         .def_property_readonly("markers", [](Item* item) {
+            item->load_deferred_fields(ErrorStatusHandler());
             return ((MarkerVectorProxy*) &item->markers());
             })
         .def_property_readonly("effects", [](Item* item) {
+            item->load_deferred_fields(ErrorStatusHandler());
             return ((EffectVectorProxy*) &item->effects());
             })
         .def("duration", [](Item* item) {
@@ -558,6 +577,18 @@ Should be subclassed (for example by :class:`.Track` and :class:`.Stack`), not u
         .def("find_clips", [](Composition* c, std::optional<TimeRange> const& search_range, bool shallow_search) {
                 return find_clips(c, search_range, shallow_search);
             }, "search_range"_a = std::nullopt, "shallow_search"_a = false)
+        .def("time_index_stats", [](Composition* c) {
+                auto stats = c->time_index_stats();
+                py::dict d;
+                d["queries"] = stats.queries;
+                d["rebuilds"] = stats.rebuilds;
+                d["size"] = stats.size;
+                return d;
+            }, R"docstring(
+Return statistics about the time index used by :meth:`child_at_time`, :meth:`children_in_range` and :meth:`find_children` with a ``search_range``.
+
+The index is kept between queries and rebuilt after anything that affects timing changes.  The returned dictionary holds the number of ``queries`` that used the index, the number of times it was built (``rebuilds``) and the number of children it holds (``size``).
+)docstring")
         .def("handles_of_child", [](Composition* c, Composable* child) {
                 auto result = c->handles_of_child(child, ErrorStatusHandler());
                 return py::make_tuple(py::cast(result.first), py::cast(result.second));
@@ -7,6 +7,7 @@
 #include <pybind11/stl.h>
 #include <string>
 #include "opentimelineio/stringUtils.h"
+#include "opentimelineio/contentStamp.h"
 #include "opentimelineio/serializableObject.h"
 #include "opentimelineio/vectorIndexing.h"
 #include "opentimelineio/safely_typed_any.h"
@@ -73,6 +74,8 @@ struct MutableSequencePyAPI : public V {
             throw pybind11::index_error();
         }
         v[index] = value;
+        // the item holding the vector does not see edits made through it
+        bump_content_stamp();
     }
     
     void insert(int index, VALUE_TYPE value) {
@@ -85,6 +88,7 @@ struct MutableSequencePyAPI : public V {
         else {
             v.insert(v.begin() + std::max(index, 0), std::move(value));
         }
+        bump_content_stamp();
     }
 
     void del_item(int index) {
@@ -101,6 +105,7 @@ struct MutableSequencePyAPI : public V {
         else {
             v.erase(v.begin() + std::max(index, 0));
         }
+        bump_content_stamp();
     }
 
     int len() {
@@ -150,6 +155,7 @@ struct PyAny {
 pybind11::object any_to_py(std::any const& a, bool top_level = false);
 pybind11::object plain_string(std::string const& s);
 pybind11::object plain_int(int i);
+void py_to_any(pybind11::object const& o, std::any* result);
 AnyDictionary py_to_any_dictionary(pybind11::object const& o);
 
 bool compare_typeids(std::type_info const& lhs, std::type_info const& rhs);
@@ -9,35 +9,96 @@ from .. import (
     exceptions
 )
 
+import mmap
 import os
 
 _DEFAULT_VERSION_ENVVAR = "OTIO_DEFAULT_TARGET_VERSION_FAMILY_LABEL"
 
 
-def read_from_file(filepath):
+def read_from_file(
+    filepath,
+    use_mmap=False,
+    load="full",
+    lazy_metadata=False,
+    num_threads=1
+):
     """
     De-serializes an OpenTimelineIO object from a file
 
     Args:
         filepath (str): The path to an otio file to read from
+        use_mmap (bool): Map the file into memory and parse it in place,
+            rather than reading it in chunks
+        load (str): "full" to read everything, or "skeleton" to read only
+            the structure and timing of the timeline.  A skeleton skips the
+            metadata, markers and effects of timelines, stacks, tracks,
+            clips, gaps, transitions and media references, which each object
+            loads from the file when one of them is first accessed.  They
+            are all loaded before the skeleton is written to a file, which
+            can be the one it was read from, and cannot be loaded once that
+            file has changed.
+        lazy_metadata (bool): Keep the metadata of each object as json text
+            until it is first accessed.  Metadata that is never accessed is
+            written back out as it was read.
+        num_threads (int): Parse the file on this many threads, or on one
+            per core if 0.  The clips and other items of large tracks,
+            stacks and collections are parsed in runs, each on its own.
+            The file is mapped into memory to be parsed on several threads,
+            whatever use_mmap is.
 
     Returns:
         OpenTimeline: An OpenTimeline object
+
+    Raises:
+        ValueError: if load is not "full" or "skeleton", or if use_mmap,
+            lazy_metadata or num_threads are given with load="skeleton",
+            which reads the file on one thread without them
     """
-    return core.deserialize_json_from_file(filepath)
+    if load == "skeleton":
+        if use_mmap or lazy_metadata or num_threads != 1:
+            raise ValueError(
+                "use_mmap, lazy_metadata and num_threads cannot be used with "
+                "load='skeleton'"
+            )
+        return core.deserialize_json_skeleton_from_file(filepath)
+    if load != "full":
+        raise ValueError(
+            "load must be 'full' or 'skeleton', not {!r}".format(load)
+        )
+
+    if not use_mmap or num_threads != 1:
+        return core.deserialize_json_from_file(
+            filepath,
+            lazy_metadata,
+            num_threads
+        )
+
+    with open(filepath, "rb") as f:
+        # an empty file cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return core.deserialize_json_from_string(b"", lazy_metadata)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return core.deserialize_json_from_string(mapped, lazy_metadata)
 
 
-def read_from_string(input_str):
+def read_from_string(input_str, lazy_metadata=False):
     """
     De-serializes an OpenTimelineIO object from a json string
 
     Args:
-        input_str (str): A string containing json serialized otio contents
+        input_str (str): A string containing json serialized otio contents,
+            or utf-8 json in bytes, a bytearray, a memoryview or any other
+            object that supports the buffer protocol, which is parsed in
+            place
+        lazy_metadata (bool): Keep the metadata of each object as json text
+            until it is first accessed.  Metadata that is never accessed is
+            written back out as it was read.
 
     Returns:
         OpenTimeline: An OpenTimeline object
     """
-    return core.deserialize_json_from_string(input_str)
+    return core.deserialize_json_from_string(input_str, lazy_metadata)
 
 
 def _fetch_downgrade_map_from_env():
@@ -72,7 +133,15 @@ def _fetch_downgrade_map_from_env():
         )
 
 
-def write_to_string(input_otio, target_schema_versions=None, indent=4):
+def write_to_string(
+        input_otio,
+        target_schema_versions=None,
+        indent=4,
+        omit_defaults=False,
+        float_precision=0,
+        integral_as_int=False,
+        compact_times=False
+):
     """
     Serializes an OpenTimelineIO object into a string
 
@@ -80,6 +149,17 @@ def write_to_string(input_otio, target_schema_versions=None, indent=4):
         input_otio (OpenTimeline): An OpenTimeline object
         indent (int): number of spaces for each json indentation level. Use\
             -1 for no indentation or newlines.
+        omit_defaults (bool): leave out fields that are equal to the value\
+            they are read as when they are missing, such as empty metadata.
+        float_precision (int): if not 0, round the non-integral numbers of\
+            time, color and geometry values to that many significant digits.\
+            The digits of a time value are counted after its whole frames, so\
+            that its frame does not change.
+        integral_as_int (bool): write the integral numbers of time, color and\
+            geometry values without a fractional part.
+        compact_times (bool): write the RationalTime and TimeRange fields of\
+            schemas as arrays of their numbers, which only this and later\
+            releases read. Ignored when downgrading to target_schema_versions.
 
     If target_schema_versions is None and the environment variable
     "OTIO_DEFAULT_TARGET_VERSION_FAMILY_LABEL" is set, will read a map out of
@@ -104,7 +184,11 @@ def write_to_string(input_otio, target_schema_versions=None, indent=4):
     return core.serialize_json_to_string(
         input_otio,
         target_schema_versions,
-        indent
+        indent,
+        omit_defaults=omit_defaults,
+        float_precision=float_precision,
+        integral_as_int=integral_as_int,
+        compact_times=compact_times
     )
 
 
@@ -112,7 +196,11 @@ def write_to_file(
         input_otio,
         filepath,
         target_schema_versions=None,
-        indent=4
+        indent=4,
+        omit_defaults=False,
+        float_precision=0,
+        integral_as_int=False,
+        compact_times=False
 ):
     """
     Serializes an OpenTimelineIO object into a file
@@ -123,6 +211,17 @@ def write_to_file(
         filepath (str): The name of an otio file to write to
         indent (int): number of spaces for each json indentation level.\
             Use -1 for no indentation or newlines.
+        omit_defaults (bool): leave out fields that are equal to the value\
+            they are read as when they are missing, such as empty metadata.
+        float_precision (int): if not 0, round the non-integral numbers of\
+            time, color and geometry values to that many significant digits.\
+            The digits of a time value are counted after its whole frames, so\
+            that its frame does not change.
+        integral_as_int (bool): write the integral numbers of time, color and\
+            geometry values without a fractional part.
+        compact_times (bool): write the RationalTime and TimeRange fields of\
+            schemas as arrays of their numbers, which only this and later\
+            releases read. Ignored when downgrading to target_schema_versions.
 
     If target_schema_versions is None and the environment variable
     "OTIO_DEFAULT_TARGET_VERSION_FAMILY_LABEL" is set, will read a map out of
@@ -149,5 +248,74 @@ def write_to_file(
         input_otio,
         filepath,
         target_schema_versions,
-        indent
+        indent,
+        omit_defaults=omit_defaults,
+        float_precision=float_precision,
+        integral_as_int=integral_as_int,
+        compact_times=compact_times
+    )
+
+
+def write_to_stream(
+        input_otio,
+        stream,
+        target_schema_versions=None,
+        indent=4,
+        omit_defaults=False,
+        float_precision=0,
+        integral_as_int=False,
+        compact_times=False
+):
+    """
+    Serializes an OpenTimelineIO object into a writable file object
+
+    The json is written in fixed size chunks as it is encoded, so the whole
+    string is never held in memory.
+
+    Args:
+
+        input_otio (OpenTimeline): An OpenTimeline object
+        stream: A file object to write to, for example ``sys.stdout``, an
+            open file or a zip file member. Text streams are written ``str``,
+            other streams utf-8 ``bytes``.
+        indent (int): number of spaces for each json indentation level.\
+            Use -1 for no indentation or newlines.
+        omit_defaults (bool): leave out fields that are equal to the value\
+            they are read as when they are missing, such as empty metadata.
+        float_precision (int): if not 0, round the non-integral numbers of\
+            time, color and geometry values to that many significant digits.\
+            The digits of a time value are counted after its whole frames, so\
+            that its frame does not change.
+        integral_as_int (bool): write the integral numbers of time, color and\
+            geometry values without a fractional part.
+        compact_times (bool): write the RationalTime and TimeRange fields of\
+            schemas as arrays of their numbers, which only this and later\
+            releases read. Ignored when downgrading to target_schema_versions.
+
+    If target_schema_versions is None and the environment variable
+    "OTIO_DEFAULT_TARGET_VERSION_FAMILY_LABEL" is set, will read a map out of
+    that for downgrade target.  The variable should be of the form
+    FAMILY:LABEL, for example "MYSTUDIO:JUNE2022".
+
+    Raises:
+        otio.exceptions.InvalidEnvironmentVariableError: if there is a problem
+        with the default environment variable
+        "OTIO_DEFAULT_TARGET_VERSION_FAMILY_LABEL".
+    """
+
+    if (
+        target_schema_versions is None
+        and _DEFAULT_VERSION_ENVVAR in os.environ
+    ):
+        target_schema_versions = _fetch_downgrade_map_from_env()
+
+    core.serialize_json_to_stream(
+        input_otio,
+        stream,
+        target_schema_versions,
+        indent,
+        omit_defaults=omit_defaults,
+        float_precision=float_precision,
+        integral_as_int=integral_as_int,
+        compact_times=compact_times
     )
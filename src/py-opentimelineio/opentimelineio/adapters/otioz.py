@@ -17,6 +17,7 @@ read on unix and windows platforms.
 """
 
 import os
+import time
 import zipfile
 
 from .. import (
@@ -120,9 +121,6 @@ def write_to_file(
             # author the final_path in url form into the target_url
             mr.target_url = url_utils.url_from_filepath(final_path)
 
-    # write the otioz file to the temp directory
-    otio_str = otio_json.write_to_string(result_otio)
-
     with zipfile.ZipFile(filepath, mode='w') as target:
         # write the version file (compressed)
         target.writestr(
@@ -142,13 +140,18 @@ def write_to_file(
             compress_type=zipfile.ZIP_DEFLATED
         )
 
-        # write the OTIO (compressed)
-        target.writestr(
+        # write the OTIO (compressed), streaming it into the zip file rather
+        # than building the whole json string first
+        playlist_info = zipfile.ZipInfo(
             utils.BUNDLE_PLAYLIST_PATH,
-            otio_str,
-            # XXX: See comment above about ZIP_DEFLATED vs other algorithms
-            compress_type=zipfile.ZIP_DEFLATED
+            date_time=time.localtime(time.time())[:6]
         )
+        # XXX: See comment above about ZIP_DEFLATED vs other algorithms
+        playlist_info.compress_type = zipfile.ZIP_DEFLATED
+        playlist_info.external_attr = 0o600 << 16
+        # the size is not known up front, and may need zip64
+        with target.open(playlist_info, "w", force_zip64=True) as playlist:
+            otio_json.write_to_stream(result_otio, playlist)
 
         # write the media (uncompressed)
         for src, dst in abspath_to_output_path_map.items():
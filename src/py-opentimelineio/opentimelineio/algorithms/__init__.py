@@ -11,13 +11,18 @@ from .track_algo import (
 
 from .stack_algo import (
     flatten_stack,
+    resolve_stack,
+    ResolvedSegment,
     top_clip_at_time,
 )
 
 from .filter import (
     filtered_composition,
-    filtered_with_sequence_context
+    filtered_with_sequence_context,
+    Pipeline
 )
 from .timeline_algo import (
     timeline_trimmed_to_range
 )
+
+from . import edit
@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Editing algorithms: overwrite, insert, trim, slice, slip, slide, ripple,
+roll, fill and remove.
+
+These modify the composition (usually a track) they are given in place. They
+run in C++ and release the GIL while they do. The slice edit is exported as
+:func:`slice_at`, so that it does not shadow the ``slice`` builtin.
+
+To apply many edits at once, build a list of :class:`Edit` and pass it to
+:func:`apply_edits`::
+
+    edits = [Edit.slice(time) for time in cut_times]
+    apply_edits(track, edits)
+"""
+
+from .. import _otio
+
+ReferencePoint = _otio.algo.ReferencePoint
+Edit = _otio.algo.Edit
+
+overwrite = _otio.algo.overwrite
+insert = _otio.algo.insert
+trim = _otio.algo.trim
+slice_at = _otio.algo.slice
+slip = _otio.algo.slip
+slide = _otio.algo.slide
+ripple = _otio.algo.ripple
+roll = _otio.algo.roll
+fill = _otio.algo.fill
+remove = _otio.algo.remove
+
+apply_edits = _otio.algo.apply_edits
+
+__all__ = [
+    'ReferencePoint',
+    'Edit',
+    'overwrite',
+    'insert',
+    'trim',
+    'slice_at',
+    'slip',
+    'slide',
+    'ripple',
+    'roll',
+    'fill',
+    'remove',
+    'apply_edits',
+]
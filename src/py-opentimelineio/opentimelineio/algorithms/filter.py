@@ -6,22 +6,195 @@
 import copy
 
 from .. import (
+    core,
+    exceptions,
+    opentime,
     schema
 )
 
 
-def _is_in(thing, container):
-    return any(thing is item for item in container)
+def _apply_filter(filter_fn, types_to_prune, prev_item, child, next_item):
+    # first try to prune
+    if types_to_prune and isinstance(child, types_to_prune):
+        return None
+    # finally call the user function
+    return filter_fn(prev_item, child, next_item)
 
 
-def _isinstance_in(child, typelist):
-    return any(isinstance(child, t) for t in typelist)
+def _placeholder_for(child):
+    # a gap that takes up as much time as the child, so that the ranges of
+    # its neighbors do not change while it is detached
+    placeholder = schema.Gap()
+    if not isinstance(child, core.Item):
+        return placeholder
+
+    try:
+        duration = child.duration()
+    except exceptions.OTIOError:
+        return placeholder
+
+    placeholder.source_range = opentime.TimeRange(
+        opentime.RationalTime(0, duration.rate),
+        duration
+    )
+    return placeholder
+
+
+def _filter_children(
+    composition,
+    filter_fn,
+    types_to_prune,
+    sequence_context
+):
+    # Detach each child just before the filter function is called with it,
+    # by putting a placeholder in its place, so that the function can wrap it
+    # or reparent it while its neighbors keep their parent and ranges.  The
+    # results are collected and swapped in all at once rather than deleting
+    # and re-inserting every child at its index, so that the whole
+    # composition is filtered in linear time.
+    children = list(composition)
+    results = []
+
+    with_neighbors = sequence_context and isinstance(composition, schema.Track)
+    last_index = len(children) - 1
+
+    for index, child in enumerate(children):
+        prev_item = next_item = None
+        if with_neighbors:
+            if index > 0:
+                prev_item = children[index - 1]
+            if index < last_index:
+                next_item = children[index + 1]
+
+        composition[index] = _placeholder_for(child)
+
+        result = _apply_filter(
+            filter_fn,
+            types_to_prune,
+            prev_item,
+            child,
+            next_item
+        )
+
+        # if an item is pruned, do not traverse its children
+        if result is None:
+            continue
+
+        if type(result) is not tuple:
+            results.append(result)
+        else:
+            results.extend(result)
+
+        # a child that is kept as it is goes back in its place, where the
+        # following children see it as their previous neighbor
+        if result is child and child.parent() is None:
+            composition[index] = child
+
+        _filter_descendants(child, filter_fn, types_to_prune, sequence_context)
+
+    del composition[:]
+    composition.extend(results)
+
+
+def _filter_descendants(thing, filter_fn, types_to_prune, sequence_context):
+    if isinstance(thing, core.Composition):
+        _filter_children(thing, filter_fn, types_to_prune, sequence_context)
+
+    elif isinstance(thing, schema.Timeline):
+        _filter_descendants(
+            thing.tracks,
+            filter_fn,
+            types_to_prune,
+            sequence_context
+        )
+
+    elif isinstance(thing, schema.SerializableCollection):
+        # the children of a collection are not replaced, only traversed
+        for child in thing:
+            if (
+                    isinstance(child, core.Composable)
+                    and _apply_filter(
+                        filter_fn,
+                        types_to_prune,
+                        None,
+                        child,
+                        None
+                    ) is None
+            ):
+                continue
+
+            _filter_descendants(
+                child,
+                filter_fn,
+                types_to_prune,
+                sequence_context
+            )
+
+
+def _filtered(root, filter_fn, types_to_prune, in_place, sequence_context):
+    if in_place:
+        mutable_object = root
+    else:
+        # deep copy everything
+        mutable_object = copy.deepcopy(root)
+
+    if types_to_prune:
+        types_to_prune = tuple(types_to_prune)
+
+    # only an object filtered in place can have a parent
+    parent = _safe_parent(mutable_object)
+    if parent is not None:
+        child_index = parent.index(mutable_object)
+        del parent[child_index]
+
+    result = _apply_filter(
+        filter_fn,
+        types_to_prune,
+        None,
+        mutable_object,
+        None
+    )
+
+    if result is None:
+        return None
+
+    if parent is not None:
+        parent[child_index:child_index] = (
+            result if type(result) is tuple else [result]
+        )
+
+    if isinstance(mutable_object, schema.Timeline):
+        # the tracks of a timeline are filtered, but cannot be replaced
+        tracks_result = _apply_filter(
+            filter_fn,
+            types_to_prune,
+            None,
+            mutable_object.tracks,
+            None
+        )
+        if tracks_result is not None:
+            _filter_children(
+                mutable_object.tracks,
+                filter_fn,
+                types_to_prune,
+                sequence_context
+            )
+    else:
+        _filter_descendants(
+            mutable_object,
+            filter_fn,
+            types_to_prune,
+            sequence_context
+        )
+
+    return result
 
 
 def filtered_composition(
     root,
     unary_filter_fn,
     types_to_prune=None,
+    in_place=False,
 ):
     """
     Filter a deep copy of root (and children) with ``unary_filter_fn``.
@@ -32,7 +205,7 @@ def filtered_composition(
         :noindex:
 
 
-    1. Make a deep copy of root
+    1. Make a deep copy of root (unless ``in_place`` is True)
     2. Starting with root, perform a depth first traversal
     3. For each item (including root):
 
@@ -44,7 +217,7 @@ def filtered_composition(
           II.  Returns a tuple: insert it into the list, replacing original
           III. Returns None: prune it
     4. If an item is pruned, do not traverse its children
-    5. Return the new deep copy.
+    5. Return the new deep copy (or the filtered root, if ``in_place``).
 
     Example 1 (filter)::
 
@@ -90,53 +263,16 @@ def filtered_composition(
     :param SerializableObjectWithMetadata root: Object to filter on
     :param unary_filter_fn: Filter function
     :param tuple(type) types_to_prune: Types to prune. Example: (otio.schema.Gap,...)
+    :param bool in_place: Filter root itself instead of a deep copy of it
     """
 
-    # deep copy everything
-    mutable_object = copy.deepcopy(root)
-
-    prune_list = set()
-
-    header_list = [mutable_object]
-
-    if isinstance(mutable_object, schema.Timeline):
-        header_list.append(mutable_object.tracks)
-
-    iter_list = header_list + list(mutable_object.find_children())
-
-    for child in iter_list:
-        if _safe_parent(child) is not None and _is_in(child.parent(), prune_list):
-            prune_list.add(child)
-            continue
-
-        parent = None
-        child_index = None
-        if _safe_parent(child) is not None:
-            child_index = child.parent().index(child)
-            parent = child.parent()
-            del child.parent()[child_index]
-
-        # first try to prune
-        if (types_to_prune and _isinstance_in(child, types_to_prune)):
-            result = None
-        # finally call the user function
-        else:
-            result = unary_filter_fn(child)
-
-        if child is mutable_object:
-            mutable_object = result
-
-        if result is None:
-            prune_list.add(child)
-            continue
-
-        if type(result) is not tuple:
-            result = [result]
-
-        if parent is not None:
-            parent[child_index:child_index] = result
-
-    return mutable_object
+    return _filtered(
+        root,
+        lambda _, thing, __: unary_filter_fn(thing),
+        types_to_prune,
+        in_place,
+        sequence_context=False
+    )
 
 
 def _safe_parent(child):
@@ -149,6 +285,7 @@ def filtered_with_sequence_context(
     root,
     reduce_fn,
     types_to_prune=None,
+    in_place=False,
 ):
     """Filter a deep copy of root (and children) with ``reduce_fn``.
 
@@ -159,7 +296,7 @@ def filtered_with_sequence_context(
     .. py:function:: func(previous_item: typing.Any, current: typing.Any, next_item: typing.Any) -> list[typing.Any]  # noqa
         :noindex:
 
-    1. Make a deep copy of root
+    1. Make a deep copy of root (unless ``in_place`` is True)
     2. Starting with root, perform a depth first traversal
     3. For each item (including root):
 
@@ -175,7 +312,7 @@ def filtered_with_sequence_context(
                     deep copy, not what prior calls return. See below for examples
 
     4. If an item is pruned, do not traverse its children
-    5. Return the new deep copy.
+    5. Return the new deep copy (or the filtered root, if ``in_place``).
 
     Example 1 (filter)::
 
@@ -224,62 +361,151 @@ def filtered_with_sequence_context(
     :param SerializableObjectWithMetadata root: Object to filter on
     :param reduce_fn: Filter function
     :param tuple(type) types_to_prune: Types to prune. Example: (otio.schema.Gap,...)
+    :param bool in_place: Filter root itself instead of a deep copy of it
     """
 
-    # deep copy everything
-    mutable_object = copy.deepcopy(root)
-
-    prune_list = set()
-
-    header_list = [mutable_object]
-
-    if isinstance(mutable_object, schema.Timeline):
-        header_list.append(mutable_object.tracks)
-
-    iter_list = header_list + list(mutable_object.find_children())
-
-    # expand to include prev, next when appropriate
-    expanded_iter_list = []
-    for child in iter_list:
-        if _safe_parent(child) and isinstance(child.parent(), schema.Track):
-            prev_item, next_item = child.parent().neighbors_of(child)
-            expanded_iter_list.append((prev_item, child, next_item))
-        else:
-            expanded_iter_list.append((None, child, None))
-
-    def _safe_name(x):
-        return x.name if x else "<NONE>"
-
-    for prev_item, child, next_item in expanded_iter_list:
-        if _safe_parent(child) is not None and _is_in(child.parent(), prune_list):
-            prune_list.add(child)
-            continue
-
-        parent = None
-        child_index = None
-        if _safe_parent(child) is not None:
-            child_index = child.parent().index(child)
-            parent = child.parent()
-            del child.parent()[child_index]
-
-        # first try to prune
-        if types_to_prune and _isinstance_in(child, types_to_prune):
-            result = None
-        # finally call the user function
-        else:
-            result = reduce_fn(prev_item, child, next_item)
-
-        if child is mutable_object:
-            mutable_object = result
-
-        if result is None:
-            prune_list.add(child)
-            continue
+    return _filtered(
+        root,
+        reduce_fn,
+        types_to_prune,
+        in_place,
+        sequence_context=True
+    )
+
+
+class Pipeline:
+    """A chain of filters that is run in a single traversal.
+
+    Each stage is given every item in turn (depth first, as with
+    :func:`filtered_composition`), along with the result of the stages
+    before it. If a stage prunes an item, the stages after it are skipped
+    and its children are not traversed. Items that are added by a stage
+    are passed to the stages after it, but their children are not
+    traversed.
+
+    Example::
+
+        pipeline = (
+            Pipeline()
+            .prune([otio.schema.Transition])
+            .keep_tracks(lambda track: track.kind == "Video")
+            .map_clips(rename_clip)
+            .strip_metadata(["secret"])
+        )
+        filtered_timeline = pipeline.run(timeline)
+    """
 
-        if type(result) is not tuple:
-            result = [result]
+    def __init__(self):
+        self._stages = []
+
+    def __len__(self):
+        return len(self._stages)
+
+    def map(self, fn, types=None):
+        """Add a stage that filters items with ``fn``.
+
+        ``fn`` has the same signature as the ``unary_filter_fn`` of
+        :func:`filtered_composition`.
+
+        :param fn: Filter function
+        :param tuple(type) types: If given, only items of these types are
+            passed to ``fn``, other items are left as they are
+        :returns: This pipeline
+        """
+        self._stages.append((fn, tuple(types) if types else None))
+        return self
+
+    def prune(self, types):
+        """Add a stage that prunes the items of the given types.
+
+        :param tuple(type) types: Types to prune
+        :returns: This pipeline
+        """
+        return self.map(lambda _: None, types)
+
+    def keep_tracks(self, predicate):
+        """Add a stage that keeps only the tracks ``predicate`` returns True
+        for.
+
+        :param predicate: Function called with each track
+        :returns: This pipeline
+        """
+        def _keep(track):
+            return track if predicate(track) else None
+
+        return self.map(_keep, (schema.Track,))
+
+    def map_clips(self, fn):
+        """Add a stage that filters clips with ``fn``.
+
+        :param fn: Filter function, see :meth:`map`
+        :returns: This pipeline
+        """
+        return self.map(fn, (schema.Clip,))
+
+    def strip_metadata(self, keys):
+        """Add a stage that removes keys from the metadata of each item, and
+        from its markers, effects and media reference.
+
+        :param list(str) keys: Metadata keys to remove
+        :returns: This pipeline
+        """
+        keys = list(keys)
+
+        def _strip(thing):
+            for key in keys:
+                if key in thing.metadata:
+                    del thing.metadata[key]
+
+        def _strip_all(item):
+            _strip(item)
+            for marker in getattr(item, 'markers', ()):
+                _strip(marker)
+            for effect in getattr(item, 'effects', ()):
+                _strip(effect)
+            media_reference = getattr(item, 'media_reference', None)
+            if media_reference:
+                _strip(media_reference)
+            return item
+
+        return self.map(_strip_all)
+
+    def run(self, root, in_place=False):
+        """Run all the stages over root (and children).
+
+        :param SerializableObjectWithMetadata root: Object to filter on
+        :param bool in_place: Filter root itself instead of a deep copy of it
+        :returns: The filtered copy (or the filtered root, if ``in_place``)
+        """
+        return _filtered(
+            root,
+            self._filter,
+            None,
+            in_place,
+            sequence_context=False
+        )
+
+    def _filter(self, _, item, __):
+        items = [item]
+        for fn, types in self._stages:
+            results = []
+            for thing in items:
+                if types and not isinstance(thing, types):
+                    results.append(thing)
+                    continue
+
+                result = fn(thing)
+                if result is None:
+                    continue
+                if type(result) is tuple:
+                    results.extend(result)
+                else:
+                    results.append(result)
 
-        if parent is not None:
-            parent[child_index:child_index] = result
+            if not results:
+                return None
+            items = results
 
-    return mutable_object
+        if len(items) == 1:
+            return items[0]
+        return tuple(items)
@@ -3,6 +3,8 @@
 
 __doc__ = """ Algorithms for stack objects. """
 
+import collections
+
 from .. import (
     schema,
     opentime,
@@ -64,3 +66,42 @@ def top_clip_at_time(in_stack, t):
 
 
 flatten_stack = _otio.flatten_stack
+
+
+ResolvedSegment = collections.namedtuple(
+    "ResolvedSegment",
+    ["item", "range_in_stack", "source_range"]
+)
+ResolvedSegment.__doc__ = """A visible segment of a stack.
+
+``item`` is the original item (or transition) that is visible, or ``None``
+for the end of a track that is shorter than the others. ``range_in_stack``
+is the range of the segment in the stack, and ``source_range`` the source
+range of the item for that segment (``None`` for transitions).
+"""
+
+
+def resolve_stack(in_stack, search_range=None):
+    """Yield the visible segments of a stack, in time order.
+
+    The segments are the ones :func:`flatten_stack` would produce, but
+    instead of building a new track of cloned items, each segment refers to
+    the original item along with its ranges. The stack must not be modified
+    while iterating.
+
+    Example::
+
+        for segment in resolve_stack(timeline.tracks):
+            print(segment.item.name, segment.range_in_stack)
+
+    :param in_stack: Stack, or list of tracks
+    :param TimeRange search_range: If given, only the segments that
+        intersect this range are returned, trimmed to it
+    :returns: Generator of :class:`ResolvedSegment`
+    """
+
+    for item, range_in_stack, source_range in _otio.resolve_stack(
+        in_stack,
+        search_range
+    ):
+        yield ResolvedSegment(item, range_in_stack, source_range)
@@ -3,8 +3,6 @@
 
 """Algorithms for timeline objects."""
 
-import copy
-
 from . import (
     track_algo
 )
@@ -27,19 +25,22 @@ def timeline_trimmed_to_range(in_timeline, trim_range):
     :returnd: New trimmed timeline
     :rtype: Timeline
     """
-    new_timeline = copy.deepcopy(in_timeline)
+    # the tracks are copied by track_trimmed_to_range, and only once
+    new_timeline = in_timeline.clone_without_children()
 
-    for track_num, child_track in enumerate(in_timeline.tracks):
+    for child_track in in_timeline.tracks:
         # @TODO: put the trim_range into the space of the tracks
         # new_range = new_timeline.tracks.transformed_time_range(
         #     trim_range,
         #     child_track
         # )
 
-        # trim the track and assign it to the new stack.
-        new_timeline.tracks[track_num] = track_algo.track_trimmed_to_range(
-            child_track,
-            trim_range
+        # trim the track and add it to the new stack.
+        new_timeline.tracks.append(
+            track_algo.track_trimmed_to_range(
+                child_track,
+                trim_range
+            )
         )
 
     return new_timeline
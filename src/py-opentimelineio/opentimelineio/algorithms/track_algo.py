@@ -29,19 +29,19 @@ def track_trimmed_to_range(in_track, trim_range):
     :returns: New trimmed track
     :rtype: Track
     """
-    new_track = copy.deepcopy(in_track)
+    # only the children that are kept are copied
+    new_track = in_track.clone_without_children()
 
-    track_map = new_track.range_of_all_children()
+    track_map = in_track.range_of_all_children()
 
-    # iterate backwards so we can delete items
-    for c, child in reversed(list(enumerate(new_track))):
+    for child in in_track:
         child_range = track_map[child]
         if not trim_range.intersects(child_range):
             # completely outside the trim range, so we discard it
-            del new_track[c]
+            continue
         elif trim_range.contains(child_range):
             # completely contained, keep the whole thing
-            pass
+            new_track.append(child.clone())
         else:
             if isinstance(child, schema.Transition):
                 raise exceptions.CannotTrimTransitionsError(
@@ -72,7 +72,9 @@ def track_trimmed_to_range(in_track, trim_range):
                 )
 
             # set the new child's trims
-            child.source_range = child_source_range
+            new_child = child.clone()
+            new_child.source_range = child_source_range
+            new_track.append(new_child)
 
     return new_track
 
@@ -70,31 +70,26 @@ def _parsed_args():
     return parser.parse_args()
 
 
-def _otio_compatible_file_to_json_string(
+def _read_otio_compatible_file(
         fpath,
         media_linker_name,
         hooks_args,
         media_linker_argument_map,
         adapter_argument_map
 ):
-    """Read the file at fpath with the default otio adapter and return the json
-    as a string.
-    """
-
-    adapter = otio.adapters.from_name("otio_json")
-    return adapter.write_to_string(
-        otio.adapters.read_from_file(
-            fpath,
-            hook_function_argument_map=hooks_args,
-            media_linker_name=media_linker_name,
-            media_linker_argument_map=media_linker_argument_map,
-            **adapter_argument_map
-        )
+    """Read the file at fpath with the adapter for its suffix."""
+
+    return otio.adapters.read_from_file(
+        fpath,
+        hook_function_argument_map=hooks_args,
+        media_linker_name=media_linker_name,
+        media_linker_argument_map=media_linker_argument_map,
+        **adapter_argument_map
     )
 
 
 def main():
-    """Parse arguments and call _otio_compatible_file_to_json_string."""
+    """Parse arguments and print each file as otio json."""
 
     args = _parsed_args()
 
@@ -119,16 +114,22 @@ def main():
         sys.stderr.write("\n" + str(exc) + "\n")
         sys.exit(1)
 
+    # stream the json, rather than building the whole string first, straight
+    # to the binary stdout when there is one, so it is not decoded
+    stdout = getattr(sys.stdout, "buffer", sys.stdout)
     for fpath in args.filepath:
-        print(
-            _otio_compatible_file_to_json_string(
+        sys.stdout.flush()
+        otio.adapters.otio_json.write_to_stream(
+            _read_otio_compatible_file(
                 fpath,
                 media_linker_name,
                 hooks_args,
                 media_linker_argument_map,
                 read_adapter_arg_map
-            )
+            ),
+            stdout
         )
+        sys.stdout.write("\n")
 
 
 if __name__ == '__main__':
@@ -62,23 +62,41 @@ def main():
         for timeline in timelines:
             keep_only_audio_tracks(timeline)
 
+    # The filters, along with the removal and redaction of Phase 6 when none
+    # of the phases in between are used, run in a single pass over each
+    # timeline.
+    filters = otio.algorithms.Pipeline()
+
     if args.remove_transitions:
-        timelines = filter_transitions(timelines)
+        filters.prune([otio.schema.Transition])
 
     if args.only_tracks_with_name or args.only_tracks_with_index:
-        timelines = filter_tracks(
-            args.only_tracks_with_name,
-            args.only_tracks_with_index,
-            timelines
+        filters.keep_tracks(
+            _track_filter(
+                args.only_tracks_with_name,
+                args.only_tracks_with_index
+            )
         )
 
     if args.only_clips_with_name or args.only_clips_with_name_regex:
-        timelines = filter_clips(
-            args.only_clips_with_name,
-            args.only_clips_with_name_regex,
-            timelines
+        filters.map_clips(
+            _clip_filter(
+                args.only_clips_with_name,
+                args.only_clips_with_name_regex
+            )
         )
 
+    if (
+        args.trim
+        or args.stack
+        or args.concat
+        or args.flatten
+        or args.relink_by_name
+        or args.copy_media_to_folder
+    ):
+        timelines = run_filters(filters, timelines)
+        filters = otio.algorithms.Pipeline()
+
     if args.trim:
         for timeline in timelines:
             trim_timeline(args.trim[0], args.trim[1], timeline)
@@ -115,13 +133,12 @@ def main():
     # Phase 6: Remove/Redaction
 
     if args.remove_metadata_key:
-        for timeline in timelines:
-            for key in args.remove_metadata_key:
-                remove_metadata_key(timeline, key)
+        filters.strip_metadata(args.remove_metadata_key)
 
     if args.redact:
-        for timeline in timelines:
-            redact_timeline(timeline)
+        filters.map(_redact)
+
+    timelines = run_filters(filters, timelines)
 
     # Phase 7: Inspection
 
@@ -491,14 +508,18 @@ def keep_only_audio_tracks(timeline):
     timeline.tracks[:] = timeline.audio_tracks()
 
 
+def run_filters(pipeline, timelines):
+    """Run a filter pipeline over each of the timelines, in place."""
+    if not pipeline:
+        return timelines
+    return [pipeline.run(t, in_place=True) for t in timelines]
+
+
 def filter_transitions(timelines):
     """Return a copy of the input timelines with all transitions removed.
     The overall duration of the timelines should not be affected."""
-    def _f(item):
-        if isinstance(item, otio.schema.Transition):
-            return None
-        return item
-    return [otio.algorithms.filtered_composition(t, _f) for t in timelines]
+    pipeline = otio.algorithms.Pipeline().prune([otio.schema.Transition])
+    return [pipeline.run(t) for t in timelines]
 
 
 def _filter(item, names, patterns):
@@ -519,38 +540,49 @@ def _filter(item, names, patterns):
     # return gap
 
 
+def _track_filter(only_tracks_with_name, only_tracks_with_index):
+    """Return a predicate for tracks that match either the list of names
+    given, or the list of track indexes given. Tracks are counted in the
+    order the predicate is called."""
+    index = 0
+
+    def _f(track):
+        nonlocal index
+        index = index + 1
+        if only_tracks_with_index and index not in only_tracks_with_index:
+            return False
+        if only_tracks_with_name and track.name not in only_tracks_with_name:
+            return False
+        return True
+
+    return _f
+
+
+def _clip_filter(only_clips_with_name, only_clips_with_name_regex):
+    """Return a filter function for clips with names that match either the
+    given list of names, or regular expression patterns."""
+    def _f(clip):
+        return _filter(clip, only_clips_with_name, only_clips_with_name_regex)
+
+    return _f
+
+
 def filter_tracks(only_tracks_with_name, only_tracks_with_index, timelines):
     """Return a copy of the input timelines with only tracks that match
     either the list of names given, or the list of track indexes given."""
-
-    # Use a variable saved within this function so that the closure
-    # below can modify it.
-    # See: https://stackoverflow.com/questions/21959985/why-cant-python-increment-variable-in-closure   # noqa: E501
-    filter_tracks.index = 0
-
-    def _f(item):
-        if not isinstance(item, otio.schema.Track):
-            return item
-        filter_tracks.index = filter_tracks.index + 1
-        if only_tracks_with_index and filter_tracks.index not in only_tracks_with_index:
-            return None
-        if only_tracks_with_name and item.name not in only_tracks_with_name:
-            return None
-        return item
-
-    return [otio.algorithms.filtered_composition(t, _f) for t in timelines]
+    pipeline = otio.algorithms.Pipeline().keep_tracks(
+        _track_filter(only_tracks_with_name, only_tracks_with_index)
+    )
+    return [pipeline.run(t) for t in timelines]
 
 
 def filter_clips(only_clips_with_name, only_clips_with_name_regex, timelines):
     """Return a copy of the input timelines with only clips with names
     that match either the given list of names, or regular expression patterns."""
-
-    def _f(item):
-        if not isinstance(item, otio.schema.Clip):
-            return item
-        return _filter(item, only_clips_with_name, only_clips_with_name_regex)
-
-    return [otio.algorithms.filtered_composition(t, _f) for t in timelines]
+    pipeline = otio.algorithms.Pipeline().map_clips(
+        _clip_filter(only_clips_with_name, only_clips_with_name_regex)
+    )
+    return [pipeline.run(t) for t in timelines]
 
 
 def stack_timelines(timelines):
@@ -651,23 +683,10 @@ def trim_timeline(start, end, timeline):
 
 
 def remove_metadata_key(timeline, key):
-    def rem(d):
-        if key in d:
-            del d[key]
-
-    rem(timeline.metadata)
-    for child in [timeline.tracks] + list(timeline.find_children()):
-        rem(child.metadata)
-        if hasattr(child, 'markers'):
-            for marker in child.markers:
-                rem(marker.metadata)
-        if hasattr(child, 'effects'):
-            for effect in child.effects:
-                rem(effect.metadata)
-        if hasattr(child, 'media_reference'):
-            media_reference = child.media_reference
-            if media_reference:
-                rem(media_reference.metadata)
+    otio.algorithms.Pipeline().strip_metadata([key]).run(
+        timeline,
+        in_place=True
+    )
 
 
 # Used only within _counter() to keep track of object indexes
@@ -682,37 +701,38 @@ def _counter(name):
     return counter
 
 
-def redact_timeline(timeline):
+def _redact(item):
     """Remove all metadata, names, or other identifying information from this
-    timeline. Only the structure, schema and timing will remain."""
+    item, its markers, effects and media reference."""
+    counter = _counter(item.schema_name())
+    item.name = f"{item.schema_name()} #{counter}"
+    item.metadata.clear()
+    if hasattr(item, 'markers'):
+        for marker in item.markers:
+            counter = _counter(marker.schema_name())
+            marker.name = f"{marker.schema_name()} #{counter}"
+            marker.metadata.clear()
+    if hasattr(item, 'effects'):
+        for effect in item.effects:
+            counter = _counter(effect.schema_name())
+            effect.name = f"{effect.schema_name()} #{counter}"
+            effect.metadata.clear()
+    if hasattr(item, 'media_reference'):
+        media_reference = item.media_reference
+        if media_reference:
+            counter = _counter(media_reference.schema_name())
+            has_target_url = hasattr(media_reference, 'target_url')
+            if has_target_url and media_reference.target_url:
+                media_reference.target_url = f"URL #{counter}"
+            media_reference.name = f"{media_reference.schema_name()} #{counter}"
+            media_reference.metadata.clear()
+    return item
 
-    counter = _counter(timeline.schema_name())
-    timeline.name = f"{timeline.schema_name()} #{counter}"
-    timeline.metadata.clear()
 
-    for child in [timeline.tracks] + list(timeline.find_children()):
-        counter = _counter(child.schema_name())
-        child.name = f"{child.schema_name()} #{counter}"
-        child.metadata.clear()
-        if hasattr(child, 'markers'):
-            for marker in child.markers:
-                counter = _counter(marker.schema_name())
-                marker.name = f"{marker.schema_name()} #{counter}"
-                marker.metadata.clear()
-        if hasattr(child, 'effects'):
-            for effect in child.effects:
-                counter = _counter(effect.schema_name())
-                effect.name = f"{effect.schema_name()} #{counter}"
-                effect.metadata.clear()
-        if hasattr(child, 'media_reference'):
-            media_reference = child.media_reference
-            if media_reference:
-                counter = _counter(media_reference.schema_name())
-                has_target_url = hasattr(media_reference, 'target_url')
-                if has_target_url and media_reference.target_url:
-                    media_reference.target_url = f"URL #{counter}"
-                media_reference.name = f"{media_reference.schema_name()} #{counter}"
-                media_reference.metadata.clear()
+def redact_timeline(timeline):
+    """Remove all metadata, names, or other identifying information from this
+    timeline. Only the structure, schema and timing will remain."""
+    otio.algorithms.Pipeline().map(_redact).run(timeline, in_place=True)
 
 
 def copy_media(url, destination_path):
@@ -928,8 +948,14 @@ def write_output(output_path, output):
     """Write the given OTIO object to a file path. If the file path given is
     the string '-' then the output is written to stdout instead."""
     if output_path == '-':
-        result = otio.adapters.write_to_string(output)
-        print(result)
+        # stream it, rather than building the whole string first, straight
+        # to the binary stdout when there is one, so it is not decoded
+        sys.stdout.flush()
+        otio.adapters.otio_json.write_to_stream(
+            output,
+            getattr(sys.stdout, "buffer", sys.stdout)
+        )
+        sys.stdout.write("\n")
     else:
         otio.adapters.write_to_file(output, output_path)
 
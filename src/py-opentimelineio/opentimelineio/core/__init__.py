@@ -3,6 +3,9 @@
 
 """Core implementation details and wrappers around the C++ library"""
 
+import codecs
+import io
+
 from .. _otio import ( # noqa
     # errors
     CannotComputeAvailableRangeError,
@@ -18,17 +21,25 @@ from .. _otio import ( # noqa
     Track,
 
     # functions
+    deserialize_binary_from_file,
+    deserialize_binary_from_string,
     deserialize_json_from_file,
     deserialize_json_from_string,
+    deserialize_json_skeleton_from_file,
     flatten_stack,
     install_external_keepalive_monitor,
     instance_from_schema,
     register_serializable_object_type,
     register_upgrade_function,
     register_downgrade_function,
+    register_upgrade_rules,
+    register_downgrade_rules,
     set_type_record,
     _serialize_json_to_string,
     _serialize_json_to_file,
+    _serialize_json_to_writer,
+    _serialize_binary_to_string,
+    _serialize_binary_to_file,
     type_version_map,
     release_to_schema_version_map,
 )
@@ -56,8 +67,11 @@ __all__ = [
     'SerializableObject',
     'SerializableObjectWithMetadata',
     'Track',
+    'deserialize_binary_from_file',
+    'deserialize_binary_from_string',
     'deserialize_json_from_file',
     'deserialize_json_from_string',
+    'deserialize_json_skeleton_from_file',
     'flatten_stack',
     'install_external_keepalive_monitor',
     'instance_from_schema',
@@ -69,13 +83,24 @@ __all__ = [
     'deprecated_field',
     'serialize_json_to_string',
     'serialize_json_to_file',
+    'serialize_json_to_stream',
+    'serialize_binary_to_string',
+    'serialize_binary_to_file',
     'register_type',
     'type_version_map',
     'release_to_schema_version_map',
 ]
 
 
-def serialize_json_to_string(root, schema_version_targets=None, indent=4):
+def serialize_json_to_string(
+        root,
+        schema_version_targets=None,
+        indent=4,
+        omit_defaults=False,
+        float_precision=0,
+        integral_as_int=False,
+        compact_times=False
+):
     """Serialize root to a json string.  Optionally downgrade resulting schemas
     to schema_version_targets.
 
@@ -88,6 +113,22 @@ def serialize_json_to_string(root, schema_version_targets=None, indent=4):
                                                   OpenTimelineIO.
     :param int indent: number of spaces for each json indentation level. Use -1
                        for no indentation or newlines.
+    :param bool omit_defaults: if true, leave out fields that are equal to
+                               the value they are read as when they are
+                               missing, such as empty metadata.
+    :param int float_precision: if not 0, round the non-integral numbers of
+                                time, color and geometry values to that many
+                                significant digits. Use
+                                ``is_equivalent_to(other, float_precision)``
+                                to check what is read back.
+    :param bool integral_as_int: if true, write the integral numbers of time,
+                                 color and geometry values without a
+                                 fractional part.
+    :param bool compact_times: if true, write the RationalTime and TimeRange
+                               fields of schemas as arrays of their numbers,
+                               which only this and later releases read. The
+                               verbose form is written anyway when
+                               schema_version_targets are given.
 
     :returns: resulting json string
     :rtype: str
@@ -95,7 +136,11 @@ def serialize_json_to_string(root, schema_version_targets=None, indent=4):
     return _serialize_json_to_string(
         _value_to_any(root),
         schema_version_targets or {},
-        indent
+        indent,
+        omit_defaults,
+        float_precision,
+        integral_as_int,
+        compact_times
     )
 
 
@@ -103,7 +148,11 @@ def serialize_json_to_file(
         root,
         filename,
         schema_version_targets=None,
-        indent=4
+        indent=4,
+        omit_defaults=False,
+        float_precision=0,
+        integral_as_int=False,
+        compact_times=False
 ):
     """Serialize root to a json file.  Optionally downgrade resulting schemas
     to schema_version_targets.
@@ -117,6 +166,22 @@ def serialize_json_to_file(
                                                   OpenTimelineIO.
     :param int indent: number of spaces for each json indentation level. Use -1
                        for no indentation or newlines.
+    :param bool omit_defaults: if true, leave out fields that are equal to
+                               the value they are read as when they are
+                               missing, such as empty metadata.
+    :param int float_precision: if not 0, round the non-integral numbers of
+                                time, color and geometry values to that many
+                                significant digits. Use
+                                ``is_equivalent_to(other, float_precision)``
+                                to check what is read back.
+    :param bool integral_as_int: if true, write the integral numbers of time,
+                                 color and geometry values without a
+                                 fractional part.
+    :param bool compact_times: if true, write the RationalTime and TimeRange
+                               fields of schemas as arrays of their numbers,
+                               which only this and later releases read. The
+                               verbose form is written anyway when
+                               schema_version_targets are given.
 
     :returns: true for success, false for failure
     :rtype: bool
@@ -125,8 +190,138 @@ def serialize_json_to_file(
         _value_to_any(root),
         filename,
         schema_version_targets or {},
-        indent
+        indent,
+        omit_defaults,
+        float_precision,
+        integral_as_int,
+        compact_times
+    )
+
+
+def serialize_json_to_stream(
+        root,
+        stream,
+        schema_version_targets=None,
+        indent=4,
+        buffer_size=65536,
+        omit_defaults=False,
+        float_precision=0,
+        integral_as_int=False,
+        compact_times=False
+):
+    """Serialize root as json to a writable file object.  Optionally
+    downgrade resulting schemas to schema_version_targets.
+
+    The json is written as it is encoded, in chunks of at most buffer_size
+    bytes, so that the whole document is never held in memory.  stream can
+    be anything with a ``write`` method, such as a file, ``sys.stdout``, a
+    socket file or a zip file member.  Text streams, including wrappers that
+    have an ``encoding`` attribute or refuse ``bytes``, are written ``str``
+    chunks, other streams ``bytes`` chunks of utf-8.  For ``sys.stdout``,
+    writing to ``sys.stdout.buffer`` avoids the decoding.
+
+    :param SerializableObject root: root object to serialize
+    :param stream: object to write to
+    :param dict[str, int] schema_version_targets: optional dictionary mapping
+                                                  schema name to desired schema
+                                                  version, for downgrading the
+                                                  result to be compatible with
+                                                  older versions of
+                                                  OpenTimelineIO.
+    :param int indent: number of spaces for each json indentation level. Use -1
+                       for no indentation or newlines.
+    :param int buffer_size: size in bytes of the chunks written to stream
+    :param bool omit_defaults: if true, leave out fields that are equal to
+                               the value they are read as when they are
+                               missing, such as empty metadata.
+    :param int float_precision: if not 0, round the non-integral numbers of
+                                time, color and geometry values to that many
+                                significant digits. Use
+                                ``is_equivalent_to(other, float_precision)``
+                                to check what is read back.
+    :param bool integral_as_int: if true, write the integral numbers of time,
+                                 color and geometry values without a
+                                 fractional part.
+    :param bool compact_times: if true, write the RationalTime and TimeRange
+                               fields of schemas as arrays of their numbers,
+                               which only this and later releases read. The
+                               verbose form is written anyway when
+                               schema_version_targets are given.
+    """
+    write, finish = _stream_writer(stream)
+
+    _serialize_json_to_writer(
+        _value_to_any(root),
+        write,
+        schema_version_targets or {},
+        indent,
+        buffer_size,
+        omit_defaults,
+        float_precision,
+        integral_as_int,
+        compact_times
     )
+    finish()
+
+
+def _stream_writer(stream):
+    """Return a function writing utf-8 chunks to stream, and one to call once
+    all of them have been written.
+
+    The chunks go to binary streams as they are, and to text streams, told
+    apart by their type or an ``encoding`` attribute, decoded.  Any other
+    stream is tried with bytes first, and written text if it refuses them.
+    """
+    # a chunk can end in the middle of a multi-byte character
+    decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def write_text(chunk):
+        text = decoder.decode(chunk)
+        if text:
+            stream.write(text)
+
+    def finish():
+        text = decoder.decode(b"", final=True)
+        if text:
+            stream.write(text)
+
+    def write_bytes(chunk):
+        # a raw stream can write only part of a chunk, and return how much,
+        # while other streams may not return anything
+        written = stream.write(chunk)
+        if not isinstance(written, int) or written >= len(chunk):
+            return
+
+        view = memoryview(chunk)
+        while written < len(view):
+            view = view[written:]
+            written = stream.write(view)
+            if written is None:
+                raise BlockingIOError(
+                    "stream cannot take the rest of the json without blocking"
+                )
+
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        return write_bytes, finish
+
+    if isinstance(stream, io.TextIOBase) or hasattr(stream, "encoding"):
+        return write_text, finish
+
+    write = None
+
+    def write_unknown(chunk):
+        nonlocal write
+        if write is None:
+            try:
+                write_bytes(chunk)
+            except TypeError:
+                write = write_text
+            else:
+                write = write_bytes
+                return
+        write(chunk)
+
+    return write_unknown, finish
 
 
 def register_type(classobj, schemaname=None):
@@ -184,6 +379,10 @@ def upgrade_function_for(cls, version_to_upgrade_to):
     that add or remove fields, only for schema versions that change the field
     names.
 
+    Upgrades that only rename, drop or add fields are faster as rules, which
+    are applied without calling into Python for each object; see
+    :func:`register_upgrade_rules`.
+
     :param typing.Type[SerializableObject] cls: class to upgrade
     :param int version_to_upgrade_to: the version to upgrade to
     """
@@ -313,3 +512,46 @@ def deprecated_field():
         raise DeprecationWarning
 
     return property(getter, setter, doc="Deprecated field, do not use.")
+
+
+def serialize_binary_to_string(root, schema_version_targets=None):
+    """Serialize root to the binary (.otiob) format.  Optionally downgrade
+    resulting schemas to schema_version_targets.
+
+    :param SerializableObject root: root object to serialize
+    :param dict[str, int] schema_version_targets: optional dictionary mapping
+                                                  schema name to desired schema
+                                                  version, for downgrading the
+                                                  result to be compatible with
+                                                  older versions of
+                                                  OpenTimelineIO.
+
+    :returns: resulting binary data
+    :rtype: bytes
+    """
+    return _serialize_binary_to_string(
+        _value_to_any(root),
+        schema_version_targets or {}
+    )
+
+
+def serialize_binary_to_file(root, filename, schema_version_targets=None):
+    """Serialize root to a binary (.otiob) file.  Optionally downgrade
+    resulting schemas to schema_version_targets.
+
+    :param SerializableObject root: root object to serialize
+    :param dict[str, int] schema_version_targets: optional dictionary mapping
+                                                  schema name to desired schema
+                                                  version, for downgrading the
+                                                  result to be compatible with
+                                                  older versions of
+                                                  OpenTimelineIO.
+
+    :returns: true for success, false for failure
+    :rtype: bool
+    """
+    return _serialize_binary_to_file(
+        _value_to_any(root),
+        filename,
+        schema_version_targets or {}
+    )
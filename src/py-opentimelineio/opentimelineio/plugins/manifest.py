@@ -100,6 +100,9 @@ class Manifest(core.SerializableObject):
 
         self.version_manifests = {}
 
+        self.upgrade_rules = {}
+        self.downgrade_rules = {}
+
     adapters = core.serializable_field(
         "adapters",
         type([]),
@@ -130,6 +133,16 @@ class Manifest(core.SerializableObject):
         type({}),
         "Sets of versions to downgrade schemas to."
     )
+    upgrade_rules = core.serializable_field(
+        "upgrade_rules",
+        type({}),
+        "Rules that upgrade schemas, by schema name and version."
+    )
+    downgrade_rules = core.serializable_field(
+        "downgrade_rules",
+        type({}),
+        "Rules that downgrade schemas, by schema name and version."
+    )
 
     def extend(self, another_manifest):
         """
@@ -154,6 +167,15 @@ class Manifest(core.SerializableObject):
                 self.version_manifests[family] = {}
             self.version_manifests[family].update(label_map)
 
+        for rules, other_rules in (
+            (self.upgrade_rules, another_manifest.upgrade_rules),
+            (self.downgrade_rules, another_manifest.downgrade_rules),
+        ):
+            for schema_name, version_map in other_rules.items():
+                if schema_name not in rules:
+                    rules[schema_name] = {}
+                rules[schema_name].update(version_map)
+
         for trigger_name, hooks in another_manifest.hooks.items():
             # because self.hooks is an AnyDictionary instead of a vanilla
             # python dictionary, it does not support the .set_default() method.
@@ -174,6 +196,21 @@ class Manifest(core.SerializableObject):
         ):
             thing._json_path = path
 
+    def _register_schema_rules(self):
+        """Register the upgrade and downgrade rules with the type registry.
+
+        Rules for a schema and version that already has an upgrade or
+        downgrade are ignored.
+        """
+
+        for register, rules in (
+            (core.register_upgrade_rules, self.upgrade_rules),
+            (core.register_downgrade_rules, self.downgrade_rules),
+        ):
+            for schema_name, version_map in rules.items():
+                for version, schema_rules in version_map.items():
+                    register(schema_name, int(version), schema_rules)
+
     def from_filepath(self, suffix):
         """Return the adapter object associated with a given file suffix."""
 
@@ -321,6 +358,9 @@ def load_manifest():
     for s in result.schemadefs:
         s.module()
 
+    # the schemas the rules apply to are registered now
+    result._register_schema_rules()
+
     return result
 
 
@@ -3,6 +3,9 @@
 
 """Test builtin adapters."""
 
+import io
+import json
+import mmap
 import os
 import unittest
 
@@ -21,6 +24,24 @@ SAMPLE_DATA_DIR = os.path.join(os.path.dirname(__file__), "sample_data")
 SCREENING_EXAMPLE_PATH = os.path.join(SAMPLE_DATA_DIR, "screening_example.otio")
 
 
+class _WriteOnlyStream:
+    """A stream that only has a write method, accepting one type of data."""
+
+    def __init__(self, data_type):
+        self.data_type = data_type
+        self.chunks = []
+
+    def write(self, data):
+        if not isinstance(data, self.data_type):
+            raise TypeError(
+                "expected {}, got {}".format(
+                    self.data_type.__name__,
+                    type(data).__name__
+                )
+            )
+        self.chunks.append(data)
+
+
 class BuiltInAdapterTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
 
     def test_disk_io(self):
@@ -74,6 +95,568 @@ class BuiltInAdapterTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
 
             self.assertEqual(in_memory, on_disk)
 
+    def test_stream_vs_string(self):
+        """ Writing to a stream, text or binary and in chunks of any size,
+        should produce the same result as writing to a string
+        """
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        # multi-byte characters, to be split between chunks
+        timeline.name = "\u00e9t\u00e9 \U0001f3ac"
+        in_memory = otio_json.write_to_string(timeline)
+
+        for buffer_size in (1, 7, 4096, 1 << 20):
+            with self.subTest(buffer_size=buffer_size):
+                binary = io.BytesIO()
+                otio.core.serialize_json_to_stream(
+                    timeline,
+                    binary,
+                    buffer_size=buffer_size
+                )
+                self.assertEqual(binary.getvalue().decode("utf-8"), in_memory)
+
+                text = io.StringIO()
+                otio.core.serialize_json_to_stream(
+                    timeline,
+                    text,
+                    buffer_size=buffer_size
+                )
+                self.assertEqual(text.getvalue(), in_memory)
+
+                # wrappers that only have a write method
+                text_wrapper = _WriteOnlyStream(str)
+                otio.core.serialize_json_to_stream(
+                    timeline,
+                    text_wrapper,
+                    buffer_size=buffer_size
+                )
+                self.assertEqual("".join(text_wrapper.chunks), in_memory)
+
+                binary_wrapper = _WriteOnlyStream(bytes)
+                otio.core.serialize_json_to_stream(
+                    timeline,
+                    binary_wrapper,
+                    buffer_size=buffer_size
+                )
+                self.assertEqual(
+                    b"".join(binary_wrapper.chunks).decode("utf-8"),
+                    in_memory
+                )
+
+        text = io.StringIO()
+        otio_json.write_to_stream(timeline, text, indent=-1)
+        self.assertEqual(
+            text.getvalue(),
+            otio_json.write_to_string(timeline, indent=-1)
+        )
+
+    def test_stream_write_error(self):
+        class BrokenStream(io.RawIOBase):
+            def writable(self):
+                return True
+
+            def write(self, data):
+                raise OSError("broken stream")
+
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        with self.assertRaisesRegex(OSError, "broken stream"):
+            otio_json.write_to_stream(timeline, BrokenStream())
+
+    def test_stream_short_writes(self):
+        class SlowStream(io.RawIOBase):
+            def __init__(self):
+                self.data = bytearray()
+
+            def writable(self):
+                return True
+
+            def write(self, data):
+                self.data += data[:10]
+                return min(len(data), 10)
+
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        stream = SlowStream()
+        otio_json.write_to_stream(timeline, stream)
+        self.assertEqual(
+            stream.data.decode("utf-8"),
+            otio_json.write_to_string(timeline)
+        )
+
+    def test_write_omit_defaults(self):
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        track = timeline.tracks[0]
+        track[0].enabled = False
+        track[0].markers.append(otio.schema.Marker(name="m", color="GREEN"))
+        # a gap is created with an empty source range, not None
+        gap = otio.schema.Gap()
+        gap.source_range = None
+        track.append(gap)
+        track.append(otio.schema.Gap())
+
+        full = otio_json.write_to_string(timeline)
+        text = otio_json.write_to_string(timeline, omit_defaults=True)
+        self.assertLess(len(text), len(full))
+        self.assertNotIn('"metadata": {}', text)
+        clip = json.loads(text)["tracks"]["children"][0]["children"][0]
+        self.assertFalse(clip["enabled"])
+        self.assertNotIn("color", clip["markers"][-1])
+
+        decoded = otio_json.read_from_string(text)
+        self.assertJsonEqual(timeline, decoded)
+        self.assertIsNone(decoded.tracks[0][-2].source_range)
+        self.assertMultiLineEqual(otio_json.write_to_string(decoded), full)
+
+        lazy = otio_json.read_from_string(full, lazy_metadata=True)
+        self.assertMultiLineEqual(
+            otio_json.write_to_string(lazy, omit_defaults=True),
+            text
+        )
+
+        stream = io.StringIO()
+        otio_json.write_to_stream(timeline, stream, omit_defaults=True)
+        self.assertMultiLineEqual(stream.getvalue(), text)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test_omit_defaults.otio")
+            otio_json.write_to_file(timeline, temp_file, omit_defaults=True)
+            with open(temp_file) as f:
+                self.assertMultiLineEqual(f.read(), text)
+
+    def test_write_float_precision(self):
+        rate = 24000 / 1001
+        clip = otio.schema.Clip(
+            source_range=otio.opentime.TimeRange(
+                otio.opentime.RationalTime(86400, rate),
+                otio.opentime.RationalTime(12.5, rate)
+            ),
+            metadata={"scale": 2.0, "ratio": rate}
+        )
+        clip.color = otio.core.Color(0.5, 0.25, 1.0, 1.0, "c")
+
+        text = otio_json.write_to_string(
+            clip,
+            indent=-1,
+            float_precision=9,
+            integral_as_int=True
+        )
+        self.assertIn('"rate":23.976024,"value":86400}', text)
+        self.assertIn('"rate":23.976024,"value":12.5}', text)
+        self.assertIn('"r":0.5,"g":0.25,"b":1,"a":1', text)
+
+        decoded = otio_json.read_from_string(text)
+        self.assertFalse(decoded.is_equivalent_to(clip))
+        self.assertTrue(decoded.is_equivalent_to(clip, float_precision=9))
+        self.assertFalse(decoded.is_equivalent_to(clip, float_precision=12))
+        self.assertEqual(
+            decoded.source_range.start_time.to_frames(),
+            clip.source_range.start_time.to_frames()
+        )
+        self.assertEqual(decoded.color.to_hex(), clip.color.to_hex())
+
+        # metadata is not rounded, and its floats stay floats
+        self.assertEqual(decoded.metadata["ratio"], rate)
+        self.assertIsInstance(decoded.metadata["scale"], float)
+
+        # integral numbers are read back as the doubles they were
+        text = otio_json.write_to_string(clip, integral_as_int=True)
+        self.assertIn('"value": 86400\n', text)
+        self.assertJsonEqual(clip, otio_json.read_from_string(text))
+
+    def test_write_float_precision_keeps_frames(self):
+        clip = otio.schema.Clip(
+            source_range=otio.opentime.TimeRange(
+                otio.opentime.RationalTime(172800000.5, 48000),
+                otio.opentime.RationalTime(1234567.25, 48000)
+            )
+        )
+
+        for compact_times in (False, True):
+            for float_precision in (3, 6, 9):
+                text = otio_json.write_to_string(
+                    clip,
+                    float_precision=float_precision,
+                    compact_times=compact_times
+                )
+                decoded = otio_json.read_from_string(text)
+                self.assertEqual(decoded.source_range, clip.source_range)
+                self.assertEqual(
+                    decoded.source_range.start_time.to_frames(),
+                    172800000
+                )
+                self.assertTrue(
+                    decoded.is_equivalent_to(
+                        clip,
+                        float_precision=float_precision
+                    )
+                )
+
+        # the digits are counted after the whole frames
+        text = otio_json.write_to_string(
+            otio.opentime.RationalTime(1234567.123456789, 48000),
+            indent=-1,
+            float_precision=3
+        )
+        self.assertIn('"value":1234567.123}', text)
+
+        # equivalent times must be in the same frames
+        moved = clip.clone()
+        moved.source_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(172800001, 48000),
+            otio.opentime.RationalTime(1234570, 48000)
+        )
+        self.assertFalse(moved.is_equivalent_to(clip, float_precision=6))
+        self.assertFalse(clip.is_equivalent_to(moved, float_precision=6))
+
+    def test_write_compact_times(self):
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        timeline.global_start_time = otio.opentime.RationalTime(86400, 24)
+        clip = timeline.find_clips()[0]
+        clip.metadata["time"] = otio.opentime.RationalTime(3, 24)
+
+        text = otio_json.write_to_string(timeline, compact_times=True)
+        self.assertIn('"global_start_time": [86400.0,24.0]', text)
+        self.assertIn('"source_range": [86501.0,24.0,31.0,24.0]', text)
+        # metadata has no schema to give the type of its values
+        self.assertEqual(text.count('"RationalTime.1"'), 1)
+
+        decoded = otio_json.read_from_string(text)
+        self.assertJsonEqual(timeline, decoded)
+        self.assertEqual(
+            decoded.find_clips()[0].metadata["time"],
+            otio.opentime.RationalTime(3, 24)
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test_compact_times.otio")
+            otio_json.write_to_file(timeline, temp_file, compact_times=True)
+            self.assertJsonEqual(
+                timeline,
+                otio_json.read_from_file(temp_file, num_threads=4)
+            )
+
+        # older releases only read the verbose form
+        self.assertMultiLineEqual(
+            otio_json.write_to_string(
+                timeline,
+                target_schema_versions={"Clip": 1},
+                compact_times=True
+            ),
+            otio_json.write_to_string(
+                timeline,
+                target_schema_versions={"Clip": 1}
+            )
+        )
+
+        with self.assertRaisesRegex(ValueError, "expected 4 numbers"):
+            otio_json.read_from_string(
+                '{"OTIO_SCHEMA": "Gap.1", "source_range": [0, 24, 1]}'
+            )
+
+    def test_read_from_buffers(self):
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        timeline.name = "\u00e9t\u00e9 \U0001f3ac"
+        text = otio_json.write_to_string(timeline)
+        data = text.encode("utf-8")
+
+        for buffer in (
+            text,
+            data,
+            bytearray(data),
+            memoryview(data),
+            # a slice of a larger buffer, not null terminated
+            memoryview(b" " + data + b"garbage")[1:len(data) + 1],
+        ):
+            with self.subTest(type=type(buffer).__name__):
+                decoded = otio_json.read_from_string(buffer)
+                self.assertJsonEqual(timeline, decoded)
+                self.assertEqual(decoded.name, timeline.name)
+
+        with self.assertRaises(ValueError):
+            otio_json.read_from_string(data[:-10])
+
+        with self.assertRaises(BufferError):
+            otio_json.read_from_string(memoryview(data)[::2])
+
+    def test_read_mmap(self):
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test_read_mmap.otio")
+            otio.adapters.write_to_file(timeline, temp_file)
+
+            decoded = otio_json.read_from_file(temp_file, use_mmap=True)
+            self.assertJsonEqual(timeline, decoded)
+
+            decoded = otio.adapters.read_from_file(temp_file, use_mmap=True)
+            self.assertJsonEqual(timeline, decoded)
+
+            with open(temp_file, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    self.assertJsonEqual(
+                        timeline,
+                        otio_json.read_from_string(m)
+                    )
+
+            empty_file = os.path.join(temp_dir, "empty.otio")
+            open(empty_file, "w").close()
+            with self.assertRaises(ValueError):
+                otio_json.read_from_file(empty_file, use_mmap=True)
+
+    def test_read_skeleton(self):
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        for i, clip in enumerate(timeline.find_clips()):
+            clip.metadata["index"] = i
+            clip.markers.append(otio.schema.Marker(name="marker_{}".format(i)))
+            clip.effects.append(otio.schema.LinearTimeWarp(time_scalar=2))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test_read_skeleton.otio")
+            otio.adapters.write_to_file(timeline, temp_file)
+
+            skeleton = otio.adapters.read_from_file(temp_file, load="skeleton")
+            self.assertEqual(skeleton.duration(), timeline.duration())
+            self.assertEqual(
+                [c.trimmed_range() for c in skeleton.find_clips()],
+                [c.trimmed_range() for c in timeline.find_clips()]
+            )
+
+            # deferred fields are loaded from the file on demand
+            clip = skeleton.find_clips()[1]
+            self.assertEqual(clip.metadata["index"], 1)
+            self.assertEqual(clip.markers[0].name, "marker_1")
+            self.assertEqual(clip.effects[0].time_scalar, 2)
+            self.assertEqual(
+                clip.media_reference.metadata,
+                timeline.find_clips()[1].media_reference.metadata
+            )
+
+            # everything else is loaded as it is written
+            self.assertJsonEqual(timeline, skeleton)
+
+            with self.assertRaises(ValueError):
+                otio_json.read_from_file(temp_file, load="partial")
+
+            # the skeleton is read without these
+            for kwargs in (
+                    {"use_mmap": True},
+                    {"lazy_metadata": True},
+                    {"num_threads": 2},
+            ):
+                with self.subTest(**kwargs):
+                    with self.assertRaises(ValueError):
+                        otio_json.read_from_file(
+                            temp_file,
+                            load="skeleton",
+                            **kwargs
+                        )
+
+    def test_skeleton_save_in_place(self):
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        for i, clip in enumerate(timeline.find_clips()):
+            clip.metadata["index"] = i
+            clip.markers.append(otio.schema.Marker(name="marker_{}".format(i)))
+        timeline.find_clips()[0].name = "renamed"
+
+        writers = (
+            otio.adapters.write_to_file,
+            otio_json.write_to_file,
+            lambda skeleton, path: skeleton.to_json_file(path),
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test_save_in_place.otio")
+            for write in writers:
+                otio.adapters.write_to_file(timeline, temp_file)
+
+                # the deferred fields are loaded before the file is written
+                skeleton = otio_json.read_from_file(temp_file, load="skeleton")
+                skeleton.find_clips()[0].name = "renamed"
+                write(skeleton, temp_file)
+                self.assertJsonEqual(
+                    otio.adapters.read_from_file(temp_file),
+                    timeline
+                )
+
+    def test_skeleton_source_changed(self):
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        timeline.find_clips()[0].metadata["index"] = 0
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test_source_changed.otio")
+            other_file = os.path.join(temp_dir, "other.otio")
+            otio.adapters.write_to_file(timeline, temp_file)
+
+            skeleton = otio_json.read_from_file(temp_file, load="skeleton")
+            with open(temp_file, "w") as f:
+                f.write("garbage")
+
+            # the deferred fields are not read from the new contents
+            clip = skeleton.find_clips()[0]
+            with self.assertRaises(ValueError):
+                clip.metadata
+            with self.assertRaises(ValueError):
+                clip.markers
+            with self.assertRaises(ValueError):
+                otio_json.write_to_string(skeleton)
+
+            # nor written without them
+            with self.assertRaises(ValueError):
+                otio_json.write_to_file(skeleton, other_file)
+            self.assertFalse(os.path.exists(other_file))
+
+            # or from a file that is gone
+            otio.adapters.write_to_file(timeline, temp_file)
+            skeleton = otio_json.read_from_file(temp_file, load="skeleton")
+            os.remove(temp_file)
+            with self.assertRaises(OSError):
+                skeleton.find_clips()[0].metadata
+
+    def test_read_lazy_metadata(self):
+        timeline = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        clip = timeline.find_clips()[0]
+        clip.metadata["values"] = {"list": [1, 2.5, None, "s"], "b": True}
+        clip.metadata["time"] = otio.opentime.RationalTime(3, 24)
+        clip.metadata["marker"] = otio.schema.Marker(name="in_metadata")
+        text = otio_json.write_to_string(timeline)
+
+        # metadata that is never accessed is written back out unchanged
+        lazy = otio_json.read_from_string(text, lazy_metadata=True)
+        self.assertMultiLineEqual(otio_json.write_to_string(lazy), text)
+        self.assertMultiLineEqual(
+            otio_json.write_to_string(lazy.clone()),
+            text
+        )
+
+        lazy = otio_json.read_from_file(
+            SCREENING_EXAMPLE_PATH,
+            lazy_metadata=True
+        )
+        self.assertJsonEqual(
+            otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH),
+            lazy
+        )
+
+        lazy = otio_json.read_from_string(text, lazy_metadata=True)
+        lazy_clip = lazy.find_clips()[0]
+        self.assertEqual(
+            list(lazy_clip.metadata["values"]["list"]),
+            [1, 2.5, None, "s"]
+        )
+        self.assertEqual(
+            lazy_clip.metadata["time"],
+            otio.opentime.RationalTime(3, 24)
+        )
+        self.assertEqual(lazy_clip.metadata["marker"].name, "in_metadata")
+
+        lazy_clip.metadata["values"]["b"] = False
+        decoded = otio_json.read_from_string(otio_json.write_to_string(lazy))
+        self.assertJsonEqual(lazy, decoded)
+        self.assertFalse(decoded.find_clips()[0].metadata["values"]["b"])
+
+    def test_read_parallel(self):
+        collection = otio.schema.SerializableCollection(
+            name="reels",
+            metadata={"children": ["not", "split"]}
+        )
+        for reel in range(2):
+            timeline = otio.schema.Timeline(name="reel_{}".format(reel))
+            for t in range(2):
+                track = otio.schema.Track(name="V{}".format(t + 1))
+                for i in range(150):
+                    track.append(
+                        otio.schema.Clip(
+                            name="clip_{}".format(i),
+                            source_range=otio.opentime.TimeRange(
+                                otio.opentime.RationalTime(i, 24),
+                                otio.opentime.RationalTime(10, 24)
+                            ),
+                            metadata={"index": i, "children": [i]}
+                        )
+                    )
+                timeline.tracks.append(track)
+            collection.append(timeline)
+        collection.append(otio.schema.Timeline(name="small"))
+        text = otio_json.write_to_string(collection)
+
+        # the first and last gaps refer to a marker read between them
+        def gap(i):
+            metadata = {"i": i}
+            if i in (0, 1999):
+                metadata["marker"] = {
+                    "OTIO_SCHEMA": "SerializableObjectRef.1",
+                    "id": "m"
+                }
+            elif i == 1000:
+                metadata["marker"] = {
+                    "OTIO_SCHEMA": "Marker.2",
+                    "OTIO_REF_ID": "m",
+                    "name": "shared",
+                    "marked_range": otio.opentime.TimeRange(),
+                }
+            return {"OTIO_SCHEMA": "Gap.1", "metadata": metadata}
+
+        references = json.dumps(
+            {
+                "OTIO_SCHEMA": "Track.1",
+                "kind": "Video",
+                "children": [gap(i) for i in range(2000)],
+            },
+            default=lambda t: json.loads(otio_json.write_to_string(t)),
+            indent=4
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test_read_parallel.otio")
+            with open(temp_file, "w") as f:
+                f.write(text)
+
+            for num_threads in (4, 0):
+                decoded = otio_json.read_from_file(
+                    temp_file,
+                    num_threads=num_threads
+                )
+                self.assertMultiLineEqual(
+                    otio_json.write_to_string(decoded),
+                    text
+                )
+
+            decoded = otio.adapters.read_from_file(
+                temp_file,
+                num_threads=4,
+                lazy_metadata=True
+            )
+            self.assertMultiLineEqual(otio_json.write_to_string(decoded), text)
+
+            # errors are reported as they are when the file is read serially
+            for bad_text in (
+                text.replace('"name": "clip_100"', '"name": 5', 1),
+                text.replace('"name": "clip_100",', '"name": "clip_100"', 1),
+            ):
+                with open(temp_file, "w") as f:
+                    f.write(bad_text)
+
+                with self.assertRaises(ValueError) as serial:
+                    otio_json.read_from_file(temp_file)
+                with self.assertRaises(ValueError) as parallel:
+                    otio_json.read_from_file(temp_file, num_threads=4)
+                self.assertEqual(
+                    str(parallel.exception),
+                    str(serial.exception)
+                )
+
+            with open(temp_file, "w") as f:
+                f.write(references)
+
+            track = otio_json.read_from_file(temp_file, num_threads=4)
+            self.assertEqual(len(track), 2000)
+            self.assertEqual(track[0].metadata["marker"].name, "shared")
+            self.assertIs(
+                track[0].metadata["marker"],
+                track[1000].metadata["marker"]
+            )
+            self.assertIs(
+                track[1999].metadata["marker"],
+                track[1000].metadata["marker"]
+            )
+
     def test_adapters_fetch(self):
         """ Test the dynamic string based adapter fetching """
         self.assertEqual(
@@ -99,6 +682,30 @@ class BuiltInAdapterTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
             otio.adapters.write_to_file(input_otio=tl, filepath=tmp_path)
             self.assertJsonEqual(tl, otio.adapters.read_from_file(filepath=tmp_path))
 
+    def test_read_many(self):
+        tl = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for i in range(6):
+                tl.name = "timeline_{}".format(i)
+                path = os.path.join(temp_dir, "read_many_{}.otio".format(i))
+                otio.adapters.write_to_file(tl, path)
+                paths.append(pathlib.Path(path) if i % 2 else path)
+
+            result = otio.adapters.read_many(paths, max_workers=3)
+
+            self.assertEqual(
+                [t.name for t in result],
+                ["timeline_{}".format(i) for i in range(6)]
+            )
+            tl.name = "timeline_5"
+            self.assertJsonEqual(tl, result[-1])
+
+            with self.assertRaises(FileNotFoundError):
+                otio.adapters.read_many(
+                    paths + [os.path.join(temp_dir, "missing.otio")]
+                )
+
 
 if __name__ == '__main__':
     unittest.main()
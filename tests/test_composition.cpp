@@ -59,6 +59,50 @@ main(int argc, char** argv)
         assertEqual(items[0].value, clip.value);
     });
 
+    // test that the time index is reused between queries and rebuilt after
+    // edits
+    tests.add_test(
+        "test_time_index", [] {
+        using namespace otio;
+        SerializableObject::Retainer<Stack> stack = new Stack();
+        SerializableObject::Retainer<Track> track = new Track;
+        stack->append_child(track);
+
+        const TimeRange range(RationalTime(0.0, 24.0), RationalTime(10.0, 24.0));
+        std::vector<SerializableObject::Retainer<Clip>> clips;
+        for (int i = 0; i < 3; ++i)
+        {
+            clips.push_back(new Clip("clip", nullptr, range));
+            track->append_child(clips.back());
+        }
+
+        opentimelineio::v1_0::ErrorStatus err;
+        auto child = stack->child_at_time(RationalTime(15.0, 24.0), &err);
+        assertFalse(is_error(err));
+        assertEqual(child.value, clips[1].value);
+        child = stack->child_at_time(RationalTime(25.0, 24.0), &err);
+        assertEqual(child.value, clips[2].value);
+
+        auto stats = track->time_index_stats();
+        assertEqual(stats.queries, int64_t(2));
+        assertEqual(stats.rebuilds, int64_t(1));
+        assertEqual(stats.size, int64_t(3));
+
+        auto items = stack->find_clips(
+            &err,
+            TimeRange(RationalTime(12.0, 24.0), RationalTime(2.0, 24.0)));
+        assertFalse(is_error(err));
+        assertEqual(items.size(), 1);
+        assertEqual(items[0].value, clips[1].value);
+        assertEqual(track->time_index_stats().rebuilds, int64_t(1));
+
+        clips[0]->set_source_range(
+            TimeRange(RationalTime(0.0, 24.0), RationalTime(20.0, 24.0)));
+        child = stack->child_at_time(RationalTime(15.0, 24.0), &err);
+        assertEqual(child.value, clips[0].value);
+        assertEqual(track->time_index_stats().rebuilds, int64_t(2));
+    });
+
     tests.run(argc, argv);
     return 0;
 }
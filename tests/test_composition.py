@@ -1707,6 +1707,61 @@ class TrackTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
         track = otio.schema.Track()
         self.assertEqual(track.range_of_all_children(), {})
 
+    def test_time_index(self):
+        track = otio.schema.Track()
+        for i in range(10):
+            track.append(
+                otio.schema.Clip(
+                    name="clip_{}".format(i),
+                    source_range=otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(0, 24),
+                        otio.opentime.RationalTime(10, 24)
+                    )
+                )
+            )
+
+        for i in range(10):
+            self.assertEqual(
+                track.child_at_time(otio.opentime.RationalTime(i * 10 + 5, 24)),
+                track[i]
+            )
+        stats = track.time_index_stats()
+        self.assertEqual(stats["queries"], 10)
+        self.assertEqual(stats["rebuilds"], 1)
+        self.assertEqual(stats["size"], 10)
+
+        search_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(25, 24),
+            otio.opentime.RationalTime(10, 24)
+        )
+        self.assertEqual(
+            track.children_in_range(search_range),
+            [track[2], track[3]]
+        )
+        self.assertEqual(
+            [c.name for c in track.find_clips(search_range=search_range)],
+            ["clip_2", "clip_3"]
+        )
+        self.assertEqual(track.time_index_stats()["rebuilds"], 1)
+
+        # edits invalidate the index
+        track[0].source_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(0, 24),
+            otio.opentime.RationalTime(5, 24)
+        )
+        self.assertEqual(
+            track.child_at_time(otio.opentime.RationalTime(7, 24)),
+            track[1]
+        )
+        del track[0]
+        self.assertEqual(
+            track.child_at_time(otio.opentime.RationalTime(7, 24)),
+            track[0]
+        )
+        stats = track.time_index_stats()
+        self.assertEqual(stats["rebuilds"], 3)
+        self.assertEqual(stats["size"], 9)
+
 
 class EdgeCases(unittest.TestCase):
 
@@ -554,6 +554,24 @@ TRACK:  (Audio)
   CLIP: KOLL-HD.mp4
 """, out)
 
+    def test_combined_filters(self):
+        sys.argv = [
+            'otiotool',
+            '-i', MULTITRACK_PATH,
+            '--remove-transitions',
+            '--only-tracks-with-name', 'Sequence 2', 'Sequence 3',
+            '--only-tracks-with-index', '3',
+            '--only-clips-with-name', 'KOLL-HD.mp4',
+            '--remove-metadata-key', 'cmx_3600',
+            '--list-tracks',
+            '--list-clips'
+        ]
+        out, err = self.run_test()
+        self.assertEqual("""TIMELINE: OTIO TEST - multitrack.Exported.01
+TRACK: Sequence 3 (Video)
+  CLIP: KOLL-HD.mp4
+""", out)
+
     def test_only_tracks_with_index(self):
         sys.argv = [
             'otiotool',
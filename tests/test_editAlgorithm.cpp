@@ -2714,7 +2714,7 @@ main(int argc, char** argv)
                     RationalTime(35.0, 24.0)),
                 TimeRange(
                     RationalTime(55.0, 24.0),
-                    RationalTime(5.0, 24.0)),
+                    RationalTime(15.0, 24.0)),
             },
             // Clip Ranges
             {
@@ -2725,8 +2725,8 @@ main(int argc, char** argv)
                     RationalTime(0.0, 24.0),
                     RationalTime(35.0, 24.0)),
                 TimeRange(
-                    RationalTime(20.0, 24.0),
-                    RationalTime(5.0, 24.0)),
+                    RationalTime(10.0, 24.0),
+                    RationalTime(15.0, 24.0)),
             }); 
     });
 
@@ -3083,6 +3083,81 @@ main(int argc, char** argv)
                           });
     });
     
+    tests.add_test("test_edit_apply_edits_cross_check", [] {
+        // Slices, inserts, overwrites and removes in one apply_edits() call
+        // give the same track as the edits applied one at a time.
+        otio::SerializableObject::Retainer<otio::Track> track_0 =
+            new otio::Track();
+        for (int i = 0; i < 20; ++i)
+        {
+            const TimeRange range(
+                RationalTime(i, 24.0),
+                RationalTime(12.0 + i, 24.0));
+            if (i % 5 == 4)
+            {
+                track_0->append_child(new otio::Gap(range));
+            }
+            else
+            {
+                track_0->append_child(new otio::Clip(
+                    "clip_" + std::to_string(i),
+                    nullptr,
+                    range));
+            }
+        }
+        otio::SerializableObject::Retainer<otio::Track> track_1 =
+            dynamic_cast<otio::Track*>(track_0->clone());
+
+        auto new_clip = [](int i) {
+            return new otio::Clip(
+                "new_" + std::to_string(i),
+                nullptr,
+                TimeRange(RationalTime(0.0, 24.0), RationalTime(8.0, 24.0)));
+        };
+
+        const otio::algo::Edit::Kind kinds[] = {
+            otio::algo::Edit::Kind::Slice,
+            otio::algo::Edit::Kind::Insert,
+            otio::algo::Edit::Kind::Overwrite,
+            otio::algo::Edit::Kind::Remove
+        };
+
+        std::vector<otio::algo::Edit> edits;
+        for (int i = 0; i < 40; ++i)
+        {
+            const RationalTime time(i * 7.0 + 3.0, 24.0);
+            otio::algo::Edit   edit { kinds[i % 4] };
+            edit.time  = time;
+            edit.range = TimeRange(time, RationalTime(4.0, 24.0));
+            edit.fill  = i % 3 != 0;
+            switch (edit.kind)
+            {
+                case otio::algo::Edit::Kind::Slice:
+                    otio::algo::slice(track_0, time);
+                    break;
+                case otio::algo::Edit::Kind::Insert:
+                    edit.item = new_clip(i);
+                    otio::algo::insert(new_clip(i), track_0, time);
+                    break;
+                case otio::algo::Edit::Kind::Overwrite:
+                    edit.item = new_clip(i);
+                    otio::algo::overwrite(new_clip(i), track_0, edit.range);
+                    break;
+                default:
+                    otio::algo::remove(track_0, time, edit.fill);
+                    break;
+            }
+            edits.push_back(edit);
+        }
+
+        otio::ErrorStatus error_status;
+        otio::algo::apply_edits(track_1, edits, &error_status);
+        assertFalse(otio::is_error(error_status));
+        assertEqual(
+            track_1->to_json_string(),
+            track_0->to_json_string());
+    });
+    
     tests.run(argc, argv);
     return 0;
 }
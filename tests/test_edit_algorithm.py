@@ -0,0 +1,396 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Test file for the edit algorithms."""
+
+import random
+import re
+import unittest
+
+import opentimelineio as otio
+import opentimelineio.test_utils as otio_test_utils
+from opentimelineio.algorithms import edit
+
+
+def _rt(value, rate=24):
+    return otio.opentime.RationalTime(value, rate)
+
+
+def _tr(start, duration, rate=24):
+    return otio.opentime.TimeRange(_rt(start, rate), _rt(duration, rate))
+
+
+def _make_track(*durations):
+    track = otio.schema.Track()
+    for i, duration in enumerate(durations):
+        track.append(
+            otio.schema.Clip(
+                name="clip{}".format(i),
+                source_range=_tr(0, duration)
+            )
+        )
+    return track
+
+
+def _summary(track):
+    return [
+        (type(child).__name__, child.name, child.source_range)
+        for child in track
+    ]
+
+
+class EditAlgorithmTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
+
+    def test_slice(self):
+        track = _make_track(24, 24)
+        edit.slice_at(track, _rt(12))
+
+        self.assertEqual(len(track), 3)
+        self.assertEqual(track[0].source_range, _tr(0, 12))
+        self.assertEqual(track[1].source_range, _tr(12, 12))
+        self.assertEqual(track.duration(), _rt(48))
+
+    def test_insert(self):
+        track = _make_track(24, 24)
+        clip = otio.schema.Clip(name="new", source_range=_tr(0, 10))
+        edit.insert(clip, track, _rt(24))
+
+        self.assertEqual(
+            [child.name for child in track],
+            ["clip0", "new", "clip1"]
+        )
+        self.assertEqual(track.duration(), _rt(58))
+
+    def test_overwrite(self):
+        track = _make_track(24, 24)
+        clip = otio.schema.Clip(name="new", source_range=_tr(0, 12))
+        edit.overwrite(clip, track, _tr(6, 12))
+
+        self.assertEqual(
+            [child.name for child in track],
+            ["clip0", "new", "clip0", "clip1"]
+        )
+        self.assertEqual(track[0].source_range, _tr(0, 6))
+        self.assertEqual(track[2].source_range, _tr(18, 6))
+        self.assertEqual(track.duration(), _rt(48))
+
+    def test_overwrite_several_items(self):
+        for durations, range_, expected in (
+                ((10, 4, 1, 10), _tr(12, 4), [10, 2, 4, 9]),
+                ((10, 4, 1, 10), _tr(5, 15), [5, 15, 5]),
+                ((10, 4, 1, 10), _tr(20, 10), [10, 4, 1, 5, 10]),
+                ((40.5, 3.5, 0.5, 10), _tr(42.5, 2), [40.5, 2, 2, 10]),
+                ((40.5, 3.5, 0.5, 10), _tr(40, 4.25), [40, 4.25, 0.25, 10]),
+        ):
+            with self.subTest(durations=durations, range=range_):
+                track = _make_track(*durations)
+                batched = track.deepcopy()
+                total = max(
+                    track.duration(),
+                    range_.end_time_exclusive()
+                )
+
+                clip = otio.schema.Clip(name="new", source_range=_tr(0, 24))
+                edit.overwrite(clip, track, range_)
+                self.assertEqual(
+                    [child.duration().value for child in track],
+                    expected
+                )
+                self.assertIn("new", [child.name for child in track])
+                self.assertEqual(track.duration(), total)
+
+                # a single edit across several items falls back to overwrite
+                clip = otio.schema.Clip(name="new", source_range=_tr(0, 24))
+                edit.apply_edits(batched, [edit.Edit.overwrite(clip, range_)])
+                self.assertJsonEqual(batched, track)
+
+    def test_remove(self):
+        track = _make_track(24, 24)
+        edit.remove(track, _rt(30))
+
+        self.assertIsInstance(track[1], otio.schema.Gap)
+        self.assertEqual(track.duration(), _rt(48))
+
+        edit.remove(track, _rt(30), fill=False)
+        self.assertEqual(len(track), 1)
+
+    def test_slip_and_ripple(self):
+        track = _make_track(24, 24)
+        edit.slip(track[0], _rt(4))
+        self.assertEqual(track[0].source_range, _tr(4, 24))
+
+        edit.ripple(track[0], _rt(0), _rt(-4))
+        self.assertEqual(track[0].source_range, _tr(4, 20))
+        self.assertEqual(track.duration(), _rt(44))
+
+    def test_apply_edits(self):
+        one_by_one = _make_track(24, 24, 24)
+        batched = one_by_one.deepcopy()
+
+        for time in (6, 30, 60):
+            edit.slice_at(one_by_one, _rt(time))
+        edit.remove(one_by_one, _rt(10))
+        edit.insert(
+            otio.schema.Clip(name="new", source_range=_tr(0, 8)),
+            one_by_one,
+            _rt(30)
+        )
+
+        edits = [edit.Edit.slice(_rt(time)) for time in (6, 30, 60)]
+        edits.append(edit.Edit.remove(_rt(10)))
+        edits.append(
+            edit.Edit.insert(
+                otio.schema.Clip(name="new", source_range=_tr(0, 8)),
+                _rt(30)
+            )
+        )
+        self.assertEqual(edits[0].kind, edit.Edit.Kind.slice)
+        edit.apply_edits(batched, edits)
+
+        self.assertEqual(_summary(batched), _summary(one_by_one))
+        self.assertJsonEqual(batched, one_by_one)
+
+    def test_apply_edits_item_edits(self):
+        track = _make_track(24, 24)
+        edit.apply_edits(
+            track,
+            [
+                edit.Edit.slip(track[0], _rt(2)),
+                edit.Edit.ripple(track[1], _rt(0), _rt(-4)),
+            ]
+        )
+
+        self.assertEqual(track[0].source_range, _tr(2, 24))
+        self.assertEqual(track[1].source_range, _tr(0, 20))
+
+    def test_apply_edits_error(self):
+        track = _make_track(24, 24)
+        stray = otio.schema.Clip(source_range=_tr(0, 24))
+        edits = [
+            edit.Edit.slice(_rt(12)),
+            edit.Edit.ripple(stray, _rt(0), _rt(1)),
+            edit.Edit.slice(_rt(36)),
+        ]
+
+        with self.assertRaises(otio.exceptions.NotAChildError) as context:
+            edit.apply_edits(track, edits)
+        self.assertIn("edit 1:", str(context.exception))
+
+        # the edits before the failing one stay applied
+        self.assertEqual(len(track), 3)
+
+
+class BatchEditCrossCheckTests(
+    unittest.TestCase,
+    otio_test_utils.OTIOAssertions
+):
+    """apply_edits applies runs of slice, insert, overwrite and remove edits
+    to a track in a single sweep. These check it against the same edits
+    applied one at a time.
+    """
+
+    def _random_track(self, rng, count, max_duration=48):
+        track = otio.schema.Track()
+        for i in range(count):
+            duration = rng.randint(1, max_duration)
+            if rng.random() < 0.2:
+                track.append(otio.schema.Gap(source_range=_tr(0, duration)))
+            else:
+                track.append(
+                    otio.schema.Clip(
+                        name="clip{}".format(i),
+                        source_range=_tr(rng.randint(0, 100), duration)
+                    )
+                )
+        return track
+
+    def _random_edits(
+            self,
+            rng,
+            count,
+            duration,
+            sort=True,
+            kinds=("slice", "insert", "overwrite", "remove"),
+            max_length=30
+    ):
+        specs = []
+        for i in range(count):
+            kind = rng.choice(kinds)
+            time = rng.randint(-2, int(duration) + 30)
+            length = rng.randint(1, max_length)
+            specs.append((kind, time, length, i))
+        if sort:
+            specs.sort(key=lambda spec: spec[1])
+        return specs
+
+    def _item(self, spec):
+        kind, time, length, i = spec
+        clip = otio.schema.Clip(
+            name="new{}".format(i),
+            source_range=_tr(10, length)
+        )
+        if i % 7 == 0:
+            clip.effects.append(otio.schema.LinearTimeWarp())
+        return clip
+
+    def _apply_one_by_one(self, track, specs):
+        """Return the index and type of the error of the failing edit, if
+        any, like apply_edits() reports them.
+        """
+        for index, spec in enumerate(specs):
+            kind, time, length, _ = spec
+            try:
+                if kind == "slice":
+                    edit.slice_at(track, _rt(time))
+                elif kind == "insert":
+                    edit.insert(self._item(spec), track, _rt(time))
+                elif kind == "overwrite":
+                    edit.overwrite(
+                        self._item(spec),
+                        track,
+                        _tr(time, length)
+                    )
+                else:
+                    edit.remove(track, _rt(time), fill=length % 2 == 0)
+            except Exception as e:
+                return index, type(e)
+
+        return None
+
+    def _edits(self, specs):
+        edits = []
+        for spec in specs:
+            kind, time, length, _ = spec
+            if kind == "slice":
+                edits.append(edit.Edit.slice(_rt(time)))
+            elif kind == "insert":
+                edits.append(edit.Edit.insert(self._item(spec), _rt(time)))
+            elif kind == "overwrite":
+                edits.append(
+                    edit.Edit.overwrite(self._item(spec), _tr(time, length))
+                )
+            else:
+                edits.append(
+                    edit.Edit.remove(_rt(time), fill=length % 2 == 0)
+                )
+        return edits
+
+    def _apply_batched(self, track, specs):
+        try:
+            edit.apply_edits(track, self._edits(specs))
+        except Exception as e:
+            match = re.search(r"edit (\d+):", str(e))
+            self.assertIsNotNone(match, str(e))
+            return int(match.group(1)), type(e)
+
+        return None
+
+    def _cross_check(
+            self,
+            seed,
+            sort=True,
+            max_duration=48,
+            **edit_options
+    ):
+        rng = random.Random(seed)
+        one_by_one = self._random_track(
+            rng,
+            rng.randint(1, 40),
+            max_duration
+        )
+        batched = one_by_one.deepcopy()
+        specs = self._random_edits(
+            rng,
+            rng.randint(1, 60),
+            one_by_one.duration().value,
+            sort,
+            **edit_options
+        )
+
+        self.assertEqual(
+            self._apply_batched(batched, specs),
+            self._apply_one_by_one(one_by_one, specs)
+        )
+        self.assertJsonEqual(batched, one_by_one)
+
+    def test_sorted_edits(self):
+        for seed in range(200):
+            with self.subTest(seed=seed):
+                self._cross_check(seed)
+
+    def test_unsorted_edits(self):
+        for seed in range(100):
+            with self.subTest(seed=seed):
+                self._cross_check(seed, sort=False)
+
+    def test_overwrites_across_items(self):
+        # short items and long overwrites, so that most overwrites span
+        # several items
+        for seed in range(100):
+            with self.subTest(seed=seed):
+                self._cross_check(
+                    seed,
+                    sort=seed % 2 == 0,
+                    max_duration=6,
+                    kinds=("overwrite", "slice"),
+                    max_length=40
+                )
+
+    def test_slices(self):
+        one_by_one = _make_track(*([24] * 50))
+        batched = one_by_one.deepcopy()
+        times = range(5, 1200, 7)
+
+        for time in times:
+            edit.slice_at(one_by_one, _rt(time))
+        edit.apply_edits(batched, [edit.Edit.slice(_rt(t)) for t in times])
+
+        self.assertJsonEqual(batched, one_by_one)
+        self.assertEqual(batched.duration(), _rt(1200))
+
+    def test_overwrites(self):
+        one_by_one = otio.schema.Track()
+        one_by_one.append(otio.schema.Gap(source_range=_tr(0, 1000)))
+        batched = one_by_one.deepcopy()
+        ranges = [_tr(start, 12) for start in range(0, 1000, 20)]
+
+        for i, range_ in enumerate(ranges):
+            clip = otio.schema.Clip(name=str(i), source_range=_tr(0, 12))
+            edit.overwrite(clip, one_by_one, range_)
+        edit.apply_edits(
+            batched,
+            [
+                edit.Edit.overwrite(
+                    otio.schema.Clip(name=str(i), source_range=_tr(0, 12)),
+                    range_
+                )
+                for i, range_ in enumerate(ranges)
+            ]
+        )
+
+        self.assertJsonEqual(batched, one_by_one)
+        self.assertEqual(batched.duration(), _rt(1000))
+
+    def test_transitions(self):
+        # not taken by the sweep, the result must still be the same
+        one_by_one = _make_track(24, 24, 24)
+        one_by_one.insert(
+            1,
+            otio.schema.Transition(in_offset=_rt(4), out_offset=_rt(4))
+        )
+        batched = one_by_one.deepcopy()
+
+        for time in (6, 22, 40, 60):
+            edit.slice_at(one_by_one, _rt(time))
+        edit.apply_edits(
+            batched,
+            [edit.Edit.slice(_rt(t)) for t in (6, 22, 40, 60)]
+        )
+
+        self.assertJsonEqual(batched, one_by_one)
+
+
+if __name__ == '__main__':
+    unittest.main()
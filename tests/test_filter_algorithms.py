@@ -144,6 +144,57 @@ class FilterTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
         tr.extend([copy.deepcopy(tr[0]), copy.deepcopy(tr[0])])
         self.assertJsonEqual(tr, result)
 
+    def test_in_place(self):
+        md = {'test': 'bar'}
+        tr = otio.schema.Track(name='foo', metadata=md)
+        tr.append(otio.schema.Clip(name='cl1', metadata=md))
+        tr.append(otio.schema.Gap())
+        tr.append(otio.schema.Clip(name='cl2', metadata=md))
+        cl2 = tr[2]
+
+        result = otio.algorithms.filtered_composition(
+            tr,
+            lambda _: _,
+            types_to_prune=(otio.schema.Gap,),
+            in_place=True
+        )
+
+        self.assertIs(tr, result)
+        self.assertEqual(['cl1', 'cl2'], [item.name for item in tr])
+        self.assertIs(cl2, tr[1])
+        self.assertIs(tr, cl2.parent())
+
+    def test_visit_order(self):
+        """Test that items are visited depth first, in order."""
+
+        tl = otio.schema.Timeline(name='tl')
+        for track_name in ('V1', 'V2'):
+            tr = otio.schema.Track(name=track_name)
+            tr.append(otio.schema.Clip(name=track_name + '_cl1'))
+            nested = otio.schema.Stack(name=track_name + '_nested')
+            nested.append(otio.schema.Clip(name=track_name + '_cl2'))
+            tr.append(nested)
+            tr.append(otio.schema.Clip(name=track_name + '_cl3'))
+            tl.tracks.append(tr)
+
+        visited = []
+
+        def record(thing):
+            visited.append(thing.name)
+            return thing
+
+        result = otio.algorithms.filtered_composition(tl, record)
+
+        self.assertEqual(
+            visited,
+            [
+                'tl', 'tracks',
+                'V1', 'V1_cl1', 'V1_nested', 'V1_cl2', 'V1_cl3',
+                'V2', 'V2_cl1', 'V2_nested', 'V2_cl2', 'V2_cl3',
+            ]
+        )
+        self.assertJsonEqual(tl, result)
+
 
 class ReduceTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
     maxDiff = None
@@ -320,6 +371,235 @@ class ReduceTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
         self.assertTrue(isinstance(result[2], otio.schema.Gap))
         self.assertTrue(isinstance(result[3], otio.schema.Clip))
 
+    def test_in_place(self):
+        tr = otio.schema.Track(name='foo')
+        for i in range(5):
+            tr.append(otio.schema.Clip(name='cl' + str(i)))
+            tr.append(otio.schema.Gap(name='gap' + str(i)))
+
+        neighbors = []
+
+        def no_gaps(prev_item, thing, next_item):
+            if isinstance(thing, otio.schema.Gap):
+                return None
+            neighbors.append(
+                (prev_item and prev_item.name, next_item and next_item.name)
+            )
+            return thing
+
+        result = otio.algorithms.filtered_with_sequence_context(
+            tr,
+            no_gaps,
+            in_place=True
+        )
+
+        self.assertIs(tr, result)
+        self.assertEqual(
+            ['cl0', 'cl1', 'cl2', 'cl3', 'cl4'],
+            [item.name for item in tr]
+        )
+
+        # the neighbors are the ones from before filtering
+        self.assertEqual(
+            neighbors,
+            [
+                (None, None),
+                (None, 'gap0'),
+                ('gap0', 'gap1'),
+                ('gap1', 'gap2'),
+                ('gap2', 'gap3'),
+                ('gap3', 'gap4'),
+            ]
+        )
+
+    def test_neighbor_ranges(self):
+        """the neighbors passed to the filter are still in the track"""
+
+        tr = otio.schema.Track()
+        for i in range(3):
+            tr.append(
+                otio.schema.Clip(
+                    name='cl' + str(i),
+                    source_range=otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(0, 24),
+                        otio.opentime.RationalTime(10 * (i + 1), 24)
+                    )
+                )
+            )
+
+        next_ranges = []
+
+        def record_next_range(_, thing, next_item):
+            if next_item is not None:
+                next_ranges.append(next_item.range_in_parent())
+            return thing
+
+        result = otio.algorithms.filtered_with_sequence_context(
+            tr,
+            record_next_range
+        )
+
+        self.assertEqual(
+            ['cl0', 'cl1', 'cl2'],
+            [item.name for item in result]
+        )
+        self.assertEqual(
+            next_ranges,
+            [
+                otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(10, 24),
+                    otio.opentime.RationalTime(20, 24)
+                ),
+                otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(30, 24),
+                    otio.opentime.RationalTime(30, 24)
+                ),
+            ]
+        )
+
+    def test_wrap_item(self):
+        """the item passed to the filter is detached, so it can be wrapped"""
+
+        tr = otio.schema.Track()
+        for i in range(3):
+            tr.append(otio.schema.Clip(name='c' + str(i)))
+
+        parents = []
+
+        def wrap_c1(_, thing, __):
+            if isinstance(thing, otio.schema.Track):
+                return thing
+            parents.append(thing.parent())
+            if thing.name != 'c1':
+                return thing
+            wrapper = otio.schema.Stack(name='wrapped')
+            wrapper.append(thing)
+            return wrapper
+
+        result = otio.algorithms.filtered_with_sequence_context(tr, wrap_c1)
+
+        self.assertEqual(
+            ['c0', 'wrapped', 'c2'],
+            [item.name for item in result]
+        )
+        self.assertEqual(['c1'], [item.name for item in result[1]])
+        self.assertEqual(parents, [None, None, None])
+        for item in result:
+            self.assertIs(item.parent(), result)
+
+
+class PipelineTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
+    maxDiff = None
+
+    def _timeline(self):
+        md = {'keep': 'me', 'secret': 'remove me'}
+        tl = otio.schema.Timeline(name='tl', metadata=md)
+        for track_name in ('V1', 'V2'):
+            tr = otio.schema.Track(name=track_name, metadata=md)
+            tr.append(otio.schema.Clip(name='a_cl1', metadata=md))
+            tr.append(otio.schema.Transition(name='tr1'))
+            clip = otio.schema.Clip(
+                name='cl2',
+                metadata=md,
+                media_reference=otio.schema.ExternalReference(
+                    target_url='/media/cl2.mov',
+                    metadata=md
+                )
+            )
+            clip.markers.append(otio.schema.Marker(name='m1', metadata=md))
+            tr.append(clip)
+            tl.tracks.append(tr)
+        return tl
+
+    def test_stages(self):
+        tl = self._timeline()
+
+        def no_a(clip):
+            return None if clip.name.startswith('a') else clip
+
+        result = (
+            otio.algorithms.Pipeline()
+            .prune([otio.schema.Transition])
+            .keep_tracks(lambda track: track.name == 'V2')
+            .map_clips(no_a)
+            .strip_metadata(['secret'])
+            .run(tl)
+        )
+
+        # the original is left untouched
+        self.assertEqual(2, len(tl.tracks))
+        self.assertEqual(3, len(tl.tracks[0]))
+
+        # the same as running each filter in turn
+        expected = otio.algorithms.filtered_composition(
+            tl,
+            lambda _: _,
+            types_to_prune=(otio.schema.Transition,)
+        )
+        expected = otio.algorithms.filtered_composition(
+            expected,
+            lambda thing: (
+                None if isinstance(thing, otio.schema.Track)
+                and thing.name != 'V2' else thing
+            )
+        )
+        expected = otio.algorithms.filtered_composition(
+            expected,
+            lambda thing: (
+                no_a(thing) if isinstance(thing, otio.schema.Clip) else thing
+            )
+        )
+        for thing in [expected, expected.tracks] + list(
+            expected.find_children()
+        ):
+            thing.metadata.pop('secret', None)
+        del expected.tracks[0][0].markers[0].metadata['secret']
+        del expected.tracks[0][0].media_reference.metadata['secret']
+
+        self.assertJsonEqual(expected, result)
+        self.assertEqual(['cl2'], [clip.name for clip in result.find_clips()])
+        self.assertEqual({'keep': 'me'}, dict(result.tracks[0][0].metadata))
+
+    def test_in_place(self):
+        tl = self._timeline()
+        v2 = tl.tracks[1]
+
+        result = (
+            otio.algorithms.Pipeline()
+            .keep_tracks(lambda track: track.name == 'V2')
+            .run(tl, in_place=True)
+        )
+
+        self.assertIs(tl, result)
+        self.assertEqual(1, len(tl.tracks))
+        self.assertIs(v2, tl.tracks[0])
+
+    def test_map_expands(self):
+        tr = otio.schema.Track(name='foo')
+        tr.append(otio.schema.Clip(name='cl1'))
+
+        def double(clip):
+            return (clip, otio.schema.Clip(name=clip.name + '_copy'))
+
+        def rename(clip):
+            clip.name = clip.name.upper()
+            return clip
+
+        result = (
+            otio.algorithms.Pipeline()
+            .map_clips(double)
+            .map_clips(rename)
+            .run(tr)
+        )
+
+        # later stages see the items added by the earlier ones
+        self.assertEqual(['CL1', 'CL1_COPY'], [clip.name for clip in result])
+
+    def test_empty(self):
+        tl = self._timeline()
+        self.assertEqual(0, len(otio.algorithms.Pipeline()))
+        self.assertJsonEqual(tl, otio.algorithms.Pipeline().run(tl))
+
 
 if __name__ == '__main__':
     unittest.main()
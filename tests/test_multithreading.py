@@ -86,6 +86,74 @@ class MultithreadingTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
     def bash_retainers2(self):
         otio._otio._testing.bash_retainers2(self.sc, self.materialize)
 
+    def test_concurrent_json_round_trip(self):
+        tl = otio.schema.Timeline(name="threaded")
+        tr = otio.schema.Track()
+        tl.tracks.append(tr)
+        for i in range(100):
+            tr.append(
+                otio.schema.Clip(
+                    name="clip_{}".format(i),
+                    source_range=otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(i, 24),
+                        otio.opentime.RationalTime(10, 24)
+                    )
+                )
+            )
+        baseline = otio.adapters.write_to_string(tl)
+        results = [None] * 8
+
+        def round_trip(index):
+            decoded = otio.adapters.read_from_string(baseline)
+            results[index] = otio.adapters.write_to_string(decoded)
+
+        threads = []
+        for i in range(len(results)):
+            t = threading.Thread(target=round_trip, args=(i,))
+            t.daemon = True
+            t.start()
+            threads.append(t)
+
+        for t in threads:
+            t.join()
+
+        for result in results:
+            self.assertEqual(result, baseline)
+
+    def test_downgrade_while_reading_registry(self):
+        @otio.core.register_type
+        class FakeThing(otio.core.SerializableObject):
+            _serializable_label = "FakeThingToDowngradeThreaded.2"
+            foo_two = otio.core.serializable_field("foo_2")
+
+        @otio.core.downgrade_function_from(FakeThing, 2)
+        def downgrade_2_to_1(_data_dict):
+            return {"foo": _data_dict["foo_2"]}
+
+        thing = FakeThing()
+        thing.foo_two = "a thing here"
+        done = threading.Event()
+
+        def read_registry():
+            while not done.is_set():
+                otio.core.type_version_map()
+
+        t = threading.Thread(target=read_registry)
+        t.daemon = True
+        t.start()
+        try:
+            for _ in range(200):
+                result = otio.adapters.write_to_string(
+                    thing,
+                    target_schema_versions={
+                        "FakeThingToDowngradeThreaded": 1
+                    }
+                )
+                self.assertIn("FakeThingToDowngradeThreaded.1", result)
+        finally:
+            done.set()
+            t.join()
+
 
 if __name__ == '__main__':
     unittest.main()
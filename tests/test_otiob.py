@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Tests for the OTIOB adapter."""
+
+import glob
+import os
+import tempfile
+import unittest
+
+import opentimelineio as otio
+from opentimelineio import test_utils as otio_test_utils
+from opentimelineio.adapters import (
+    otio_json,
+    otiob,
+)
+
+SAMPLE_DATA_DIR = os.path.join(os.path.dirname(__file__), "sample_data")
+SCREENING_EXAMPLE_PATH = os.path.join(SAMPLE_DATA_DIR, "screening_example.otio")
+
+
+class OTIOBTester(unittest.TestCase, otio_test_utils.OTIOAssertions):
+
+    def test_round_trip_sample_data(self):
+        """ Converting to .otiob and back loses nothing """
+        for path in sorted(glob.glob(os.path.join(SAMPLE_DATA_DIR, "*.otio"))):
+            with self.subTest(path=os.path.basename(path)):
+                tl = otio_json.read_from_file(path)
+                data = otiob.write_to_string(tl)
+                self.assertIsInstance(data, bytes)
+
+                decoded = otiob.read_from_string(data)
+                self.assertMultiLineEqual(
+                    otio_json.write_to_string(tl),
+                    otio_json.write_to_string(decoded)
+                )
+                self.assertEqual(otiob.write_to_string(decoded), data)
+
+    def test_value_types(self):
+        clip = otio.schema.Clip(
+            name="clip",
+            source_range=otio.opentime.TimeRange(
+                otio.opentime.RationalTime(1.5, 23.976),
+                otio.opentime.RationalTime(-100, 24)
+            )
+        )
+        clip.color = otio.core.Color(0.25, 0.5, 0.75, 1.0, "blueish")
+        clip.effects.append(otio.schema.LinearTimeWarp(time_scalar=-2.5))
+        clip.media_reference = otio.schema.ExternalReference(
+            target_url="file:///média/" + "long" * 100 + ".mov",
+            available_image_bounds=otio.schema.Box2d(
+                otio.schema.V2d(-16.0, -9.0),
+                otio.schema.V2d(16.0, 9.0)
+            )
+        )
+        clip.metadata["values"] = {
+            "none": None,
+            "bools": [True, False],
+            "ints": [0, 1, -1, 2 ** 62, -2 ** 63],
+            "floats": [0.1, -1e300, float("inf")],
+            "strings": ["", "clip", "clip", "ünïcødé"],
+            "nested": {"list": [[], {}, [{"a": [1]}]]},
+            "time": otio.opentime.RationalTime(7, 30),
+            "transform": otio.opentime.TimeTransform(
+                otio.opentime.RationalTime(1, 24),
+                2.0,
+                48.0
+            ),
+        }
+
+        decoded = otiob.read_from_string(otiob.write_to_string(clip))
+        self.assertJsonEqual(clip, decoded)
+        self.assertEqual(decoded.color.name, "blueish")
+        self.assertEqual(
+            decoded.metadata["values"]["transform"],
+            clip.metadata["values"]["transform"]
+        )
+
+    def test_disk_io(self):
+        tl = otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test_disk_io.otiob")
+            otio.adapters.write_to_file(tl, temp_file)
+            with open(temp_file, "rb") as f:
+                self.assertEqual(f.read(), otiob.write_to_string(tl))
+
+            self.assertJsonEqual(tl, otio.adapters.read_from_file(temp_file))
+
+        self.assertLess(
+            len(otiob.write_to_string(tl)),
+            len(otio_json.write_to_string(tl, indent=-1)) / 3
+        )
+
+    def test_downgrade(self):
+        clip = otio.schema.Clip(name="clip")
+        data = otiob.write_to_string(clip, {"Clip": 1})
+        self.assertIn(b"Clip.1", data)
+        self.assertJsonEqual(clip, otiob.read_from_string(data))
+
+    def test_malformed(self):
+        data = otiob.write_to_string(
+            otio.adapters.read_from_file(SCREENING_EXAMPLE_PATH)
+        )
+
+        for bad in (b"", b"{}", data[:-1], data + b"\0", data[:100]):
+            with self.assertRaises(ValueError):
+                otiob.read_from_string(bad)
+
+        with self.assertRaises(ValueError):
+            otiob.read_from_file(SCREENING_EXAMPLE_PATH)
+
+
+if __name__ == '__main__':
+    unittest.main()
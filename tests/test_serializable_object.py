@@ -6,9 +6,12 @@
 import opentimelineio as otio
 import opentimelineio.test_utils as otio_test_utils
 
+import os
 import unittest
 import json
 
+SAMPLE_DATA_DIR = os.path.join(os.path.dirname(__file__), "sample_data")
+
 
 class OpenTimeTypeSerializerTest(unittest.TestCase):
 
@@ -147,6 +150,288 @@ class SerializableObjTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
         self.assertEqual(repr(so.metadata["vectors"]), repr(v))
 
 
+class ContentHashTests(unittest.TestCase):
+    def _timeline(self):
+        track = otio.schema.Track(name="V1")
+        for i in range(3):
+            clip = otio.schema.Clip(
+                name="clip{}".format(i),
+                media_reference=otio.schema.ExternalReference(
+                    target_url="/media/clip{}.mov".format(i)
+                ),
+                source_range=otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(0, 24),
+                    otio.opentime.RationalTime(24, 24)
+                )
+            )
+            clip.markers.append(otio.schema.Marker(name="marker"))
+            track.append(clip)
+        timeline = otio.schema.Timeline(name="timeline")
+        timeline.tracks.append(track)
+        return timeline
+
+    def test_equal_content(self):
+        timeline = self._timeline()
+        copy = timeline.deepcopy()
+        self.assertEqual(timeline.content_hash(), copy.content_hash())
+
+        round_trip = otio.adapters.read_from_string(
+            otio.adapters.write_to_string(timeline)
+        )
+        self.assertEqual(timeline.content_hash(), round_trip.content_hash())
+
+        # identical subtrees have the same hash
+        track = timeline.tracks[0]
+        self.assertNotEqual(track[0].content_hash(), track[1].content_hash())
+        track[1].name = "clip0"
+        track[1].media_reference.target_url = "/media/clip0.mov"
+        self.assertEqual(track[0].content_hash(), track[1].content_hash())
+
+    def test_different_content(self):
+        o1 = otio.core.SerializableObjectWithMetadata()
+        o2 = otio.core.SerializableObjectWithMetadata()
+        self.assertEqual(o1.content_hash(), o2.content_hash())
+
+        for value in (1, 1.0, "1", True, [1], {"1": 1}, None):
+            o2.metadata["value"] = value
+            self.assertNotEqual(o1.content_hash(), o2.content_hash(), value)
+
+        self.assertNotEqual(
+            otio.schema.Gap().content_hash(),
+            otio.schema.Clip().content_hash()
+        )
+
+    def test_mutation(self):
+        timeline = self._timeline()
+        copy = timeline.deepcopy()
+        track = timeline.tracks[0]
+        clip = track[1]
+
+        edits = [
+            lambda: setattr(clip, "name", "renamed"),
+            lambda: clip.metadata.__setitem__("key", "value"),
+            lambda: setattr(
+                clip,
+                "source_range",
+                otio.opentime.TimeRange(duration=clip.duration() + clip.duration())
+            ),
+            lambda: setattr(clip.markers[0], "name", "renamed"),
+            lambda: setattr(clip.media_reference, "target_url", "/other.mov"),
+            lambda: track.append(otio.schema.Gap()),
+            lambda: track.pop(0),
+            lambda: setattr(
+                timeline,
+                "global_start_time",
+                otio.opentime.RationalTime(1, 24)
+            ),
+        ]
+        for edit in edits:
+            before = timeline.content_hash()
+            edit()
+            self.assertNotEqual(timeline.content_hash(), before)
+            self.assertNotEqual(timeline.content_hash(), copy.content_hash())
+
+    def test_held_references(self):
+        so = otio.core.SerializableObjectWithMetadata()
+        metadata = so.metadata
+        before = so.content_hash()
+
+        metadata["key"] = {"sub-key": 1}
+        after = so.content_hash()
+        self.assertNotEqual(after, before)
+
+        nested = so.metadata["key"]
+        self.assertEqual(so.content_hash(), after)
+        nested["sub-key"] = 2
+        self.assertNotEqual(so.content_hash(), after)
+
+        clip = otio.schema.Clip()
+        markers = clip.markers
+        before = clip.content_hash()
+        markers.append(otio.schema.Marker())
+        self.assertNotEqual(clip.content_hash(), before)
+
+    def test_cycle_detection(self):
+        o = otio.core.SerializableObjectWithMetadata()
+        o.metadata["myself"] = o
+        with self.assertRaises(ValueError):
+            o.content_hash()
+
+        child = otio.core.SerializableObjectWithMetadata()
+        o.metadata["myself"] = child
+        child.metadata["parent"] = o
+        with self.assertRaises(ValueError):
+            o.content_hash()
+
+        del child.metadata["parent"]
+        self.assertEqual(
+            o.content_hash(),
+            otio.core.SerializableObjectWithMetadata(
+                metadata={"myself": otio.core.SerializableObjectWithMetadata()}
+            ).content_hash()
+        )
+
+
+class CloneTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
+    """The built-in schemas are cloned by copying their fields, the others
+    through serialization. Either way the clone serializes the same.
+    """
+
+    def assertClonesEqual(self, obj):
+        clone = obj.clone()
+        self.assertIsNot(clone, obj)
+        self.assertIs(type(clone), type(obj))
+        self.assertEqual(clone.to_json_string(), obj.to_json_string())
+        return clone
+
+    def test_sample_data(self):
+        for name in sorted(os.listdir(SAMPLE_DATA_DIR)):
+            if not name.endswith(".otio"):
+                continue
+            with self.subTest(name=name):
+                self.assertClonesEqual(
+                    otio.adapters.read_from_file(
+                        os.path.join(SAMPLE_DATA_DIR, name)
+                    )
+                )
+
+    def test_all_schemas(self):
+        rt = otio.opentime.RationalTime
+        tr = otio.opentime.TimeRange
+
+        clip = otio.schema.Clip(
+            name="clip",
+            source_range=tr(rt(1, 24), rt(10, 24)),
+            metadata={"list": [1, 2.5, "x", None, {"nested": True}]}
+        )
+        media_references = {
+            "DEFAULT_MEDIA": otio.schema.ImageSequenceReference(
+                target_url_base="/media/",
+                name_prefix="shot.",
+                name_suffix=".exr",
+                start_frame=1001,
+                frame_step=2,
+                rate=30,
+                frame_zero_padding=4,
+                missing_frame_policy=(
+                    otio.schema.ImageSequenceReference.MissingFramePolicy.hold
+                ),
+                available_image_bounds=otio.schema.Box2d(
+                    otio.schema.V2d(0.0, 0.0),
+                    otio.schema.V2d(16.0, 9.0)
+                )
+            ),
+            "generated": otio.schema.GeneratorReference(
+                generator_kind="bars",
+                parameters={"color": "red"}
+            ),
+            "missing": otio.schema.MissingReference(),
+        }
+        clip.set_media_references(media_references, "generated")
+        clip.enabled = False
+        clip.color = otio.core.Color.RED
+        clip.effects.append(otio.schema.LinearTimeWarp(time_scalar=2.0))
+        clip.effects.append(otio.schema.FreezeFrame())
+        clip.effects.append(otio.schema.Effect(effect_name="blur"))
+        clip.markers.append(
+            otio.schema.Marker(
+                name="marker",
+                marked_range=tr(rt(2, 24), rt(1, 24)),
+                color=otio.schema.MarkerColor.BLUE,
+                comment="note"
+            )
+        )
+
+        track = otio.schema.Track(kind=otio.schema.TrackKind.Audio)
+        track.append(clip)
+        track.append(
+            otio.schema.Transition(
+                transition_type="SMPTE_Dissolve",
+                in_offset=rt(2, 24),
+                out_offset=rt(3, 24)
+            )
+        )
+        track.append(otio.schema.Gap(source_range=tr(rt(0, 24), rt(5, 24))))
+        timeline = otio.schema.Timeline(
+            name="timeline",
+            global_start_time=rt(86400, 24)
+        )
+        timeline.tracks.append(track)
+        timeline.tracks.append(otio.schema.Stack(name="nested"))
+        collection = otio.schema.SerializableCollection(
+            name="collection",
+            children=[timeline, otio.schema.Clip(name="loose")]
+        )
+
+        clone = self.assertClonesEqual(collection)
+
+        cloned_track = clone[0].tracks[0]
+        self.assertIs(cloned_track.parent(), clone[0].tracks)
+        self.assertIs(cloned_track[0].parent(), cloned_track)
+        self.assertEqual(
+            cloned_track.range_of_child_at_index(2),
+            track.range_of_child_at_index(2)
+        )
+
+        # the clone does not share anything with the original
+        cloned_track[0].metadata["list"][4]["nested"] = False
+        cloned_track[0].media_reference.parameters["color"] = "blue"
+        self.assertTrue(clip.metadata["list"][4]["nested"])
+        self.assertEqual(clip.media_reference.parameters["color"], "red")
+
+    def test_python_schema(self):
+        @otio.core.register_type
+        class CloneThing(otio.core.SerializableObjectWithMetadata):
+            _serializable_label = "CloneThing.1"
+            value = otio.core.serializable_field("value")
+
+        thing = CloneThing()
+        thing.value = {"answer": 42}
+        clip = otio.schema.Clip(name="clip", metadata={"thing": thing})
+        collection = otio.schema.SerializableCollection(children=[thing.clone()])
+
+        cloned_clip = self.assertClonesEqual(clip)
+        self.assertIs(type(cloned_clip.metadata["thing"]), CloneThing)
+        self.assertIsNot(cloned_clip.metadata["thing"], thing)
+        self.assertIs(type(self.assertClonesEqual(collection)[0]), CloneThing)
+        self.assertIs(type(self.assertClonesEqual(thing)), CloneThing)
+
+    def test_clone_without_children(self):
+        timeline = otio.adapters.read_from_file(
+            os.path.join(SAMPLE_DATA_DIR, "nested_example.otio")
+        )
+        timeline.metadata["key"] = "value"
+
+        clone = timeline.clone_without_children()
+        self.assertEqual(len(clone.tracks), 0)
+        self.assertEqual(clone.name, timeline.name)
+        self.assertEqual(clone.metadata["key"], "value")
+        self.assertEqual(clone.global_start_time, timeline.global_start_time)
+        self.assertEqual(clone.tracks.name, timeline.tracks.name)
+        self.assertNotEqual(len(timeline.tracks), 0)
+
+        track = timeline.tracks[0]
+        empty_track = track.clone_without_children()
+        self.assertEqual(len(empty_track), 0)
+        self.assertEqual(empty_track.kind, track.kind)
+        self.assertEqual(empty_track.source_range, track.source_range)
+
+        for child in track:
+            empty_track.append(child.clone())
+        self.assertJsonEqual(empty_track, track)
+
+    def test_unknown_schema(self):
+        clip = otio.adapters.otio_json.read_from_string(json.dumps({
+            "OTIO_SCHEMA": "Clip.1",
+            "metadata": {
+                "stuff": {"OTIO_SCHEMA": "NoSuchSchema.3", "some_data": 895}
+            },
+        }))
+
+        clone = self.assertClonesEqual(clip)
+        self.assertTrue(clone.metadata["stuff"].is_unknown_schema)
+
+
 class VersioningTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
     def test_schema_definition(self):
         """define a schema and instantiate it from python"""
@@ -222,6 +507,69 @@ class VersioningTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
         ft = otio.core.instance_from_schema("NewStuff", 4, {"foo_3": "bar"})
         self.assertEqual(ft._dynamic_fields['foo_3'], "bar")
 
+    def test_upgrade_rules(self):
+        """Test upgrading a type with schema rules"""
+
+        @otio.core.register_type
+        class FakeThing(otio.core.SerializableObjectWithMetadata):
+            _serializable_label = "NewStuffByRules.3"
+            foo_two = otio.core.serializable_field("foo_2")
+
+        self.assertTrue(
+            otio.core.register_upgrade_rules(
+                "NewStuffByRules",
+                2,
+                [
+                    ("rename", "foo", "foo_2"),
+                    ("drop", "unused"),
+                    ("set_default", "count", 1),
+                ]
+            )
+        )
+        self.assertTrue(
+            otio.core.register_upgrade_rules(
+                "NewStuffByRules",
+                3,
+                [
+                    ["move_to_metadata", "count"],
+                    ["move_to_metadata", "note", "old_note"],
+                ]
+            )
+        )
+
+        # not allowed to overwrite registered rules or functions
+        self.assertFalse(
+            otio.core.register_upgrade_rules("NewStuffByRules", 3, [])
+        )
+        self.assertFalse(
+            otio.core.register_upgrade_rules("NotRegisteredStuff", 2, [])
+        )
+
+        ft = otio.core.instance_from_schema(
+            "NewStuffByRules",
+            1,
+            {"foo": "bar", "unused": True, "note": "n"}
+        )
+        self.assertEqual(ft.foo_two, "bar")
+        self.assertEqual(ft.metadata, {"count": 1, "old_note": "n"})
+        self.assertNotIn("unused", ft._dynamic_fields)
+
+        ft = otio.core.instance_from_schema(
+            "NewStuffByRules",
+            2,
+            {"foo_2": "bar", "count": 5, "metadata": {"a": 1}}
+        )
+        self.assertEqual(ft.foo_two, "bar")
+        self.assertEqual(ft.metadata, {"a": 1, "count": 5})
+
+        for rules in (
+            [("unknown", "foo")],
+            [("rename", "foo")],
+            [("drop", "foo", "bar")],
+        ):
+            with self.assertRaises(ValueError):
+                otio.core.register_upgrade_rules("NewStuffByRules", 4, rules)
+
     def test_upgrade_rename(self):
         """test that upgrading system handles schema renames correctly"""
 
@@ -269,6 +617,97 @@ class VersioningTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
             }
         )
 
+    def test_downgrade_rules(self):
+        """ test downgrading with schema rules """
+
+        @otio.core.register_type
+        class FakeThing(otio.core.SerializableObject):
+            _serializable_label = "FakeThingToDowngradeByRules.2"
+            foo_two = otio.core.serializable_field("foo_2")
+
+        otio.core.register_downgrade_rules(
+            "FakeThingToDowngradeByRules",
+            2,
+            [("rename", "foo_2", "foo"), ("set_default", "bar", [1, 2])]
+        )
+
+        f = FakeThing()
+        f.foo_two = "a thing here"
+
+        result = json.loads(
+            otio.adapters.otio_json.write_to_string(
+                f,
+                {"FakeThingToDowngradeByRules": 1}
+            )
+        )
+
+        self.assertDictEqual(
+            result,
+            {
+                "OTIO_SCHEMA": "FakeThingToDowngradeByRules.1",
+                "foo": "a thing here",
+                "bar": [1, 2],
+            }
+        )
+
+    def test_downgrade_many(self):
+        """ downgrades run on every object of a schema, in order """
+
+        @otio.core.register_type
+        class FakeThing(otio.core.SerializableObject):
+            _serializable_label = "FakeThingToDowngradeTwice.3"
+            foo_three = otio.core.serializable_field("foo_3")
+
+        @otio.core.downgrade_function_from(FakeThing, 3)
+        def downgrade_3_to_2(_data_dict):
+            return {"foo_2": _data_dict["foo_3"]}
+
+        @otio.core.downgrade_function_from(FakeThing, 2)
+        def downgrade_2_to_1(_data_dict):
+            return {"foo": _data_dict["foo_2"] + "!"}
+
+        track = otio.schema.Track()
+        for i in range(3):
+            thing = FakeThing()
+            thing.foo_three = str(i)
+            track.append(
+                otio.schema.Clip(
+                    name=str(i),
+                    media_reference=otio.schema.ExternalReference(
+                        target_url="clip_{}.mov".format(i)
+                    ),
+                    metadata={"thing": thing}
+                )
+            )
+
+        result = json.loads(
+            otio.adapters.otio_json.write_to_string(
+                track,
+                {"FakeThingToDowngradeTwice": 1, "Clip": 1}
+            )
+        )
+        for i, clip in enumerate(result["children"]):
+            self.assertEqual(clip["OTIO_SCHEMA"], "Clip.1")
+            self.assertNotIn("media_references", clip)
+            self.assertEqual(
+                clip["media_reference"]["target_url"],
+                "clip_{}.mov".format(i)
+            )
+            self.assertDictEqual(
+                clip["metadata"]["thing"],
+                {
+                    "OTIO_SCHEMA": "FakeThingToDowngradeTwice.1",
+                    "foo": "{}!".format(i),
+                }
+            )
+
+        # there is no way to go from version 1 to version 0
+        with self.assertRaises(ValueError):
+            otio.adapters.otio_json.write_to_string(
+                track,
+                {"FakeThingToDowngradeTwice": 0}
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
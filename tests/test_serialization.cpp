@@ -4,6 +4,8 @@
 #include "utils.h"
 
 #include <opentimelineio/clip.h>
+#include <opentimelineio/gap.h>
+#include <opentimelineio/marker.h>
 #include <opentimelineio/timeline.h>
 #include <opentimelineio/track.h>
 #include <opentimelineio/serialization.h>
@@ -115,6 +117,136 @@ main(int argc, char** argv)
 })CONTENT");
     });
 
+    tests.add_test(
+        "omit defaults", [] {
+        otio::SerializableObject::Retainer<otio::Track> tr =
+            new otio::Track("track");
+        otio::SerializableObject::Retainer<otio::Gap> gap = new otio::Gap();
+        gap->set_enabled(false);
+        tr->append_child(gap);
+
+        otio::ErrorStatus err;
+        auto output = otio::serialize_json_to_string(
+            std::any(otio::SerializableObject::Retainer<>(tr)),
+            nullptr,
+            &err,
+            -1,
+            true);
+        assertFalse(otio::is_error(err));
+        assertEqual(output.c_str(), R"CONTENT({"OTIO_SCHEMA":"Track.1","name":"track","children":[{"OTIO_SCHEMA":"Gap.1","enabled":false}],"kind":"Video"})CONTENT");
+
+        otio::SerializableObject::Retainer<otio::Track> decoded =
+            dynamic_cast<otio::Track*>(
+                otio::SerializableObject::from_json_string(output, &err));
+        assertFalse(otio::is_error(err));
+        assertTrue(decoded->is_equivalent_to(*tr));
+    });
+
+    tests.add_test(
+        "content hash", [] {
+        otio::SerializableObject::Retainer<otio::Clip> cl =
+            new otio::Clip("clip");
+        otio::SerializableObject::Retainer<otio::Track> tr =
+            new otio::Track();
+        tr->append_child(cl);
+        otio::SerializableObject::Retainer<otio::Timeline> tl =
+            new otio::Timeline();
+        tl->tracks()->append_child(tr);
+
+        otio::ErrorStatus err;
+        auto hash = tl.value->content_hash(&err);
+        assertFalse(otio::is_error(err));
+
+        otio::SerializableObject::Retainer<otio::Timeline> copy =
+            dynamic_cast<otio::Timeline*>(tl.value->clone(&err));
+        assertFalse(otio::is_error(err));
+        assertEqual(copy.value->content_hash(), hash);
+
+        // a change deep in the tree reaches the timeline
+        cl->set_name("renamed");
+        assertNotEqual(tl.value->content_hash(), hash);
+        cl->set_name("clip");
+        assertEqual(tl.value->content_hash(), hash);
+
+        cl->metadata()["key"] = std::string("value");
+        assertNotEqual(tl.value->content_hash(), hash);
+        cl->metadata().erase("key");
+        assertEqual(tl.value->content_hash(), hash);
+
+        tr->remove_child(0);
+        assertNotEqual(tl.value->content_hash(), hash);
+    });
+
+    tests.add_test(
+        "object references", [] {
+        // the first gap refers to a marker that is only read after it
+        std::string input = R"CONTENT({
+    "OTIO_SCHEMA": "Track.1",
+    "kind": "Video",
+    "children": [
+        {
+            "OTIO_SCHEMA": "Gap.1",
+            "name": "forward",
+            "metadata": {
+                "marker": {"OTIO_SCHEMA": "SerializableObjectRef.1", "id": "m"}
+            }
+        },
+        {
+            "OTIO_SCHEMA": "Gap.1",
+            "name": "definition",
+            "metadata": {
+                "marker": {
+                    "OTIO_SCHEMA": "Marker.2",
+                    "OTIO_REF_ID": "m",
+                    "name": "shared",
+                    "marked_range": {
+                        "OTIO_SCHEMA": "TimeRange.1",
+                        "start_time": {"OTIO_SCHEMA": "RationalTime.1", "rate": 24, "value": 1},
+                        "duration": {"OTIO_SCHEMA": "RationalTime.1", "rate": 24, "value": 0}
+                    }
+                }
+            }
+        },
+        {
+            "OTIO_SCHEMA": "Gap.1",
+            "name": "backward",
+            "metadata": {
+                "marker": {"OTIO_SCHEMA": "SerializableObjectRef.1", "id": "m"}
+            }
+        }
+    ]
+})CONTENT";
+
+        otio::ErrorStatus err;
+        otio::SerializableObject::Retainer<otio::Track> tr =
+            dynamic_cast<otio::Track*>(
+                otio::SerializableObject::from_json_string(input, &err));
+        assertFalse(otio::is_error(err));
+        assertEqual(tr->children().size(), size_t(3));
+
+        std::vector<otio::SerializableObject*> markers;
+        for (auto const& child: tr->children())
+        {
+            auto& metadata = dynamic_cast<otio::Gap*>(child.value)->metadata();
+            markers.push_back(
+                std::any_cast<otio::SerializableObject::Retainer<>>(
+                    metadata["marker"]).value);
+        }
+        assertEqual(markers[0], markers[1]);
+        assertEqual(markers[2], markers[1]);
+        assertEqual(
+            dynamic_cast<otio::Marker*>(markers[1])->name(),
+            std::string("shared"));
+
+        otio::SerializableObject::from_json_string(R"CONTENT({
+    "OTIO_SCHEMA": "Gap.1",
+    "metadata": {
+        "marker": {"OTIO_SCHEMA": "SerializableObjectRef.1", "id": "missing"}
+    }
+})CONTENT", &err);
+        assertEqual(err.outcome, otio::ErrorStatus::UNRESOLVED_OBJECT_REFERENCE);
+    });
+
     tests.run(argc, argv);
     return 0;
 }
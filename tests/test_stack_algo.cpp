@@ -213,6 +213,87 @@ main(int argc, char** argv)
         assertEqual(result->duration().value(), 300);
     });
 
+    tests.add_test(
+        "test_stack_resolver", [] {
+        using namespace otio;
+
+        otio::RationalTime rt_0_24{0, 24};
+        otio::RationalTime rt_150_24{150, 24};
+        otio::TimeRange tr_0_150_24{rt_0_24, rt_150_24};
+
+        // 0         150          300
+        // [    A     ]
+        // [    B     |     C     ]
+        //
+        // should resolve to:
+        // [    A     |     C     ]
+        // without cloning anything
+
+        otio::SerializableObject::Retainer<otio::Clip> cl_A =
+            new otio::Clip("track1_A", nullptr, tr_0_150_24);
+        otio::SerializableObject::Retainer<otio::Clip> cl_B =
+            new otio::Clip("track1_B", nullptr, tr_0_150_24);
+        otio::SerializableObject::Retainer<otio::Clip> cl_C =
+            new otio::Clip("track1_C", nullptr, tr_0_150_24);
+
+        otio::SerializableObject::Retainer<otio::Track> tr_over =
+            new otio::Track();
+        tr_over->append_child(cl_A);
+
+        otio::SerializableObject::Retainer<otio::Track> tr_under =
+            new otio::Track();
+        tr_under->append_child(cl_B);
+        tr_under->append_child(cl_C);
+
+        otio::SerializableObject::Retainer<otio::Stack> st =
+            new otio::Stack();
+        st->append_child(tr_under);
+        st->append_child(tr_over);
+
+        otio::ErrorStatus err;
+        StackResolver resolver(st, std::nullopt, &err);
+        std::vector<ResolvedSegment> segments;
+        ResolvedSegment segment;
+        while (resolver.next(segment, &err))
+        {
+            segments.push_back(segment);
+        }
+        assertFalse(otio::is_error(err));
+        assertEqual(segments.size(), 2);
+        assertEqual(segments[0].composable, cl_A.value);
+        assertEqual(segments[1].composable, cl_C.value);
+        assertEqual(segments[1].range, otio::TimeRange(rt_150_24, rt_150_24));
+        assertEqual(*segments[1].source_range, tr_0_150_24);
+        assertFalse(segments[1].trimmed);
+
+        // with a search range, the segments are trimmed to it
+        StackResolver trimmed_resolver(
+            st,
+            otio::TimeRange(otio::RationalTime(100, 24), rt_150_24),
+            &err);
+        segments.clear();
+        while (trimmed_resolver.next(segment, &err))
+        {
+            segments.push_back(segment);
+        }
+        assertFalse(otio::is_error(err));
+        assertEqual(segments.size(), 2);
+        assertEqual(
+            segments[0].range,
+            otio::TimeRange(
+                otio::RationalTime(100, 24),
+                otio::RationalTime(50, 24)));
+        assertEqual(
+            *segments[0].source_range,
+            otio::TimeRange(
+                otio::RationalTime(100, 24),
+                otio::RationalTime(50, 24)));
+        assertTrue(segments[0].trimmed);
+        assertEqual(
+            segments[1].range,
+            otio::TimeRange(rt_150_24, otio::RationalTime(100, 24)));
+    });
+
     tests.run(argc, argv);
     return 0;
 }
\ No newline at end of file
@@ -539,6 +539,122 @@ class StackAlgoTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
         self.assertIsOTIOEquivalentTo(flat_track[1], self.trackgFg[1])
         self.assertIsOTIOEquivalentTo(flat_track[2], self.trackABC[2])
 
+    def test_flatten_nested_gaps_and_padding(self):
+        def _clip(name, start, duration):
+            return otio.schema.Clip(
+                name=name,
+                source_range=otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(start, 24),
+                    otio.opentime.RationalTime(duration, 24)
+                )
+            )
+
+        def _gap(duration):
+            return otio.schema.Gap(
+                duration=otio.opentime.RationalTime(duration, 24)
+            )
+
+        # the two upper tracks are shorter than the bottom one, so their
+        # gaps and their padding show the tracks below
+        # 0    30   50        120  150            300
+        # [ T  ][      gap     ]
+        # [  gap    ][     M        ]
+        # [                 Z                      ]
+        stack = otio.schema.Stack(children=[
+            otio.schema.Track(children=[_clip("Z", 0, 300)]),
+            otio.schema.Track(children=[_gap(50), _clip("M", 100, 100)]),
+            otio.schema.Track(children=[_clip("T", 0, 30), _gap(90)]),
+        ])
+        before = otio.adapters.write_to_string(stack, 'otio_json')
+
+        flat_track = otio.algorithms.flatten_stack(stack)
+        self.assertEqual(
+            [
+                (item.name, item.source_range.start_time.value,
+                 item.source_range.duration.value)
+                for item in flat_track
+            ],
+            [
+                ("T", 0, 30),
+                ("Z", 30, 20),
+                ("M", 100, 70),
+                ("M", 170, 30),
+                ("Z", 150, 150),
+            ]
+        )
+        self.assertEqual(
+            flat_track.duration(),
+            otio.opentime.RationalTime(300, 24)
+        )
+
+        # the input is left untouched
+        self.assertEqual(
+            otio.adapters.write_to_string(stack, 'otio_json'),
+            before
+        )
+
+    def test_resolve_stack(self):
+        stack = otio.schema.Stack(children=[
+            self.trackZ,
+            self.trackgFg
+        ])
+        flat_track = otio.algorithms.flatten_stack(stack)
+        segments = list(otio.algorithms.resolve_stack(stack))
+
+        # the same segments as flatten_stack, referring to the originals
+        self.assertEqual(len(segments), len(flat_track))
+        for segment, item in zip(segments, flat_track):
+            self.assertEqual(segment.item.name, item.name)
+            self.assertEqual(
+                segment.range_in_stack,
+                item.range_in_parent()
+            )
+            self.assertEqual(segment.source_range, item.trimmed_range())
+        self.assertIs(segments[0].item, self.trackZ[0])
+        self.assertIs(segments[1].item, self.trackgFg[1])
+        self.assertIs(segments[2].item, self.trackZ[0])
+
+        # only the segments within the search range, trimmed to it
+        search_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(40, 24),
+            otio.opentime.RationalTime(20, 24)
+        )
+        segments = list(
+            otio.algorithms.resolve_stack(stack, search_range)
+        )
+        self.assertEqual(
+            [
+                (segment.item, segment.range_in_stack, segment.source_range)
+                for segment in segments
+            ],
+            [
+                (
+                    self.trackZ[0],
+                    otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(40, 24),
+                        otio.opentime.RationalTime(10, 24)
+                    ),
+                    otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(40, 24),
+                        otio.opentime.RationalTime(10, 24)
+                    )
+                ),
+                (
+                    self.trackgFg[1],
+                    otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(50, 24),
+                        otio.opentime.RationalTime(10, 24)
+                    ),
+                    otio.opentime.TimeRange(
+                        self.trackgFg[1].source_range.start_time,
+                        otio.opentime.RationalTime(10, 24)
+                    )
+                ),
+            ]
+        )
+
+        self.assertEqual(list(otio.algorithms.resolve_stack([])), [])
+
     def test_flatten_example_code(self):
         timeline = otio.adapters.read_from_file(MULTITRACK_EXAMPLE_PATH)
         preflattened = otio.adapters.read_from_file(PREFLATTENED_EXAMPLE_PATH)
@@ -213,6 +213,31 @@ class TimelineTrimmingTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
             )
         )
 
+    def test_trim_leaves_original_alone(self):
+        original_timeline, original_track = self.make_sample_timeline()
+        original_timeline.name = "timeline"
+        original_timeline.metadata["key"] = "value"
+        original_json = original_timeline.to_json_string()
+
+        trimmed = otio.algorithms.timeline_trimmed_to_range(
+            original_timeline,
+            otio.opentime.TimeRange(
+                start_time=otio.opentime.RationalTime(60, 24),
+                duration=otio.opentime.RationalTime(60, 24)
+            )
+        )
+
+        self.assertEqual(original_timeline.to_json_string(), original_json)
+        self.assertEqual(trimmed.name, "timeline")
+        self.assertEqual(trimmed.metadata["key"], "value")
+        self.assertEqual(trimmed.tracks.name, original_timeline.tracks.name)
+        self.assertEqual(len(trimmed.tracks), 1)
+        self.assertEqual(
+            [child.name for child in trimmed.tracks[0]],
+            ["B", "C"]
+        )
+        self.assertIsNot(trimmed.tracks[0][1], original_track[2])
+
     def test_trim_with_transitions(self):
         original_timeline, original_track = self.make_sample_timeline()
         self.assertEqual(
@@ -4,6 +4,7 @@
 #include "utils.h"
 
 #include <opentimelineio/clip.h>
+#include <opentimelineio/mediaReference.h>
 #include <opentimelineio/stack.h>
 #include <opentimelineio/track.h>
 
@@ -166,6 +167,76 @@ main(int argc, char** argv)
             std::find(items.begin(), items.end(), clip.value) != items.end());
     });
 
+    tests.add_test(
+        "test_range_of_child_at_index_after_edits", [] {
+        using namespace otio;
+
+        SerializableObject::Retainer<Track> track = new Track;
+        std::vector<SerializableObject::Retainer<Clip>> clips;
+        for (int i = 0; i < 4; ++i)
+        {
+            clips.push_back(new Clip(
+                "clip",
+                nullptr,
+                TimeRange(RationalTime(0.0, 24.0), RationalTime(10.0, 24.0))));
+            track->append_child(clips.back());
+        }
+
+        otio::ErrorStatus err;
+        auto range = track->range_of_child_at_index(3, &err);
+        assertFalse(is_error(err));
+        assertEqual(range.start_time(), RationalTime(30.0, 24.0));
+        assertEqual(track->index_of_child(clips[2], &err), 2);
+
+        // Changing the source range of an earlier child moves the later ones.
+        clips[0]->set_source_range(
+            TimeRange(RationalTime(0.0, 24.0), RationalTime(5.0, 24.0)));
+        range = track->range_of_child_at_index(3, &err);
+        assertEqual(range.start_time(), RationalTime(25.0, 24.0));
+
+        // So does removing and inserting children.
+        track->remove_child(1, &err);
+        range = track->range_of_child_at_index(2, &err);
+        assertEqual(range.start_time(), RationalTime(15.0, 24.0));
+        assertEqual(track->index_of_child(clips[3], &err), 2);
+
+        SerializableObject::Retainer<Clip> inserted = new Clip(
+            "inserted",
+            nullptr,
+            TimeRange(RationalTime(0.0, 24.0), RationalTime(2.0, 24.0)));
+        track->insert_child(0, inserted, &err);
+        range = track->range_of_child_at_index(3, &err);
+        assertEqual(range.start_time(), RationalTime(17.0, 24.0));
+        assertEqual(track->index_of_child(clips[3], &err), 3);
+        assertEqual(track->index_of_child(inserted, &err), 0);
+
+        // And changing the available range of a media reference that a
+        // child without a source range depends on.
+        SerializableObject::Retainer<MediaReference> media =
+            new MediaReference(
+                "media",
+                TimeRange(RationalTime(0.0, 24.0), RationalTime(4.0, 24.0)));
+        SerializableObject::Retainer<Clip> untrimmed =
+            new Clip("untrimmed", media);
+        track->insert_child(0, untrimmed, &err);
+        range = track->range_of_child_at_index(1, &err);
+        assertEqual(range.start_time(), RationalTime(4.0, 24.0));
+        media->set_available_range(
+            TimeRange(RationalTime(0.0, 24.0), RationalTime(8.0, 24.0)));
+        range = track->range_of_child_at_index(1, &err);
+        assertEqual(range.start_time(), RationalTime(8.0, 24.0));
+        assertFalse(is_error(err));
+
+        // A child without a duration is still reported as an error.
+        track->append_child(new Clip);
+        track->range_of_child_at_index(-1, &err);
+        assertTrue(is_error(err));
+        err = otio::ErrorStatus();
+        range = track->range_of_child_at_index(1, &err);
+        assertFalse(is_error(err));
+        assertEqual(range.start_time(), RationalTime(8.0, 24.0));
+    });
+
     tests.run(argc, argv);
     return 0;
 }
@@ -81,6 +81,58 @@ class TrackTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
         self.assertTrue(audio_clip in items)
         self.assertTrue(audio_track in items)
 
+    def test_range_in_parent_after_edits(self):
+        track = otio.schema.Track()
+        clips = []
+        for i in range(5):
+            clips.append(
+                otio.schema.Clip(
+                    name="clip_{}".format(i),
+                    source_range=otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(0, 24),
+                        otio.opentime.RationalTime(10, 24)
+                    )
+                )
+            )
+            track.append(clips[-1])
+
+        self.assertEqual(
+            [c.range_in_parent().start_time.value for c in clips],
+            [0, 10, 20, 30, 40]
+        )
+
+        clips[1].source_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(0, 24),
+            otio.opentime.RationalTime(5, 24)
+        )
+        self.assertEqual(clips[4].range_in_parent().start_time.value, 35)
+
+        del track[0]
+        self.assertEqual(clips[4].range_in_parent().start_time.value, 25)
+
+        track.insert(0, otio.schema.Transition(
+            in_offset=otio.opentime.RationalTime(1, 24),
+            out_offset=otio.opentime.RationalTime(1, 24)
+        ))
+        self.assertEqual(track.range_of_child_at_index(0).start_time.value, -1)
+        self.assertEqual(clips[4].range_in_parent().start_time.value, 25)
+        track[0].in_offset = otio.opentime.RationalTime(3, 24)
+        self.assertEqual(track.range_of_child_at_index(0).start_time.value, -3)
+
+        clips[2].media_reference = otio.schema.ExternalReference(
+            available_range=otio.opentime.TimeRange(
+                otio.opentime.RationalTime(0, 24),
+                otio.opentime.RationalTime(100, 24)
+            )
+        )
+        clips[2].source_range = None
+        self.assertEqual(clips[4].range_in_parent().start_time.value, 115)
+        clips[2].media_reference.available_range = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(0, 24),
+            otio.opentime.RationalTime(50, 24)
+        )
+        self.assertEqual(clips[4].range_in_parent().start_time.value, 65)
+
 
 if __name__ == '__main__':
     unittest.main()
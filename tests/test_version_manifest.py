@@ -46,6 +46,26 @@ SECOND_MANIFEST = """{
 }
 """
 
+RULES_MANIFEST = """{
+    "OTIO_SCHEMA" : "PluginManifest.1",
+    "upgrade_rules": {
+        "RulesTestSchema": {
+            "2": [["rename", "foo", "foo_2"], ["set_default", "bar", 1]]
+        }
+    }
+}
+"""
+
+SECOND_RULES_MANIFEST = """{
+    "OTIO_SCHEMA" : "PluginManifest.1",
+    "downgrade_rules": {
+        "RulesTestSchema": {
+            "2": [["rename", "foo_2", "foo"], ["drop", "bar"]]
+        }
+    }
+}
+"""
+
 
 class TestPlugin_VersionManifest(unittest.TestCase):
     def setUp(self):
@@ -143,6 +163,34 @@ class TestPlugin_VersionManifest(unittest.TestCase):
         self.assertIn("April2022", lay_fam)
         self.assertEqual(lay_fam["May2022"]["SimpleClass"], 2)
 
+    def test_schema_rules(self):
+        @otio.core.register_type
+        class RulesTestSchema(otio.core.SerializableObject):
+            _serializable_label = "RulesTestSchema.2"
+            foo_two = otio.core.serializable_field("foo_2")
+
+        man = otio.plugins.manifest.manifest_from_string(RULES_MANIFEST)
+        man.extend(
+            otio.plugins.manifest.manifest_from_string(SECOND_RULES_MANIFEST)
+        )
+        self.assertIn("RulesTestSchema", man.upgrade_rules)
+        self.assertIn("RulesTestSchema", man.downgrade_rules)
+        man._register_schema_rules()
+
+        rts = otio.adapters.otio_json.read_from_string(
+            '{"OTIO_SCHEMA": "RulesTestSchema.1", "foo": "asdf"}'
+        )
+        self.assertEqual(rts.foo_two, "asdf")
+        self.assertEqual(rts._dynamic_fields["bar"], 1)
+
+        result = json.loads(
+            otio.adapters.otio_json.write_to_string(rts, {"RulesTestSchema": 1})
+        )
+        self.assertDictEqual(
+            result,
+            {"OTIO_SCHEMA": "RulesTestSchema.1", "foo": "asdf"}
+        )
+
 
 if __name__ == '__main__':
     unittest.main()